@@ -40,6 +40,16 @@ class AccountErrorCode(Enum):
     UNKNOWN_IP_ADDRESS = "unknown_ip_address"
 
 
+class CustomerBulkCreateErrorCode(Enum):
+    BLANK = "blank"
+    DUPLICATED_INPUT_ITEM = "duplicated_input_item"
+    GRAPHQL_ERROR = "graphql_error"
+    INVALID = "invalid"
+    REQUIRED = "required"
+    UNIQUE = "unique"
+    MAX_LENGTH = "max_length"
+
+
 class CustomerBulkUpdateErrorCode(Enum):
     BLANK = "blank"
     DUPLICATED_INPUT_ITEM = "duplicated_input_item"
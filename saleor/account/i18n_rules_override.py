@@ -1,6 +1,16 @@
+from functools import lru_cache
+
 import i18naddress
 
 original_load_validation_data = i18naddress.load_validation_data
+original_get_validation_rules = i18naddress.get_validation_rules
+
+# The number of validation rules kept in memory. Rules depend on the country and,
+# for some countries, on the country area, city and city area of the address.
+VALIDATION_RULES_CACHE_SIZE = 4096
+
+# Address fields used by `i18naddress.get_validation_rules`.
+VALIDATION_RULES_ADDRESS_FIELDS = ("country_code", "country_area", "city", "city_area")
 
 
 COUNTRIES_RULES_OVERRIDE = {
@@ -24,5 +34,28 @@ def patched_load_validation_data(country_code="all"):
     return validation_data
 
 
+@lru_cache(maxsize=VALIDATION_RULES_CACHE_SIZE)
+def _get_cached_validation_rules(key):
+    return original_get_validation_rules(
+        dict(zip(VALIDATION_RULES_ADDRESS_FIELDS, key, strict=True))
+    )
+
+
+def cached_get_validation_rules(address):
+    """Return validation rules for the address, reusing the rules built before.
+
+    Building rules loads and parses the country data files and compiles postal
+    code patterns, which is repeated for every validated address otherwise.
+    Values are compared case-insensitively by the library, so they are normalized
+    before they are used as the cache key.
+    """
+    key = tuple(
+        (address.get(field) or "").strip().lower()
+        for field in VALIDATION_RULES_ADDRESS_FIELDS
+    )
+    return _get_cached_validation_rules(key)
+
+
 def i18n_rules_override():
     i18naddress.load_validation_data = patched_load_validation_data
+    i18naddress.get_validation_rules = cached_get_validation_rules
@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-10-19 12:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("account", "0088_user_email_lower_idx"),
+    ]
+
+    atomic = False
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="search_index_dirty",
+            field=models.BooleanField(default=False),
+        ),
+        AddIndexConcurrently(
+            model_name="user",
+            index=models.Index(
+                condition=models.Q(("search_index_dirty", True)),
+                fields=["search_index_dirty"],
+                name="user_search_index_dirty_idx",
+            ),
+        ),
+    ]
@@ -8,6 +8,7 @@ from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.db.models import JSONField, Q, Value
 from django.db.models.expressions import Exists, OuterRef
+from django.db.models.functions import Lower
 from django.forms.models import model_to_dict
 from django.utils import timezone
 from django.utils.crypto import get_random_string
@@ -188,6 +189,7 @@ class User(
         max_length=35, choices=settings.LANGUAGES, default=settings.LANGUAGE_CODE
     )
     search_document = models.TextField(blank=True, default="")
+    search_index_dirty = models.BooleanField(default=False)
     uuid = models.UUIDField(default=uuid4, unique=True)
 
     USERNAME_FIELD = "email"
@@ -233,6 +235,14 @@ class User(
                 name="last_name_gin",
                 opclasses=["gin_trgm_ops"],
             ),
+            # Case-insensitive email lookup index
+            models.Index(Lower("email"), name="user_email_lower_idx"),
+            # Users waiting for the search document update
+            models.Index(
+                fields=["search_index_dirty"],
+                name="user_search_index_dirty_idx",
+                condition=Q(search_index_dirty=True),
+            ),
         ]
 
     def __init__(self, *args, **kwargs):
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING
 
+from django.contrib.postgres.search import TrigramWordSimilarity
 from django.db.models import Q, Value, prefetch_related_objects
 
 from ..core.postgres import NoValidationSearchVector
@@ -9,6 +10,7 @@ if TYPE_CHECKING:
 
 
 USER_SEARCH_FIELDS = ["email", "first_name", "last_name"]
+USERS_BATCH_SIZE = 500
 ADDRESS_SEARCH_FIELDS = [
     "first_name",
     "last_name",
@@ -43,6 +45,22 @@ def prepare_user_search_document_value(
     return search_document.lower()
 
 
+def update_users_search_document(users: list["User"]):
+    """Set `search_document` for given users and save them.
+
+    Addresses are fetched for all users at once.
+    """
+    from .models import User
+
+    prefetch_related_objects(users, "addresses")
+    for user in users:
+        user.search_document = prepare_user_search_document_value(
+            user, already_prefetched=True
+        )
+        user.search_index_dirty = False
+    User.objects.bulk_update(users, ["search_document", "search_index_dirty"])
+
+
 def generate_user_fields_search_document_value(user: "User"):
     value = "\n".join(
         [getattr(user, field) for field in USER_SEARCH_FIELDS if getattr(user, field)]
@@ -111,5 +129,7 @@ def search_users(qs, value):
         lookup = Q()
         for val in value.split():
             lookup &= Q(search_document__ilike=val.lower())
-        qs = qs.filter(lookup)
+        qs = qs.filter(lookup).annotate(
+            search_rank=TrigramWordSimilarity(value.lower(), "search_document")
+        )
     return qs
@@ -2,17 +2,20 @@ import logging
 from typing import cast
 from urllib.parse import urlencode
 
+from django.conf import settings
 from django.utils import timezone
 
 from ..celeryconf import app
 from ..core.db.connection import allow_writer
 from ..core.tokens import token_generator
+from ..core.tracing import traced_atomic_transaction
 from ..core.utils.events import call_event
 from ..core.utils.url import prepare_url
+from ..giftcard.search import mark_gift_cards_search_index_as_dirty_by_users
 from ..graphql.plugins.dataloaders import get_plugin_manager_promise
 from ..graphql.site.dataloaders import get_site_promise
-from . import events, notifications, search
-from .models import User
+from . import CustomerEvents, events, notifications, search
+from .models import CustomerEvent, User
 from .notifications import send_password_reset_notification
 from .utils import RequestorAwareContext
 
@@ -120,3 +123,78 @@ def finish_creating_user(user_pk, redirect_url, channel_slug, context_data):
 
     call_event(manager.customer_created, user)
     events.customer_account_created_event(user=user)
+
+
+@app.task()
+@allow_writer()
+def customers_bulk_create_actions_task(
+    created_ids, updated_ids, events_data, context_data
+):
+    """Process the actions deferred from the customers bulk creation.
+
+    Create the customer events and trigger the `CUSTOMER_CREATED` and
+    `CUSTOMER_UPDATED` webhooks. The search documents of the customers are set by
+    `update_users_search_document_task`.
+
+    `events_data` contains the type and parameters of the events created on behalf
+    of the requestor, e.g. when the name of an updated customer has changed.
+    """
+    context_data["allow_replica"] = True
+    context = RequestorAwareContext.from_context_data(context_data)
+    manager = get_plugin_manager_promise(context).get()
+
+    created_customers = list(User.objects.filter(pk__in=created_ids))
+    updated_customers = list(User.objects.filter(pk__in=updated_ids))
+
+    customer_events = [
+        CustomerEvent(user=customer, type=CustomerEvents.ACCOUNT_CREATED)
+        for customer in created_customers
+    ]
+    customer_events.extend(
+        CustomerEvent(
+            user=context.user,
+            app=context.app,
+            type=event_type,
+            parameters=parameters,
+        )
+        for event_type, parameters in events_data
+    )
+    CustomerEvent.objects.bulk_create(customer_events)
+    if updated_customers:
+        mark_gift_cards_search_index_as_dirty_by_users(updated_customers)
+
+    if created_customers:
+        call_event(manager.customers_created, created_customers)
+    if updated_customers:
+        call_event(manager.customers_updated, updated_customers)
+
+
+@app.task(
+    queue=settings.UPDATE_SEARCH_VECTOR_INDEX_QUEUE_NAME,
+    expires=settings.BEAT_UPDATE_SEARCH_EXPIRE_AFTER_SEC,
+)
+def update_users_search_document_task():
+    user_ids = list(
+        User.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(search_index_dirty=True)
+        .order_by("pk")
+        .values_list("pk", flat=True)[: search.USERS_BATCH_SIZE]
+    )
+    if not user_ids:
+        return
+    with allow_writer():
+        with traced_atomic_transaction():
+            # Re-read the users on the writer under a lock, so the dirty flag set by
+            # a concurrent change is not cleared with a search document built from
+            # stale data. Users locked by other transactions are left for the next
+            # run.
+            users = list(
+                User.objects.select_for_update(of=("self",), skip_locked=True)
+                .filter(pk__in=user_ids, search_index_dirty=True)
+                .order_by("pk")
+            )
+            if users:
+                search.update_users_search_document(users)
+
+    if len(users) == search.USERS_BATCH_SIZE:
+        update_users_search_document_task.delay()
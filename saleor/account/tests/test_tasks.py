@@ -0,0 +1,95 @@
+from unittest.mock import patch
+
+from .. import CustomerEvents
+from ..models import CustomerEvent, User
+from ..search import prepare_user_search_document_value
+from ..tasks import (
+    customers_bulk_create_actions_task,
+    update_users_search_document_task,
+)
+
+
+def test_update_users_search_document_task(customer_user, address):
+    # given
+    customer_user.addresses.add(address)
+    customer_user.search_document = ""
+    customer_user.search_index_dirty = True
+    customer_user.save(update_fields=["search_document", "search_index_dirty"])
+
+    # when
+    update_users_search_document_task()
+
+    # then
+    customer_user.refresh_from_db()
+    assert customer_user.search_index_dirty is False
+    assert customer_user.search_document == prepare_user_search_document_value(
+        customer_user
+    )
+
+
+@patch("saleor.account.search.USERS_BATCH_SIZE", 1)
+def test_update_users_search_document_task_queued_again_for_full_batch(
+    customer_users,
+):
+    # given
+    for user in customer_users:
+        user.search_document = ""
+        user.search_index_dirty = True
+    User.objects.bulk_update(customer_users, ["search_document", "search_index_dirty"])
+
+    # when
+    update_users_search_document_task()
+
+    # then
+    assert not User.objects.filter(search_index_dirty=True).exists()
+    for user in customer_users:
+        user.refresh_from_db()
+        assert user.search_document == prepare_user_search_document_value(user)
+
+
+def test_update_users_search_document_task_skips_clean_users(customer_user):
+    # given
+    customer_user.search_document = ""
+    customer_user.search_index_dirty = False
+    customer_user.save(update_fields=["search_document", "search_index_dirty"])
+
+    # when
+    update_users_search_document_task()
+
+    # then
+    customer_user.refresh_from_db()
+    assert customer_user.search_document == ""
+
+
+@patch("saleor.plugins.manager.PluginsManager.customers_updated")
+@patch("saleor.plugins.manager.PluginsManager.customers_created")
+def test_customers_bulk_create_actions_task(
+    mocked_customers_created,
+    mocked_customers_updated,
+    customer_users,
+    staff_user,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    created_customer, updated_customer = customer_users[:2]
+    context_data = {
+        "allow_replica": False,
+        "user_pk": staff_user.pk,
+        "app_pk": None,
+    }
+    events_data = [(CustomerEvents.NAME_ASSIGNED, {"message": "John Doe"})]
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        customers_bulk_create_actions_task(
+            [created_customer.pk], [updated_customer.pk], events_data, context_data
+        )
+
+    # then
+    created_event = CustomerEvent.objects.get(type=CustomerEvents.ACCOUNT_CREATED)
+    assert created_event.user == created_customer
+    name_event = CustomerEvent.objects.get(type=CustomerEvents.NAME_ASSIGNED)
+    assert name_event.user == staff_user
+    assert name_event.parameters == {"message": "John Doe"}
+    mocked_customers_created.assert_called_once_with([created_customer])
+    mocked_customers_updated.assert_called_once_with([updated_customer])
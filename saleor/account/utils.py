@@ -2,7 +2,8 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from django.conf import settings
-from django.db.models import Exists, OuterRef
+from django.db.models import Exists, OuterRef, Value
+from django.db.models.functions import Lower
 
 from ..app.models import App
 from ..checkout import AddressType
@@ -160,7 +161,12 @@ def retrieve_user_by_email(email):
     Email lookup is case-insensitive, unless the query returns more than one user. In
     such a case, function return case-sensitive result.
     """
-    users = list(User.objects.filter(email__iexact=email))
+    # compare lowercased emails to use the `user_email_lower_idx` index
+    users = list(
+        User.objects.alias(normalized_email=Lower("email")).filter(
+            normalized_email=Lower(Value(email))
+        )
+    )
 
     if len(users) > 1:
         users_exact = [user for user in users if user.email == email]
@@ -2,6 +2,7 @@ import logging
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.db.models import Exists, OuterRef, Q
 from django.utils import timezone
 from requests import HTTPError, RequestException
@@ -74,16 +75,21 @@ def _raw_remove_deliveries(deliveries_ids):
         Exists(deliveries.filter(id=OuterRef("delivery_id")))
     )
 
-    files_to_delete = [
+    files_to_delete = {
         event_payload.payload_file.name
         for event_payload in payloads.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
         if event_payload.payload_file
-    ]
-    delete_files_from_private_storage_task.delay(files_to_delete)
+    }
 
-    attempts._raw_delete(attempts.db)  # type: ignore[attr-defined] # raw access # noqa: E501
-    deliveries._raw_delete(deliveries.db)  # type: ignore[attr-defined] # raw access # noqa: E501
-    payloads._raw_delete(payloads.db)  # type: ignore[attr-defined] # raw access # noqa: E501
+    with transaction.atomic():
+        EventPayload.objects.lock_files(files_to_delete)
+        attempts._raw_delete(attempts.db)  # type: ignore[attr-defined] # raw access # noqa: E501
+        deliveries._raw_delete(deliveries.db)  # type: ignore[attr-defined] # raw access # noqa: E501
+        payloads._raw_delete(payloads.db)  # type: ignore[attr-defined] # raw access # noqa: E501
+
+        # segment files may still be used by payloads of other deliveries
+        files_to_delete -= EventPayload.objects.get_referenced_files(files_to_delete)
+    delete_files_from_private_storage_task.delay(list(files_to_delete))
 
 
 @celeryconf.app.task
@@ -0,0 +1,113 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+
+from ...graphql.app.dataloaders import AppByTokenLoader
+from ..models import AppToken
+from ..token_cache import get_app_token_digest, verified_app_token_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_verified_app_token_cache(settings):
+    settings.APP_TOKEN_CACHE_ENABLED = True
+    verified_app_token_cache.clear()
+    cache.clear()
+    yield
+    verified_app_token_cache.clear()
+
+
+def _load_app(rf, raw_token):
+    context = rf.request()
+    context.allow_replica = False
+    return AppByTokenLoader(context).load(raw_token).get()
+
+
+def test_verified_token_skips_password_check(rf, app):
+    # given
+    _, raw_token = AppToken.objects.create(app=app)
+    assert _load_app(rf, raw_token) == app
+
+    # when
+    with mock.patch(
+        "saleor.graphql.app.dataloaders.app.check_password"
+    ) as check_password_mock:
+        loaded_app = _load_app(rf, raw_token)
+
+    # then
+    assert loaded_app == app
+    check_password_mock.assert_not_called()
+
+
+def test_verified_token_is_shared_between_processes(rf, app):
+    # given
+    _, raw_token = AppToken.objects.create(app=app)
+    _load_app(rf, raw_token)
+    # other processes have only the shared cache
+    verified_app_token_cache.clear()
+
+    # when
+    with mock.patch(
+        "saleor.graphql.app.dataloaders.app.check_password"
+    ) as check_password_mock:
+        loaded_app = _load_app(rf, raw_token)
+
+    # then
+    assert loaded_app == app
+    check_password_mock.assert_not_called()
+
+
+def test_deleted_token_is_rejected(rf, app):
+    # given
+    app_token, raw_token = AppToken.objects.create(app=app)
+    _load_app(rf, raw_token)
+
+    # when
+    app_token.delete()
+
+    # then
+    assert _load_app(rf, raw_token) is None
+
+
+def test_token_of_deactivated_app_is_rejected(rf, app):
+    # given
+    _, raw_token = AppToken.objects.create(app=app)
+    _load_app(rf, raw_token)
+
+    # when
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+
+    # then
+    assert _load_app(rf, raw_token) is None
+
+
+def test_invalid_token_is_not_cached(rf, app):
+    # given
+    _, raw_token = AppToken.objects.create(app=app)
+    invalid_token = "invalid" + raw_token[-4:]
+
+    # when
+    loaded_app = _load_app(rf, invalid_token)
+
+    # then
+    assert loaded_app is None
+    digest = get_app_token_digest(invalid_token)
+    assert verified_app_token_cache.get_many([digest]) == {}
+
+
+def test_token_cache_disabled(rf, app, settings):
+    # given
+    settings.APP_TOKEN_CACHE_ENABLED = False
+    _, raw_token = AppToken.objects.create(app=app)
+    _load_app(rf, raw_token)
+
+    # when
+    with mock.patch(
+        "saleor.graphql.app.dataloaders.app.check_password", return_value=True
+    ) as check_password_mock:
+        loaded_app = _load_app(rf, raw_token)
+
+    # then
+    assert loaded_app == app
+    check_password_mock.assert_called_once()
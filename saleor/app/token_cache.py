@@ -0,0 +1,90 @@
+"""Cache of verified app tokens.
+
+App tokens are stored as password hashes, so checking a raw token against the
+candidates found by its last 4 characters runs the slow password hasher on every
+request of an app.
+
+Tokens that passed the check are remembered under a keyed HMAC of the raw token,
+in a process-local cache and in the shared Django cache, together with the ID and
+the hash of the matching `AppToken`. A remembered token is accepted without the
+hasher only if the database still returns a token with the same ID and hash, so a
+deleted or regenerated token is rejected immediately. The app itself, with its
+active state and permissions, is never cached.
+"""
+
+import threading
+import time
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.crypto import salted_hmac
+
+from ..core.utils.cache import CacheDict
+
+VERIFIED_APP_TOKEN_CACHE_KEY_PREFIX = "verified_app_token:"
+VERIFIED_APP_TOKEN_LOCAL_CACHE_SIZE = 1000
+
+# (AppToken ID, AppToken.auth_token)
+VerifiedToken = tuple[int, str]
+
+
+class VerifiedAppTokenCache:
+    def __init__(self, capacity: int):
+        self._entries: CacheDict = CacheDict(capacity)
+        self._lock = threading.Lock()
+
+    def get_many(self, digests: Iterable[str]) -> dict[str, VerifiedToken]:
+        found: dict[str, VerifiedToken] = {}
+        missing = []
+        now = time.monotonic()
+        with self._lock:
+            for digest in digests:
+                entry = self._entries.get(digest)
+                if entry is not None and entry[1] >= now:
+                    found[digest] = entry[0]
+                else:
+                    missing.append(digest)
+        if missing:
+            shared = cache.get_many(
+                [VERIFIED_APP_TOKEN_CACHE_KEY_PREFIX + digest for digest in missing]
+            )
+            for digest in missing:
+                value = shared.get(VERIFIED_APP_TOKEN_CACHE_KEY_PREFIX + digest)
+                if value is not None:
+                    found[digest] = tuple(value)  # type: ignore[assignment]
+                    self._set_local(digest, found[digest])
+        return found
+
+    def set(self, digest: str, verified_token: VerifiedToken):
+        self._set_local(digest, verified_token)
+        cache.set(
+            VERIFIED_APP_TOKEN_CACHE_KEY_PREFIX + digest,
+            verified_token,
+            timeout=settings.APP_TOKEN_CACHE_TIMEOUT,
+        )
+
+    def _set_local(self, digest: str, verified_token: VerifiedToken):
+        expires_at = time.monotonic() + settings.APP_TOKEN_CACHE_TIMEOUT
+        with self._lock:
+            self._entries[digest] = (verified_token, expires_at)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+verified_app_token_cache = VerifiedAppTokenCache(
+    capacity=VERIFIED_APP_TOKEN_LOCAL_CACHE_SIZE
+)
+
+
+def is_app_token_cache_enabled() -> bool:
+    return settings.APP_TOKEN_CACHE_ENABLED
+
+
+def get_app_token_digest(raw_token: str) -> str:
+    """Return a keyed HMAC of the raw token, safe to be used as a cache key."""
+    return salted_hmac(
+        "saleor.app.token_cache", raw_token, algorithm="sha256"
+    ).hexdigest()
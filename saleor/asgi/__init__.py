@@ -22,12 +22,17 @@ def preload_app() -> None:
     """Import the app code to make sure that Django application is loaded.
 
     By default, Django does not import the application until the first request is processed.
+    Objects built by the warm-up are frozen together with the imported code.
     """
     from django.conf import settings
     from django.urls import get_resolver
 
+    from ..core.warmup import warm_up_app
+
     initialize_telemetry()
     getattr(get_resolver(settings.ROOT_URLCONF), "url_patterns")
+    if settings.WARMUP_ENABLED:
+        warm_up_app()
     gc.collect()
     gc.freeze()  # mark anything that remains as uncollectable to speed up future collections
 
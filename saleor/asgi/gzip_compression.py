@@ -1,8 +1,9 @@
 # adapted from Starlette's GZipMiddleware
 # Starlette does not work with Django's case-sensitive headers
 
-import gzip
-import io
+import asyncio
+import zlib
+from collections.abc import Iterator
 
 from asgiref.typing import (
     ASGI3Application,
@@ -13,135 +14,270 @@ from asgiref.typing import (
     Scope,
 )
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Compression levels by the response size, the first matching upper bound wins.
+# Higher levels give only a few percent smaller JSON responses while their CPU cost
+# grows with the payload, so large responses are compressed with faster levels.
+GZIP_LEVELS = [(64 * 1024, 6), (1024 * 1024, 5), (None, 4)]
+BROTLI_LEVELS = [(64 * 1024, 5), (1024 * 1024, 4), (None, 3)]
+ZSTD_LEVELS = [(64 * 1024, 6), (1024 * 1024, 3), (None, 1)]
+
+# Size of the chunks in which large responses are compressed and sent.
+CHUNK_SIZE = 256 * 1024
+
+
+class GzipCompressor:
+    encoding = b"gzip"
+    levels = GZIP_LEVELS
+
+    def __init__(self, level: int):
+        # wbits=31 produces the gzip container instead of the raw zlib stream
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliCompressor:
+    encoding = b"br"
+    levels = BROTLI_LEVELS
+
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdCompressor:
+    encoding = b"zstd"
+    levels = ZSTD_LEVELS
+
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+Compressor = GzipCompressor | BrotliCompressor | ZstdCompressor
+
+
+def get_available_compressors() -> list[type[Compressor]]:
+    """Return the supported compressors, in the order of preference."""
+    compressors: list[type[Compressor]] = []
+    if zstandard is not None:
+        compressors.append(ZstdCompressor)
+    if brotli is not None:
+        compressors.append(BrotliCompressor)
+    compressors.append(GzipCompressor)
+    return compressors
+
+
+def parse_accept_encoding(accept_encoding: bytes) -> set[bytes]:
+    accepted = set()
+    for item in accept_encoding.lower().split(b","):
+        encoding, _, params = item.strip().partition(b";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith(b"q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                continue
+        if encoding and quality > 0:
+            accepted.add(encoding.strip())
+    return accepted
+
+
+def negotiate_compressor(accept_encoding: bytes) -> type[Compressor] | None:
+    accepted = parse_accept_encoding(accept_encoding)
+    for compressor in get_available_compressors():
+        if compressor.encoding in accepted:
+            return compressor
+    return None
+
+
+def get_compression_level(levels: list[tuple[int | None, int]], size: int) -> int:
+    for max_size, level in levels:
+        if max_size is None or size <= max_size:
+            return level
+    return levels[-1][1]
+
+
+def get_content_length(headers) -> int | None:
+    for key, value in headers:
+        if key.lower() == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+def iter_chunks(body: bytes) -> Iterator[bytes]:
+    view = memoryview(body)
+    for start in range(0, len(body), CHUNK_SIZE):
+        yield bytes(view[start : start + CHUNK_SIZE])
+
 
 def gzip_compression(
-    app: ASGI3Application, minimum_size: int = 500, compresslevel: int = 9
+    app: ASGI3Application,
+    minimum_size: int = 500,
+    threaded_minimum_size: int = 64 * 1024,
 ) -> ASGI3Application:
+    """Compress responses with the best encoding accepted by the client.
+
+    Zstandard and brotli are used when their optional packages are installed,
+    gzip is always available. The compression level is chosen by the response
+    size. Responses of at least `threaded_minimum_size` bytes are compressed in
+    a worker thread so the event loop keeps serving other requests, and are
+    sent in chunks as they get compressed.
+    """
+
     async def gzip_compression_wrapper(
         scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable
     ) -> None:
-        if scope["type"] == "http":
-            accepted_encoding = next(
-                (
+        if scope["type"] != "http":
+            await app(scope, receive, send)
+            return
+
+        accepted_encoding = next(
+            (
+                value
+                for key, value in scope["headers"]
+                if key.lower() == b"accept-encoding"
+            ),
+            b"",
+        )
+        compressor_class = negotiate_compressor(accepted_encoding)
+        if compressor_class is None:
+            await app(scope, receive, send)
+            return
+
+        start_message: HTTPResponseStartEvent | None = None
+        content_encoding_set = False
+        started = False
+        compressor: Compressor | None = None
+
+        async def compress(data: bytes, finish: bool) -> bytes:
+            assert compressor is not None
+            if len(data) < threaded_minimum_size:
+                compressed = compressor.compress(data)
+                return compressed + compressor.finish() if finish else compressed
+
+            def compress_in_thread() -> bytes:
+                assert compressor is not None
+                compressed = compressor.compress(data)
+                return compressed + compressor.finish() if finish else compressed
+
+            return await asyncio.to_thread(compress_in_thread)
+
+        async def send_compressed_chunks(body: bytes, more_body: bool) -> None:
+            chunks = list(iter_chunks(body)) or [b""]
+            for index, chunk in enumerate(chunks):
+                is_last = index == len(chunks) - 1
+                compressed = await compress(chunk, finish=is_last and not more_body)
+                if compressed or (is_last and not more_body):
+                    await send(
+                        {
+                            "type": "http.response.body",
+                            "body": compressed,
+                            "more_body": not is_last or more_body,
+                        }
+                    )
+
+        def set_compression_headers(with_length: int | None) -> None:
+            assert start_message is not None
+            headers = [
+                (key, value)
+                for key, value in start_message["headers"]
+                if key.lower() not in (b"content-length", b"content-encoding")
+            ]
+            headers.append((b"content-encoding", compressor_class.encoding))
+            if with_length is not None:
+                headers.append((b"content-length", str(with_length).encode("latin-1")))
+            for index, (key, value) in enumerate(headers):
+                if key.lower() == b"vary":
+                    if b"accept-encoding" not in value.lower():
+                        headers[index] = (key, value + b", Accept-Encoding")
+                    break
+            else:
+                headers.append((b"vary", b"Accept-Encoding"))
+            start_message["headers"] = headers
+
+        async def send_compressed(message: ASGISendEvent) -> None:
+            nonlocal content_encoding_set
+            nonlocal start_message
+            nonlocal started
+            nonlocal compressor
+            if message["type"] == "http.response.start":
+                start_message = message
+                headers = start_message["headers"]
+                content_encoding_set = any(
                     value
-                    for key, value in scope["headers"]
-                    if key.lower() == b"accept-encoding"
-                ),
-                b"",
-            )
-            if b"gzip" in accepted_encoding:
-                start_message: HTTPResponseStartEvent | None = None
-                content_encoding_set = False
-                started = False
-                gzip_buffer = io.BytesIO()
-                gzip_file = gzip.GzipFile(
-                    mode="wb", fileobj=gzip_buffer, compresslevel=compresslevel
+                    for key, value in headers
+                    if key.lower() == b"content-encoding"
+                )
+            elif message["type"] == "http.response.body" and content_encoding_set:
+                if not started:
+                    assert start_message is not None
+                    started = True
+                    await send(start_message)
+                await send(message)
+            elif message["type"] == "http.response.body" and not started:
+                assert start_message is not None
+                started = True
+                body = message.get("body", b"")
+                more_body = message.get("more_body", False)
+                if len(body) < minimum_size and not more_body:
+                    # Don't compress small outgoing responses.
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                size = get_content_length(start_message["headers"]) or len(body)
+                level = get_compression_level(compressor_class.levels, size)
+                compressor = compressor_class(level)
+                if not more_body and len(body) < threaded_minimum_size:
+                    # Small enough to be compressed at once on the event loop.
+                    message["body"] = await compress(body, finish=True)
+                    set_compression_headers(with_length=len(message["body"]))
+                    await send(start_message)
+                    await send(message)
+                else:
+                    # Large or streaming response, the compressed length is not
+                    # known upfront.
+                    set_compression_headers(with_length=None)
+                    await send(start_message)
+                    await send_compressed_chunks(body, more_body)
+            elif message["type"] == "http.response.body":
+                if compressor is None:
+                    # Response was sent uncompressed.
+                    await send(message)
+                    return
+                await send_compressed_chunks(
+                    message.get("body", b""), message.get("more_body", False)
                 )
 
-                async def send_compressed(message: ASGISendEvent) -> None:
-                    nonlocal content_encoding_set
-                    nonlocal start_message
-                    nonlocal started
-                    if message["type"] == "http.response.start":
-                        start_message = message
-                        headers = start_message["headers"]
-                        content_encoding_set = any(
-                            value
-                            for key, value in headers
-                            if key.lower() == b"content-encoding"
-                        )
-                    elif (
-                        message["type"] == "http.response.body" and content_encoding_set
-                    ):
-                        if not started:
-                            assert start_message is not None
-                            started = True
-                            await send(start_message)
-                        await send(message)
-                    elif message["type"] == "http.response.body" and not started:
-                        assert start_message is not None
-                        started = True
-                        body = message.get("body", b"")
-                        more_body = message.get("more_body", False)
-                        if len(body) < minimum_size and not more_body:
-                            # Don't apply GZip to small outgoing responses.
-                            await send(start_message)
-                            await send(message)
-                        elif not more_body:
-                            # Standard GZip response.
-                            gzip_file.write(body)
-                            gzip_file.close()
-                            body = gzip_buffer.getvalue()
-
-                            headers = start_message["headers"]
-                            headers = [
-                                (key, value)
-                                for key, value in headers
-                                if key.lower()
-                                not in (b"content-length", b"content-encoding")
-                            ]
-                            headers.append((b"content-encoding", b"gzip"))
-                            headers.append(
-                                (
-                                    b"content-length",
-                                    str(len(body)).encode("latin-1"),
-                                )
-                            )
-                            for key, value in headers:
-                                if key.lower() == b"vary":
-                                    if b"Accept-Encoding" not in value:
-                                        value += b", Accept-Encoding"
-                                        break
-                            start_message["headers"] = headers
-
-                            message["body"] = body
-
-                            await send(start_message)
-                            await send(message)
-                        else:
-                            # Initial body in streaming GZip response.
-                            headers = start_message["headers"]
-                            headers = [
-                                (key, value)
-                                for key, value in headers
-                                if key.lower()
-                                not in (b"content-length", b"content-encoding")
-                            ]
-                            headers.append((b"content-encoding", b"gzip"))
-                            for key, value in headers:
-                                if key.lower() == b"vary":
-                                    if b"Accept-Encoding" not in value:
-                                        value += b", Accept-Encoding"
-                                        break
-                            start_message["headers"] = headers
-
-                            gzip_file.write(body)
-                            message["body"] = gzip_buffer.getvalue()
-                            gzip_buffer.seek(0)
-                            gzip_buffer.truncate()
-
-                            await send(start_message)
-                            await send(message)
-
-                    elif message["type"] == "http.response.body":
-                        # Remaining body in streaming GZip response.
-                        body = message.get("body", b"")
-                        more_body = message.get("more_body", False)
-
-                        gzip_file.write(body)
-                        if not more_body:
-                            gzip_file.close()
-
-                        message["body"] = gzip_buffer.getvalue()
-                        gzip_buffer.seek(0)
-                        gzip_buffer.truncate()
-
-                        await send(message)
-
-                await app(scope, receive, send_compressed)
-                gzip_file.close()
-                gzip_buffer.close()
-                return
-        await app(scope, receive, send)
+        await app(scope, receive, send_compressed)
 
     return gzip_compression_wrapper
@@ -1,4 +1,7 @@
+import asyncio
 import gzip
+import zlib
+from unittest import mock
 
 from asgiref.typing import (
     ASGI3Application,
@@ -8,7 +11,12 @@ from asgiref.typing import (
     HTTPScope,
 )
 
-from ..gzip_compression import gzip_compression
+from ..gzip_compression import (
+    CHUNK_SIZE,
+    GzipCompressor,
+    gzip_compression,
+    negotiate_compressor,
+)
 
 
 def build_scope(origin: str, encodings: bytes) -> HTTPScope:
@@ -70,7 +78,9 @@ async def test_with_supported_compression(large_asgi_app: ASGI3Application, sett
     settings.ALLOWED_GRAPHQL_ORIGINS = ["*"]
     cors_app = gzip_compression(large_asgi_app)
     events = await run_app(cors_app, build_scope("http://localhost:3000", b"gzip"))
-    expected_payload = gzip.compress(10000 * b"x", compresslevel=9)
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    expected_payload = compressor.compress(10000 * b"x") + compressor.flush()
+    assert gzip.decompress(expected_payload) == 10000 * b"x"
     assert events == [
         HTTPResponseStartEvent(
             type="http.response.start",
@@ -79,6 +89,7 @@ async def test_with_supported_compression(large_asgi_app: ASGI3Application, sett
                 (b"content-type", b"text/plain"),
                 (b"content-encoding", b"gzip"),
                 (b"content-length", str(len(expected_payload)).encode("latin1")),
+                (b"vary", b"Accept-Encoding"),
             ],
             trailers=False,
         ),
@@ -86,3 +97,90 @@ async def test_with_supported_compression(large_asgi_app: ASGI3Application, sett
             type="http.response.body", body=expected_payload, more_body=False
         ),
     ]
+
+
+async def test_large_response_compressed_in_thread_and_streamed(settings):
+    # given
+    payload = b"x" * (CHUNK_SIZE * 2 + 10)
+
+    async def large_app(scope, receive, send):
+        await send(
+            HTTPResponseStartEvent(
+                type="http.response.start",
+                status=200,
+                headers=[
+                    (b"content-length", str(len(payload)).encode("latin1")),
+                    (b"content-type", b"application/json"),
+                    (b"vary", b"Authorization"),
+                ],
+                trailers=False,
+            )
+        )
+        await send(
+            HTTPResponseBodyEvent(
+                type="http.response.body", body=payload, more_body=False
+            )
+        )
+
+    app = gzip_compression(large_app)
+
+    # when
+    with mock.patch(
+        "saleor.asgi.gzip_compression.asyncio.to_thread",
+        wraps=asyncio.to_thread,
+    ) as to_thread_mock:
+        events = await run_app(app, build_scope("http://localhost:3000", b"gzip"))
+
+    # then
+    # the last, short chunk is compressed on the event loop
+    assert to_thread_mock.call_count == 2
+    start, *body_events = events
+    assert start["headers"] == [
+        (b"content-type", b"application/json"),
+        (b"vary", b"Authorization, Accept-Encoding"),
+        (b"content-encoding", b"gzip"),
+    ]
+    assert all(event["more_body"] for event in body_events[:-1])
+    assert body_events[-1]["more_body"] is False
+    body = b"".join(event["body"] for event in body_events)
+    assert gzip.decompress(body) == payload
+
+
+async def test_streaming_response_compressed(settings):
+    # given
+    async def streaming_app(scope, receive, send):
+        await send(
+            HTTPResponseStartEvent(
+                type="http.response.start",
+                status=200,
+                headers=[(b"content-type", b"text/plain")],
+                trailers=False,
+            )
+        )
+        for _ in range(3):
+            await send(
+                HTTPResponseBodyEvent(
+                    type="http.response.body", body=b"y" * 1000, more_body=True
+                )
+            )
+        await send(
+            HTTPResponseBodyEvent(type="http.response.body", body=b"", more_body=False)
+        )
+
+    app = gzip_compression(streaming_app)
+
+    # when
+    events = await run_app(app, build_scope("http://localhost:3000", b"gzip, br;q=0"))
+
+    # then
+    assert (b"content-encoding", b"gzip") in events[0]["headers"]
+    assert (b"vary", b"Accept-Encoding") in events[0]["headers"]
+    assert events[-1]["more_body"] is False
+    body = b"".join(event["body"] for event in events[1:])
+    assert gzip.decompress(body) == b"y" * 3000
+
+
+def test_negotiate_compressor_skips_rejected_encodings():
+    assert negotiate_compressor(b"gzip;q=0, deflate") is None
+    assert negotiate_compressor(b"deflate, GZIP;q=0.5") is GzipCompressor
+    assert negotiate_compressor(b"identity") is None
@@ -871,11 +871,28 @@ def _create_order(
 
     update_order_charge_data(order, with_save=False)
     update_order_authorize_data(order, with_save=False)
-    order.search_vector = FlatConcatSearchVector(
-        *prepare_order_search_vector_value(order)
-    )
+    if settings.ORDER_SEARCH_INDEX_DEFERRED or (
+        settings.CHECKOUT_COMPLETE_DEFER_ORDER_ACTIONS
+    ):
+        order.search_index_dirty = True
+    else:
+        order.search_vector = FlatConcatSearchVector(
+            *prepare_order_search_vector_value(order)
+        )
+    if settings.CHECKOUT_COMPLETE_DEFER_ORDER_ACTIONS:
+        # cleared by `order_created_actions_task` once the actions are processed
+        order.post_create_actions_pending = True
     order.save()
 
+    if settings.CHECKOUT_COMPLETE_DEFER_ORDER_ACTIONS:
+        _defer_post_create_order_actions(
+            order=order,
+            user=user,
+            app=app,
+            is_automatic_completion=is_automatic_completion,
+        )
+        return order
+
     order_info = OrderInfo(
         order=order,
         customer_email=order_data["user_email"],
@@ -1367,6 +1384,32 @@ def _post_create_order_actions(
     )
 
 
+def _defer_post_create_order_actions(
+    order: "Order",
+    user: User | None,
+    app: Optional["App"],
+    is_automatic_completion: bool,
+):
+    """Schedule the order post-create actions to be processed by a worker.
+
+    The task is enqueued only when the order transaction is committed, so the
+    actions are never triggered for an order that was rolled back.
+    """
+    from ..order.tasks import order_created_actions_task
+
+    order_id = order.pk
+    user_id = user.pk if user else None
+    app_id = app.pk if app else None
+    transaction.on_commit(
+        lambda: order_created_actions_task.delay(
+            order_id=order_id,
+            user_id=user_id,
+            app_id=app_id,
+            automatic=is_automatic_completion,
+        )
+    )
+
+
 def _create_order_from_checkout(
     checkout_info: CheckoutInfo,
     checkout_lines_info: list[CheckoutLineInfo],
@@ -1542,11 +1585,28 @@ def _create_order_from_checkout(
     update_order_display_gross_prices(order)
 
     # order search
-    order.search_vector = FlatConcatSearchVector(
-        *prepare_order_search_vector_value(order)
-    )
+    if settings.ORDER_SEARCH_INDEX_DEFERRED or (
+        settings.CHECKOUT_COMPLETE_DEFER_ORDER_ACTIONS
+    ):
+        order.search_index_dirty = True
+    else:
+        order.search_vector = FlatConcatSearchVector(
+            *prepare_order_search_vector_value(order)
+        )
+    if settings.CHECKOUT_COMPLETE_DEFER_ORDER_ACTIONS:
+        # cleared by `order_created_actions_task` once the actions are processed
+        order.post_create_actions_pending = True
     order.save()
 
+    if settings.CHECKOUT_COMPLETE_DEFER_ORDER_ACTIONS:
+        _defer_post_create_order_actions(
+            order=order,
+            user=user,
+            app=app,
+            is_automatic_completion=is_automatic_completion,
+        )
+        return order
+
     # post create actions
     _post_create_order_actions(
         order=order,
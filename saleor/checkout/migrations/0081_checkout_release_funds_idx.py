@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-19 12:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("checkout", "0080_merge_20250527_1210"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="checkout",
+            index=models.Index(
+                condition=models.Q(("automatically_refundable", True)),
+                fields=["last_change"],
+                name="checkout_release_funds_idx",
+            ),
+        ),
+    ]
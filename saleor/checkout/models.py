@@ -232,6 +232,14 @@ class Checkout(models.Model):
             (CheckoutPermissions.HANDLE_TAXES.codename, "Handle taxes"),
             (CheckoutPermissions.MANAGE_TAXES.codename, "Manage taxes"),
         )
+        indexes = [
+            # Checkouts waiting for releasing funds of their transactions.
+            models.Index(
+                fields=["last_change"],
+                name="checkout_release_funds_idx",
+                condition=models.Q(automatically_refundable=True),
+            ),
+        ]
 
     def __iter__(self):
         return iter(self.lines.all())
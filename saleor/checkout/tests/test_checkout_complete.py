@@ -208,6 +208,103 @@ def test_create_order_captured_payment_creates_expected_events(
     assert not placement_event.parameters  # should not have any additional parameters
 
 
+@override_settings(ORDER_SEARCH_INDEX_DEFERRED=True)
+def test_create_order_search_index_deferred(
+    checkout_with_item,
+    customer_user,
+    shipping_method,
+    payment_txn_captured,
+):
+    # given
+    checkout = checkout_with_item
+    checkout.user = customer_user
+    checkout.billing_address = customer_user.default_billing_address
+    checkout.shipping_address = customer_user.default_shipping_address
+    checkout.shipping_method = shipping_method
+    checkout.payments.add(payment_txn_captured)
+    checkout.save()
+
+    manager = get_plugins_manager(allow_replica=False)
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, manager)
+
+    # when
+    order = _create_order(
+        checkout_info=checkout_info,
+        checkout_lines=lines,
+        order_data=_prepare_order_data(
+            manager=manager,
+            checkout_info=checkout_info,
+            lines=lines,
+            prices_entered_with_tax=True,
+        ),
+        user=customer_user,
+        app=None,
+        manager=manager,
+    )
+
+    # then
+    order.refresh_from_db()
+    assert order.search_index_dirty is True
+    assert not order.search_vector
+
+
+@override_settings(CHECKOUT_COMPLETE_DEFER_ORDER_ACTIONS=True)
+@mock.patch("saleor.order.tasks.order_created_actions_task.delay")
+@mock.patch("saleor.checkout.complete_checkout.order_created")
+def test_create_order_defer_order_actions(
+    mocked_order_created,
+    mocked_order_created_actions_task,
+    checkout_with_item,
+    customer_user,
+    shipping_method,
+    payment_txn_captured,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    checkout = checkout_with_item
+    checkout.user = customer_user
+    checkout.billing_address = customer_user.default_billing_address
+    checkout.shipping_address = customer_user.default_shipping_address
+    checkout.shipping_method = shipping_method
+    checkout.payments.add(payment_txn_captured)
+    checkout.save()
+
+    manager = get_plugins_manager(allow_replica=False)
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, manager)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        order = _create_order(
+            checkout_info=checkout_info,
+            checkout_lines=lines,
+            order_data=_prepare_order_data(
+                manager=manager,
+                checkout_info=checkout_info,
+                lines=lines,
+                prices_entered_with_tax=True,
+            ),
+            user=customer_user,
+            app=None,
+            manager=manager,
+        )
+
+    # then
+    assert order.lines.exists()
+    assert order.search_index_dirty is True
+    assert order.post_create_actions_pending is True
+    assert not order.search_vector
+    assert not order.events.exists()
+    mocked_order_created.assert_not_called()
+    mocked_order_created_actions_task.assert_called_once_with(
+        order_id=order.pk,
+        user_id=customer_user.pk,
+        app_id=None,
+        automatic=False,
+    )
+
+
 @mock.patch("saleor.plugins.manager.PluginsManager.notify")
 def test_create_order_captured_payment_creates_expected_events_anonymous_user(
     mock_notify,
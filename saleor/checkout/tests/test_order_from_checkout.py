@@ -1074,3 +1074,50 @@ def test_create_order_from_checkout_update_tax_error(
     assert not Order.objects.exists()
     assert "Tax app error for checkout" in caplog.text
     assert caplog.records[0].checkout_id == to_global_id_or_none(checkout)
+
+
+@override_settings(CHECKOUT_COMPLETE_DEFER_ORDER_ACTIONS=True)
+@patch("saleor.order.tasks.order_created_actions_task.delay")
+@patch("saleor.checkout.complete_checkout.order_created")
+def test_create_order_from_checkout_defer_order_actions(
+    mocked_order_created,
+    mocked_order_created_actions_task,
+    checkout_with_item,
+    customer_user,
+    shipping_method,
+    app,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    checkout = checkout_with_item
+    checkout.billing_address = customer_user.default_billing_address
+    checkout.shipping_address = customer_user.default_billing_address
+    checkout.shipping_method = shipping_method
+    checkout.save()
+
+    manager = get_plugins_manager(allow_replica=False)
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, manager)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        order = create_order_from_checkout(
+            checkout_info=checkout_info,
+            manager=manager,
+            user=customer_user,
+            app=app,
+        )
+
+    # then
+    assert order.lines.exists()
+    assert order.search_index_dirty is True
+    assert order.post_create_actions_pending is True
+    assert not order.search_vector
+    assert not order.events.exists()
+    mocked_order_created.assert_not_called()
+    mocked_order_created_actions_task.assert_called_once_with(
+        order_id=order.pk,
+        user_id=customer_user.pk,
+        app_id=app.pk,
+        automatic=False,
+    )
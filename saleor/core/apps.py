@@ -17,6 +17,26 @@ class CoreAppConfig(AppConfig):
         if settings.SENTRY_DSN:
             settings.SENTRY_INIT(settings.SENTRY_DSN, settings.SENTRY_OPTS)
         self.validate_jwt_manager()
+        self.connect_reference_data_signals()
+        self.connect_auth_cache_signals()
+        self.connect_transaction_amount_snapshot_signals()
+
+    def connect_reference_data_signals(self) -> None:
+        from .reference_data_cache import connect_reference_data_signals
+
+        connect_reference_data_signals()
+
+    def connect_auth_cache_signals(self) -> None:
+        from .auth_cache import connect_auth_cache_signals
+
+        connect_auth_cache_signals()
+
+    def connect_transaction_amount_snapshot_signals(self) -> None:
+        from ..payment.transaction_item_calculations import (
+            connect_transaction_amount_snapshot_signals,
+        )
+
+        connect_transaction_amount_snapshot_signals()
 
     def validate_jwt_manager(self) -> None:
         jwt_manager_path = getattr(settings, "JWT_MANAGER_PATH", None)
@@ -10,6 +10,12 @@ from ..permission.enums import (
 )
 from ..plugins.manager import get_plugins_manager
 from .auth import get_token_from_request
+from .auth_cache import (
+    get_cached_user,
+    get_user_snapshot_key,
+    is_auth_cache_enabled,
+    set_cached_user,
+)
 from .jwt import (
     JWT_ACCESS_TYPE,
     JWT_THIRDPARTY_ACCESS_TYPE,
@@ -73,9 +79,7 @@ class JSONWebTokenBackend(BaseBackend):
         perm_cache_name = "_effective_permissions_cache"
         if not getattr(user_obj, perm_cache_name, None):
             perms = getattr(self, f"_get_{from_name}_permissions")(user_obj)
-            perms = perms.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-            perms = perms.values_list("content_type__app_label", "codename").order_by()
-            setattr(user_obj, perm_cache_name, {f"{ct}.{name}" for ct, name in perms})
+            setattr(user_obj, perm_cache_name, get_permission_names(perms))
         return getattr(user_obj, perm_cache_name)
 
     # Moved from `django.contrib.auth.backends.ModelBackend`
@@ -119,6 +123,34 @@ class PluginBackend(JSONWebTokenBackend):
         return manager.authenticate_user(request)
 
 
+def get_permission_names(permissions) -> set[str]:
+    permissions = permissions.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+    permissions = permissions.values_list(
+        "content_type__app_label", "codename"
+    ).order_by()
+    return {f"{ct}.{name}" for ct, name in permissions}
+
+
+def _load_user(request, payload):
+    user_loader = UserByEmailLoader(request)
+    snapshot_key = get_user_snapshot_key(payload) if is_auth_cache_enabled() else None
+    if snapshot_key is not None:
+        user = get_cached_user(snapshot_key)
+        if user is not None:
+            user_loader.prime(payload["email"], user)
+            return user
+
+    user = user_loader.load(payload["email"]).get()
+    if snapshot_key and user and user.jwt_token_key == payload.get("token"):
+        permissions = None
+        # permissions of staff users are checked on nearly every request
+        if user.is_staff:
+            permissions = get_permission_names(user.effective_permissions)
+            user._effective_permissions_cache = permissions
+        set_cached_user(snapshot_key, user, permissions)
+    return user
+
+
 def load_user_from_request(request):
     if request is None:
         return None
@@ -134,7 +166,7 @@ def load_user_from_request(request):
         )
     permissions = payload.get(PERMISSIONS_FIELD, None)
 
-    user = UserByEmailLoader(request).load(payload["email"]).get()
+    user = _load_user(request, payload)
     user_jwt_token = payload.get("token")
     if not user_jwt_token:
         raise jwt.InvalidTokenError(
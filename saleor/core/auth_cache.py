@@ -0,0 +1,255 @@
+"""Short-lived caches of JWT authentication.
+
+Every request of a staff user or a customer verifies the token signature, loads
+the user by email and, for permission checks, queries the user's permissions.
+Dashboard pages send dozens of requests with the same token, repeating the same
+work.
+
+Verified claims are cached in process under a digest of the token, no longer
+than until the token expires. Users are cached in process together with their
+permissions, under the user ID, the `jwt_token_key` from the token and two
+versions kept in the shared Django cache: one per user, changed whenever the
+user or the user's groups and permissions change, and one for all permission
+groups. Changing a version makes every process ignore its cached snapshots.
+Versions are random, so a version evicted from the shared cache never matches an
+old snapshot. Changes that bypass model signals (e.g. `QuerySet.update`) are
+picked up after `AUTH_CACHE_TIMEOUT`.
+"""
+
+import copy
+import threading
+import time
+import uuid
+from typing import Any
+
+import graphene
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.utils.crypto import salted_hmac
+
+from ..account.models import Group, User
+from .utils.cache import CacheDict
+
+AUTH_CACHE_LOCAL_SIZE = 10000
+USER_VERSION_CACHE_KEY_PREFIX = "auth_user_version:"
+PERMISSION_GROUPS_VERSION_CACHE_KEY = "auth_permission_groups_version"
+
+# JSON fields of the user, copied together with the user as they are mutable.
+USER_JSON_FIELDS = ("metadata", "private_metadata")
+
+# Attributes set on the user while handling a request, never cached.
+PER_REQUEST_USER_ATTRIBUTES = (
+    "_effective_permissions_cache",
+    "_perm_cache",
+)
+
+
+class LocalExpiringCache:
+    def __init__(self, capacity: int):
+        self._entries: CacheDict = CacheDict(capacity)
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key, value, expires_at: float):
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+jwt_claims_cache = LocalExpiringCache(AUTH_CACHE_LOCAL_SIZE)
+user_snapshot_cache = LocalExpiringCache(AUTH_CACHE_LOCAL_SIZE)
+
+
+def is_auth_cache_enabled() -> bool:
+    return settings.AUTH_CACHE_ENABLED
+
+
+def get_token_digest(token: str) -> str:
+    """Return a keyed HMAC of the token, safe to be used as a cache key."""
+    return salted_hmac("saleor.core.auth_cache", token, algorithm="sha256").hexdigest()
+
+
+def get_cached_jwt_claims(
+    token: str, verify_expiration: bool, verify_aud: bool
+) -> dict[str, Any] | None:
+    claims = jwt_claims_cache.get(
+        (get_token_digest(token), verify_expiration, verify_aud)
+    )
+    return dict(claims) if claims is not None else None
+
+
+def set_cached_jwt_claims(
+    token: str, verify_expiration: bool, verify_aud: bool, claims: dict[str, Any]
+):
+    expires_at = time.time() + settings.AUTH_CACHE_TIMEOUT
+    if verify_expiration and isinstance(claims.get("exp"), int | float):
+        expires_at = min(expires_at, claims["exp"])
+    jwt_claims_cache.set(
+        (get_token_digest(token), verify_expiration, verify_aud),
+        dict(claims),
+        expires_at,
+    )
+
+
+def _get_user_version_key(user_id: int) -> str:
+    return f"{USER_VERSION_CACHE_KEY_PREFIX}{user_id}"
+
+
+def get_auth_versions(user_id: int) -> tuple[str, str]:
+    """Return the version of the user and the version of all permission groups."""
+    user_key = _get_user_version_key(user_id)
+    keys = [user_key, PERMISSION_GROUPS_VERSION_CACHE_KEY]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, uuid.uuid4().hex, timeout=None)
+            versions[key] = cache.get(key)
+    return versions[user_key], versions[PERMISSION_GROUPS_VERSION_CACHE_KEY]
+
+
+def get_user_id_from_claims(claims: dict[str, Any]) -> int | None:
+    global_id = claims.get("user_id")
+    if not global_id:
+        return None
+    try:
+        _, user_id = graphene.Node.from_global_id(global_id)
+        return int(user_id)
+    except (TypeError, ValueError):
+        return None
+
+
+def get_user_snapshot_key(claims: dict[str, Any]) -> tuple | None:
+    """Return the key of the user snapshot, to be read before loading the user.
+
+    A user loaded from the database after the key was read may be older than the
+    versions in the key only if it was changed meanwhile, which bumps the versions
+    again.
+    """
+    user_id = get_user_id_from_claims(claims)
+    if user_id is None:
+        return None
+    user_version, groups_version = get_auth_versions(user_id)
+    return (
+        user_id,
+        claims.get("email"),
+        claims.get("token"),
+        user_version,
+        groups_version,
+    )
+
+
+def _copy_user(user: User) -> User:
+    """Return a copy of the user that doesn't share the JSON fields with it."""
+    user = copy.copy(user)
+    for field_name in USER_JSON_FIELDS:
+        if field_name in user.__dict__:
+            setattr(user, field_name, copy.deepcopy(getattr(user, field_name)))
+    return user
+
+
+def get_cached_user(key: tuple) -> User | None:
+    """Return a copy of the cached user."""
+    snapshot = user_snapshot_cache.get(key)
+    if snapshot is None:
+        return None
+    user, permissions = snapshot
+    user = _copy_user(user)
+    if permissions is not None:
+        user._effective_permissions_cache = set(permissions)
+    return user
+
+
+def set_cached_user(key: tuple, user: User, permissions: set[str] | None = None):
+    """Cache the user loaded for the token, before any per-token changes."""
+    if key[0] != user.pk:
+        return
+    user = _copy_user(user)
+    for attr in PER_REQUEST_USER_ATTRIBUTES:
+        user.__dict__.pop(attr, None)
+    # Reset rather than remove, as copies don't run `User.__init__` that sets it.
+    user._effective_permissions = None
+    user_snapshot_cache.set(
+        key,
+        (user, frozenset(permissions) if permissions is not None else None),
+        time.time() + settings.AUTH_CACHE_TIMEOUT,
+    )
+
+
+def _bump_version(key: str):
+    cache.set(key, uuid.uuid4().hex, timeout=None)
+
+
+def bump_user_version(user_id: int):
+    transaction.on_commit(lambda: _bump_version(_get_user_version_key(user_id)))
+
+
+def bump_permission_groups_version():
+    transaction.on_commit(lambda: _bump_version(PERMISSION_GROUPS_VERSION_CACHE_KEY))
+
+
+def invalidate_user(instance, **_kwargs):
+    bump_user_version(instance.pk)
+
+
+def invalidate_user_m2m(instance, action, reverse, pk_set, **_kwargs):
+    if not action.startswith("post_"):
+        return
+    if reverse:
+        # group.user_set or permission.user_set was changed
+        if pk_set:
+            for user_id in pk_set:
+                bump_user_version(user_id)
+        else:
+            bump_permission_groups_version()
+    else:
+        bump_user_version(instance.pk)
+
+
+def invalidate_permission_groups(**_kwargs):
+    bump_permission_groups_version()
+
+
+def connect_auth_cache_signals():
+    post_save.connect(
+        invalidate_user, sender=User, dispatch_uid="auth_cache_invalidate_user"
+    )
+    post_delete.connect(
+        invalidate_user, sender=User, dispatch_uid="auth_cache_invalidate_user_delete"
+    )
+    for through in (User.groups.through, User.user_permissions.through):
+        m2m_changed.connect(
+            invalidate_user_m2m,
+            sender=through,
+            dispatch_uid=f"auth_cache_invalidate_{through._meta.label}",
+        )
+    post_save.connect(
+        invalidate_permission_groups,
+        sender=Group,
+        dispatch_uid="auth_cache_invalidate_group",
+    )
+    post_delete.connect(
+        invalidate_permission_groups,
+        sender=Group,
+        dispatch_uid="auth_cache_invalidate_group_delete",
+    )
+    for through in (Group.permissions.through, Group.channels.through):
+        m2m_changed.connect(
+            invalidate_permission_groups,
+            sender=through,
+            dispatch_uid=f"auth_cache_invalidate_{through._meta.label}",
+        )
@@ -14,6 +14,11 @@ from ..permission.enums import (
     get_permissions_from_names,
 )
 from ..permission.models import Permission
+from .auth_cache import (
+    get_cached_jwt_claims,
+    is_auth_cache_enabled,
+    set_cached_jwt_claims,
+)
 from .jwt_manager import get_jwt_manager
 
 JWT_ACCESS_TYPE = "access"
@@ -82,8 +87,16 @@ def jwt_decode_with_exception_handler(
 def jwt_decode(
     token: str, verify_expiration=settings.JWT_EXPIRE, verify_aud: bool = False
 ) -> dict[str, Any]:
+    cache_enabled = is_auth_cache_enabled()
+    if cache_enabled:
+        claims = get_cached_jwt_claims(token, verify_expiration, verify_aud)
+        if claims is not None:
+            return claims
     jwt_manager = get_jwt_manager()
-    return jwt_manager.decode(token, verify_expiration, verify_aud=verify_aud)
+    claims = jwt_manager.decode(token, verify_expiration, verify_aud=verify_aud)
+    if cache_enabled:
+        set_cached_jwt_claims(token, verify_expiration, verify_aud, claims)
+    return claims
 
 
 def create_token(payload: dict[str, Any], exp_delta: datetime.timedelta) -> str:
@@ -0,0 +1,76 @@
+import json
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+
+# Executed in a fresh interpreter so nothing is imported or cached upfront.
+COLD_START_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import django
+
+django.setup()
+timings = {"django_setup": time.perf_counter() - start}
+
+if sys.argv[1] == "1":
+    from saleor.core.warmup import warm_up_app
+
+    timings.update(warm_up_app())
+
+start = time.perf_counter()
+from saleor.graphql.api import backend, schema
+
+backend.document_from_string(schema, "query { shop { name } channels { slug } }")
+timings["first_operation"] = time.perf_counter() - start
+print(json.dumps(timings))
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the start-up time of a worker process, split into warm-up "
+        "phases, and the time of parsing and validating the first operation."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--runs",
+            type=int,
+            default=5,
+            help="Number of fresh processes to start.",
+        )
+        parser.add_argument(
+            "--no-warmup",
+            action="store_true",
+            help="Skip the warm-up, to compare against the lazy start.",
+        )
+
+    def handle(self, *args, **options):
+        warmup = "0" if options["no_warmup"] else "1"
+        results: defaultdict[str, list[float]] = defaultdict(list)
+        for _ in range(options["runs"]):
+            output = subprocess.run(
+                [sys.executable, "-c", COLD_START_SCRIPT, warmup],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+            # logging may write to stdout before the timings
+            timings = json.loads(output.strip().splitlines()[-1])
+            for phase, duration in timings.items():
+                results[phase].append(duration)
+
+        self.stdout.write(f"{'phase':<32}{'min':>10}{'median':>10}{'max':>10}")
+        for phase, durations in results.items():
+            self.stdout.write(
+                f"{phase:<32}"
+                f"{min(durations):>10.3f}"
+                f"{statistics.median(durations):>10.3f}"
+                f"{max(durations):>10.3f}"
+            )
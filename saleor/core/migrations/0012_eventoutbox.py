@@ -0,0 +1,50 @@
+# Generated by Django 5.2 on 2026-10-19 10:00
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0011_eventpayload_payload_file"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventOutbox",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("event_type", models.CharField(max_length=255)),
+                ("model_name", models.CharField(max_length=255)),
+                ("object_id", models.CharField(max_length=255)),
+                (
+                    "requestor_model_name",
+                    models.CharField(max_length=255, null=True),
+                ),
+                (
+                    "requestor_object_id",
+                    models.CharField(max_length=255, null=True),
+                ),
+                ("request_time", models.DateTimeField(null=True)),
+                (
+                    "webhook_ids",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.IntegerField(), size=None
+                    ),
+                ),
+                ("queue", models.CharField(max_length=255, null=True)),
+            ],
+            options={
+                "ordering": ("pk",),
+            },
+        ),
+    ]
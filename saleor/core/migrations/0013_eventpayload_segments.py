@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0012_eventoutbox"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="eventpayload",
+            name="payload_length",
+            field=models.PositiveIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name="eventpayload",
+            name="payload_offset",
+            field=models.PositiveIntegerField(null=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-19 18:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0013_eventpayload_segments"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="eventoutbox",
+            name="attempts",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -2,14 +2,17 @@ import datetime
 from collections.abc import Iterable
 from typing import Any, TypeVar
 
+from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
 from django.contrib.postgres.indexes import GinIndex, PostgresIndex
 from django.core.files.base import ContentFile
-from django.db import models, transaction
+from django.db import connections, models, transaction
 from django.db.models import F, JSONField, Max, Q
 from django.utils.crypto import get_random_string
 from storages.utils import safe_join
 
 from . import EventDeliveryStatus, JobStatus, private_storage
+from .payload_storage import pack_payloads, read_packed_payload
 from .utils.json_serializer import CustomJsonEncoder
 
 
@@ -150,9 +153,15 @@ class Job(models.Model):
         abstract = True
 
 
+# Namespace of the advisory locks taken on payload files.
+PAYLOAD_FILES_LOCK_ID = 1001
+
+
 class EventPayloadManager(models.Manager["EventPayload"]):
     @transaction.atomic
     def create_with_payload_file(self, payload: str) -> "EventPayload":
+        if settings.EVENT_PAYLOAD_SEGMENTS_ENABLED:
+            return self.bulk_create_with_payload_files([self.model()], [payload])[0]
         obj = super().create()
         obj.save_payload_file(payload)
         return obj
@@ -162,11 +171,63 @@ class EventPayloadManager(models.Manager["EventPayload"]):
         self, objs: Iterable["EventPayload"], payloads=Iterable[str]
     ) -> list["EventPayload"]:
         created_objs = self.bulk_create(objs)
+        if settings.EVENT_PAYLOAD_SEGMENTS_ENABLED:
+            self._save_payload_segments(created_objs, payloads)
+            self.bulk_update(
+                created_objs, ["payload_file", "payload_offset", "payload_length"]
+            )
+            return created_objs
         for obj, payload_data in zip(created_objs, payloads, strict=False):
             obj.save_payload_file(payload_data, save_instance=False)
         self.bulk_update(created_objs, ["payload_file"])
         return created_objs
 
+    def _save_payload_segments(
+        self, objs: list["EventPayload"], payloads: Iterable[str]
+    ):
+        segments, locations = pack_payloads(
+            payloads, settings.EVENT_PAYLOAD_SEGMENT_MAX_SIZE
+        )
+        prefix = safe_join(self.model.PAYLOADS_DIR, get_random_string(length=12))
+        segment_names = [
+            private_storage.save(
+                safe_join(prefix, f"{objs[0].pk}-{index}.seg"), ContentFile(segment)
+            )
+            for index, segment in enumerate(segments)
+        ]
+        for obj, (segment_index, offset, length) in zip(objs, locations, strict=False):
+            obj.payload_file = segment_names[segment_index]
+            obj.payload_offset = offset
+            obj.payload_length = length
+
+    def lock_files(self, paths: Iterable[str]):
+        """Lock the payload files until the end of the current transaction.
+
+        Call it before deleting payloads, so deletions of payloads sharing a segment
+        file are serialized. The `get_referenced_files` check of a deletion then sees
+        the concurrent deletions committed, and the last deletion removes the file.
+        """
+        paths = sorted(set(paths))
+        if not paths:
+            return
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock(%s, hashtext(path)) "
+                "FROM unnest(%s::text[]) WITH ORDINALITY AS t(path, position) "
+                "ORDER BY position",
+                [PAYLOAD_FILES_LOCK_ID, paths],
+            )
+
+    def get_referenced_files(self, paths: Iterable[str]) -> set[str]:
+        """Return the paths that are still used by any payload.
+
+        Segment files are shared by all payloads of a batch and can be deleted only
+        together with the last of them.
+        """
+        return set(
+            self.filter(payload_file__in=paths).values_list("payload_file", flat=True)
+        )
+
 
 class EventPayload(models.Model):
     PAYLOADS_DIR = "payloads"
@@ -175,12 +236,19 @@ class EventPayload(models.Model):
     payload_file = models.FileField(
         storage=private_storage, upload_to=PAYLOADS_DIR, null=True
     )
+    # Set when the payload is compressed and packed in a segment file.
+    payload_offset = models.PositiveIntegerField(null=True)
+    payload_length = models.PositiveIntegerField(null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     objects = EventPayloadManager()
 
     # TODO (PE-568): change typing of return payload to `bytes` to avoid unnecessary decoding.
     def get_payload(self):
+        if self.payload_file and self.payload_offset is not None:
+            return read_packed_payload(
+                self.payload_file.name, self.payload_offset, self.payload_length
+            )
         if self.payload_file:
             with self.payload_file.open("rb") as f:
                 payload_data = f.read()
@@ -220,6 +288,31 @@ class EventDelivery(models.Model):
         ordering = ("-created_at",)
 
 
+class EventOutbox(models.Model):
+    """Intent of triggering async subscription webhooks for a single object.
+
+    Records are created in the same transaction as the change that caused the
+    event, so they are discarded on rollback. Payloads and deliveries are created
+    later, in bulk, by the outbox relay task.
+    """
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    event_type = models.CharField(max_length=255)
+    model_name = models.CharField(max_length=255)
+    object_id = models.CharField(max_length=255)
+    requestor_model_name = models.CharField(max_length=255, null=True)
+    requestor_object_id = models.CharField(max_length=255, null=True)
+    request_time = models.DateTimeField(null=True)
+    webhook_ids = ArrayField(models.IntegerField())
+    queue = models.CharField(max_length=255, null=True)
+    # the number of failed relay attempts; records that reached
+    # `WEBHOOK_EVENT_OUTBOX_MAX_ATTEMPTS` are kept for inspection and skipped
+    attempts = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ("pk",)
+
+
 class EventDeliveryAttempt(models.Model):
     delivery = models.ForeignKey(
         EventDelivery, related_name="attempts", null=True, on_delete=models.CASCADE
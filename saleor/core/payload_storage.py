@@ -0,0 +1,69 @@
+"""Packed storage of event payloads.
+
+Payloads created in one batch are compressed one by one and written together
+to segment files in the private storage. Each payload points at its part of a
+segment by offset and length, and identical payloads of a batch point at the
+same part. Segments are never referenced by payloads of other batches, so a
+segment can be deleted as soon as none of the payloads of its batch exist.
+"""
+
+import hashlib
+import zlib
+from collections.abc import Iterable
+from functools import lru_cache
+
+from django.core.files.storage import Storage
+
+from . import private_storage
+
+# The number of recently read payloads kept in memory, e.g. when the same
+# payload is delivered to multiple webhooks.
+PACKED_PAYLOAD_READ_CACHE_SIZE = 32
+
+# (segment index, offset, length)
+PayloadLocation = tuple[int, int, int]
+
+
+def pack_payloads(
+    payloads: Iterable[str], max_segment_size: int
+) -> tuple[list[bytes], list[PayloadLocation]]:
+    """Compress payloads into segments.
+
+    Return contents of the segments and the location of each payload. A segment
+    exceeds `max_segment_size` only if it holds a single payload.
+    """
+    segments: list[bytearray] = []
+    locations: list[PayloadLocation] = []
+    packed: dict[bytes, PayloadLocation] = {}
+    for payload in payloads:
+        payload_bytes = payload.encode("utf-8")
+        digest = hashlib.sha256(payload_bytes).digest()
+        location = packed.get(digest)
+        if location is None:
+            compressed = zlib.compress(payload_bytes)
+            if not segments or (
+                segments[-1] and len(segments[-1]) + len(compressed) > max_segment_size
+            ):
+                segments.append(bytearray())
+            segment = segments[-1]
+            location = (len(segments) - 1, len(segment), len(compressed))
+            segment += compressed
+            packed[digest] = location
+        locations.append(location)
+    return [bytes(segment) for segment in segments], locations
+
+
+def read_range(storage: Storage, name: str, offset: int, length: int) -> bytes:
+    """Read a part of the file, with a ranged request if the storage supports it."""
+    if read := getattr(storage, "read_range", None):
+        return read(name, offset, length)
+    with storage.open(name, "rb") as f:
+        f.seek(offset)
+        return f.read(length)
+
+
+@lru_cache(maxsize=PACKED_PAYLOAD_READ_CACHE_SIZE)
+def read_packed_payload(name: str, offset: int, length: int) -> str:
+    # segment names are unique, so cached payloads never become stale
+    compressed = read_range(private_storage, name, offset, length)
+    return zlib.decompress(compressed).decode("utf-8")
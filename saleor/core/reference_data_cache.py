@@ -0,0 +1,183 @@
+"""Process-local cache for rarely changing reference data.
+
+Reference data (channels, tax configuration, warehouses, shipping zones,
+attributes, sites and menus) is read by almost every storefront request but
+changes only when staff or apps edit the configuration. Dataloaders that opt in
+keep loaded instances in a process-local LRU cache that outlives a single
+request.
+
+Entries are tagged with a generation number stored in the shared Django cache.
+Saving or deleting any of the reference models bumps the generation, which makes
+every process drop its local entries on the next lookup. Rows of related models
+(e.g. the warehouse address) bump it only when referenced by reference data.
+Entries also expire after `DATALOADER_REFERENCE_CACHE_TIMEOUT` seconds to bound
+staleness for writes that bypass model signals (e.g. `QuerySet.update`).
+"""
+
+import copy
+import threading
+import time
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+
+from .utils.cache import CacheDict
+
+REFERENCE_DATA_GENERATION_CACHE_KEY = "reference_data_generation"
+
+REFERENCE_DATA_MODELS = [
+    "channel.Channel",
+    "tax.TaxConfiguration",
+    "tax.TaxConfigurationPerCountry",
+    "tax.TaxClass",
+    "tax.TaxClassCountryRate",
+    "warehouse.Warehouse",
+    "warehouse.ChannelWarehouse",
+    "shipping.ShippingZone",
+    "attribute.Attribute",
+    "sites.Site",
+    "site.SiteSettings",
+    "menu.Menu",
+    "menu.MenuItem",
+]
+
+# Models that are a part of the reference data only when referenced by one of the
+# reference models, mapped to the referencing models and their foreign key fields.
+REFERENCE_DATA_RELATED_MODELS = {
+    "account.Address": [
+        ("warehouse.Warehouse", "address"),
+        ("site.SiteSettings", "company_address"),
+    ],
+}
+
+
+class ReferenceDataCache:
+    def __init__(self, capacity: int):
+        self._entries: CacheDict = CacheDict(capacity)
+        self._generation: int | None = None
+        self._lock = threading.Lock()
+
+    def _set_generation(self, generation: int):
+        if generation != self._generation:
+            self._entries.clear()
+            self._generation = generation
+
+    def get_many(self, generation: int, keys: Iterable[Hashable]) -> dict:
+        found = {}
+        now = time.monotonic()
+        with self._lock:
+            self._set_generation(generation)
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                value, expires_at = entry
+                if expires_at < now:
+                    del self._entries[key]
+                    continue
+                found[key] = _copy_value(value)
+        return found
+
+    def set(self, generation: int, key: Hashable, value: Any, timeout: float):
+        with self._lock:
+            self._set_generation(generation)
+            self._entries[key] = (_copy_value(value), time.monotonic() + timeout)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation = None
+
+
+def _copy_value(value: Any) -> Any:
+    """Return a copy safe to hand out to a single request.
+
+    Resolvers are allowed to annotate and modify model instances, including their
+    metadata and cached related objects, so the cache never shares any part of
+    the instance between requests.
+    """
+    return copy.deepcopy(value)
+
+
+reference_data_cache = ReferenceDataCache(
+    capacity=settings.DATALOADER_REFERENCE_CACHE_MAX_SIZE
+)
+
+
+def is_reference_data_cache_enabled() -> bool:
+    return settings.DATALOADER_REFERENCE_CACHE_ENABLED
+
+
+def get_reference_data_generation() -> int:
+    generation = cache.get(REFERENCE_DATA_GENERATION_CACHE_KEY)
+    if generation is None:
+        cache.add(REFERENCE_DATA_GENERATION_CACHE_KEY, 0, timeout=None)
+        generation = cache.get(REFERENCE_DATA_GENERATION_CACHE_KEY, 0)
+    return generation
+
+
+def bump_reference_data_generation():
+    try:
+        cache.incr(REFERENCE_DATA_GENERATION_CACHE_KEY)
+    except ValueError:
+        # the key does not exist yet or was evicted
+        cache.add(REFERENCE_DATA_GENERATION_CACHE_KEY, 1, timeout=None)
+    reference_data_cache.clear()
+
+
+def invalidate_reference_data_cache(**_kwargs):
+    """Invalidate cached reference data once the current transaction commits.
+
+    Bumping the generation before commit would let other processes cache the
+    old rows again before the new ones become visible.
+    """
+    transaction.on_commit(bump_reference_data_generation)
+
+
+def invalidate_reference_data_cache_for_related_model(sender, instance, **_kwargs):
+    """Invalidate cached reference data if the instance is referenced by it."""
+    if not is_reference_data_cache_enabled():
+        return
+    for model_label, field_name in REFERENCE_DATA_RELATED_MODELS[sender._meta.label]:
+        model = apps.get_model(model_label)
+        if model.objects.filter(**{f"{field_name}_id": instance.pk}).exists():
+            invalidate_reference_data_cache()
+            return
+
+
+def connect_reference_data_signals():
+    for model_label in REFERENCE_DATA_MODELS:
+        model = apps.get_model(model_label)
+        dispatch_uid = f"invalidate_reference_data_cache_{model_label}"
+        post_save.connect(
+            invalidate_reference_data_cache, sender=model, dispatch_uid=dispatch_uid
+        )
+        post_delete.connect(
+            invalidate_reference_data_cache, sender=model, dispatch_uid=dispatch_uid
+        )
+        for field in model._meta.local_many_to_many:
+            m2m_changed.connect(
+                invalidate_reference_data_cache,
+                sender=field.remote_field.through,
+                dispatch_uid=f"{dispatch_uid}_{field.name}",
+            )
+
+    for model_label in REFERENCE_DATA_RELATED_MODELS:
+        model = apps.get_model(model_label)
+        dispatch_uid = f"invalidate_reference_data_cache_{model_label}"
+        post_save.connect(
+            invalidate_reference_data_cache_for_related_model,
+            sender=model,
+            dispatch_uid=dispatch_uid,
+        )
+        # referencing rows are checked before they are removed with the instance
+        pre_delete.connect(
+            invalidate_reference_data_cache_for_related_model,
+            sender=model,
+            dispatch_uid=dispatch_uid,
+        )
@@ -2,6 +2,7 @@ from django.conf import settings
 from storages.backends.azure_storage import AzureStorage as AzureBaseStorage
 from storages.backends.gcloud import GoogleCloudStorage
 from storages.backends.s3boto3 import S3Boto3Storage
+from storages.utils import clean_name
 
 
 class S3MediaStorage(S3Boto3Storage):
@@ -17,6 +18,11 @@ class S3MediaPrivateStorage(S3Boto3Storage):
         self.custom_domain = None
         super().__init__(*args, **kwargs)
 
+    def read_range(self, name: str, offset: int, length: int) -> bytes:
+        obj = self.bucket.Object(self._normalize_name(clean_name(name)))
+        response = obj.get(Range=f"bytes={offset}-{offset + length - 1}")
+        return response["Body"].read()
+
 
 class GCSMediaStorage(GoogleCloudStorage):
     def __init__(self, *args, **kwargs):
@@ -31,6 +37,10 @@ class GCSMediaPrivateStorage(GoogleCloudStorage):
         self.custom_endpoint = None
         super().__init__(*args, **kwargs)
 
+    def read_range(self, name: str, offset: int, length: int) -> bytes:
+        blob = self.bucket.blob(self._normalize_name(clean_name(name)))
+        return blob.download_as_bytes(start=offset, end=offset + length - 1)
+
 
 class AzureStorage(AzureBaseStorage):
     def __init__(self, *args, **kwargs):
@@ -51,3 +61,7 @@ class AzureMediaPrivateStorage(AzureBaseStorage):
     def __init__(self, *args, **kwargs):
         self.azure_container = settings.AZURE_CONTAINER_PRIVATE
         super().__init__(*args, **kwargs)
+
+    def read_range(self, name: str, offset: int, length: int) -> bytes:
+        blob_client = self.client.get_blob_client(self._get_valid_path(name))
+        return blob_client.download_blob(offset=offset, length=length).readall()
@@ -4,7 +4,7 @@ from celery import Task
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.core.files.storage import default_storage
-from django.db import connections
+from django.db import connections, transaction
 from django.db.models import Exists, OuterRef
 from django.utils import timezone
 
@@ -79,14 +79,18 @@ def delete_event_payloads_task(expiration_date=None):
     if ids:
         if expiration_date > timezone.now():
             qs = EventPayload.objects.filter(pk__in=ids)
-            files_to_delete = [
+            files_to_delete = {
                 event_payload.payload_file.name
                 for event_payload in qs.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
                 if event_payload.payload_file
-            ]
-            with allow_writer():
+            }
+            with allow_writer(), transaction.atomic():
+                EventPayload.objects.lock_files(files_to_delete)
                 qs.delete()
-            delete_files_from_private_storage_task.delay(files_to_delete)
+                files_to_delete -= EventPayload.objects.get_referenced_files(
+                    files_to_delete
+                )
+            delete_files_from_private_storage_task.delay(list(files_to_delete))
             delete_event_payloads_task.delay(expiration_date)
         else:
             task_logger.error("Task invocation time limit reached, aborting task")
@@ -0,0 +1,193 @@
+from unittest import mock
+
+import jwt
+import pytest
+from django.core.cache import cache
+
+from ...account.models import Group
+from ..auth_backend import JSONWebTokenBackend
+from ..auth_cache import jwt_claims_cache, user_snapshot_cache
+from ..jwt import create_access_token, jwt_decode
+
+
+@pytest.fixture(autouse=True)
+def clear_auth_cache(settings):
+    settings.AUTH_CACHE_ENABLED = True
+    jwt_claims_cache.clear()
+    user_snapshot_cache.clear()
+    cache.clear()
+    yield
+    jwt_claims_cache.clear()
+    user_snapshot_cache.clear()
+
+
+def _authenticate(rf, token):
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {token}")
+    return JSONWebTokenBackend().authenticate(request)
+
+
+def test_jwt_decode_reuses_verified_claims(staff_user):
+    # given
+    token = create_access_token(staff_user)
+    payload = jwt_decode(token)
+
+    # when
+    with mock.patch("saleor.core.jwt.get_jwt_manager") as get_jwt_manager_mock:
+        cached_payload = jwt_decode(token)
+
+    # then
+    assert cached_payload == payload
+    get_jwt_manager_mock.assert_not_called()
+
+
+def test_jwt_decode_does_not_cache_invalid_tokens(staff_user):
+    # given
+    token = create_access_token(staff_user)
+
+    # when
+    with mock.patch("saleor.core.jwt.get_jwt_manager") as get_jwt_manager_mock:
+        get_jwt_manager_mock.return_value.decode.side_effect = jwt.InvalidTokenError
+        for _ in range(2):
+            with pytest.raises(jwt.InvalidTokenError):
+                jwt_decode(token)
+
+    # then
+    assert get_jwt_manager_mock.return_value.decode.call_count == 2
+
+
+def test_authenticate_reuses_user_and_permissions(
+    rf, staff_user, permission_manage_orders, django_assert_num_queries
+):
+    # given
+    staff_user.user_permissions.add(permission_manage_orders)
+    token = create_access_token(staff_user)
+    _authenticate(rf, token)
+
+    # when
+    with django_assert_num_queries(0):
+        user = _authenticate(rf, token)
+        has_perm = user.has_perm("order.manage_orders")
+
+    # then
+    assert user == staff_user
+    assert has_perm
+
+
+def test_authenticate_cached_user_effective_permissions(
+    rf, staff_user, permission_manage_orders
+):
+    # given
+    staff_user.user_permissions.add(permission_manage_orders)
+    token = create_access_token(staff_user)
+    _authenticate(rf, token).effective_permissions.count()
+
+    # when
+    user = _authenticate(rf, token)
+
+    # then
+    assert list(user.effective_permissions) == [permission_manage_orders]
+
+
+def test_authenticate_cached_superuser_has_perm(rf, superuser):
+    # given
+    token = create_access_token(superuser)
+    _authenticate(rf, token)
+
+    # when
+    user = _authenticate(rf, token)
+
+    # then
+    assert user.has_perm("order.manage_orders")
+    assert user.effective_permissions.exists()
+
+
+def test_authenticate_returns_copy_of_cached_user(rf, customer_user):
+    # given
+    token = create_access_token(customer_user)
+    user = _authenticate(rf, token)
+
+    # when
+    user.first_name = "Changed"
+
+    # then
+    assert _authenticate(rf, token).first_name == customer_user.first_name
+
+
+def test_authenticate_cached_user_doesnt_share_metadata(rf, customer_user):
+    # given
+    token = create_access_token(customer_user)
+    user = _authenticate(rf, token)
+
+    # when
+    user.metadata["key"] = "value"
+    user.private_metadata["key"] = "value"
+
+    # then
+    cached_user = _authenticate(rf, token)
+    assert "key" not in cached_user.metadata
+    assert "key" not in cached_user.private_metadata
+
+
+def test_cached_user_invalidated_on_deactivation(
+    rf, customer_user, django_capture_on_commit_callbacks
+):
+    # given
+    token = create_access_token(customer_user)
+    _authenticate(rf, token)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        customer_user.is_active = False
+        customer_user.save(update_fields=["is_active"])
+
+    # then
+    with pytest.raises(jwt.InvalidTokenError):
+        _authenticate(rf, token)
+
+
+def test_cached_permissions_invalidated_on_group_change(
+    rf, staff_user, permission_manage_orders, django_capture_on_commit_callbacks
+):
+    # given
+    group = Group.objects.create(name="Orders")
+    staff_user.groups.add(group)
+    token = create_access_token(staff_user)
+    assert not _authenticate(rf, token).has_perm("order.manage_orders")
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        group.permissions.add(permission_manage_orders)
+
+    # then
+    assert _authenticate(rf, token).has_perm("order.manage_orders")
+
+
+def test_cached_permissions_invalidated_on_group_membership_change(
+    rf, staff_user, permission_manage_orders, django_capture_on_commit_callbacks
+):
+    # given
+    group = Group.objects.create(name="Orders")
+    group.permissions.add(permission_manage_orders)
+    token = create_access_token(staff_user)
+    assert not _authenticate(rf, token).has_perm("order.manage_orders")
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        group.user_set.add(staff_user)
+
+    # then
+    assert _authenticate(rf, token).has_perm("order.manage_orders")
+
+
+def test_auth_cache_disabled(rf, customer_user, settings, django_assert_num_queries):
+    # given
+    settings.AUTH_CACHE_ENABLED = False
+    token = create_access_token(customer_user)
+    _authenticate(rf, token)
+
+    # when
+    with django_assert_num_queries(1):
+        user = _authenticate(rf, token)
+
+    # then
+    assert user == customer_user
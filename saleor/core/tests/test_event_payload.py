@@ -1,9 +1,10 @@
 import pytest
 from django.core.files.base import ContentFile
+from django.db import connection, transaction
 from django.utils.crypto import get_random_string
 from storages.utils import safe_join
 
-from ..models import EventPayload
+from ..models import PAYLOAD_FILES_LOCK_ID, EventPayload
 
 
 @pytest.fixture
@@ -37,3 +38,84 @@ def test_reading_event_payload_saved_as_string(payload_data):
 
     # then
     assert read_payload == payload_data
+
+
+def test_bulk_create_payloads_in_segment(payload_data, settings):
+    # given
+    settings.EVENT_PAYLOAD_SEGMENTS_ENABLED = True
+    payloads = [payload_data, '{"other": "payload"}', payload_data]
+
+    # when
+    created = EventPayload.objects.bulk_create_with_payload_files(
+        [EventPayload() for _ in payloads], payloads
+    )
+
+    # then
+    assert len({payload.payload_file.name for payload in created}) == 1
+    # identical payloads are stored once
+    assert created[0].payload_offset == created[2].payload_offset
+    assert created[0].payload_offset != created[1].payload_offset
+    for payload, payload_str in zip(
+        EventPayload.objects.filter(pk__in=[p.pk for p in created]).order_by("pk"),
+        payloads,
+        strict=True,
+    ):
+        assert payload.get_payload() == payload_str
+
+
+def test_bulk_create_payloads_splits_segments(settings):
+    # given
+    settings.EVENT_PAYLOAD_SEGMENTS_ENABLED = True
+    settings.EVENT_PAYLOAD_SEGMENT_MAX_SIZE = 1
+    payloads = ['{"id": 1}', '{"id": 2}']
+
+    # when
+    created = EventPayload.objects.bulk_create_with_payload_files(
+        [EventPayload() for _ in payloads], payloads
+    )
+
+    # then
+    assert created[0].payload_file.name != created[1].payload_file.name
+    assert [payload.get_payload() for payload in created] == payloads
+
+
+def test_segment_file_deleted_with_last_payload(payload_data, settings):
+    # given
+    settings.EVENT_PAYLOAD_SEGMENTS_ENABLED = True
+    first, second = EventPayload.objects.bulk_create_with_payload_files(
+        [EventPayload(), EventPayload()], [payload_data, payload_data]
+    )
+    segment = first.payload_file.name
+
+    # when
+    first.delete()
+    referenced_after_first = EventPayload.objects.get_referenced_files([segment])
+    second.delete()
+    referenced_after_second = EventPayload.objects.get_referenced_files([segment])
+
+    # then
+    assert referenced_after_first == {segment}
+    assert referenced_after_second == set()
+
+
+def test_lock_files_takes_advisory_locks(payload_data, settings):
+    # given
+    settings.EVENT_PAYLOAD_SEGMENTS_ENABLED = True
+    payloads = EventPayload.objects.bulk_create_with_payload_files(
+        [EventPayload()], [payload_data]
+    )
+    paths = [payloads[0].payload_file.name, "other.seg"]
+
+    # when
+    with transaction.atomic():
+        EventPayload.objects.lock_files(paths)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT count(*) FROM pg_locks WHERE locktype = 'advisory' "
+                "AND classid = %s AND pid = pg_backend_pid()",
+                [PAYLOAD_FILES_LOCK_ID],
+            )
+            (locks_count,) = cursor.fetchone()
+
+    # then
+    assert locks_count == len(paths)
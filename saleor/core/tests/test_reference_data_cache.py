@@ -0,0 +1,127 @@
+import pytest
+from django.core.cache import cache
+
+from ...graphql.channel.dataloaders import ChannelByIdLoader, ChannelByOrderIdLoader
+from ..reference_data_cache import (
+    REFERENCE_DATA_GENERATION_CACHE_KEY,
+    get_reference_data_generation,
+    reference_data_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_reference_data_cache(settings):
+    settings.DATALOADER_REFERENCE_CACHE_ENABLED = True
+    cache.delete(REFERENCE_DATA_GENERATION_CACHE_KEY)
+    reference_data_cache.clear()
+    yield
+    reference_data_cache.clear()
+
+
+def _load_channel(rf, channel_id, allow_replica=True):
+    context = rf.request()
+    context.allow_replica = allow_replica
+    return ChannelByIdLoader(context).load(channel_id).get()
+
+
+def test_reference_data_loader_reuses_values_between_requests(
+    rf, channel_USD, django_assert_num_queries
+):
+    # given
+    _load_channel(rf, channel_USD.pk)
+
+    # when
+    with django_assert_num_queries(0):
+        channel = _load_channel(rf, channel_USD.pk)
+
+    # then
+    assert channel == channel_USD
+    # each request gets its own instance
+    assert channel is not _load_channel(rf, channel_USD.pk)
+
+
+def test_reference_data_loader_invalidated_on_model_change(
+    rf, channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    _load_channel(rf, channel_USD.pk)
+    generation = get_reference_data_generation()
+
+    # when
+    channel_USD.name = "New name"
+    with django_capture_on_commit_callbacks(execute=True):
+        channel_USD.save(update_fields=["name"])
+
+    # then
+    assert get_reference_data_generation() == generation + 1
+    assert _load_channel(rf, channel_USD.pk).name == "New name"
+
+
+def test_reference_data_loader_skips_cache_for_writer_connection(
+    rf, channel_USD, django_assert_num_queries
+):
+    # given
+    _load_channel(rf, channel_USD.pk)
+
+    # when & then
+    with django_assert_num_queries(1):
+        _load_channel(rf, channel_USD.pk, allow_replica=False)
+
+
+def test_reference_data_loader_disabled(
+    rf, channel_USD, settings, django_assert_num_queries
+):
+    # given
+    settings.DATALOADER_REFERENCE_CACHE_ENABLED = False
+    _load_channel(rf, channel_USD.pk)
+
+    # when & then
+    with django_assert_num_queries(1):
+        _load_channel(rf, channel_USD.pk)
+
+
+def test_not_declared_loader_does_not_use_reference_data_cache():
+    assert ChannelByIdLoader.use_reference_data_cache is True
+    assert ChannelByOrderIdLoader.use_reference_data_cache is False
+
+
+def test_reference_data_loader_values_dont_share_metadata(rf, channel_USD):
+    # given
+    channel = _load_channel(rf, channel_USD.pk)
+
+    # when
+    channel.metadata["key"] = "value"
+
+    # then
+    assert "key" not in _load_channel(rf, channel_USD.pk).metadata
+
+
+def test_reference_data_cache_invalidated_on_warehouse_address_change(
+    warehouse, django_capture_on_commit_callbacks
+):
+    # given
+    generation = get_reference_data_generation()
+    address = warehouse.address
+
+    # when
+    address.city = "New city"
+    with django_capture_on_commit_callbacks(execute=True):
+        address.save(update_fields=["city"])
+
+    # then
+    assert get_reference_data_generation() == generation + 1
+
+
+def test_reference_data_cache_not_invalidated_on_not_referenced_address_change(
+    address, django_capture_on_commit_callbacks
+):
+    # given
+    generation = get_reference_data_generation()
+
+    # when
+    address.city = "New city"
+    with django_capture_on_commit_callbacks(execute=True):
+        address.save(update_fields=["city"])
+
+    # then
+    assert get_reference_data_generation() == generation
@@ -0,0 +1,101 @@
+import json
+from unittest import mock
+
+import pytest
+
+from ...graphql.api import backend, schema
+from ...graphql.query_cost_map import COST_MAP
+from ...graphql.webhook.subscription_payload import compile_subscription_query
+from ..warmup import (
+    get_operations_manifest,
+    load_operations_manifest,
+    load_query_cost_map,
+    load_webhook_subscription_queries,
+    warm_up_app,
+)
+
+
+def test_load_query_cost_map_reports_unknown_entries():
+    # given
+    query_costs = {**COST_MAP["Query"], "notExistingField": {"complexity": 1}}
+
+    # when
+    with mock.patch.dict(
+        COST_MAP, {"Query": query_costs, "NotExistingType": {"field": {}}}
+    ):
+        unknown_entries = load_query_cost_map(schema)
+
+    # then
+    assert "Query.notExistingField" in unknown_entries
+    assert "NotExistingType" in unknown_entries
+
+
+def test_load_webhook_subscription_queries(webhook, subscription_order_created_webhook):
+    # given
+    compile_subscription_query.cache_clear()
+
+    # when
+    count = load_webhook_subscription_queries()
+
+    # then
+    assert count == 1
+    assert compile_subscription_query.cache_info().currsize == 1
+
+
+def test_load_webhook_subscription_queries_skips_inactive_webhooks(
+    subscription_order_created_webhook,
+):
+    # given
+    subscription_order_created_webhook.is_active = False
+    subscription_order_created_webhook.save(update_fields=["is_active"])
+
+    # when
+    count = load_webhook_subscription_queries()
+
+    # then
+    assert count == 0
+
+
+def test_load_operations_manifest(tmp_path):
+    # given
+    query = "query { shop { name } }"
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps([query, "query {", {"not": "a query"}]))
+
+    # when
+    with mock.patch.object(
+        backend, "document_from_string", wraps=backend.document_from_string
+    ) as document_from_string_mock:
+        count = load_operations_manifest(schema, str(manifest))
+
+    # then
+    assert count == 2
+    document_from_string_mock.assert_any_call(schema, query)
+
+
+def test_get_operations_manifest_missing_file(tmp_path):
+    # when
+    operations = get_operations_manifest(str(tmp_path / "missing.json"))
+
+    # then
+    assert operations == []
+
+
+@pytest.mark.django_db
+@mock.patch("saleor.core.warmup.connections")
+def test_warm_up_app_reports_phases(mocked_connections, settings):
+    # given
+    settings.GRAPHQL_WARMUP_OPERATIONS_MANIFEST = None
+
+    # when
+    phases = warm_up_app()
+
+    # then
+    mocked_connections.close_all.assert_called_once_with()
+    assert set(phases) == {
+        "schema",
+        "query_cost_map",
+        "plugins",
+        "webhook_subscription_queries",
+        "operations_manifest",
+    }
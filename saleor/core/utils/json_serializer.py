@@ -1,9 +1,18 @@
+import json
+from typing import Any
+
+from django.conf import settings
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.serializers.json import Serializer as JsonSerializer
 from draftjs_sanitizer import SafeJSONEncoder
 from measurement.measures import Weight
 from prices import Money
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 MONEY_TYPE = "Money"
 
 
@@ -29,3 +38,41 @@ class HTMLSafeJSON(SafeJSONEncoder, DjangoJSONEncoder):
     It is used for integrating JSON into HTML content in addition to
     serializing Django objects.
     """
+
+
+_custom_json_encoder = CustomJsonEncoder()
+
+
+def _orjson_default(obj):
+    return _custom_json_encoder.default(obj)
+
+
+def _use_orjson() -> bool:
+    return orjson is not None and settings.FAST_JSON_SERIALIZER_ENABLED
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize an object to JSON bytes, supporting the `CustomJsonEncoder` types.
+
+    When `FAST_JSON_SERIALIZER_ENABLED` is set and `orjson` is installed, it
+    serializes the data straight to bytes and falls back to `CustomJsonEncoder` only
+    for the types it does not handle natively. Datetimes and dataclasses are always
+    passed to the encoder, so the values have the same format no matter which
+    backend is used; only the whitespace and escaping of the output differ.
+    """
+    if _use_orjson():
+        return orjson.dumps(
+            obj,
+            default=_orjson_default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(obj, cls=CustomJsonEncoder).encode("utf-8")
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string, see `json_dumps_bytes`."""
+    if _use_orjson():
+        return json_dumps_bytes(obj).decode("utf-8")
+    return json.dumps(obj, cls=CustomJsonEncoder)
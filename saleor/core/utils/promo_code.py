@@ -1,4 +1,5 @@
 import secrets
+from collections.abc import Iterable
 
 from django.core.exceptions import ValidationError
 
@@ -6,6 +7,21 @@ from ...discount.models import VoucherCode
 from ...giftcard.error_codes import GiftCardErrorCode
 from ...giftcard.models import GiftCard
 
+PROMO_CODE_ALPHABET = "0123456789ABCDEF"
+PROMO_CODE_LENGTH = 12
+PROMO_CODE_GROUP_SIZE = 4
+
+# The number of codes checked for collisions with a single query.
+PROMO_CODE_BATCH_SIZE = 1000
+
+# The number of batches in a row without a single new code after which generating
+# more codes is given up.
+PROMO_CODE_MAX_ATTEMPTS = 10
+
+
+class PromoCodeGenerationError(Exception):
+    """Raised when the requested number of unused promo codes can't be generated."""
+
 
 class InvalidPromoCode(ValidationError):
     def __init__(self, message=None, **kwargs):
@@ -20,16 +36,79 @@ class InvalidPromoCode(ValidationError):
 
 def generate_promo_code():
     """Generate a promo unique code that can be used as a voucher or gift card code."""
-    code = generate_random_code()
-    while not is_available_promo_code(code):
-        code = generate_random_code()
-    return code
+    return generate_promo_codes(1)[0]
+
+
+def generate_promo_codes(
+    count: int,
+    alphabet: str = PROMO_CODE_ALPHABET,
+    length: int = PROMO_CODE_LENGTH,
+    group_size: int | None = PROMO_CODE_GROUP_SIZE,
+) -> list[str]:
+    """Generate unique promo codes that can be used as voucher or gift card codes.
+
+    Candidates are generated in batches and each batch is checked against the
+    existing codes with a single query. Raise `PromoCodeGenerationError` when
+    the alphabet and length can't produce enough unused codes.
+    """
+    if len(set(alphabet)) ** length < count:
+        raise PromoCodeGenerationError(
+            f"Can't generate {count} codes of length {length} from the alphabet."
+        )
+    codes: set[str] = set()
+    attempts = 0
+    while len(codes) < count:
+        if attempts == PROMO_CODE_MAX_ATTEMPTS:
+            raise PromoCodeGenerationError(
+                f"Generated {len(codes)} of {count} unused codes in "
+                f"{PROMO_CODE_MAX_ATTEMPTS} attempts."
+            )
+        batch_size = min(count - len(codes), PROMO_CODE_BATCH_SIZE)
+        candidates = {
+            generate_random_code(alphabet, length, group_size)
+            for _ in range(batch_size)
+        }
+        candidates -= codes
+        new_codes = candidates - get_unavailable_promo_codes(candidates)
+        # only batches without any new code count as failed attempts
+        attempts = attempts + 1 if not new_codes else 0
+        codes.update(new_codes)
+    return list(codes)
+
+
+def generate_random_code(
+    alphabet: str = PROMO_CODE_ALPHABET,
+    length: int = PROMO_CODE_LENGTH,
+    group_size: int | None = PROMO_CODE_GROUP_SIZE,
+) -> str:
+    # by default generate code in format "ABCD-EFGH-IJKL"
+    code = "".join(secrets.choice(alphabet) for _ in range(length))
+    if not group_size:
+        return code
+    return "-".join(
+        code[i : i + group_size]  # noqa: E203
+        for i in range(0, len(code), group_size)
+    )
 
 
-def generate_random_code():
-    # generate code in format "ABCD-EFGH-IJKL"
-    code = secrets.token_hex(nbytes=6).upper()
-    return "-".join(code[i : i + 4] for i in range(0, len(code), 4))  # noqa: E203
+def get_unavailable_promo_codes(codes: Iterable[str]) -> set[str]:
+    """Return codes already used by vouchers or gift cards."""
+    codes = list(codes)
+    unavailable_codes: set[str] = set()
+    for i in range(0, len(codes), PROMO_CODE_BATCH_SIZE):
+        batch = codes[i : i + PROMO_CODE_BATCH_SIZE]  # noqa: E203
+        gift_card_codes = (
+            GiftCard.objects.filter(code__in=batch)
+            .order_by()
+            .values_list("code", flat=True)
+        )
+        voucher_codes = (
+            VoucherCode.objects.filter(code__in=batch)
+            .order_by()
+            .values_list("code", flat=True)
+        )
+        unavailable_codes.update(gift_card_codes.union(voucher_codes))
+    return unavailable_codes
 
 
 def is_available_promo_code(code):
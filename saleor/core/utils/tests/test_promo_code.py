@@ -0,0 +1,96 @@
+from unittest import mock
+
+import pytest
+
+from ..promo_code import (
+    PROMO_CODE_MAX_ATTEMPTS,
+    PromoCodeGenerationError,
+    generate_promo_codes,
+    generate_random_code,
+    get_unavailable_promo_codes,
+)
+
+
+def test_generate_random_code_default_format():
+    # when
+    code = generate_random_code()
+
+    # then
+    groups = code.split("-")
+    assert len(groups) == 3
+    assert all(len(group) == 4 for group in groups)
+    assert set(code.replace("-", "")) <= set("0123456789ABCDEF")
+
+
+def test_generate_random_code_custom_alphabet_and_length():
+    # when
+    code = generate_random_code(alphabet="XYZ", length=10, group_size=None)
+
+    # then
+    assert len(code) == 10
+    assert set(code) <= set("XYZ")
+
+
+def test_get_unavailable_promo_codes(gift_card, voucher, django_assert_num_queries):
+    # given
+    codes = [gift_card.code, voucher.codes.first().code, "FREE-CODE"]
+
+    # when
+    with django_assert_num_queries(1):
+        unavailable_codes = get_unavailable_promo_codes(codes)
+
+    # then
+    assert unavailable_codes == {gift_card.code, voucher.codes.first().code}
+
+
+def test_generate_promo_codes_checks_collisions_in_bulk(db, django_assert_num_queries):
+    # given
+    count = 50
+
+    # when
+    with django_assert_num_queries(1):
+        codes = generate_promo_codes(count)
+
+    # then
+    assert len(codes) == count
+    assert len(set(codes)) == count
+
+
+@mock.patch("saleor.core.utils.promo_code.generate_random_code")
+def test_generate_promo_codes_skips_existing_and_duplicated_codes(
+    mocked_generate_random_code, gift_card, voucher
+):
+    # given
+    voucher_code = voucher.codes.first().code
+    mocked_generate_random_code.side_effect = [
+        gift_card.code,
+        "CODE-1",
+        "CODE-1",
+        voucher_code,
+        "CODE-2",
+    ]
+
+    # when
+    codes = generate_promo_codes(2)
+
+    # then
+    assert sorted(codes) == ["CODE-1", "CODE-2"]
+
+
+def test_generate_promo_codes_alphabet_too_small(db):
+    # when & then
+    with pytest.raises(PromoCodeGenerationError):
+        generate_promo_codes(5, alphabet="AB", length=2, group_size=None)
+
+
+@mock.patch("saleor.core.utils.promo_code.generate_random_code")
+def test_generate_promo_codes_gives_up_without_unused_codes(
+    mocked_generate_random_code, gift_card
+):
+    # given
+    mocked_generate_random_code.return_value = gift_card.code
+
+    # when & then
+    with pytest.raises(PromoCodeGenerationError):
+        generate_promo_codes(1)
+    assert mocked_generate_random_code.call_count == PROMO_CODE_MAX_ATTEMPTS
@@ -1,9 +1,15 @@
+import datetime
 import json
+import uuid
+from decimal import Decimal
 
+import pytest
+from django.utils.translation import gettext_lazy
 from measurement.measures import Weight
+from prices import Money
 
 from ...taxes import zero_money
-from ..json_serializer import CustomJsonEncoder
+from ..json_serializer import CustomJsonEncoder, json_dumps, json_dumps_bytes
 
 
 def test_custom_json_encoder_dumps_money_objects():
@@ -31,3 +37,33 @@ def test_custom_json_encoder_dumps_weight_objects():
     # then
     data = json.loads(serialized_data)
     assert data["weight"] == "5.0:kg"
+
+
+@pytest.mark.parametrize("fast_serializer_enabled", [True, False])
+def test_json_dumps_bytes_matches_custom_json_encoder(
+    fast_serializer_enabled, settings
+):
+    # given
+    if fast_serializer_enabled:
+        pytest.importorskip("orjson")
+    settings.FAST_JSON_SERIALIZER_ENABLED = fast_serializer_enabled
+    input = {
+        "money": Money(Decimal("10.50"), "USD"),
+        "decimal": Decimal("1.10"),
+        "uuid": uuid.UUID("7e7d3a4c-1b39-4d4c-8a55-3c7a6d7c3c1e"),
+        "datetime": datetime.datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.UTC),
+        "date": datetime.date(2024, 1, 2),
+        "lazy": gettext_lazy("Lazy text"),
+        "weight": Weight(kg=5),
+        "list": [1, "a", None],
+    }
+
+    # when
+    serialized_data = json_dumps_bytes(input)
+
+    # then
+    assert isinstance(serialized_data, bytes)
+    assert json.loads(serialized_data) == json.loads(
+        json.dumps(input, cls=CustomJsonEncoder)
+    )
+    assert json.loads(json_dumps(input)) == json.loads(serialized_data)
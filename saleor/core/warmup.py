@@ -0,0 +1,176 @@
+"""Warm up a worker process before it starts serving requests.
+
+The GraphQL schema, the query cost map, the plugin classes and the documents of
+webhook subscription queries are otherwise built lazily while the first requests
+are processed, which makes freshly started workers noticeably slower.
+"""
+
+import json
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    def __init__(self):
+        self.phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - start
+
+
+def load_schema():
+    """Build the schema and run all validation rules once."""
+    from graphql import parse, validate
+    from graphql.utils.introspection_query import introspection_query
+
+    from ..graphql.api import schema
+
+    for graphql_type in schema.get_type_map().values():
+        # field maps of graphql-core types are built on the first access
+        getattr(graphql_type, "fields", None)
+    validate(schema, parse(introspection_query))
+    return schema
+
+
+def load_query_cost_map(schema) -> list[str]:
+    """Validate the query cost map against the schema.
+
+    Return the entries of the cost map that don't exist in the schema.
+    """
+    from ..graphql.query_cost_map import COST_MAP
+
+    unknown_entries = []
+    for type_name, type_costs in COST_MAP.items():
+        graphql_type = schema.get_type(type_name)
+        fields = getattr(graphql_type, "fields", None)
+        if fields is None:
+            unknown_entries.append(type_name)
+            continue
+        unknown_entries.extend(
+            f"{type_name}.{field_name}"
+            for field_name in type_costs
+            if field_name not in fields
+        )
+    if unknown_entries:
+        logger.warning(
+            "Query cost map contains entries missing in the schema: %s",
+            ", ".join(unknown_entries),
+        )
+    return unknown_entries
+
+
+def load_plugins() -> None:
+    for plugin_path in settings.PLUGINS:
+        import_string(plugin_path)
+
+
+def load_webhook_subscription_queries() -> int:
+    """Compile subscription queries of active webhooks.
+
+    Return the number of distinct queries, or 0 if the database is not available.
+    """
+    from ..graphql.webhook.subscription_payload import compile_subscription_query
+    from ..webhook.models import Webhook
+
+    try:
+        subscription_queries = list(
+            Webhook.objects.filter(is_active=True, app__is_active=True)
+            .exclude(subscription_query__isnull=True)
+            .exclude(subscription_query="")
+            .values_list("subscription_query", flat=True)
+            .distinct()
+        )
+    except DatabaseError:
+        logger.warning(
+            "Unable to load webhook subscription queries during warm-up.",
+            exc_info=True,
+        )
+        return 0
+
+    for subscription_query in subscription_queries:
+        try:
+            compile_subscription_query(subscription_query)
+        except Exception:
+            logger.warning(
+                "Unable to compile webhook subscription query during warm-up.",
+                exc_info=True,
+            )
+    return len(subscription_queries)
+
+
+def get_operations_manifest(path: str | None) -> list[str]:
+    """Read the list of GraphQL documents from the JSON manifest file."""
+    if not path:
+        return []
+    try:
+        with open(path) as manifest:
+            operations = json.load(manifest)
+    except (OSError, ValueError):
+        logger.warning("Unable to read GraphQL operations manifest %s.", path)
+        return []
+    return [operation for operation in operations if isinstance(operation, str)]
+
+
+def load_operations_manifest(schema, path: str | None) -> int:
+    """Parse and validate known hot operations into the document cache."""
+    from ..graphql.api import backend
+
+    operations = get_operations_manifest(path)
+    for operation in operations:
+        try:
+            backend.document_from_string(schema, operation)
+        except Exception:
+            logger.warning(
+                "Unable to parse GraphQL operation from the manifest.", exc_info=True
+            )
+    return len(operations)
+
+
+def warm_up_app() -> dict[str, float]:
+    """Eagerly load what is otherwise loaded by the first requests.
+
+    Return the duration of each warm-up phase in seconds.
+    """
+    timer = StartupTimer()
+    try:
+        with timer.phase("schema"):
+            schema = load_schema()
+        with timer.phase("query_cost_map"):
+            load_query_cost_map(schema)
+        with timer.phase("plugins"):
+            load_plugins()
+        with timer.phase("webhook_subscription_queries"):
+            subscription_queries_count = load_webhook_subscription_queries()
+        with timer.phase("operations_manifest"):
+            operations_count = load_operations_manifest(
+                schema, settings.GRAPHQL_WARMUP_OPERATIONS_MANIFEST
+            )
+    finally:
+        # The warm-up may run in the server's master process before the workers
+        # are forked, so the database connections it opened can't be left open to
+        # be shared between the workers.
+        connections.close_all()
+
+    logger.info(
+        "Warm-up finished in %.3fs.",
+        sum(timer.phases.values()),
+        extra={
+            "phases": {name: round(value, 6) for name, value in timer.phases.items()},
+            "subscription_queries": subscription_queries_count,
+            "operations": operations_count,
+        },
+    )
+    return timer.phases
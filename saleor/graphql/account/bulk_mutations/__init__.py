@@ -1,9 +1,11 @@
+from .customer_bulk_create import CustomerBulkCreate
 from .customer_bulk_delete import CustomerBulkDelete
 from .customer_bulk_update import CustomerBulkUpdate
 from .staff_bulk_delete import StaffBulkDelete
 from .user_bulk_set_active import UserBulkSetActive
 
 __all__ = [
+    "CustomerBulkCreate",
     "CustomerBulkDelete",
     "CustomerBulkUpdate",
     "StaffBulkDelete",
@@ -0,0 +1,60 @@
+from django.core.exceptions import ValidationError
+from graphene.utils.str_converters import to_camel_case
+
+from ....account import models
+from ...core.mutations import BaseMutation
+from ..i18n import I18nMixin
+
+
+class BaseCustomerBulkMutation(BaseMutation, I18nMixin):
+    """Base customer bulk mutation with shared error and result handling."""
+
+    # Type of the items of the `results` field.
+    result_type: type
+
+    # Prefix of the error paths, relative to a single item of the input list.
+    error_path_prefix = ""
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def format_errors(cls, index, errors, index_error_map, field_prefix=None):
+        for key, value in errors.error_dict.items():
+            for e in value:
+                path = (
+                    to_camel_case(f"{field_prefix}.{key}")
+                    if field_prefix
+                    else to_camel_case(key)
+                )
+                index_error_map[index].append(
+                    cls._meta.error_type_class(
+                        path=f"{cls.error_path_prefix}{path}",
+                        message=e.messages[0],
+                        code=e.code,
+                    )
+                )
+
+    @classmethod
+    def clean_address(
+        cls, address_data, address_type, field, index, index_error_map, info
+    ) -> models.Address | None:
+        try:
+            return cls.validate_address(
+                address_data, address_type=address_type, info=info
+            )
+        except ValidationError as exc:
+            cls.format_errors(index, exc, index_error_map, field_prefix=field)
+        return None
+
+    @classmethod
+    def get_results(cls, instances_data_with_errors_list, reject_everything=False):
+        if reject_everything:
+            return [
+                cls.result_type(customer=None, errors=data.get("errors"))
+                for data in instances_data_with_errors_list
+            ]
+        return [
+            cls.result_type(customer=data.get("instance"), errors=data.get("errors"))
+            for data in instances_data_with_errors_list
+        ]
@@ -0,0 +1,624 @@
+from collections import defaultdict
+from copy import deepcopy
+
+import graphene
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+from ....account import models
+from ....account.error_codes import CustomerBulkCreateErrorCode
+from ....account.events import CustomerEvents
+from ....account.tasks import customers_bulk_create_actions_task
+from ....account.utils import RequestorAwareContext
+from ....checkout import AddressType
+from ....core.tracing import traced_atomic_transaction
+from ....core.utils import metadata_manager
+from ....permission.enums import AccountPermissions
+from ....webhook.event_types import WebhookEventAsyncType
+from ...core.descriptions import ADDED_IN_322
+from ...core.doc_category import DOC_CATEGORY_USERS
+from ...core.enums import ErrorPolicyEnum
+from ...core.mutations import DeprecatedModelMutation
+from ...core.types import BaseObjectType, CustomerBulkCreateError, NonNullList
+from ...core.utils import WebhookEventInfo, get_duplicated_values
+from ...meta.inputs import MetadataInput
+from ...payment.utils import deprecated_metadata_contains_empty_key
+from ..mutations.base import (
+    BILLING_ADDRESS_FIELD,
+    SHIPPING_ADDRESS_FIELD,
+    CustomerInput,
+)
+from ..types import User
+from .base_customer_bulk import BaseCustomerBulkMutation
+
+ADDRESS_FIELDS_TO_UPDATE = [
+    "first_name",
+    "last_name",
+    "company_name",
+    "street_address_1",
+    "street_address_2",
+    "city",
+    "city_area",
+    "postal_code",
+    "country",
+    "country_area",
+    "phone",
+    "validation_skipped",
+]
+
+CUSTOMER_FIELDS_TO_UPDATE = [
+    "first_name",
+    "last_name",
+    "is_active",
+    "is_confirmed",
+    "note",
+    "language_code",
+    "external_reference",
+    "metadata",
+    "private_metadata",
+    "default_shipping_address",
+    "default_billing_address",
+    "search_index_dirty",
+    "updated_at",
+]
+
+
+class CustomerBulkCreateResult(BaseObjectType):
+    customer = graphene.Field(User, required=False, description="Customer data.")
+    errors = NonNullList(
+        CustomerBulkCreateError,
+        required=False,
+        description="List of errors that occurred during the create attempt.",
+    )
+
+    class Meta:
+        doc_category = DOC_CATEGORY_USERS
+
+
+class CustomerBulkCreate(BaseCustomerBulkMutation):
+    count = graphene.Int(
+        required=True,
+        default_value=0,
+        description="Returns how many objects were created or updated.",
+    )
+    results = NonNullList(
+        CustomerBulkCreateResult,
+        required=True,
+        default_value=[],
+        description="List of the created or updated customers.",
+    )
+
+    result_type = CustomerBulkCreateResult
+
+    class Arguments:
+        customers = NonNullList(
+            CustomerInput,
+            required=True,
+            description="Input list of customers to create.",
+        )
+        upsert = graphene.Boolean(
+            required=False,
+            default_value=False,
+            description=(
+                "Update customers that already exist with the given email instead "
+                "of returning an error."
+            ),
+        )
+        error_policy = ErrorPolicyEnum(
+            required=False,
+            description=(
+                "Policies of error handling. DEFAULT: "
+                + ErrorPolicyEnum.REJECT_EVERYTHING.name
+            ),
+        )
+
+    class Meta:
+        description = (
+            "Creates customers, or updates existing customers matched by email. "
+            "Customer events, search documents and webhooks are processed "
+            "asynchronously after the customers are saved." + ADDED_IN_322
+        )
+        doc_category = DOC_CATEGORY_USERS
+        permissions = (AccountPermissions.MANAGE_USERS,)
+        error_type_class = CustomerBulkCreateError
+        webhook_events_info = [
+            WebhookEventInfo(
+                type=WebhookEventAsyncType.CUSTOMER_CREATED,
+                description="A new customer account was created.",
+            ),
+            WebhookEventInfo(
+                type=WebhookEventAsyncType.CUSTOMER_UPDATED,
+                description="An existing customer account was updated.",
+            ),
+        ]
+
+    @classmethod
+    def clean_address(
+        cls, address_data, address_type, field, index, index_error_map, info
+    ):
+        address_metadata: list[MetadataInput] = address_data.pop("metadata", [])
+        address = super().clean_address(
+            address_data, address_type, field, index, index_error_map, info
+        )
+        if address is None:
+            return None
+        try:
+            metadata_collection = cls.create_metadata_from_graphql_input(
+                address_metadata, error_field_name="metadata"
+            )
+        except ValidationError as exc:
+            cls.format_errors(index, exc, index_error_map, field_prefix=field)
+            return None
+
+        metadata_manager.store_on_instance(
+            metadata_collection, address, metadata_manager.MetadataType.PUBLIC
+        )
+        return address
+
+    @classmethod
+    def clean_customers(cls, info, customers_input, index_error_map):
+        cleaned_inputs_map: dict = {}
+
+        emails = [
+            customer_input["email"].lower()
+            for customer_input in customers_input
+            if customer_input.get("email")
+        ]
+        external_refs = [
+            customer_input["external_reference"]
+            for customer_input in customers_input
+            if customer_input.get("external_reference")
+        ]
+        duplicated_emails = get_duplicated_values(emails)
+        duplicated_refs = get_duplicated_values(external_refs)
+        duplicated_code = CustomerBulkCreateErrorCode.DUPLICATED_INPUT_ITEM.value
+
+        for index, customer_input in enumerate(customers_input):
+            shipping_address_data = customer_input.pop(SHIPPING_ADDRESS_FIELD, None)
+            billing_address_data = customer_input.pop(BILLING_ADDRESS_FIELD, None)
+
+            cleaned_input = DeprecatedModelMutation.clean_input(
+                info, None, customer_input, input_cls=CustomerInput
+            )
+
+            if email := cleaned_input.get("email"):
+                cleaned_input["email"] = email.lower()
+                if cleaned_input["email"] in duplicated_emails:
+                    index_error_map[index].append(
+                        CustomerBulkCreateError(
+                            path="email",
+                            message="Duplicated email value.",
+                            code=duplicated_code,
+                        )
+                    )
+            else:
+                index_error_map[index].append(
+                    CustomerBulkCreateError(
+                        path="email",
+                        message="This field is required.",
+                        code=CustomerBulkCreateErrorCode.REQUIRED.value,
+                    )
+                )
+
+            if cleaned_input.get("external_reference") in duplicated_refs:
+                index_error_map[index].append(
+                    CustomerBulkCreateError(
+                        path="externalReference",
+                        message="Duplicated externalReference value.",
+                        code=duplicated_code,
+                    )
+                )
+
+            for field_name, path in [
+                ("metadata", "metadata"),
+                ("private_metadata", "privateMetadata"),
+            ]:
+                metadata_list = cleaned_input.get(field_name)
+                if metadata_list and deprecated_metadata_contains_empty_key(
+                    metadata_list
+                ):
+                    index_error_map[index].append(
+                        CustomerBulkCreateError(
+                            path=path,
+                            message="Metadata key cannot be empty.",
+                            code=CustomerBulkCreateErrorCode.REQUIRED.value,
+                        )
+                    )
+
+            if shipping_address_data:
+                cleaned_input[SHIPPING_ADDRESS_FIELD] = cls.clean_address(
+                    shipping_address_data,
+                    address_type=AddressType.SHIPPING,
+                    field=SHIPPING_ADDRESS_FIELD,
+                    index=index,
+                    index_error_map=index_error_map,
+                    info=info,
+                )
+
+            if billing_address_data:
+                cleaned_input[BILLING_ADDRESS_FIELD] = cls.clean_address(
+                    billing_address_data,
+                    address_type=AddressType.BILLING,
+                    field=BILLING_ADDRESS_FIELD,
+                    index=index,
+                    index_error_map=index_error_map,
+                    info=info,
+                )
+
+            if index_error_map[index]:
+                cleaned_inputs_map[index] = None
+            else:
+                cleaned_inputs_map[index] = cleaned_input
+
+        return cleaned_inputs_map
+
+    @classmethod
+    def get_existing_customers(cls, cleaned_inputs_map: dict) -> list[models.User]:
+        emails = []
+        external_refs = []
+        for cleaned_input in cleaned_inputs_map.values():
+            if not cleaned_input:
+                continue
+            emails.append(cleaned_input["email"])
+            if external_ref := cleaned_input.get("external_reference"):
+                external_refs.append(external_ref)
+
+        if not emails:
+            return []
+
+        # compare lowercased emails to use the `user_email_lower_idx` index
+        return list(
+            models.User.objects.alias(normalized_email=Lower("email"))
+            .filter(
+                Q(normalized_email__in=emails) | Q(external_reference__in=external_refs)
+            )
+            .select_related("default_shipping_address", "default_billing_address")
+        )
+
+    @staticmethod
+    def get_customer_by_email(customers: list[models.User], email: str):
+        """Return the customer matching the lowercased email.
+
+        As in `retrieve_user_by_email`, emails are compared case-insensitively,
+        unless more customers match. In such a case, only the customer with the
+        lowercased email matches.
+        """
+        if len(customers) == 1:
+            return customers[0]
+        for customer in customers:
+            if customer.email == email:
+                return customer
+        return None
+
+    @classmethod
+    def update_address(cls, instance, address, field):
+        """Copy the validated address to the customer's default address, if any."""
+        existing_address = getattr(instance, field)
+        if not existing_address:
+            return address
+        for field_name in ADDRESS_FIELDS_TO_UPDATE:
+            setattr(existing_address, field_name, getattr(address, field_name))
+        existing_address.store_value_in_metadata(address.metadata)
+        return existing_address
+
+    @classmethod
+    def prepare_customers(cls, cleaned_inputs_map, index_error_map, upsert):
+        instances_data_and_errors_list: list = []
+        existing_customers = cls.get_existing_customers(cleaned_inputs_map)
+        customers_by_email = defaultdict(list)
+        for customer in existing_customers:
+            customers_by_email[customer.email.lower()].append(customer)
+        customers_by_external_ref = {
+            customer.external_reference: customer
+            for customer in existing_customers
+            if customer.external_reference
+        }
+
+        for index, cleaned_input in cleaned_inputs_map.items():
+            if not cleaned_input:
+                instances_data_and_errors_list.append(
+                    {"instance": None, "errors": index_error_map[index]}
+                )
+                continue
+
+            email_owners = customers_by_email.get(cleaned_input["email"], [])
+            old_instance = cls.get_customer_by_email(
+                email_owners, cleaned_input["email"]
+            )
+            if email_owners and not old_instance:
+                index_error_map[index].append(
+                    CustomerBulkCreateError(
+                        path="email",
+                        message="Multiple users with this Email already exist.",
+                        code=CustomerBulkCreateErrorCode.UNIQUE.value,
+                    )
+                )
+            elif old_instance and (not upsert or old_instance.is_staff):
+                index_error_map[index].append(
+                    CustomerBulkCreateError(
+                        path="email",
+                        message="User with this Email already exists.",
+                        code=CustomerBulkCreateErrorCode.UNIQUE.value,
+                    )
+                )
+            external_ref = cleaned_input.get("external_reference")
+            ref_owner = customers_by_external_ref.get(external_ref)
+            if ref_owner and ref_owner != old_instance:
+                index_error_map[index].append(
+                    CustomerBulkCreateError(
+                        path="externalReference",
+                        message="User with this External reference already exists.",
+                        code=CustomerBulkCreateErrorCode.UNIQUE.value,
+                    )
+                )
+            if index_error_map[index]:
+                instances_data_and_errors_list.append(
+                    {"instance": None, "errors": index_error_map[index]}
+                )
+                continue
+
+            shipping_address = cleaned_input.pop(SHIPPING_ADDRESS_FIELD, None)
+            billing_address = cleaned_input.pop(BILLING_ADDRESS_FIELD, None)
+            metadata_list: list[MetadataInput] = cleaned_input.pop("metadata", None)
+            private_metadata_list: list[MetadataInput] = cleaned_input.pop(
+                "private_metadata", None
+            )
+
+            if old_instance:
+                # the email identifies the customer and is not changed
+                cleaned_input.pop("email")
+                instance = deepcopy(old_instance)
+            else:
+                instance = models.User()
+            instance = cls.construct_instance(instance, cleaned_input)
+            try:
+                # uniqueness is already checked for all customers at once
+                instance.full_clean(
+                    exclude=["password"],
+                    validate_unique=False,
+                    validate_constraints=False,
+                )
+            except ValidationError as exc:
+                cls.format_errors(index, exc, index_error_map)
+                instances_data_and_errors_list.append(
+                    {"instance": None, "errors": index_error_map[index]}
+                )
+                continue
+
+            if metadata_list:
+                metadata_manager.store_on_instance(
+                    cls.create_metadata_from_graphql_input(
+                        metadata_list, error_field_name="metadata"
+                    ),
+                    instance,
+                    metadata_manager.MetadataType.PUBLIC,
+                )
+            if private_metadata_list:
+                metadata_manager.store_on_instance(
+                    cls.create_metadata_from_graphql_input(
+                        private_metadata_list, error_field_name="private_metadata"
+                    ),
+                    instance,
+                    metadata_manager.MetadataType.PRIVATE,
+                )
+
+            if shipping_address:
+                shipping_address = cls.update_address(
+                    instance, shipping_address, SHIPPING_ADDRESS_FIELD
+                )
+            if billing_address:
+                billing_address = cls.update_address(
+                    instance, billing_address, BILLING_ADDRESS_FIELD
+                )
+
+            instances_data_and_errors_list.append(
+                {
+                    "instance": instance,
+                    "old_instance": old_instance,
+                    "errors": index_error_map[index],
+                    SHIPPING_ADDRESS_FIELD: shipping_address,
+                    BILLING_ADDRESS_FIELD: billing_address,
+                }
+            )
+
+        return instances_data_and_errors_list
+
+    @classmethod
+    def save_customers(cls, instances_data_with_errors_list):
+        """Save customers and their addresses with multi-row inserts and updates.
+
+        Search documents are not built here; customers are only marked as requiring
+        indexing.
+        """
+        now = timezone.now()
+        customers_to_create = []
+        customers_to_update = []
+        addresses_to_create = []
+        addresses_to_update = []
+        new_customer_addresses = []
+
+        for customer_data in instances_data_with_errors_list:
+            customer = customer_data["instance"]
+            if not customer:
+                continue
+
+            if customer.pk:
+                customers_to_update.append(customer)
+            else:
+                customers_to_create.append(customer)
+            customer.search_index_dirty = True
+            customer.updated_at = now
+
+            for field in [SHIPPING_ADDRESS_FIELD, BILLING_ADDRESS_FIELD]:
+                address = customer_data[field]
+                if not address:
+                    continue
+                if address.pk:
+                    addresses_to_update.append(address)
+                else:
+                    addresses_to_create.append(address)
+                    setattr(customer, field, address)
+                    new_customer_addresses.append((customer, address))
+
+        models.Address.objects.bulk_create(addresses_to_create)
+        models.Address.objects.bulk_update(
+            addresses_to_update, fields=[*ADDRESS_FIELDS_TO_UPDATE, "metadata"]
+        )
+        models.User.objects.bulk_create(customers_to_create)
+        models.User.objects.bulk_update(
+            customers_to_update, fields=CUSTOMER_FIELDS_TO_UPDATE
+        )
+
+        UserAddress = models.User.addresses.through
+        UserAddress.objects.bulk_create(
+            [
+                UserAddress(user_id=customer.pk, address_id=address.pk)
+                for customer, address in new_customer_addresses
+            ]
+        )
+
+        return customers_to_create, customers_to_update
+
+    @classmethod
+    def add_conflicting_customers_errors(cls, instances_data_with_errors_list):
+        """Add errors to customers conflicting with customers saved in the meantime.
+
+        Return whether any conflicting customers were found.
+        """
+        customers_data = [
+            customer_data
+            for customer_data in instances_data_with_errors_list
+            if customer_data["instance"]
+        ]
+        emails = [
+            customer_data["instance"].email.lower()
+            for customer_data in customers_data
+            if not customer_data.get("old_instance")
+        ]
+        external_refs = [
+            customer_data["instance"].external_reference
+            for customer_data in customers_data
+            if customer_data["instance"].external_reference
+        ]
+        existing_customers = models.User.objects.alias(
+            normalized_email=Lower("email")
+        ).filter(
+            Q(normalized_email__in=emails) | Q(external_reference__in=external_refs)
+        )
+        existing_emails = set()
+        external_ref_owners = {}
+        for pk, email, external_ref in existing_customers.values_list(
+            "pk", "email", "external_reference"
+        ):
+            existing_emails.add(email.lower())
+            if external_ref:
+                external_ref_owners[external_ref] = pk
+
+        conflicts_found = False
+        for customer_data in customers_data:
+            customer = customer_data["instance"]
+            old_instance = customer_data.get("old_instance")
+            errors = []
+            if not old_instance and customer.email.lower() in existing_emails:
+                errors.append(
+                    CustomerBulkCreateError(
+                        path="email",
+                        message="User with this Email already exists.",
+                        code=CustomerBulkCreateErrorCode.UNIQUE.value,
+                    )
+                )
+            ref_owner_id = external_ref_owners.get(customer.external_reference)
+            if ref_owner_id and (not old_instance or ref_owner_id != old_instance.pk):
+                errors.append(
+                    CustomerBulkCreateError(
+                        path="externalReference",
+                        message="User with this External reference already exists.",
+                        code=CustomerBulkCreateErrorCode.UNIQUE.value,
+                    )
+                )
+            if errors:
+                customer_data["errors"].extend(errors)
+                conflicts_found = True
+        return conflicts_found
+
+    @classmethod
+    def get_events_data(cls, instances_data_with_errors_list):
+        """Return type and parameters of the events of the updated customers."""
+        events_data = []
+        for customer_data in instances_data_with_errors_list:
+            customer = customer_data["instance"]
+            old_instance = customer_data.get("old_instance")
+            if not customer or not old_instance:
+                continue
+
+            new_fullname = customer.get_full_name()
+            if old_instance.get_full_name() != new_fullname:
+                events_data.append(
+                    (CustomerEvents.NAME_ASSIGNED, {"message": new_fullname})
+                )
+            if not old_instance.is_active and customer.is_active:
+                events_data.append(
+                    (CustomerEvents.ACCOUNT_ACTIVATED, {"account_id": customer.pk})
+                )
+            if old_instance.is_active and not customer.is_active:
+                events_data.append(
+                    (CustomerEvents.ACCOUNT_DEACTIVATED, {"account_id": customer.pk})
+                )
+        return events_data
+
+    @classmethod
+    @traced_atomic_transaction()
+    def perform_mutation(cls, _root, info, **data):
+        error_policy = data.get("error_policy", ErrorPolicyEnum.REJECT_EVERYTHING.value)
+        index_error_map: dict = defaultdict(list)
+
+        cleaned_inputs_map = cls.clean_customers(
+            info, data["customers"], index_error_map
+        )
+        instances_data_with_errors_list = cls.prepare_customers(
+            cleaned_inputs_map, index_error_map, data.get("upsert", False)
+        )
+
+        if any(index_error_map.values()):
+            if error_policy == ErrorPolicyEnum.REJECT_EVERYTHING.value:
+                results = cls.get_results(instances_data_with_errors_list, True)
+                return CustomerBulkCreate(count=0, results=results)
+
+            if error_policy == ErrorPolicyEnum.REJECT_FAILED_ROWS.value:
+                for customer_data in instances_data_with_errors_list:
+                    if customer_data["errors"] and customer_data["instance"]:
+                        customer_data["instance"] = None
+
+        try:
+            with transaction.atomic():
+                created_customers, updated_customers = cls.save_customers(
+                    instances_data_with_errors_list
+                )
+        except IntegrityError:
+            # customers with the same email or external reference were saved
+            # in the meantime
+            if not cls.add_conflicting_customers_errors(
+                instances_data_with_errors_list
+            ):
+                raise
+            results = cls.get_results(instances_data_with_errors_list, True)
+            return CustomerBulkCreate(count=0, results=results)
+
+        created_ids = [customer.pk for customer in created_customers]
+        updated_ids = [customer.pk for customer in updated_customers]
+        events_data = cls.get_events_data(instances_data_with_errors_list)
+        context_data = RequestorAwareContext.create_context_data(info.context)
+        if created_ids or updated_ids:
+            transaction.on_commit(
+                lambda: customers_bulk_create_actions_task.delay(
+                    created_ids, updated_ids, events_data, context_data
+                )
+            )
+
+        results = cls.get_results(instances_data_with_errors_list)
+        return CustomerBulkCreate(
+            count=len(created_ids) + len(updated_ids), results=results
+        )
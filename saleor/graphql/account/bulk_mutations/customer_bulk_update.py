@@ -4,7 +4,6 @@ from copy import deepcopy
 import graphene
 from django.core.exceptions import ValidationError
 from django.db.models import Q
-from graphene.utils.str_converters import to_camel_case
 
 from ....account import models
 from ....account.events import CustomerEvents
@@ -20,7 +19,7 @@ from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
 from ...core.doc_category import DOC_CATEGORY_USERS
 from ...core.enums import CustomerBulkUpdateErrorCode, ErrorPolicyEnum
-from ...core.mutations import BaseMutation, DeprecatedModelMutation
+from ...core.mutations import DeprecatedModelMutation
 from ...core.types import (
     BaseInputObjectType,
     BaseObjectType,
@@ -32,13 +31,13 @@ from ...core.validators import validate_one_of_args_is_in_mutation
 from ...meta.inputs import MetadataInput
 from ...payment.utils import deprecated_metadata_contains_empty_key
 from ...plugins.dataloaders import get_app_promise, get_plugin_manager_promise
-from ..i18n import I18nMixin
 from ..mutations.base import (
     BILLING_ADDRESS_FIELD,
     SHIPPING_ADDRESS_FIELD,
     CustomerInput,
 )
 from ..types import User
+from .base_customer_bulk import BaseCustomerBulkMutation
 
 
 class CustomerBulkResult(BaseObjectType):
@@ -67,7 +66,7 @@ class CustomerBulkUpdateInput(BaseInputObjectType):
         doc_category = DOC_CATEGORY_USERS
 
 
-class CustomerBulkUpdate(BaseMutation, I18nMixin):
+class CustomerBulkUpdate(BaseCustomerBulkMutation):
     count = graphene.Int(
         required=True,
         default_value=0,
@@ -80,6 +79,9 @@ class CustomerBulkUpdate(BaseMutation, I18nMixin):
         description="List of the updated customers.",
     )
 
+    result_type = CustomerBulkResult
+    error_path_prefix = "input."
+
     class Arguments:
         customers = NonNullList(
             CustomerBulkUpdateInput,
@@ -110,23 +112,6 @@ class CustomerBulkUpdate(BaseMutation, I18nMixin):
             ),
         ]
 
-    @classmethod
-    def format_errors(cls, index, errors, index_error_map, field_prefix=None):
-        for key, value in errors.error_dict.items():
-            for e in value:
-                path = (
-                    to_camel_case(f"{field_prefix}.{key}")
-                    if field_prefix
-                    else to_camel_case(key)
-                )
-                index_error_map[index].append(
-                    CustomerBulkUpdateError(
-                        path=f"input.{path}",
-                        message=e.messages[0],
-                        code=e.code,
-                    )
-                )
-
     @classmethod
     def validate_customer(
         cls, customer_id, external_ref, cleaned_input, index, index_error_map
@@ -176,30 +161,12 @@ class CustomerBulkUpdate(BaseMutation, I18nMixin):
 
     @classmethod
     def clean_address(
-        cls,
-        address_data,
-        address_type,
-        field,
-        index,
-        index_error_map,
-        info,
-        format_check=True,
-        required_check=True,
-        enable_normalization=True,
+        cls, address_data, address_type, field, index, index_error_map, info
     ):
-        try:
-            address = cls.validate_address(
-                address_data,
-                address_type=address_type,
-                format_check=format_check,
-                required_check=required_check,
-                enable_normalization=enable_normalization,
-                info=info,
-            )
-
-            return address.as_data()
-        except ValidationError as exc:
-            cls.format_errors(index, exc, index_error_map, field_prefix=field)
+        address = super().clean_address(
+            address_data, address_type, field, index, index_error_map, info
+        )
+        return address.as_data() if address else None
 
     @classmethod
     def clean_metadata(
@@ -665,20 +632,6 @@ class CustomerBulkUpdate(BaseMutation, I18nMixin):
         models.CustomerEvent.objects.bulk_create(customer_events)
         mark_gift_cards_search_index_as_dirty_by_users(users_with_name_or_email_updated)
 
-    @classmethod
-    def get_results(cls, instances_data_with_errors_list, reject_everything=False):
-        if reject_everything:
-            return [
-                CustomerBulkResult(customer=None, errors=data.get("errors"))
-                for data in instances_data_with_errors_list
-            ]
-        return [
-            CustomerBulkResult(customer=data.get("instance"), errors=data.get("errors"))
-            if data.get("instance")
-            else CustomerBulkResult(customer=None, errors=data.get("errors"))
-            for data in instances_data_with_errors_list
-        ]
-
     @classmethod
     @traced_atomic_transaction()
     def perform_mutation(cls, _root, info, **data):
@@ -19,6 +19,7 @@ from ..core import ResolveInfo
 SKIP_ADDRESS_VALIDATION_PERMISSION_MAP: dict[str, list[BasePermissionEnum]] = {
     "addressCreate": [AccountPermissions.MANAGE_USERS],
     "addressUpdate": [AccountPermissions.MANAGE_USERS],
+    "customerBulkCreate": [AccountPermissions.MANAGE_USERS],
     "customerBulkUpdate": [AccountPermissions.MANAGE_USERS],
     "draftOrderCreate": [OrderPermissions.MANAGE_ORDERS],
     "draftOrderUpdate": [OrderPermissions.MANAGE_ORDERS],
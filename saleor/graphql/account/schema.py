@@ -1,4 +1,5 @@
 import graphene
+from graphql import GraphQLError
 
 from ...permission.auth_filters import AuthorizationFilters
 from ...permission.enums import AccountPermissions, OrderPermissions
@@ -12,6 +13,7 @@ from ..core.types import FilterInputObjectType
 from ..core.utils import from_global_id_or_error
 from ..core.validators import validate_one_of_args_is_in_query
 from .bulk_mutations import (
+    CustomerBulkCreate,
     CustomerBulkDelete,
     CustomerBulkUpdate,
     StaffBulkDelete,
@@ -75,7 +77,7 @@ from .resolvers import (
     resolve_staff_users,
     resolve_user,
 )
-from .sorters import PermissionGroupSortingInput, UserSortingInput
+from .sorters import PermissionGroupSortingInput, UserSortField, UserSortingInput
 from .types import (
     Address,
     AddressValidationData,
@@ -86,6 +88,21 @@ from .types import (
 )
 
 
+def search_string_in_kwargs(kwargs: dict) -> bool:
+    filter_search = (kwargs.get("filter") or {}).get("search", "") or ""
+    return bool(filter_search.strip())
+
+
+def check_for_sorting_by_rank(kwargs: dict):
+    sort_by = kwargs.get("sort_by") or {}
+    if sort_by.get("field") == UserSortField.RANK:
+        # sort by RANK can be used only with search filter
+        if not search_string_in_kwargs(kwargs):
+            raise GraphQLError(
+                "Sorting by RANK is available only when using a search filter."
+            )
+
+
 class CustomerFilterInput(FilterInputObjectType):
     class Meta:
         doc_category = DOC_CATEGORY_USERS
@@ -211,6 +228,7 @@ class AccountQueries(graphene.ObjectType):
 
     @staticmethod
     def resolve_customers(_root, info: ResolveInfo, **kwargs):
+        check_for_sorting_by_rank(kwargs)
         qs = resolve_customers(info)
         qs = filter_connection_queryset(
             qs, kwargs, allow_replica=info.context.allow_replica
@@ -237,6 +255,7 @@ class AccountQueries(graphene.ObjectType):
 
     @staticmethod
     def resolve_staff_users(_root, info: ResolveInfo, **kwargs):
+        check_for_sorting_by_rank(kwargs)
         qs = resolve_staff_users(info)
         qs = filter_connection_queryset(
             qs, kwargs, allow_replica=info.context.allow_replica
@@ -300,6 +319,7 @@ class AccountMutations(graphene.ObjectType):
     customer_create = CustomerCreate.Field()
     customer_update = CustomerUpdate.Field()
     customer_delete = CustomerDelete.Field()
+    customer_bulk_create = CustomerBulkCreate.Field()
     customer_bulk_delete = CustomerBulkDelete.Field()
     customer_bulk_update = CustomerBulkUpdate.Field()
 
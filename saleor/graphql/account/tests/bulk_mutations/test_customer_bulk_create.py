@@ -0,0 +1,295 @@
+from unittest.mock import patch
+
+from .....account import CustomerEvents, models
+from .....account.error_codes import CustomerBulkCreateErrorCode
+from ....core.enums import ErrorPolicyEnum
+from ....tests.utils import get_graphql_content
+
+CUSTOMER_BULK_CREATE_MUTATION = """
+    mutation CustomerBulkCreate(
+        $customers: [CustomerInput!]!,
+        $upsert: Boolean,
+        $errorPolicy: ErrorPolicyEnum
+    ){
+        customerBulkCreate(
+            customers: $customers, upsert: $upsert, errorPolicy: $errorPolicy
+        ){
+            results{
+                errors {
+                    path
+                    message
+                    code
+                }
+                customer{
+                    id
+                    email
+                    firstName
+                    defaultShippingAddress {
+                        postalCode
+                    }
+                    defaultBillingAddress {
+                        postalCode
+                    }
+                }
+            }
+            count
+        }
+    }
+"""
+
+
+@patch(
+    "saleor.graphql.account.bulk_mutations.customer_bulk_create."
+    "customers_bulk_create_actions_task.delay"
+)
+def test_customers_bulk_create(
+    mocked_actions_task,
+    staff_api_client,
+    permission_manage_users,
+    graphql_address_data,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    customers_input = [
+        {
+            "email": "John.Doe@example.com",
+            "firstName": "John",
+            "defaultShippingAddress": graphql_address_data,
+            "defaultBillingAddress": graphql_address_data,
+        },
+        {"email": "jane.doe@example.com", "firstName": "Jane"},
+    ]
+    variables = {"customers": customers_input}
+    staff_api_client.user.user_permissions.add(permission_manage_users)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        response = staff_api_client.post_graphql(
+            CUSTOMER_BULK_CREATE_MUTATION, variables
+        )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["customerBulkCreate"]
+    assert data["count"] == 2
+    assert not data["results"][0]["errors"]
+    assert not data["results"][1]["errors"]
+
+    customer_1 = models.User.objects.get(email="john.doe@example.com")
+    customer_2 = models.User.objects.get(email="jane.doe@example.com")
+    assert customer_1.search_index_dirty
+    assert customer_2.search_index_dirty
+    assert customer_1.addresses.count() == 2
+    assert customer_1.default_shipping_address.metadata == {"public": "public_value"}
+    assert customer_1.default_billing_address.postal_code == "53-601"
+    assert not customer_2.addresses.exists()
+    mocked_actions_task.assert_called_once()
+    created_ids, updated_ids, events_data, _ = mocked_actions_task.call_args.args
+    assert sorted(created_ids) == sorted([customer_1.pk, customer_2.pk])
+    assert updated_ids == []
+    assert events_data == []
+
+
+def test_customers_bulk_create_existing_email(
+    staff_api_client, permission_manage_users, customer_user
+):
+    # given
+    customers_input = [
+        {"email": customer_user.email.upper(), "firstName": "New"},
+        {"email": "new.customer@example.com"},
+    ]
+    variables = {"customers": customers_input}
+    staff_api_client.user.user_permissions.add(permission_manage_users)
+
+    # when
+    response = staff_api_client.post_graphql(CUSTOMER_BULK_CREATE_MUTATION, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["customerBulkCreate"]
+    assert data["count"] == 0
+    errors = data["results"][0]["errors"]
+    assert errors[0]["path"] == "email"
+    assert errors[0]["code"] == CustomerBulkCreateErrorCode.UNIQUE.name
+    assert not models.User.objects.filter(email="new.customer@example.com").exists()
+
+
+def test_customers_bulk_create_duplicated_email_reject_failed_rows(
+    staff_api_client, permission_manage_users
+):
+    # given
+    customers_input = [
+        {"email": "john.doe@example.com"},
+        {"email": "JOHN.DOE@example.com"},
+        {"email": "jane.doe@example.com"},
+    ]
+    variables = {
+        "customers": customers_input,
+        "errorPolicy": ErrorPolicyEnum.REJECT_FAILED_ROWS.name,
+    }
+    staff_api_client.user.user_permissions.add(permission_manage_users)
+
+    # when
+    response = staff_api_client.post_graphql(CUSTOMER_BULK_CREATE_MUTATION, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["customerBulkCreate"]
+    assert data["count"] == 1
+    for result in data["results"][:2]:
+        assert result["errors"][0]["code"] == (
+            CustomerBulkCreateErrorCode.DUPLICATED_INPUT_ITEM.name
+        )
+    assert data["results"][2]["customer"]["email"] == "jane.doe@example.com"
+    assert not models.User.objects.filter(email="john.doe@example.com").exists()
+
+
+@patch(
+    "saleor.graphql.account.bulk_mutations.customer_bulk_create."
+    "customers_bulk_create_actions_task.delay"
+)
+def test_customers_bulk_create_upsert(
+    mocked_actions_task,
+    staff_api_client,
+    permission_manage_users,
+    customer_user,
+    graphql_address_data,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    shipping_address = customer_user.default_shipping_address
+    addresses_count = customer_user.addresses.count()
+    graphql_address_data["postalCode"] = "53-602"
+    customers_input = [
+        {
+            "email": customer_user.email,
+            "firstName": "Updated",
+            "defaultShippingAddress": graphql_address_data,
+        },
+        {"email": "new.customer@example.com", "firstName": "New"},
+    ]
+    variables = {"customers": customers_input, "upsert": True}
+    staff_api_client.user.user_permissions.add(permission_manage_users)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        response = staff_api_client.post_graphql(
+            CUSTOMER_BULK_CREATE_MUTATION, variables
+        )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["customerBulkCreate"]
+    assert data["count"] == 2
+
+    customer_user.refresh_from_db()
+    new_customer = models.User.objects.get(email="new.customer@example.com")
+    assert customer_user.first_name == "Updated"
+    assert customer_user.search_index_dirty
+    assert customer_user.default_shipping_address_id == shipping_address.pk
+    assert customer_user.default_shipping_address.postal_code == "53-602"
+    assert customer_user.addresses.count() == addresses_count
+
+    created_ids, updated_ids, events_data, _ = mocked_actions_task.call_args.args
+    assert created_ids == [new_customer.pk]
+    assert updated_ids == [customer_user.pk]
+    assert events_data == [
+        (CustomerEvents.NAME_ASSIGNED, {"message": customer_user.get_full_name()})
+    ]
+
+
+def test_customers_bulk_create_upsert_email_matching_multiple_users(
+    staff_api_client, permission_manage_users
+):
+    # given
+    models.User.objects.bulk_create(
+        [
+            models.User(email="Mixed.Case@example.com"),
+            models.User(email="MIXED.CASE@example.com"),
+        ]
+    )
+    customers_input = [{"email": "mixed.case@example.com", "firstName": "New"}]
+    variables = {"customers": customers_input, "upsert": True}
+    staff_api_client.user.user_permissions.add(permission_manage_users)
+
+    # when
+    response = staff_api_client.post_graphql(CUSTOMER_BULK_CREATE_MUTATION, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["customerBulkCreate"]
+    assert data["count"] == 0
+    errors = data["results"][0]["errors"]
+    assert len(errors) == 1
+    assert errors[0]["path"] == "email"
+    assert errors[0]["code"] == CustomerBulkCreateErrorCode.UNIQUE.name
+    assert not models.User.objects.filter(first_name="New").exists()
+
+
+def test_customers_bulk_create_upsert_prefers_user_with_lowercased_email(
+    staff_api_client, permission_manage_users, django_capture_on_commit_callbacks
+):
+    # given
+    customer, other_customer = models.User.objects.bulk_create(
+        [
+            models.User(email="mixed.case@example.com"),
+            models.User(email="MIXED.CASE@example.com"),
+        ]
+    )
+    customers_input = [{"email": "Mixed.Case@example.com", "firstName": "New"}]
+    variables = {"customers": customers_input, "upsert": True}
+    staff_api_client.user.user_permissions.add(permission_manage_users)
+
+    # when
+    with django_capture_on_commit_callbacks():
+        response = staff_api_client.post_graphql(
+            CUSTOMER_BULK_CREATE_MUTATION, variables
+        )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["customerBulkCreate"]
+    assert data["count"] == 1
+    customer.refresh_from_db()
+    other_customer.refresh_from_db()
+    assert customer.first_name == "New"
+    assert other_customer.first_name != "New"
+
+
+@patch(
+    "saleor.graphql.account.bulk_mutations.customer_bulk_create."
+    "CustomerBulkCreate.get_existing_customers"
+)
+def test_customers_bulk_create_customer_created_in_the_meantime(
+    mocked_get_existing_customers,
+    staff_api_client,
+    permission_manage_users,
+    customer_user,
+):
+    # given
+    # the customer is created after the existing customers are fetched
+    mocked_get_existing_customers.return_value = []
+    customers_input = [
+        {"email": customer_user.email, "firstName": "New"},
+        {"email": "new.customer@example.com"},
+    ]
+    variables = {
+        "customers": customers_input,
+        "errorPolicy": ErrorPolicyEnum.REJECT_FAILED_ROWS.name,
+    }
+    staff_api_client.user.user_permissions.add(permission_manage_users)
+
+    # when
+    response = staff_api_client.post_graphql(CUSTOMER_BULK_CREATE_MUTATION, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["customerBulkCreate"]
+    assert data["count"] == 0
+    errors = data["results"][0]["errors"]
+    assert len(errors) == 1
+    assert errors[0]["path"] == "email"
+    assert errors[0]["code"] == CustomerBulkCreateErrorCode.UNIQUE.name
+    assert not data["results"][1]["errors"]
+    assert not data["results"][1]["customer"]
+    assert not models.User.objects.filter(email="new.customer@example.com").exists()
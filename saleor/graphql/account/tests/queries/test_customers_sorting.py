@@ -1,6 +1,7 @@
 import pytest
 
 from .....account.models import User
+from .....account.search import prepare_user_search_document_value
 from .....order.models import Order
 from ....tests.utils import get_graphql_content
 
@@ -171,3 +172,50 @@ def test_query_customers_pagination_with_sort(
     assert result_order[0] == nodes[0]["node"]["firstName"]
     assert result_order[1] == nodes[1]["node"]["firstName"]
     assert len(nodes) == page_size
+
+
+def test_query_customers_sort_by_rank(
+    staff_api_client, permission_manage_users, customers_for_pagination
+):
+    # given
+    joe = customers_for_pagination[1]
+    joe.first_name = "Johnathan"
+    for user in customers_for_pagination:
+        user.search_document = prepare_user_search_document_value(
+            user, attach_addresses_data=False
+        )
+    User.objects.bulk_update(
+        customers_for_pagination, ["first_name", "search_document"]
+    )
+    variables = {
+        "first": 2,
+        "sortBy": {"field": "RANK", "direction": "DESC"},
+        "filter": {"search": "john"},
+    }
+    staff_api_client.user.user_permissions.add(permission_manage_users)
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_CUSTOMERS_WITH_PAGINATION, variables)
+
+    # then
+    content = get_graphql_content(response)
+    nodes = content["data"]["customers"]["edges"]
+    assert [node["node"]["firstName"] for node in nodes] == ["John", "Johnathan"]
+
+
+def test_query_customers_sort_by_rank_without_search(
+    staff_api_client, permission_manage_users, customers_for_pagination
+):
+    # given
+    variables = {"first": 2, "sortBy": {"field": "RANK", "direction": "DESC"}}
+    staff_api_client.user.user_permissions.add(permission_manage_users)
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_CUSTOMERS_WITH_PAGINATION, variables)
+
+    # then
+    content = get_graphql_content(response, ignore_errors=True)
+    assert (
+        content["errors"][0]["message"]
+        == "Sorting by RANK is available only when using a search filter."
+    )
@@ -40,6 +40,7 @@ from ..core.doc_category import DOC_CATEGORY_USERS
 from ..core.enums import LanguageCodeEnum
 from ..core.federation import federated_entity, resolve_federation_references
 from ..core.fields import ConnectionField, PermissionsField
+from ..core.projection import METADATA_FIELDS, register_deferrable_fields
 from ..core.scalars import UUID, DateTime
 from ..core.tracing import traced_resolver
 from ..core.types import (
@@ -1028,3 +1029,13 @@ class GroupCountableConnection(CountableConnection):
     class Meta:
         doc_category = DOC_CATEGORY_USERS
         node = Group
+
+
+register_deferrable_fields(
+    models.User,
+    {
+        "note": ("note",),
+        "search_document": (),
+        **METADATA_FIELDS,
+    },
+)
@@ -3,6 +3,11 @@ from collections import defaultdict
 from django.contrib.auth.hashers import check_password
 
 from ....app.models import App, AppToken
+from ....app.token_cache import (
+    get_app_token_digest,
+    is_app_token_cache_enabled,
+    verified_app_token_cache,
+)
 from ...core.dataloaders import DataLoader
 
 
@@ -29,13 +34,31 @@ class AppByTokenLoader(DataLoader[str, App]):
         tokens = (
             AppToken.objects.using(self.database_connection_name)
             .filter(token_last_4__in=last_4s_to_raw_token_map.keys())
-            .values_list("auth_token", "token_last_4", "app_id")
+            .values_list("id", "auth_token", "token_last_4", "app_id")
         )
+        use_cache = is_app_token_cache_enabled()
+        digests = {}
+        verified_tokens = {}
+        if use_cache:
+            digests = {raw_token: get_app_token_digest(raw_token) for raw_token in keys}
+            verified_tokens = verified_app_token_cache.get_many(digests.values())
+
         authed_apps = {}
-        for auth_token, token_last_4, app_id in tokens:
+        for token_id, auth_token, token_last_4, app_id in tokens:
             for raw_token in last_4s_to_raw_token_map[token_last_4]:
+                if raw_token in authed_apps:
+                    continue
+                if use_cache:
+                    digest = digests[raw_token]
+                    if verified_tokens.get(digest) == (token_id, auth_token):
+                        authed_apps[raw_token] = app_id
+                        continue
                 if check_password(raw_token, auth_token):
                     authed_apps[raw_token] = app_id
+                    if use_cache:
+                        verified_app_token_cache.set(
+                            digests[raw_token], (token_id, auth_token)
+                        )
 
         apps = (
             App.objects.using(self.database_connection_name)
@@ -21,6 +21,7 @@ class AttributeValuesByAttributeIdLoader(DataLoader[int, list[AttributeValue]]):
 
 class AttributesByAttributeId(DataLoader[int, Attribute]):
     context_key = "attributes_by_id"
+    use_reference_data_cache = True
 
     def batch_load(self, keys):
         attributes = Attribute.objects.using(self.database_connection_name).in_bulk(
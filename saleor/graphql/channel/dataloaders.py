@@ -10,6 +10,7 @@ from ..order.dataloaders import OrderByIdLoader
 
 class ChannelByIdLoader(DataLoader[int, Channel]):
     context_key = "channel_by_id"
+    use_reference_data_cache = True
 
     def batch_load(self, keys):
         channels = Channel.objects.using(self.database_connection_name).in_bulk(keys)
@@ -18,6 +19,7 @@ class ChannelByIdLoader(DataLoader[int, Channel]):
 
 class ChannelBySlugLoader(DataLoader[str, Channel]):
     context_key = "channel_by_slug"
+    use_reference_data_cache = True
 
     def batch_load(self, keys):
         channels = Channel.objects.using(self.database_connection_name).in_bulk(
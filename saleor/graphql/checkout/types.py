@@ -49,6 +49,7 @@ from ..core.descriptions import (
 from ..core.doc_category import DOC_CATEGORY_CHECKOUT
 from ..core.enums import LanguageCodeEnum
 from ..core.fields import BaseField, PermissionsField
+from ..core.query_planner import flatten, register_prefetcher, unwrap_root
 from ..core.scalars import UUID, DateTime, PositiveDecimal
 from ..core.tracing import traced_resolver
 from ..core.types import Money, NonNullList, TaxedMoney
@@ -1649,3 +1650,25 @@ class CheckoutCountableConnection(CountableConnection):
     class Meta:
         doc_category = DOC_CATEGORY_CHECKOUT
         node = Checkout
+
+
+@register_prefetcher("Checkout", "lines", child_type_name="CheckoutLine")
+def prefetch_checkout_lines(context, roots):
+    return (
+        CheckoutLinesByCheckoutTokenLoader(context)
+        .load_many([unwrap_root(root).token for root in roots])
+        .then(flatten)
+    )
+
+
+@register_prefetcher("Checkout", "channel")
+def prefetch_checkout_channel(context, roots):
+    ChannelByIdLoader(context).load_many(
+        {unwrap_root(root).channel_id for root in roots}
+    )
+
+
+@register_prefetcher("CheckoutLine", "variant")
+def prefetch_checkout_line_variant(context, lines):
+    ProductVariantByIdLoader(context).load_many({line.variant_id for line in lines})
+    ChannelByCheckoutIDLoader(context).load_many({line.checkout_id for line in lines})
@@ -21,6 +21,8 @@ from ..core.enums import OrderDirection
 from ..core.types import BaseConnection, NonNullList
 from ..utils.sorting import sort_queryset_for_connection
 from .context import SyncWebhookControlContext
+from .projection import defer_unselected_connection_fields
+from .query_planner import prefetch_connection_nodes
 
 if TYPE_CHECKING:
     from ..core import ResolveInfo
@@ -339,6 +341,9 @@ def create_connection_slice(
         iterable=queryset, args=args, allow_replica=allow_replica
     )
     args["sort_by"] = sort_by
+    queryset = defer_unselected_connection_fields(
+        queryset, info, _get_required_fields_for_sorting(sort_by, queryset)
+    )
 
     from ...core.db.connection import allow_writer_in_context
 
@@ -359,9 +364,20 @@ def create_connection_slice(
             edges_with_context.append(edge)
         slice.edges = edges_with_context
 
+    prefetch_connection_nodes(
+        info, connection_type._meta.node._meta.name, [edge.node for edge in slice.edges]
+    )
     return slice
 
 
+def _get_required_fields_for_sorting(sort_by, qs) -> list[str]:
+    try:
+        sorting_fields = _get_sorting_fields(sort_by or {}, qs)
+    except ValueError:
+        return []
+    return [field.split("__")[0] for field in sorting_fields]
+
+
 def _validate_slice_args(
     info: "ResolveInfo",
     args: dict,
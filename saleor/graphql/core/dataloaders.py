@@ -2,15 +2,22 @@ from collections import defaultdict
 from collections.abc import Iterable
 from typing import Generic, TypeVar
 
+from django.conf import settings
 from promise import Promise
 from promise.dataloader import DataLoader as BaseLoader
 
-from ...core.db.connection import allow_writer_in_context
+from ...core.db.connection import allow_writer, allow_writer_in_context
+from ...core.reference_data_cache import (
+    get_reference_data_generation,
+    is_reference_data_cache_enabled,
+    reference_data_cache,
+)
 from ...core.telemetry import saleor_attributes, tracer
 from ...thumbnail.models import Thumbnail
 from ...thumbnail.utils import get_thumbnail_format
 from . import SaleorContext
 from .context import get_database_connection_name
+from .profiling import get_current_profile, profile_path
 
 K = TypeVar("K")
 R = TypeVar("R")
@@ -20,6 +27,9 @@ class DataLoader(BaseLoader, Generic[K, R]):
     context_key: str
     context: SaleorContext
     database_connection_name: str
+    # Set to `True` in loaders of reference data to share loaded values between
+    # requests, see `saleor.core.reference_data_cache`.
+    use_reference_data_cache: bool = False
 
     def __new__(cls, context: SaleorContext):
         key = cls.context_key
@@ -42,11 +52,23 @@ class DataLoader(BaseLoader, Generic[K, R]):
     def batch_load_fn(  # pylint: disable=method-hidden
         self, keys: Iterable[K]
     ) -> Promise[list[R]]:
+        if profile := get_current_profile():
+            loader_name = self.__class__.__name__
+            keys = list(keys)
+            profile.record_dataloader_batch(loader_name, len(keys))
+            with profile_path(f"dataloader:{loader_name}"):
+                return self._batch_load_fn(keys)
+        return self._batch_load_fn(keys)
+
+    def _batch_load_fn(self, keys: Iterable[K]) -> Promise[list[R]]:
         with tracer.start_as_current_span(self.__class__.__name__) as span:
             span.set_attribute(
                 saleor_attributes.OPERATION_NAME, "dataloader.batch_load"
             )
 
+            if self._should_use_reference_data_cache():
+                return self._batch_load_with_reference_data_cache(list(keys))
+
             with allow_writer_in_context(self.context):
                 results = self.batch_load(keys)
 
@@ -54,6 +76,54 @@ class DataLoader(BaseLoader, Generic[K, R]):
                 return Promise.resolve(results)
             return results
 
+    def _should_use_reference_data_cache(self) -> bool:
+        # Requests that use the writer database (mutations) must see their own
+        # changes, so they always read from the database.
+        return (
+            self.use_reference_data_cache
+            and is_reference_data_cache_enabled()
+            and self.database_connection_name
+            == settings.DATABASE_CONNECTION_REPLICA_NAME
+        )
+
+    def _batch_load_with_reference_data_cache(self, keys: list[K]) -> Promise[list[R]]:
+        generation = get_reference_data_generation()
+        cached = reference_data_cache.get_many(
+            generation, [(self.context_key, key) for key in keys]
+        )
+        results: dict[K, R] = {
+            key: cached[(self.context_key, key)]
+            for key in keys
+            if (self.context_key, key) in cached
+        }
+        missing_keys = [key for key in keys if key not in results]
+
+        if not missing_keys:
+            return Promise.resolve([results[key] for key in keys])
+
+        def store_loaded(loaded: list[R]) -> list[R]:
+            timeout = settings.DATALOADER_REFERENCE_CACHE_TIMEOUT
+            for key, value in zip(missing_keys, loaded, strict=False):
+                if value is not None:
+                    reference_data_cache.set(
+                        generation, (self.context_key, key), value, timeout
+                    )
+                results[key] = value
+            return [results[key] for key in keys]
+
+        # Missing values are loaded from the writer database. The generation is
+        # bumped once the change is committed, and the replica may still return
+        # the old rows at that point, which would then be cached under the new
+        # generation.
+        database_connection_name = self.database_connection_name
+        self.database_connection_name = settings.DATABASE_CONNECTION_DEFAULT_NAME
+        try:
+            with allow_writer():
+                loaded = self.batch_load(missing_keys)
+        finally:
+            self.database_connection_name = database_connection_name
+        return Promise.resolve(loaded).then(store_loaded)
+
     def batch_load(self, keys: Iterable[K]) -> Promise[list[R]] | list[R]:
         raise NotImplementedError()
 
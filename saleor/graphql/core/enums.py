@@ -189,6 +189,11 @@ ChannelErrorCode.doc_category = DOC_CATEGORY_CHANNELS
 CheckoutErrorCode = graphene.Enum.from_enum(checkout_error_codes.CheckoutErrorCode)
 CheckoutErrorCode.doc_category = DOC_CATEGORY_CHECKOUT
 
+CustomerBulkCreateErrorCode = graphene.Enum.from_enum(
+    account_error_codes.CustomerBulkCreateErrorCode
+)
+CustomerBulkCreateErrorCode.doc_category = DOC_CATEGORY_USERS
+
 CustomerBulkUpdateErrorCode = graphene.Enum.from_enum(
     account_error_codes.CustomerBulkUpdateErrorCode
 )
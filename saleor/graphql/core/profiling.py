@@ -0,0 +1,220 @@
+"""Per-field profiling of GraphQL operations.
+
+Profiling is enabled for a single operation by sending the `X-Saleor-Profile`
+header by a requestor with the `MANAGE_OBSERVABILITY` permission, in which case
+the report is returned in the `profile` key of the response `extensions`.
+A fraction of all operations, set by `GRAPHQL_PROFILING_SAMPLE_RATE`, is profiled
+without returning the report, to export per-field metrics.
+
+The profile attributes to each field path (list indexes are omitted, so all items
+of a list share one entry):
+- time spent in the resolver,
+- number and time of SQL queries executed by the resolver,
+- number and time of synchronous webhook requests sent by the resolver.
+
+SQL queries executed by dataloader batches are attributed to the dataloader.
+The same SQL query executed many times by a single field path, e.g. once for
+every item of a list, is reported as a possible N+1 problem.
+"""
+
+import random
+import re
+import time
+from collections import Counter, defaultdict
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import connections
+
+from ...permission.enums import AppPermission
+from ...permission.utils import has_one_of_permissions
+from ..metrics import record_graphql_field_stats
+from .context import SaleorContext
+
+PROFILING_HEADER = "x-saleor-profile"
+
+_current_profile: ContextVar["OperationProfile | None"] = ContextVar(
+    "current_profile", default=None
+)
+_current_path: ContextVar[str | None] = ContextVar("current_path", default=None)
+
+# `IN (%s, %s, %s)` lists differ in length between batches of the same query
+_SQL_PLACEHOLDER_LIST_RE = re.compile(r"%s(?:\s*,\s*%s)+")
+
+
+@dataclass
+class FieldStats:
+    field: str
+    calls: int = 0
+    duration: float = 0.0
+    sql_count: int = 0
+    sql_duration: float = 0.0
+    webhook_count: int = 0
+    webhook_duration: float = 0.0
+
+
+@dataclass
+class DataLoaderStats:
+    batches: int = 0
+    keys: int = 0
+    max_batch_size: int = 0
+
+
+def get_sql_shape(sql: str) -> str:
+    return _SQL_PLACEHOLDER_LIST_RE.sub("%s, ...", sql)
+
+
+def get_field_path(path) -> str:
+    return ".".join(str(part) for part in path if not isinstance(part, int))
+
+
+class OperationProfile:
+    def __init__(self, report: bool):
+        self.report = report
+        self.fields: dict[str, FieldStats] = {}
+        self.dataloaders: defaultdict[str, DataLoaderStats] = defaultdict(
+            DataLoaderStats
+        )
+        self.sql_shapes: defaultdict[str, Counter[str]] = defaultdict(Counter)
+
+    def get_field_stats(self, path: str, field: str | None = None) -> FieldStats:
+        if path not in self.fields:
+            self.fields[path] = FieldStats(field=field or path)
+        return self.fields[path]
+
+    def record_sql(self, sql: str, duration: float):
+        path = _current_path.get() or "<operation>"
+        stats = self.get_field_stats(path)
+        stats.sql_count += 1
+        stats.sql_duration += duration
+        self.sql_shapes[get_sql_shape(sql)][path] += 1
+
+    def record_webhook(self, duration: float):
+        stats = self.get_field_stats(_current_path.get() or "<operation>")
+        stats.webhook_count += 1
+        stats.webhook_duration += duration
+
+    def record_dataloader_batch(self, loader_name: str, batch_size: int):
+        stats = self.dataloaders[loader_name]
+        stats.batches += 1
+        stats.keys += batch_size
+        stats.max_batch_size = max(stats.max_batch_size, batch_size)
+
+    def sql_execute_wrapper(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record_sql(sql, time.perf_counter() - start)
+
+    def get_n_plus_one_candidates(self) -> list[dict]:
+        threshold = settings.GRAPHQL_PROFILING_N_PLUS_ONE_THRESHOLD
+        return [
+            {"path": path, "sql": sql, "count": count}
+            for sql, paths in self.sql_shapes.items()
+            for path, count in paths.items()
+            if count >= threshold
+        ]
+
+    def get_report(self) -> dict:
+        return {
+            "fields": [
+                {
+                    "path": path,
+                    "calls": stats.calls,
+                    "resolverTime": round(stats.duration, 6),
+                    "sqlCount": stats.sql_count,
+                    "sqlTime": round(stats.sql_duration, 6),
+                    "webhookCount": stats.webhook_count,
+                    "webhookTime": round(stats.webhook_duration, 6),
+                }
+                for path, stats in sorted(
+                    self.fields.items(),
+                    key=lambda item: item[1].duration + item[1].sql_duration,
+                    reverse=True,
+                )
+            ],
+            "dataloaders": [
+                {
+                    "name": name,
+                    "batches": stats.batches,
+                    "keys": stats.keys,
+                    "maxBatchSize": stats.max_batch_size,
+                }
+                for name, stats in self.dataloaders.items()
+            ],
+            "nPlusOne": self.get_n_plus_one_candidates(),
+        }
+
+    def record_metrics(self):
+        for stats in self.fields.values():
+            if stats.calls:
+                record_graphql_field_stats(stats.field, stats.duration, stats.sql_count)
+
+
+def get_current_profile() -> OperationProfile | None:
+    return _current_profile.get()
+
+
+def create_operation_profile(context: SaleorContext) -> OperationProfile | None:
+    """Return a profile for the operation if it should be profiled."""
+    if not settings.GRAPHQL_PROFILING_ENABLED:
+        return None
+    if context.headers.get(PROFILING_HEADER):
+        requestor = context.app or context.user
+        if has_one_of_permissions(requestor, [AppPermission.MANAGE_OBSERVABILITY]):
+            return OperationProfile(report=True)
+    sample_rate = settings.GRAPHQL_PROFILING_SAMPLE_RATE
+    if sample_rate and random.random() < sample_rate:
+        return OperationProfile(report=False)
+    return None
+
+
+@contextmanager
+def profile_operation(profile: OperationProfile | None):
+    if profile is None:
+        yield
+        return
+    token = _current_profile.set(profile)
+    with ExitStack() as stack:
+        for alias in settings.DATABASES:
+            stack.enter_context(
+                connections[alias].execute_wrapper(profile.sql_execute_wrapper)
+            )
+        try:
+            yield
+        finally:
+            _current_profile.reset(token)
+    profile.record_metrics()
+
+
+@contextmanager
+def profile_path(path: str):
+    token = _current_path.set(path)
+    try:
+        yield
+    finally:
+        _current_path.reset(token)
+
+
+class ProfilingMiddleware:
+    """Graphene middleware recording per-field stats of profiled operations."""
+
+    def resolve(self, next_, root, info, **kwargs):
+        profile = _current_profile.get()
+        if profile is None:
+            return next_(root, info, **kwargs)
+
+        path = get_field_path(info.path)
+        stats = profile.get_field_stats(
+            path, f"{info.parent_type.name}.{info.field_name}"
+        )
+        start = time.perf_counter()
+        with profile_path(path):
+            try:
+                return next_(root, info, **kwargs)
+            finally:
+                stats.calls += 1
+                stats.duration += time.perf_counter() - start
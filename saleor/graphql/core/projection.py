@@ -0,0 +1,104 @@
+"""Skip loading heavy columns that are not needed by the selected GraphQL fields.
+
+Querysets of connections and dataloaders fetch full rows, including columns like
+`description` JSON, `search_vector` or metadata, even when a query selects only
+`id` and `name` of the nodes.
+
+Models register their deferrable columns with `register_deferrable_fields`,
+together with the names of GraphQL fields whose resolvers need the column.
+Columns that are not exposed by any GraphQL field, like search documents, are
+registered with no fields and are never loaded by connections and the major
+dataloaders.
+
+Columns are deferred rather than the needed ones selected with `.only()`, so a
+resolver that reads a deferred column still gets the right value, fetched by
+Django with an additional query, instead of failing.
+"""
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db.models import Model, QuerySet
+
+from .query_planner import get_connection_node_selection_sets, get_field_selections
+
+if TYPE_CHECKING:
+    from . import ResolveInfo
+
+# Columns of `ModelWithMetadata` and the `ObjectWithMetadata` fields reading them.
+METADATA_FIELDS = {
+    "metadata": ("metadata", "metafield", "metafields"),
+    "private_metadata": ("privateMetadata", "privateMetafield", "privateMetafields"),
+}
+
+_DEFERRABLE_FIELDS: dict[type[Model], dict[str, frozenset[str]]] = {}
+
+
+def register_deferrable_fields(
+    model: type[Model], fields: dict[str, Iterable[str]]
+) -> None:
+    """Register model columns that can be skipped, by the GraphQL fields using them.
+
+    A column mapped to no GraphQL fields is never loaded by connections and
+    dataloaders that use `defer_never_selected_fields`.
+    """
+    _DEFERRABLE_FIELDS[model] = {
+        field_name: frozenset(graphql_fields)
+        for field_name, graphql_fields in fields.items()
+    }
+
+
+def get_never_selected_fields(model: type[Model]) -> list[str]:
+    return [
+        field_name
+        for field_name, graphql_fields in _DEFERRABLE_FIELDS.get(model, {}).items()
+        if not graphql_fields
+    ]
+
+
+def get_unselected_fields(model: type[Model], selected_fields: set[str]) -> list[str]:
+    return [
+        field_name
+        for field_name, graphql_fields in _DEFERRABLE_FIELDS.get(model, {}).items()
+        if not graphql_fields & selected_fields
+    ]
+
+
+def can_defer(queryset: QuerySet) -> bool:
+    # `values()` querysets do not return instances and combined querysets
+    # (`union()` etc.) don't support `defer()`.
+    return queryset._fields is None and not queryset.query.combinator  # type: ignore[attr-defined]
+
+
+def defer_never_selected_fields(queryset: QuerySet) -> QuerySet:
+    """Skip columns of the queryset's model that no GraphQL field needs."""
+    if not settings.GRAPHQL_QUERYSET_PROJECTION_ENABLED or not can_defer(queryset):
+        return queryset
+    fields = get_never_selected_fields(queryset.model)
+    return queryset.defer(*fields) if fields else queryset
+
+
+def defer_unselected_connection_fields(
+    queryset: QuerySet, info: "ResolveInfo", required_fields: Iterable[str] = ()
+) -> QuerySet:
+    """Skip columns not needed by the fields selected on the connection nodes.
+
+    `required_fields` are always loaded, e.g. the fields the connection is sorted
+    by, which are read to build the cursors.
+    """
+    if not settings.GRAPHQL_QUERYSET_PROJECTION_ENABLED or not can_defer(queryset):
+        return queryset
+    if queryset.model not in _DEFERRABLE_FIELDS:
+        return queryset
+    selected_fields: set[str] = set()
+    for selection_set in get_connection_node_selection_sets(info):
+        if selection_set is not None:
+            selected_fields.update(get_field_selections(selection_set, info.fragments))
+    required = set(required_fields)
+    fields = [
+        field_name
+        for field_name in get_unselected_fields(queryset.model, selected_fields)
+        if field_name not in required
+    ]
+    return queryset.defer(*fields) if fields else queryset
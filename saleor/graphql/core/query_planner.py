@@ -0,0 +1,144 @@
+"""Prefetch dataloader batches of nested fields selected on connection nodes.
+
+Fields of a connection node are resolved only after graphene completes the
+parent level, so every nesting level of a query like
+`products { edges { node { variants { channelListings { ... } } } } }` waits for
+the previous one before its dataloaders dispatch their batches.
+
+When the page of nodes is fetched, the planner walks the selection set of
+`edges.node` and, for every selected field with a registered prefetcher, loads
+the dataloader keys that the field resolver will request. Nested fields are
+planned as soon as their parent batch is loaded, independently from the rest of
+the resolution, and the resolvers later get the values from dataloaders' memo.
+
+Prefetchers are registered per GraphQL type and field name with
+`register_prefetcher` and must call the same dataloaders with the same keys as
+the field resolver, otherwise the prefetched values are not reused.
+"""
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from graphql.language.ast import Field, FragmentSpread, InlineFragment, SelectionSet
+from promise import Promise
+
+from .context import SaleorContext
+
+if TYPE_CHECKING:
+    from . import ResolveInfo
+
+# Called with the request context and the roots of the field's parent type.
+# Returns a promise of the flattened roots of the child type, to plan the nested
+# selections, or None if nested fields are not planned.
+Prefetcher = Callable[[SaleorContext, list[Any]], Promise[list[Any]] | None]
+
+_PREFETCHERS: dict[tuple[str, str], tuple[Prefetcher, str | None]] = {}
+
+
+def register_prefetcher(
+    type_name: str, field_name: str, child_type_name: str | None = None
+) -> Callable[[Prefetcher], Prefetcher]:
+    def decorator(func: Prefetcher) -> Prefetcher:
+        _PREFETCHERS[(type_name, field_name)] = (func, child_type_name)
+        return func
+
+    return decorator
+
+
+def unwrap_root(root):
+    """Return the model instance of `ChannelContext` and similar wrappers."""
+    return getattr(root, "node", root)
+
+
+def flatten(values: Iterable[Iterable[Any] | None]) -> list[Any]:
+    return [item for items in values if items for item in items]
+
+
+def get_field_selections(
+    selection_set: SelectionSet, fragments: dict
+) -> defaultdict[str, list[SelectionSet | None]]:
+    selections: defaultdict[str, list[SelectionSet | None]] = defaultdict(list)
+    for selection in selection_set.selections:
+        if isinstance(selection, Field):
+            selections[selection.name.value].append(selection.selection_set)
+            continue
+        if isinstance(selection, FragmentSpread):
+            fragment = fragments.get(selection.name.value)
+            sub_selection_set = fragment.selection_set if fragment else None
+        elif isinstance(selection, InlineFragment):
+            sub_selection_set = selection.selection_set
+        else:
+            continue
+        if sub_selection_set is not None:
+            for name, sets in get_field_selections(
+                sub_selection_set, fragments
+            ).items():
+                selections[name].extend(sets)
+    return selections
+
+
+def prefetch_selections(
+    context: SaleorContext,
+    fragments: dict,
+    type_name: str,
+    selection_sets: list[SelectionSet | None],
+    roots: list[Any],
+):
+    if not roots:
+        return
+    for selection_set in selection_sets:
+        if selection_set is None:
+            continue
+        for field_name, sub_selection_sets in get_field_selections(
+            selection_set, fragments
+        ).items():
+            entry = _PREFETCHERS.get((type_name, field_name))
+            if entry is None:
+                continue
+            prefetcher, child_type_name = entry
+            children = prefetcher(context, roots)
+            if children is None or child_type_name is None:
+                continue
+            children.then(
+                partial(
+                    prefetch_selections,
+                    context,
+                    fragments,
+                    child_type_name,
+                    sub_selection_sets,
+                )
+            )
+
+
+def get_connection_node_selection_sets(
+    info: "ResolveInfo",
+) -> list[SelectionSet | None]:
+    """Return selection sets of `edges.node` of the resolved connection field."""
+    fragments = info.fragments
+    node_selection_sets: list[SelectionSet | None] = []
+    for field_ast in info.field_asts:
+        if field_ast.selection_set is None:
+            continue
+        edges = get_field_selections(field_ast.selection_set, fragments)
+        for edges_selection_set in edges.get("edges", []):
+            if edges_selection_set is None:
+                continue
+            node_selection_sets.extend(
+                get_field_selections(edges_selection_set, fragments).get("node", [])
+            )
+    return node_selection_sets
+
+
+def prefetch_connection_nodes(info: "ResolveInfo", node_type_name: str, nodes: list):
+    if not settings.GRAPHQL_QUERY_PLANNER_ENABLED or not nodes:
+        return
+    prefetch_selections(
+        info.context,
+        info.fragments,
+        node_type_name,
+        get_connection_node_selection_sets(info),
+        nodes,
+    )
@@ -0,0 +1,139 @@
+from unittest import mock
+
+from ...tests.utils import get_graphql_content
+from ..profiling import (
+    PROFILING_HEADER,
+    OperationProfile,
+    ProfilingMiddleware,
+    create_operation_profile,
+    get_sql_shape,
+    profile_operation,
+    profile_path,
+)
+
+QUERY_CHANNELS = """
+    query {
+        channels {
+            name
+        }
+    }
+"""
+
+
+def test_get_sql_shape_collapses_placeholder_lists():
+    # given
+    sql = 'SELECT "id" FROM "channel" WHERE "id" IN (%s, %s, %s) AND "slug" = %s'
+
+    # when
+    shape = get_sql_shape(sql)
+
+    # then
+    assert shape == 'SELECT "id" FROM "channel" WHERE "id" IN (%s, ...) AND "slug" = %s'
+
+
+def test_operation_profile_reports_n_plus_one(settings):
+    # given
+    settings.GRAPHQL_PROFILING_N_PLUS_ONE_THRESHOLD = 3
+    profile = OperationProfile(report=True)
+    sql = 'SELECT * FROM "product_category" WHERE "id" = %s'
+
+    # when
+    with profile_path("products.edges.node.category"):
+        for _ in range(3):
+            profile.record_sql(sql, 0.001)
+    with profile_path("dataloader:ChannelByIdLoader"):
+        profile.record_sql('SELECT * FROM "channel" WHERE "id" IN (%s, %s)', 0.001)
+        profile.record_dataloader_batch("ChannelByIdLoader", 2)
+
+    # then
+    report = profile.get_report()
+    assert report["nPlusOne"] == [
+        {"path": "products.edges.node.category", "sql": sql, "count": 3}
+    ]
+    category_stats = next(
+        field
+        for field in report["fields"]
+        if field["path"] == "products.edges.node.category"
+    )
+    assert category_stats["sqlCount"] == 3
+    assert report["dataloaders"] == [
+        {"name": "ChannelByIdLoader", "batches": 1, "keys": 2, "maxBatchSize": 2}
+    ]
+
+
+def test_profiling_middleware_records_field_stats():
+    # given
+    profile = OperationProfile(report=True)
+    info = mock.Mock(path=["products", "edges", 0, "node", "name"], field_name="name")
+    info.parent_type.name = "Product"
+
+    # when
+    with profile_operation(profile):
+        result = ProfilingMiddleware().resolve(
+            lambda root, info, **kwargs: "value", None, info
+        )
+
+    # then
+    assert result == "value"
+    stats = profile.fields["products.edges.node.name"]
+    assert stats.field == "Product.name"
+    assert stats.calls == 1
+
+
+def test_create_operation_profile_with_permission(
+    rf, staff_user, permission_manage_observability, settings
+):
+    # given
+    settings.GRAPHQL_PROFILING_ENABLED = True
+    staff_user.user_permissions.add(permission_manage_observability)
+    request = rf.post("/graphql/", HTTP_X_SALEOR_PROFILE="1")
+    request.app = None
+    request.user = staff_user
+
+    # when
+    profile = create_operation_profile(request)
+
+    # then
+    assert request.headers.get(PROFILING_HEADER) == "1"
+    assert profile.report is True
+
+
+def test_create_operation_profile_without_permission(rf, staff_user, settings):
+    # given
+    settings.GRAPHQL_PROFILING_ENABLED = True
+    settings.GRAPHQL_PROFILING_SAMPLE_RATE = 0
+    request = rf.post("/graphql/", HTTP_X_SALEOR_PROFILE="1")
+    request.app = None
+    request.user = staff_user
+
+    # when
+    profile = create_operation_profile(request)
+
+    # then
+    assert profile is None
+
+
+def test_create_operation_profile_disabled(rf, settings):
+    # given
+    settings.GRAPHQL_PROFILING_ENABLED = False
+    request = rf.post("/graphql/", HTTP_X_SALEOR_PROFILE="1")
+
+    # when & then
+    assert create_operation_profile(request) is None
+
+
+@mock.patch("saleor.graphql.views.create_operation_profile")
+def test_profile_returned_in_extensions(
+    mocked_create_operation_profile, staff_api_client, channel_USD
+):
+    # given
+    mocked_create_operation_profile.return_value = OperationProfile(report=True)
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_CHANNELS)
+
+    # then
+    content = get_graphql_content(response)
+    profile = content["extensions"]["profile"]
+    assert profile["fields"][0]["sqlCount"] > 0
+    assert profile["nPlusOne"] == []
@@ -0,0 +1,227 @@
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from graphql import GraphQLEnumType, GraphQLNonNull, GraphQLScalarType, parse
+from graphql.type.definition import get_named_type
+
+from ....order.models import Order
+from ....product.models import Product
+from ...api import schema
+from ...product.dataloaders import ProductByIdLoader
+from ...tests.utils import get_graphql_content
+from ..projection import (
+    _DEFERRABLE_FIELDS,
+    defer_never_selected_fields,
+    defer_unselected_connection_fields,
+    get_unselected_fields,
+    register_deferrable_fields,
+)
+
+QUERY_PRODUCTS_NAMES = """
+    query Products($channel: String) {
+        products(first: 10, channel: $channel) {
+            edges {
+                node {
+                    id
+                    name
+                    metadata {
+                        key
+                        value
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def _get_info(query):
+    document = parse(query)
+    operation = document.definitions[0]
+    info = mock.Mock(fragments={})
+    info.field_asts = [operation.selection_set.selections[0]]
+    return info
+
+
+def test_defer_unselected_connection_fields(settings):
+    # given
+    settings.GRAPHQL_QUERYSET_PROJECTION_ENABLED = True
+    info = _get_info(QUERY_PRODUCTS_NAMES)
+
+    # when
+    with mock.patch.dict(_DEFERRABLE_FIELDS, clear=True):
+        register_deferrable_fields(
+            Product,
+            {
+                "description": ("description",),
+                "search_vector": (),
+                "metadata": ("metadata",),
+                "name": ("name",),
+            },
+        )
+        queryset = defer_unselected_connection_fields(
+            Product.objects.all(), info, required_fields=["search_vector"]
+        )
+
+    # then
+    deferred_fields, defer = queryset.query.deferred_loading
+    assert defer is True
+    assert deferred_fields == {"description"}
+
+
+def test_defer_unselected_connection_fields_disabled(settings):
+    # given
+    settings.GRAPHQL_QUERYSET_PROJECTION_ENABLED = False
+    info = _get_info(QUERY_PRODUCTS_NAMES)
+    queryset = Product.objects.all()
+
+    # when
+    result = defer_unselected_connection_fields(queryset, info)
+
+    # then
+    assert result is queryset
+
+
+def test_defer_never_selected_fields_skips_values_queryset(settings):
+    # given
+    settings.GRAPHQL_QUERYSET_PROJECTION_ENABLED = True
+    queryset = Product.objects.values("id")
+
+    # when
+    result = defer_never_selected_fields(queryset)
+
+    # then
+    assert result is queryset
+
+
+def test_product_by_id_loader_defers_search_fields(
+    rf, product, settings, django_assert_num_queries
+):
+    # given
+    settings.GRAPHQL_QUERYSET_PROJECTION_ENABLED = True
+    context = rf.request()
+    context.allow_replica = False
+
+    # when
+    with mock.patch.dict(_DEFERRABLE_FIELDS, clear=True):
+        register_deferrable_fields(
+            Product, {"search_document": (), "search_vector": ()}
+        )
+        loaded_product = ProductByIdLoader(context).load(product.pk).get()
+
+    # then
+    deferred_fields = loaded_product.get_deferred_fields()
+    assert {"search_document", "search_vector"} <= deferred_fields
+    with django_assert_num_queries(0):
+        assert loaded_product.name == product.name
+
+
+def test_products_query_with_projection(
+    staff_api_client, product_list, channel_USD, settings
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    settings.GRAPHQL_QUERYSET_PROJECTION_ENABLED = False
+    expected_content = get_graphql_content(
+        staff_api_client.post_graphql(QUERY_PRODUCTS_NAMES, variables)
+    )
+    settings.GRAPHQL_QUERYSET_PROJECTION_ENABLED = True
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_PRODUCTS_NAMES, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"] == expected_content["data"]
+    assert len(content["data"]["products"]["edges"]) == len(product_list)
+
+
+def test_order_private_metadata_not_deferred_for_shipping_fields():
+    # when
+    unselected_fields = get_unselected_fields(
+        Order, {"id", "shippingMethod", "deliveryMethod"}
+    )
+
+    # then
+    assert "private_metadata" not in unselected_fields
+    assert "metadata" in unselected_fields
+
+
+def _get_all_fields_selection(type_name):
+    """Return selection of all fields of the type that have no required arguments."""
+    selections = []
+    for name, field in schema.get_type(type_name).fields.items():
+        if any(isinstance(arg.type, GraphQLNonNull) for arg in field.args.values()):
+            continue
+        if isinstance(get_named_type(field.type), GraphQLScalarType | GraphQLEnumType):
+            selections.append(name)
+        else:
+            selections.append(f"{name} {{ __typename }}")
+    return "\n".join(selections)
+
+
+def _count_queries(api_client, query, variables):
+    with CaptureQueriesContext(connection) as queries:
+        api_client.post_graphql(query, variables)
+    return len(queries)
+
+
+QUERY_ORDERS_ALL_FIELDS = """
+    query Orders {
+        orders(first: 10) {
+            edges {
+                node {
+                    %s
+                }
+            }
+        }
+    }
+"""
+
+QUERY_PRODUCTS_ALL_FIELDS = """
+    query Products($channel: String) {
+        products(first: 10, channel: $channel) {
+            edges {
+                node {
+                    %s
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.mark.parametrize(
+    ("query", "type_name", "objects_fixture"),
+    [
+        (QUERY_ORDERS_ALL_FIELDS, "Order", "order_list"),
+        (QUERY_PRODUCTS_ALL_FIELDS, "Product", "product_list"),
+    ],
+)
+def test_projection_doesnt_add_queries_for_any_field(
+    query,
+    type_name,
+    objects_fixture,
+    superuser_api_client,
+    channel_USD,
+    settings,
+    request,
+):
+    # given
+    request.getfixturevalue(objects_fixture)
+    query = query % _get_all_fields_selection(type_name)
+    variables = {"channel": channel_USD.slug} if type_name == "Product" else {}
+    settings.GRAPHQL_QUERYSET_PROJECTION_ENABLED = False
+    # warm up the caches shared between the requests
+    superuser_api_client.post_graphql(query, variables)
+    queries_without_projection = _count_queries(superuser_api_client, query, variables)
+    settings.GRAPHQL_QUERYSET_PROJECTION_ENABLED = True
+
+    # when
+    queries_with_projection = _count_queries(superuser_api_client, query, variables)
+
+    # then
+    # a resolver reading a deferred column would load it with a query per instance
+    assert queries_with_projection <= queries_without_projection
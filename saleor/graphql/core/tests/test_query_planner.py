@@ -0,0 +1,105 @@
+from unittest import mock
+
+from graphql import parse
+
+from ...tests.utils import get_graphql_content
+from ..query_planner import (
+    _PREFETCHERS,
+    get_field_selections,
+    prefetch_selections,
+    register_prefetcher,
+)
+
+QUERY_PRODUCTS_WITH_NESTED_FIELDS = """
+    fragment VariantFields on ProductVariant {
+        id
+        channelListings {
+            price {
+                amount
+            }
+        }
+    }
+    query Products($channel: String) {
+        products(first: 10, channel: $channel) {
+            edges {
+                node {
+                    id
+                    category {
+                        name
+                    }
+                    productType {
+                        name
+                    }
+                    variants {
+                        ...VariantFields
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def test_get_field_selections_resolves_fragments():
+    # given
+    document = parse(QUERY_PRODUCTS_WITH_NESTED_FIELDS)
+    fragment, operation = document.definitions
+    fragments = {fragment.name.value: fragment}
+    node_selection_set = (
+        operation.selection_set.selections[0]
+        .selection_set.selections[0]
+        .selection_set.selections[0]
+        .selection_set
+    )
+
+    # when
+    selections = get_field_selections(node_selection_set, fragments)
+    variant_selections = get_field_selections(selections["variants"][0], fragments)
+
+    # then
+    assert set(selections) == {"id", "category", "productType", "variants"}
+    assert set(variant_selections) == {"id", "channelListings"}
+
+
+def test_prefetch_selections_calls_registered_prefetchers():
+    # given
+    document = parse("{ node { category { name } variants { id } } }")
+    selection_set = document.definitions[0].selection_set.selections[0].selection_set
+    category_prefetcher = mock.Mock(return_value=None)
+    context = mock.Mock()
+    roots = [mock.Mock(), mock.Mock()]
+
+    # when
+    with mock.patch.dict(_PREFETCHERS, clear=True):
+        register_prefetcher("TestType", "category")(category_prefetcher)
+        prefetch_selections(context, {}, "TestType", [selection_set], roots)
+
+    # then
+    category_prefetcher.assert_called_once_with(context, roots)
+
+
+def test_products_query_with_query_planner(
+    staff_api_client,
+    permission_manage_products,
+    product_list,
+    channel_USD,
+    settings,
+):
+    # given
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    variables = {"channel": channel_USD.slug}
+    settings.GRAPHQL_QUERY_PLANNER_ENABLED = False
+    expected_content = get_graphql_content(
+        staff_api_client.post_graphql(QUERY_PRODUCTS_WITH_NESTED_FIELDS, variables)
+    )
+    settings.GRAPHQL_QUERY_PLANNER_ENABLED = True
+
+    # when
+    response = staff_api_client.post_graphql(
+        QUERY_PRODUCTS_WITH_NESTED_FIELDS, variables
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"] == expected_content["data"]
+    assert len(content["data"]["products"]["edges"]) == len(product_list)
@@ -1,19 +1,25 @@
 import json
+import threading
 from unittest import mock
 from unittest.mock import patch
 
 import graphene
 import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.db import connection
+from django.http import JsonResponse
 from django.shortcuts import render
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from graphql.execution.base import ExecutionResult
 
 from .... import __version__ as saleor_version
 from ....graphql.api import backend, schema
 from ....graphql.utils import INTERNAL_ERROR_MESSAGE
+from ...context import clear_context
 from ...tests.fixtures import API_PATH
 from ...tests.utils import get_graphql_content, get_graphql_content_from_response
-from ...views import GraphQLView, generate_cache_key
+from ...views import AsyncGraphQLView, GraphQLView, generate_cache_key
 
 
 def test_batch_queries(category, product, api_client, channel_USD):
@@ -354,6 +360,77 @@ def test_graphql_view_clears_context(rf, staff_user, product, channel_USD):
     assert request.dataloaders == {}
 
 
+def _post_batch_products_query(rf, staff_user, product, channel_USD):
+    product_id = graphene.Node.to_global_id("Product", product.pk)
+    query = (
+        f'{{ product(id: "{product_id}" channel: "{channel_USD.slug}") '
+        "{ name category { name } productType { name } } }"
+    )
+    request = rf.post(
+        path="/",
+        data=[{"query": query}, {"query": query}],
+        content_type="application/json",
+    )
+    request.app = None
+    request.user = staff_user
+    view = GraphQLView.as_view(backend=backend, schema=schema)
+    with CaptureQueriesContext(connection) as queries:
+        response = view(request)
+    return request, response, len(queries)
+
+
+def test_batch_queries_share_context(rf, staff_user, product, channel_USD, settings):
+    # given
+    settings.GRAPHQL_BATCH_SHARED_CONTEXT_ENABLED = False
+    _, _, queries_without_shared_context = _post_batch_products_query(
+        rf, staff_user, product, channel_USD
+    )
+    settings.GRAPHQL_BATCH_SHARED_CONTEXT_ENABLED = True
+
+    # when
+    with patch(
+        "saleor.graphql.views.clear_context", wraps=clear_context
+    ) as clear_context_mock:
+        request, response, queries_count = _post_batch_products_query(
+            rf, staff_user, product, channel_USD
+        )
+
+    # then
+    json_data = json.loads(response.content)
+    assert [data["data"]["product"]["name"] for data in json_data] == [
+        product.name,
+        product.name,
+    ]
+    assert queries_count < queries_without_shared_context
+    clear_context_mock.assert_called_once()
+    assert request.dataloaders == {}
+
+
+def test_batch_mutation_clears_shared_dataloaders(
+    staff_api_client, permission_manage_products, category, settings
+):
+    # given
+    settings.GRAPHQL_BATCH_SHARED_CONTEXT_ENABLED = True
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    category_id = graphene.Node.to_global_id("Category", category.pk)
+    query = f'{{ category(id: "{category_id}") {{ name }} }}'
+    mutation = (
+        f'mutation {{ categoryUpdate(id: "{category_id}", input: {{name: "New"}}) '
+        "{ category { name } errors { field } } }"
+    )
+
+    # when
+    response = staff_api_client.post(
+        [{"query": query}, {"query": mutation}, {"query": query}]
+    )
+
+    # then
+    content = get_graphql_content(response)
+    assert content[0]["data"]["category"]["name"] == category.name
+    assert content[1]["data"]["categoryUpdate"]["category"]["name"] == "New"
+    assert content[2]["data"]["category"]["name"] == "New"
+
+
 @pytest.mark.parametrize(
     ("public_url", "expected_url_base"),
     [
@@ -386,3 +463,31 @@ def test_playground_is_rendered_with_proper_api_url_if_public_url_is_set(
             "plugins_url": f"{expected_url_base}/plugins/",
         },
     )
+
+
+def test_async_graphql_view_is_coroutine():
+    # when
+    view = AsyncGraphQLView.as_view(backend=backend, schema=schema)
+
+    # then
+    assert iscoroutinefunction(view)
+
+
+@patch.object(GraphQLView, "dispatch")
+def test_async_graphql_view_dispatches_in_execution_thread_pool(mocked_dispatch, rf):
+    # given
+    def dispatch(request, *args, **kwargs):
+        return JsonResponse({"thread": threading.current_thread().name})
+
+    mocked_dispatch.side_effect = dispatch
+    request = rf.post(
+        API_PATH, data={"query": "{ shop { name } }"}, content_type="application/json"
+    )
+    view = AsyncGraphQLView.as_view(backend=backend, schema=schema)
+
+    # when
+    response = async_to_sync(view)(request)
+
+    # then
+    mocked_dispatch.assert_called_once_with(request)
+    assert json.loads(response.content)["thread"].startswith("graphql-execution")
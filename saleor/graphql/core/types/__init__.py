@@ -16,6 +16,7 @@ from .common import (
     CollectionChannelListingError,
     CollectionError,
     CountryDisplay,
+    CustomerBulkCreateError,
     CustomerBulkUpdateError,
     DateRangeInput,
     DateTimeRangeInput,
@@ -108,6 +109,7 @@ __all__ = [
     "CollectionChannelListingError",
     "CollectionError",
     "CountryDisplay",
+    "CustomerBulkCreateError",
     "CustomerBulkUpdateError",
     "DateRangeInput",
     "DateTimeRangeInput",
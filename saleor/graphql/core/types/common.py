@@ -38,6 +38,7 @@ from ..enums import (
     ChannelErrorCode,
     CheckoutErrorCode,
     CollectionErrorCode,
+    CustomerBulkCreateErrorCode,
     CustomerBulkUpdateErrorCode,
     DiscountErrorCode,
     ExportErrorCode,
@@ -278,6 +279,13 @@ class CheckoutError(Error):
         doc_category = DOC_CATEGORY_CHECKOUT
 
 
+class CustomerBulkCreateError(BulkError):
+    code = CustomerBulkCreateErrorCode(description="The error code.", required=True)
+
+    class Meta:
+        doc_category = DOC_CATEGORY_USERS
+
+
 class CustomerBulkUpdateError(BulkError):
     code = CustomerBulkUpdateErrorCode(description="The error code.", required=True)
 
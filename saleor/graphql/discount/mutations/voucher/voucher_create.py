@@ -2,7 +2,12 @@ import graphene
 from django.core.exceptions import ValidationError
 from django.db import transaction
 
-from .....core.utils.promo_code import generate_promo_code, is_available_promo_code
+from .....core.utils.promo_code import (
+    PromoCodeGenerationError,
+    generate_promo_codes,
+    get_unavailable_promo_codes,
+    is_available_promo_code,
+)
 from .....discount import models
 from .....discount.error_codes import DiscountErrorCode
 from .....permission.enums import DiscountPermissions
@@ -137,7 +142,7 @@ class VoucherCreate(DeprecatedModelMutation):
         data["code"] = data.code.strip() if data.code else None
 
         if not data["code"]:
-            data["code"] = generate_promo_code()
+            [data["code"]] = cls.generate_codes("code", 1)
         elif not is_available_promo_code(data["code"]):
             raise ValidationError(
                 {
@@ -164,17 +169,13 @@ class VoucherCreate(DeprecatedModelMutation):
                 }
             )
 
-        existing_codes = []
-        clean_add_codes = []
-        for code in data.add_codes:
-            cleaned_code = code.strip() if code else None
-
-            if not cleaned_code:
-                cleaned_code = generate_promo_code()
-            elif not is_available_promo_code(cleaned_code):
-                existing_codes.append(cleaned_code)
-
-            clean_add_codes.append(cleaned_code)
+        provided_codes = [code for code in codes if code]
+        unavailable_codes = get_unavailable_promo_codes(provided_codes)
+        existing_codes = [code for code in provided_codes if code in unavailable_codes]
+        generated_codes = iter(
+            cls.generate_codes("codes", len(codes) - len(provided_codes))
+        )
+        clean_add_codes = [code or next(generated_codes) for code in codes]
 
         if existing_codes:
             raise ValidationError(
@@ -189,6 +190,20 @@ class VoucherCreate(DeprecatedModelMutation):
 
         data["add_codes"] = clean_add_codes
 
+    @staticmethod
+    def generate_codes(field: str, count: int) -> list[str]:
+        try:
+            return generate_promo_codes(count)
+        except PromoCodeGenerationError as e:
+            raise ValidationError(
+                {
+                    field: ValidationError(
+                        "Unable to generate unique promo codes.",
+                        code=DiscountErrorCode.INVALID.value,
+                    )
+                }
+            ) from e
+
     @classmethod
     def clean_codes(cls, data):
         if data.code != "":
@@ -8,6 +8,7 @@ from django.utils.functional import SimpleLazyObject
 from freezegun import freeze_time
 
 from .....core.utils.json_serializer import CustomJsonEncoder
+from .....core.utils.promo_code import PromoCodeGenerationError
 from .....discount import DiscountValueType, VoucherType
 from .....discount.error_codes import DiscountErrorCode
 from .....discount.models import Voucher
@@ -357,6 +358,36 @@ def test_create_voucher_with_empty_code(staff_api_client, permission_manage_disc
     assert data["codes"]["edges"][0]["node"]["code"] != ""
 
 
+@patch("saleor.graphql.discount.mutations.voucher.voucher_create.generate_promo_codes")
+def test_create_voucher_unable_to_generate_codes(
+    mocked_generate_promo_codes, staff_api_client, permission_manage_discounts
+):
+    # given
+    mocked_generate_promo_codes.side_effect = PromoCodeGenerationError()
+    variables = {
+        "input": {
+            "name": "test voucher",
+            "type": VoucherTypeEnum.ENTIRE_ORDER.name,
+            "addCodes": [{"code": ""}],
+            "discountValueType": DiscountValueTypeEnum.FIXED.name,
+        }
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        CREATE_VOUCHER_MUTATION, variables, permissions=[permission_manage_discounts]
+    )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["voucherCreate"]
+    assert not data["voucher"]
+    assert len(data["errors"]) == 1
+    assert data["errors"][0]["field"] == "codes"
+    assert data["errors"][0]["code"] == DiscountErrorCode.INVALID.name
+    assert not Voucher.objects.exists()
+
+
 def test_create_voucher_with_spaces_in_code(
     staff_api_client, permission_manage_discounts
 ):
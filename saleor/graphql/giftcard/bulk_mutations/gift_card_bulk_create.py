@@ -5,7 +5,7 @@ from django.core.exceptions import ValidationError
 from django.db import transaction
 
 from ....core.tracing import traced_atomic_transaction
-from ....core.utils.promo_code import generate_promo_code
+from ....core.utils.promo_code import PromoCodeGenerationError, generate_promo_codes
 from ....core.utils.validators import is_date_in_future
 from ....giftcard import events, models
 from ....giftcard.error_codes import GiftCardErrorCode
@@ -150,11 +150,19 @@ class GiftCardBulkCreate(BaseMutation):
         count = cleaned_input.pop("count")
         balance = cleaned_input.pop("balance")
         app = get_app_promise(info.context).get()
+        try:
+            codes = generate_promo_codes(count)
+        except PromoCodeGenerationError as e:
+            raise ValidationError(
+                {
+                    "count": ValidationError(
+                        "Unable to generate unique codes for the gift cards.",
+                        code=GiftCardErrorCode.INVALID.value,
+                    )
+                }
+            ) from e
         gift_cards = models.GiftCard.objects.bulk_create(
-            [
-                models.GiftCard(code=generate_promo_code(), **cleaned_input)
-                for _ in range(count)
-            ]
+            [models.GiftCard(code=code, **cleaned_input) for code in codes]
         )
         events.gift_cards_issued_event(gift_cards, info.context.user, app, balance)
         return gift_cards
@@ -175,5 +183,4 @@ class GiftCardBulkCreate(BaseMutation):
     @classmethod
     def call_gift_card_created_on_plugins(cls, instances, manager):
         webhooks = get_webhooks_for_event(WebhookEventAsyncType.GIFT_CARD_CREATED)
-        for instance in instances:
-            cls.call_event(manager.gift_card_created, instance, webhooks=webhooks)
+        cls.call_event(manager.gift_cards_created, instances, webhooks=webhooks)
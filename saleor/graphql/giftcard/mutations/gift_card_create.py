@@ -6,7 +6,11 @@ from django.core.validators import validate_email
 
 from ....account.models import User
 from ....core.tracing import traced_atomic_transaction
-from ....core.utils.promo_code import generate_promo_code, is_available_promo_code
+from ....core.utils.promo_code import (
+    PromoCodeGenerationError,
+    generate_promo_code,
+    is_available_promo_code,
+)
 from ....core.utils.validators import is_date_in_future
 from ....giftcard import events, models
 from ....giftcard.error_codes import GiftCardErrorCode
@@ -137,7 +141,7 @@ class GiftCardCreate(DeprecatedModelMutation):
                     }
                 )
 
-            cleaned_input["code"] = code or generate_promo_code()
+            cleaned_input["code"] = code or cls.generate_code()
             cls.set_created_by_user(cleaned_input, info)
 
         cls.clean_expiry_date(cleaned_input, instance)
@@ -169,6 +173,20 @@ class GiftCardCreate(DeprecatedModelMutation):
 
         return cleaned_input
 
+    @staticmethod
+    def generate_code():
+        try:
+            return generate_promo_code()
+        except PromoCodeGenerationError as e:
+            raise ValidationError(
+                {
+                    "code": ValidationError(
+                        "Unable to generate a unique code for the gift card.",
+                        code=GiftCardErrorCode.INVALID.value,
+                    )
+                }
+            ) from e
+
     @staticmethod
     def set_created_by_user(cleaned_input, info: ResolveInfo):
         user = info.context.user
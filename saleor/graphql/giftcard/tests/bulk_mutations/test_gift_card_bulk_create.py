@@ -3,8 +3,10 @@ from unittest import mock
 
 import pytest
 
+from .....core.utils.promo_code import PromoCodeGenerationError
 from .....giftcard import GiftCardEvents
 from .....giftcard.error_codes import GiftCardErrorCode
+from .....giftcard.models import GiftCard
 from ....tests.utils import assert_no_permission, get_graphql_content
 
 GIFT_CARD_BULK_CREATE_MUTATION = """
@@ -166,7 +168,7 @@ def test_create_never_expiry_gift_cards(
     "saleor.graphql.giftcard.bulk_mutations."
     "gift_card_bulk_create.get_webhooks_for_event"
 )
-@mock.patch("saleor.plugins.webhook.plugin.trigger_webhooks_async")
+@mock.patch("saleor.plugins.webhook.plugin.trigger_webhooks_async_for_multiple_objects")
 def test_create_gift_cards_trigger_webhooks(
     mocked_webhook_trigger,
     mocked_get_webhooks_for_event,
@@ -217,7 +219,13 @@ def test_create_gift_cards_trigger_webhooks(
     assert not errors
     assert data["count"] == count
     assert len(data["giftCards"]) == count
-    assert mocked_webhook_trigger.call_count == count
+    mocked_webhook_trigger.assert_called_once()
+    webhook_payloads_data = mocked_webhook_trigger.call_args.kwargs[
+        "webhook_payloads_data"
+    ]
+    assert {
+        payload_data.subscribable_object.code for payload_data in webhook_payloads_data
+    } == {card["code"] for card in data["giftCards"]}
 
 
 def test_create_gift_cards_with_expiry_date_by_app(
@@ -535,3 +543,46 @@ def test_create_gift_cards_invalid_expiry_date(
     assert len(errors) == 1
     assert errors[0]["field"] == "expiryDate"
     assert errors[0]["code"] == GiftCardErrorCode.INVALID.name
+
+
+@mock.patch(
+    "saleor.graphql.giftcard.bulk_mutations.gift_card_bulk_create.generate_promo_codes"
+)
+def test_create_gift_cards_unable_to_generate_codes(
+    mocked_generate_promo_codes,
+    app_api_client,
+    permission_manage_gift_card,
+    permission_manage_users,
+    permission_manage_apps,
+):
+    # given
+    mocked_generate_promo_codes.side_effect = PromoCodeGenerationError()
+    variables = {
+        "input": {
+            "count": 10,
+            "balance": {"amount": 100, "currency": "USD"},
+            "isActive": True,
+        }
+    }
+
+    # when
+    response = app_api_client.post_graphql(
+        GIFT_CARD_BULK_CREATE_MUTATION,
+        variables,
+        permissions=[
+            permission_manage_gift_card,
+            permission_manage_users,
+            permission_manage_apps,
+        ],
+    )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["giftCardBulkCreate"]
+    errors = data["errors"]
+
+    assert not data["giftCards"]
+    assert len(errors) == 1
+    assert errors[0]["field"] == "count"
+    assert errors[0]["code"] == GiftCardErrorCode.INVALID.name
+    assert not GiftCard.objects.exists()
@@ -23,6 +23,7 @@ from ..core.context import get_database_connection_name
 from ..core.descriptions import DEFAULT_DEPRECATION_REASON
 from ..core.doc_category import DOC_CATEGORY_GIFT_CARDS
 from ..core.fields import PermissionsField
+from ..core.projection import METADATA_FIELDS, register_deferrable_fields
 from ..core.scalars import Date, DateTime
 from ..core.tracing import traced_resolver
 from ..core.types import BaseObjectType, ModelObjectType, Money, NonNullList
@@ -579,3 +580,12 @@ class GiftCardTagCountableConnection(CountableConnection):
     class Meta:
         doc_category = DOC_CATEGORY_GIFT_CARDS
         node = GiftCardTag
+
+
+register_deferrable_fields(
+    models.GiftCard,
+    {
+        "search_vector": (),
+        **METADATA_FIELDS,
+    },
+)
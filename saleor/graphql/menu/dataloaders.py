@@ -6,6 +6,7 @@ from ..core.dataloaders import DataLoader
 
 class MenuByIdLoader(DataLoader[int, Menu]):
     context_key = "menu_by_id"
+    use_reference_data_cache = True
 
     def batch_load(self, keys):
         menus = Menu.objects.using(self.database_connection_name).in_bulk(keys)
@@ -14,6 +15,7 @@ class MenuByIdLoader(DataLoader[int, Menu]):
 
 class MenuItemByIdLoader(DataLoader[int, MenuItem]):
     context_key = "menuitem_by_id"
+    use_reference_data_cache = True
 
     def batch_load(self, keys):
         menu_items = MenuItem.objects.using(self.database_connection_name).in_bulk(keys)
@@ -22,6 +24,7 @@ class MenuItemByIdLoader(DataLoader[int, MenuItem]):
 
 class MenuItemsByParentMenuLoader(DataLoader[int, list[MenuItem]]):
     context_key = "menuitems_by_parent_menu"
+    use_reference_data_cache = True
 
     def batch_load(self, keys):
         menu_items = MenuItem.objects.using(self.database_connection_name).filter(
@@ -35,6 +38,7 @@ class MenuItemsByParentMenuLoader(DataLoader[int, list[MenuItem]]):
 
 class MenuItemChildrenLoader(DataLoader[int, list[MenuItem]]):
     context_key = "menuitem_children"
+    use_reference_data_cache = True
 
     def batch_load(self, keys):
         menu_items = MenuItem.objects.using(self.database_connection_name).filter(
@@ -58,6 +58,25 @@ METRIC_GRAPHQL_QUERY_COST = meter.create_metric(
     bucket_boundaries=QUERY_COST_BUCKETS,
 )
 
+METRIC_GRAPHQL_FIELD_DURATION = meter.create_metric(
+    "saleor.graphql.field.duration",
+    scope=Scope.SERVICE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.SECOND,
+    description="Duration of GraphQL field resolvers in profiled operations.",
+    bucket_boundaries=DEFAULT_DURATION_BUCKETS,
+)
+
+FIELD_DB_QUERIES_BUCKETS = [0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000]
+METRIC_GRAPHQL_FIELD_DB_QUERIES = meter.create_metric(
+    "saleor.graphql.field.db_queries",
+    scope=Scope.SERVICE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.QUERY,
+    description="Number of database queries of GraphQL fields in profiled operations.",
+    bucket_boundaries=FIELD_DB_QUERIES_BUCKETS,
+)
+
 METRIC_REQUEST_COUNT = meter.create_metric(
     "saleor.request.count",
     scope=Scope.SERVICE,
@@ -121,6 +140,20 @@ def record_graphql_query_cost(
     meter.record(METRIC_GRAPHQL_QUERY_COST, cost, Unit.COST, attributes=attributes)
 
 
+def record_graphql_field_stats(field: str, duration: float, db_queries: int) -> None:
+    parent_type, _, field_name = field.partition(".")
+    attributes = {
+        saleor_attributes.GRAPHQL_PARENT_TYPE: parent_type,
+        saleor_attributes.GRAPHQL_FIELD_NAME: field_name,
+    }
+    meter.record(
+        METRIC_GRAPHQL_FIELD_DURATION, duration, Unit.SECOND, attributes=attributes
+    )
+    meter.record(
+        METRIC_GRAPHQL_FIELD_DB_QUERIES, db_queries, Unit.QUERY, attributes=attributes
+    )
+
+
 def record_request_count(
     amount: int = 1,
     error_type: str | None = None,
@@ -1,4 +1,3 @@
-import copy
 import datetime
 from collections import defaultdict
 from dataclasses import dataclass
@@ -9,9 +8,10 @@ from typing import Any
 from uuid import UUID
 
 import graphene
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import URLValidator
-from django.db.models import Q
+from django.db.models import Q, prefetch_related_objects
 from django.utils import timezone
 from graphql import GraphQLError
 from prices import Money
@@ -42,7 +42,7 @@ from ....order import (
 )
 from ....order.error_codes import OrderBulkCreateErrorCode
 from ....order.models import Fulfillment, FulfillmentLine, Order, OrderEvent, OrderLine
-from ....order.search import update_order_search_vector
+from ....order.search import set_orders_search_vector
 from ....order.utils import update_order_display_gross_prices, updates_amounts_for_order
 from ....payment import TransactionEventType
 from ....payment.models import TransactionEvent, TransactionItem
@@ -81,7 +81,7 @@ from ..types import Order as OrderType
 from .utils import get_instance
 
 MINUTES_DIFF = 5
-MAX_ORDERS = 50
+MAX_ORDERS = settings.ORDER_BULK_CREATE_MAX_ORDERS
 MAX_NOTE_LENGTH = 255
 
 
@@ -158,14 +158,9 @@ class OrderBulkCreateData:
             for event in transaction_data.events:
                 event.transaction = transaction_data.transaction
 
-    def link_gift_cards(self):
-        if self.order:
-            self.order.gift_cards.add(*self.gift_cards)
-
     def post_create_order_update(self):
         if self.order:
             updates_amounts_for_order(self.order, save=False)
-            update_order_search_vector(self.order, save=False)
 
     @property
     def all_order_lines(self) -> list[OrderLine]:
@@ -2210,22 +2205,18 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
     def handle_stocks(
         cls, orders_data: list[OrderBulkCreateData], stock_update_policy: str
     ) -> list[Stock]:
-        variant_ids: list[int] = sum(
-            [
-                order_data.unique_variant_ids
-                for order_data in orders_data
-                if order_data.order
-            ],
-            [],
-        )
-        warehouse_ids: list[UUID] = sum(
-            [
-                order_data.unique_warehouse_ids
-                for order_data in orders_data
-                if order_data.order
-            ],
-            [],
-        )
+        variant_ids: list[int] = [
+            variant_id
+            for order_data in orders_data
+            if order_data.order
+            for variant_id in order_data.unique_variant_ids
+        ]
+        warehouse_ids: list[UUID] = [
+            warehouse_id
+            for order_data in orders_data
+            if order_data.order
+            for warehouse_id in order_data.unique_warehouse_ids
+        ]
         stocks = Stock.objects.filter(
             warehouse__id__in=warehouse_ids, product_variant__id__in=variant_ids
         ).all()
@@ -2235,10 +2226,13 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
         }
 
         for order_data in orders_data:
-            # Create a copy of stocks. If full iteration over order lines
+            # Collect stock changes for the order. If full iteration over order lines
             # and fulfillments will not produce error, which disqualify whole order,
-            # than replace the copy with original stocks.
-            stocks_map_copy = copy.deepcopy(stocks_map)
+            # than apply the changes to the stocks.
+            # Changes are stored as a map of stock key to a pair of quantity
+            # allocated and quantity deltas, so the stocks don't need to be copied
+            # for each order.
+            stock_changes: dict[str, list[int]] = defaultdict(lambda: [0, 0])
             line_index = 0
             for line in order_data.lines:
                 order_line = line.line
@@ -2263,7 +2257,8 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
                     order_data.is_critical_error = True
                     break
 
-                stock = stocks_map_copy.get(f"{variant_id}_{warehouse_id}")
+                stock_key = f"{variant_id}_{warehouse_id}"
+                stock = stocks_map.get(stock_key)
                 if not stock:
                     order_data.errors.append(
                         OrderBulkError(
@@ -2277,7 +2272,10 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
                     order_data.is_critical_error = True
                     break
 
-                available_quantity = stock.quantity - stock.quantity_allocated
+                allocated_delta, quantity_delta = stock_changes[stock_key]
+                available_quantity = (stock.quantity + quantity_delta) - (
+                    stock.quantity_allocated + allocated_delta
+                )
                 if (
                     quantity_to_fulfill > available_quantity
                     and stock_update_policy != StockUpdatePolicy.FORCE
@@ -2293,17 +2291,21 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
                     )
                     order_data.is_critical_error = True
 
-                stock.quantity_allocated += quantity_to_allocate
+                stock_changes[stock_key][0] += quantity_to_allocate
 
                 fulfillment_lines: list[OrderBulkFulfillmentLine] = (
                     order_data.orderline_fulfillmentlines_map.get(order_line.id) or []
                 )
                 for fulfillment_line in fulfillment_lines:
-                    stock.quantity -= fulfillment_line.line.quantity
+                    stock_changes[stock_key][1] -= fulfillment_line.line.quantity
                 line_index += 1
 
             if not order_data.is_critical_error:
-                stocks_map = stocks_map_copy
+                for stock_key, deltas in stock_changes.items():
+                    allocated_delta, quantity_delta = deltas
+                    stock = stocks_map[stock_key]
+                    stock.quantity_allocated += allocated_delta
+                    stock.quantity += quantity_delta
 
         return list(stocks_map.values())
 
@@ -2341,24 +2343,20 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
         orders = [order_data.order for order_data in orders_data if order_data.order]
         Order.objects.bulk_create(orders)
 
-        order_lines: list[OrderLine] = sum(
-            [
-                order_data.all_order_lines
-                for order_data in orders_data
-                if order_data.order
-            ],
-            [],
-        )
+        order_lines: list[OrderLine] = [
+            line
+            for order_data in orders_data
+            if order_data.order
+            for line in order_data.all_order_lines
+        ]
         OrderLine.objects.bulk_create(order_lines)
 
-        order_line_discounts: list[OrderLineDiscount] = sum(
-            [
-                order_data.all_order_line_discounts
-                for order_data in orders_data
-                if order_data.order
-            ],
-            [],
-        )
+        order_line_discounts: list[OrderLineDiscount] = [
+            line_discount
+            for order_data in orders_data
+            if order_data.order
+            for line_discount in order_data.all_order_line_discounts
+        ]
         OrderLineDiscount.objects.bulk_create(order_line_discounts)
 
         notes = [
@@ -2378,59 +2376,73 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
         Fulfillment.objects.bulk_create(fulfillments)
         for order_data in orders_data:
             order_data.set_fulfillment_id()
-        fulfillment_lines: list[FulfillmentLine] = sum(
-            [
-                order_data.all_fulfillment_lines
-                for order_data in orders_data
-                if order_data.order
-            ],
-            [],
-        )
+        fulfillment_lines: list[FulfillmentLine] = [
+            fulfillment_line
+            for order_data in orders_data
+            if order_data.order
+            for fulfillment_line in order_data.all_fulfillment_lines
+        ]
         FulfillmentLine.objects.bulk_create(fulfillment_lines)
 
         stock_bulk_update(stocks, ["quantity"])
 
-        transactions: list[TransactionItem] = sum(
-            [
-                order_data.all_transactions
-                for order_data in orders_data
-                if order_data.order
-            ],
-            [],
-        )
+        transactions: list[TransactionItem] = [
+            transaction_item
+            for order_data in orders_data
+            if order_data.order
+            for transaction_item in order_data.all_transactions
+        ]
         TransactionItem.objects.bulk_create(transactions)
         for order_data in orders_data:
             order_data.set_transaction_id()
-        transaction_events: list[TransactionEvent] = sum(
-            [
-                order_data.all_transaction_events
-                for order_data in orders_data
-                if order_data.order
-            ],
-            [],
-        )
+        transaction_events: list[TransactionEvent] = [
+            event
+            for order_data in orders_data
+            if order_data.order
+            for event in order_data.all_transaction_events
+        ]
         TransactionEvent.objects.bulk_create(transaction_events)
 
-        invoices: list[Invoice] = sum(
-            [order_data.all_invoices for order_data in orders_data if order_data.order],
-            [],
-        )
+        invoices: list[Invoice] = [
+            invoice
+            for order_data in orders_data
+            if order_data.order
+            for invoice in order_data.all_invoices
+        ]
         Invoice.objects.bulk_create(invoices)
 
-        discounts: list[OrderDiscount] = sum(
+        discounts: list[OrderDiscount] = [
+            discount
+            for order_data in orders_data
+            if order_data.order
+            for discount in order_data.all_discounts
+        ]
+        OrderDiscount.objects.bulk_create(discounts)
+
+        OrderGiftCard = Order.gift_cards.through
+        OrderGiftCard.objects.bulk_create(
             [
-                order_data.all_discounts
+                OrderGiftCard(order_id=order_data.order.pk, giftcard_id=gift_card.pk)
                 for order_data in orders_data
                 if order_data.order
+                for gift_card in order_data.gift_cards
             ],
-            [],
+            ignore_conflicts=True,
         )
-        OrderDiscount.objects.bulk_create(discounts)
 
+        # Fetch data required for the amounts update for all orders at once.
+        prefetch_related_objects(
+            orders, "payments", "payment_transactions", "granted_refunds"
+        )
         for order_data in orders_data:
-            order_data.link_gift_cards()
             order_data.post_create_order_update()
 
+        if settings.ORDER_SEARCH_INDEX_DEFERRED:
+            for order in orders:
+                order.search_index_dirty = True
+        else:
+            set_orders_search_vector(orders)
+
         Order.objects.bulk_update(
             orders,
             [
@@ -2440,6 +2452,7 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
                 "total_authorized_amount",
                 "authorize_status",
                 "search_vector",
+                "search_index_dirty",
             ],
         )
 
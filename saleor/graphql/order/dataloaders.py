@@ -17,6 +17,7 @@ from ...order.models import (
 from ...payment.models import TransactionEvent, TransactionItem
 from ...warehouse.models import Allocation
 from ..core.dataloaders import DataLoader
+from ..core.projection import defer_never_selected_fields
 
 
 class OrderLinesByVariantIdAndChannelIdLoader(
@@ -50,7 +51,9 @@ class OrderByIdLoader(DataLoader[UUID, Order]):
     context_key = "order_by_id"
 
     def batch_load(self, keys):
-        orders = Order.objects.using(self.database_connection_name).in_bulk(keys)
+        orders = defer_never_selected_fields(
+            Order.objects.using(self.database_connection_name)
+        ).in_bulk(keys)
         return [orders.get(order_id) for order_id in keys]
 
 
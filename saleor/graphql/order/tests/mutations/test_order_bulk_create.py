@@ -1763,6 +1763,76 @@ def test_order_bulk_create_stock_update(
     assert stock_variant_2_warehouse_2.quantity == 83
 
 
+def test_order_bulk_create_stock_update_multiple_orders_reject_failed_rows(
+    staff_api_client,
+    permission_manage_orders,
+    permission_manage_orders_import,
+    permission_manage_users,
+    order_bulk_input_with_multiple_order_lines_and_fulfillments,
+    product_variant_list,
+    warehouses,
+):
+    # given
+    order_1 = order_bulk_input_with_multiple_order_lines_and_fulfillments
+    order_2 = copy.deepcopy(order_1)
+
+    variant_1 = product_variant_list[0]
+    variant_2 = product_variant_list[1]
+    warehouse_1 = warehouses[0]
+    warehouse_2 = warehouses[1]
+
+    stock_variant_1_warehouse_1 = Stock(
+        product_variant=variant_1, warehouse=warehouse_1, quantity=100
+    )
+    stock_variant_2_warehouse_1 = Stock(
+        product_variant=variant_2, warehouse=warehouse_1, quantity=100
+    )
+    # enough stock only for the first order
+    stock_variant_2_warehouse_2 = Stock(
+        product_variant=variant_2, warehouse=warehouse_2, quantity=30
+    )
+    Stock.objects.bulk_create(
+        [
+            stock_variant_1_warehouse_1,
+            stock_variant_2_warehouse_1,
+            stock_variant_2_warehouse_2,
+        ]
+    )
+
+    staff_api_client.user.user_permissions.add(
+        permission_manage_orders_import,
+        permission_manage_orders,
+        permission_manage_users,
+    )
+    variables = {
+        "orders": [order_1, order_2],
+        "stockUpdatePolicy": StockUpdatePolicyEnum.UPDATE.name,
+        "errorPolicy": ErrorPolicyEnum.REJECT_FAILED_ROWS.name,
+    }
+
+    # when
+    response = staff_api_client.post_graphql(ORDER_BULK_CREATE, variables)
+    content = get_graphql_content(response)
+
+    # then
+    assert content["data"]["orderBulkCreate"]["count"] == 1
+    data = content["data"]["orderBulkCreate"]["results"]
+    assert not data[0]["errors"]
+    assert data[1]["errors"][0]["code"] == (
+        OrderBulkCreateErrorCode.INSUFFICIENT_STOCK.name
+    )
+
+    stock_variant_1_warehouse_1.refresh_from_db()
+    stock_variant_2_warehouse_1.refresh_from_db()
+    stock_variant_2_warehouse_2.refresh_from_db()
+
+    # only the changes of the first order are applied
+    assert stock_variant_1_warehouse_1.quantity == 90
+    assert stock_variant_2_warehouse_1.quantity == 67
+    assert stock_variant_2_warehouse_2.quantity == 13
+    assert stock_variant_2_warehouse_2.quantity_allocated == 3
+
+
 def test_order_bulk_create_stock_update_insufficient_stock(
     staff_api_client,
     permission_manage_orders,
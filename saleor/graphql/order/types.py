@@ -81,6 +81,8 @@ from ..core.doc_category import DOC_CATEGORY_ORDERS
 from ..core.enums import LanguageCodeEnum
 from ..core.fields import PermissionsField
 from ..core.mutations import validation_error_to_error_type
+from ..core.projection import METADATA_FIELDS, register_deferrable_fields
+from ..core.query_planner import register_prefetcher, unwrap_root
 from ..core.scalars import DateTime, PositiveDecimal
 from ..core.tracing import traced_resolver
 from ..core.types import (
@@ -3074,3 +3076,43 @@ class OrderCountableConnection(CountableConnection):
     class Meta:
         doc_category = DOC_CATEGORY_ORDERS
         node = Order
+
+
+@register_prefetcher("Order", "lines")
+def prefetch_order_lines(context, roots):
+    OrderLinesByOrderIdLoader(context).load_many(
+        [unwrap_root(root).id for root in roots]
+    )
+
+
+@register_prefetcher("Order", "fulfillments")
+def prefetch_order_fulfillments(context, roots):
+    FulfillmentsByOrderIdLoader(context).load_many(
+        [unwrap_root(root).id for root in roots]
+    )
+
+
+@register_prefetcher("Order", "channel")
+def prefetch_order_channel(context, roots):
+    ChannelByIdLoader(context).load_many(
+        {unwrap_root(root).channel_id for root in roots}
+    )
+
+
+register_deferrable_fields(
+    models.Order,
+    {
+        "search_document": (),
+        "search_vector": (),
+        **METADATA_FIELDS,
+        # The external shipping method ID is stored in the private metadata, and
+        # the payload of the excluded shipping methods webhook includes it.
+        "private_metadata": (
+            *METADATA_FIELDS["private_metadata"],
+            "shippingMethod",
+            "deliveryMethod",
+            "shippingMethods",
+            "availableShippingMethods",
+        ),
+    },
+)
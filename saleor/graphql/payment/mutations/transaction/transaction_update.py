@@ -16,7 +16,7 @@ from .....payment.error_codes import (
     TransactionUpdateErrorCode,
 )
 from .....payment.transaction_item_calculations import (
-    calculate_transaction_amount_based_on_events,
+    calculate_transaction_amounts,
     recalculate_transaction_amounts,
 )
 from .....payment.utils import create_manual_adjustment_events
@@ -157,7 +157,7 @@ class TransactionUpdate(TransactionCreate):
         instance = cls.construct_instance(instance, transaction_data)
         instance.save()
         if money_data:
-            calculate_transaction_amount_based_on_events(transaction=instance)
+            calculate_transaction_amounts(transaction=instance)
             create_manual_adjustment_events(
                 transaction=instance, money_data=money_data, user=user, app=app
             )
@@ -21,6 +21,7 @@ from ....product.models import (
 )
 from ...channel.dataloaders import ChannelBySlugLoader
 from ...core.dataloaders import BaseThumbnailBySizeAndFormatLoader, DataLoader
+from ...core.projection import defer_never_selected_fields
 
 ProductIdAndChannelSlug = tuple[int, str]
 VariantIdAndChannelSlug = tuple[int, str]
@@ -49,7 +50,9 @@ class ProductByIdLoader(DataLoader[int, Product]):
     context_key = "product_by_id"
 
     def batch_load(self, keys):
-        products = Product.objects.using(self.database_connection_name).in_bulk(keys)
+        products = defer_never_selected_fields(
+            Product.objects.using(self.database_connection_name)
+        ).in_bulk(keys)
         return [products.get(product_id) for product_id in keys]
 
 
@@ -65,6 +65,8 @@ from ...core.fields import (
     JSONString,
     PermissionsField,
 )
+from ...core.projection import METADATA_FIELDS, register_deferrable_fields
+from ...core.query_planner import flatten, register_prefetcher
 from ...core.scalars import Date, DateTime
 from ...core.tracing import traced_resolver
 from ...core.types import (
@@ -145,6 +147,30 @@ from ..sorters import MediaSortingInput, ProductVariantSortingInput
 from .channels import ProductChannelListing, ProductVariantChannelListing
 from .digital_contents import DigitalContent
 
+
+def load_product_variants(
+    context, roots: list[ChannelContext[models.Product]]
+) -> list[Promise[list[models.ProductVariant]]]:
+    requestor = get_user_or_app_from_context(context)
+    has_required_permissions = has_one_of_permissions(
+        requestor, ALL_PRODUCTS_PERMISSIONS
+    )
+    promises = []
+    for root in roots:
+        if has_required_permissions and not root.channel_slug:
+            variants = ProductVariantsByProductIdLoader(context).load(root.node.id)
+        elif has_required_permissions and root.channel_slug:
+            variants = ProductVariantsByProductIdAndChannel(context).load(
+                (root.node.id, root.channel_slug)
+            )
+        else:
+            variants = AvailableProductVariantsByProductIdAndChannel(context).load(
+                (root.node.id, root.channel_slug)
+            )
+        promises.append(variants)
+    return promises
+
+
 destination_address_argument = graphene.Argument(
     account_types.AddressInput,
     description=(
@@ -1442,20 +1468,7 @@ class Product(ChannelContextType[models.Product]):
 
     @staticmethod
     def resolve_variants(root: ChannelContext[models.Product], info):
-        requestor = get_user_or_app_from_context(info.context)
-        has_required_permissions = has_one_of_permissions(
-            requestor, ALL_PRODUCTS_PERMISSIONS
-        )
-        if has_required_permissions and not root.channel_slug:
-            variants = ProductVariantsByProductIdLoader(info.context).load(root.node.id)
-        elif has_required_permissions and root.channel_slug:
-            variants = ProductVariantsByProductIdAndChannel(info.context).load(
-                (root.node.id, root.channel_slug)
-            )
-        else:
-            variants = AvailableProductVariantsByProductIdAndChannel(info.context).load(
-                (root.node.id, root.channel_slug)
-            )
+        variants = load_product_variants(info.context, [root])[0]
 
         def map_channel_context(variants):
             return [
@@ -2081,3 +2094,55 @@ class ProductImage(BaseObjectType):
             .load((root.id, selected_size, format))
             .then(_resolve_url)
         )
+
+
+@register_prefetcher("Product", "variants", child_type_name="ProductVariant")
+def prefetch_product_variants(context, roots):
+    return Promise.all(load_product_variants(context, roots)).then(flatten)
+
+
+@register_prefetcher("Product", "category")
+def prefetch_product_category(context, roots):
+    category_ids = {
+        root.node.category_id for root in roots if root.node.category_id is not None
+    }
+    CategoryByIdLoader(context).load_many(category_ids)
+
+
+@register_prefetcher("Product", "productType")
+def prefetch_product_type(context, roots):
+    ProductTypeByIdLoader(context).load_many(
+        {root.node.product_type_id for root in roots}
+    )
+
+
+@register_prefetcher("Product", "channelListings")
+def prefetch_product_channel_listings(context, roots):
+    ProductChannelListingByProductIdLoader(context).load_many(
+        [root.node.id for root in roots]
+    )
+
+
+@register_prefetcher("Product", "thumbnail")
+@register_prefetcher("Product", "media")
+def prefetch_product_media(context, roots):
+    MediaByProductIdLoader(context).load_many([root.node.id for root in roots])
+
+
+@register_prefetcher("ProductVariant", "channelListings")
+def prefetch_variant_channel_listings(context, variants):
+    VariantChannelListingByVariantIdLoader(context).load_many(
+        [variant.id for variant in variants]
+    )
+
+
+register_deferrable_fields(
+    models.Product,
+    {
+        "description": ("description", "descriptionJson"),
+        "description_plaintext": (),
+        "search_document": (),
+        "search_vector": (),
+        **METADATA_FIELDS,
+    },
+)
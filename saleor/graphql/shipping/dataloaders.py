@@ -24,6 +24,7 @@ class ShippingMethodByIdLoader(DataLoader):
 
 class ShippingZoneByIdLoader(DataLoader):
     context_key = "shippingzone_by_id"
+    use_reference_data_cache = True
 
     def batch_load(self, keys):
         shipping_zones = ShippingZone.objects.using(
@@ -34,6 +35,7 @@ class ShippingZoneByIdLoader(DataLoader):
 
 class ShippingZonesByChannelIdLoader(DataLoader):
     context_key = "shippingzone_by_channel_id"
+    use_reference_data_cache = True
 
     def batch_load(self, keys):
         shipping_zones_channel = ShippingZone.channels.through.objects.using(
@@ -14,6 +14,7 @@ from ..core.dataloaders import DataLoader
 
 class SiteByIdLoader(DataLoader[int, Site]):
     context_key = "site_by_id"
+    use_reference_data_cache = True
 
     def batch_load(self, keys):
         sites_mapped = Site.objects.using(self.database_connection_name).in_bulk(keys)
@@ -22,6 +23,7 @@ class SiteByIdLoader(DataLoader[int, Site]):
 
 class SiteByHostLoader(DataLoader[str, Site]):
     context_key = "site_by_host"
+    use_reference_data_cache = True
 
     def batch_load(self, keys):
         # simulate non existing `domain__iexact__in`
@@ -21,6 +21,7 @@ from ..product.dataloaders import (
 
 class TaxConfigurationPerCountryByTaxConfigurationIDLoader(DataLoader):
     context_key = "tax_configuration_per_country_by_tax_configuration_id"
+    use_reference_data_cache = True
 
     def batch_load(self, keys):
         tax_configs_per_country = TaxConfigurationPerCountry.objects.using(
@@ -36,6 +37,7 @@ class TaxConfigurationPerCountryByTaxConfigurationIDLoader(DataLoader):
 
 class TaxConfigurationByChannelId(DataLoader[int, TaxConfiguration]):
     context_key = "tax_configuration_by_channel_id"
+    use_reference_data_cache = True
 
     def batch_load(self, keys):
         tax_configs = TaxConfiguration.objects.using(
@@ -46,6 +48,7 @@ class TaxConfigurationByChannelId(DataLoader[int, TaxConfiguration]):
 
 class TaxClassCountryRateByTaxClassIDLoader(DataLoader[int, list[TaxClassCountryRate]]):
     context_key = "tax_class_country_rate_by_tax_class_id"
+    use_reference_data_cache = True
 
     def batch_load(self, keys):
         tax_rates = TaxClassCountryRate.objects.using(
@@ -61,6 +64,7 @@ class TaxClassCountryRateByTaxClassIDLoader(DataLoader[int, list[TaxClassCountry
 
 class TaxClassDefaultRateByCountryLoader(DataLoader):
     context_key = "tax_class_default_rate_by_country"
+    use_reference_data_cache = True
 
     def batch_load(self, keys):
         tax_rates = TaxClassCountryRate.objects.using(
@@ -72,6 +76,7 @@ class TaxClassDefaultRateByCountryLoader(DataLoader):
 
 class TaxClassByIdLoader(DataLoader):
     context_key = "tax_class_by_id"
+    use_reference_data_cache = True
 
     def batch_load(self, keys):
         tax_class_map = TaxClass.objects.using(self.database_connection_name).in_bulk(
@@ -1,13 +1,17 @@
 import hashlib
 import importlib
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache as memoize
 from inspect import isclass
 from typing import Any
 from urllib.parse import urljoin
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.core.cache import cache
-from django.http import HttpRequest, HttpResponseNotAllowed, JsonResponse
+from django.db import close_old_connections
+from django.http import HttpRequest, HttpResponse, HttpResponseNotAllowed
 from django.shortcuts import render
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
@@ -32,9 +36,12 @@ from requests_hardened.ip_filter import InvalidIPAddress
 from .. import __version__ as saleor_version
 from ..core.exceptions import PermissionDenied
 from ..core.telemetry import Scope, SpanKind, saleor_attributes, tracer
+from ..core.utils.json_serializer import json_dumps_bytes
 from ..webhook import observability
 from .api import API_PATH, schema
 from .context import clear_context, get_context_value
+from .core import SaleorContext
+from .core.profiling import create_operation_profile, profile_operation
 from .core.validators.query_cost import validate_query_cost
 from .metrics import (
     record_graphql_query_cost,
@@ -69,6 +76,9 @@ class GraphQLView(FileUploadGraphQLView):
     root_value = None
     backend: GraphQLBackend = None  # type: ignore[assignment]
     _query: str | None = None
+    # Set while executing operations of a batch request that share the context.
+    _shared_context: bool = False
+    _batch_context: SaleorContext | None = None
 
     HANDLED_EXCEPTIONS = (
         GraphQLError,
@@ -147,26 +157,26 @@ class GraphQLView(FileUploadGraphQLView):
             },
         )
 
-    def _handle_query(self, request: HttpRequest) -> JsonResponse:
+    def _handle_query(self, request: HttpRequest) -> HttpResponse:
         try:
             data = getattr(request, "_body", None)
             if data is None:
                 data = self.parse_body(request)
         except ValueError:
-            return JsonResponse(
-                data={"errors": [self.format_error("Unable to parse query.")]},
+            return json_response(
+                {"errors": [self.format_error("Unable to parse query.")]},
                 status=400,
             )
 
         if isinstance(data, list):
-            responses = [self.get_response(request, entry) for entry in data]
+            responses = self.get_batch_responses(request, data)
             result: list | dict | None = [response for response, code in responses]
             status_code = max((code for response, code in responses), default=200)
         else:
             result, status_code = self.get_response(request, data)
-        return JsonResponse(data=result, status=status_code, safe=False)
+        return json_response(result, status=status_code)
 
-    def handle_query(self, request: HttpRequest) -> JsonResponse:
+    def handle_query(self, request: HttpRequest) -> HttpResponse:
         with (
             tracer.start_as_current_span(
                 request.path, scope=Scope.SERVICE, kind=SpanKind.SERVER
@@ -212,6 +222,28 @@ class GraphQLView(FileUploadGraphQLView):
                 api_call.report()
             return response
 
+    def get_batch_responses(
+        self, request: HttpRequest, data: list
+    ) -> list[tuple[dict[str, list[Any]] | None, int]]:
+        """Execute operations of a batch request in order.
+
+        With `GRAPHQL_BATCH_SHARED_CONTEXT_ENABLED`, the operations share one
+        context, so the requestor, the plugins manager and values loaded by
+        dataloaders are reused by the following operations. Dataloaders are
+        dropped around mutations, so they don't return values changed by the
+        mutation.
+        """
+        if not settings.GRAPHQL_BATCH_SHARED_CONTEXT_ENABLED or len(data) < 2:
+            return [self.get_response(request, entry) for entry in data]
+        self._shared_context = True
+        try:
+            return [self.get_response(request, entry) for entry in data]
+        finally:
+            self._shared_context = False
+            if self._batch_context is not None:
+                clear_context(self._batch_context)
+                self._batch_context = None
+
     def get_response(
         self, request: HttpRequest, data: dict
     ) -> tuple[dict[str, list[Any]] | None, int]:
@@ -379,6 +411,9 @@ class GraphQLView(FileUploadGraphQLView):
                 extra_options["executor"] = self.executor
 
             context = get_context_value(request)
+            is_mutation = operation_type == "mutation"
+            if self._shared_context and is_mutation:
+                context.dataloaders.clear()
             if app := getattr(request, "app", None):
                 span.set_attribute(saleor_attributes.SALEOR_APP_ID, app.id)
                 span.set_attribute(saleor_attributes.SALEOR_APP_NAME, app.name)
@@ -394,14 +429,16 @@ class GraphQLView(FileUploadGraphQLView):
                     response = cache.get(key)
 
                 if not response:
-                    response = document.execute(
-                        root=self.get_root_value(),
-                        variables=variables,
-                        operation_name=operation_name,
-                        context=context,
-                        middleware=self.middleware,
-                        **extra_options,
-                    )
+                    profile = create_operation_profile(context)
+                    with profile_operation(profile):
+                        response = document.execute(
+                            root=self.get_root_value(),
+                            variables=variables,
+                            operation_name=operation_name,
+                            context=context,
+                            middleware=self.middleware,
+                            **extra_options,
+                        )
                     if response.errors:
                         error_type = response.errors[0].__class__.__name__
                         error_description = self.format_span_error_description(response)
@@ -411,6 +448,8 @@ class GraphQLView(FileUploadGraphQLView):
 
                     if should_use_cache_for_scheme:
                         cache.set(key, response)
+                    if profile and profile.report:
+                        response.extensions["profile"] = profile.get_report()
 
                 record_graphql_query_count(
                     operation_name=operation_name,
@@ -449,7 +488,12 @@ class GraphQLView(FileUploadGraphQLView):
                 query_duration_attrs[error_attributes.ERROR_TYPE] = error_type
                 return ExecutionResult(errors=[e], invalid=True)
             finally:
-                clear_context(context)
+                if self._shared_context:
+                    self._batch_context = context
+                    if is_mutation:
+                        context.dataloaders.clear()
+                else:
+                    clear_context(context)
 
     @staticmethod
     def parse_body(request: HttpRequest):
@@ -505,6 +549,49 @@ class GraphQLView(FileUploadGraphQLView):
         return context
 
 
+@memoize
+def get_execution_thread_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=settings.GRAPHQL_ASYNC_EXECUTION_MAX_WORKERS,
+        thread_name_prefix="graphql-execution",
+    )
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncGraphQLView(GraphQLView):
+    """GraphQL view for the ASGI stack.
+
+    Django runs synchronous views of an ASGI application in a single thread, so
+    requests of one worker are executed one after another. This view is a
+    coroutine and executes each operation in a dedicated thread pool, so requests
+    waiting on the database or on synchronous webhooks do not block each other.
+    """
+
+    view_is_async = True
+
+    async def dispatch(self, request, *args, **kwargs):  # type: ignore[override]
+        return await sync_to_async(
+            self._dispatch_in_thread,
+            thread_sensitive=False,
+            executor=get_execution_thread_pool(),
+        )(request, *args, **kwargs)
+
+    def _dispatch_in_thread(self, request, *args, **kwargs):
+        # Django closes database connections only in the thread that handles
+        # the request signals, pool threads need to take care of their own.
+        close_old_connections()
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            close_old_connections()
+
+
+def json_response(data, status: int = 200) -> HttpResponse:
+    return HttpResponse(
+        json_dumps_bytes(data), status=status, content_type="application/json"
+    )
+
+
 def get_key(key):
     try:
         int_key = int(key)
@@ -653,6 +653,7 @@ class PreorderQuantityReservedByVariantChannelListingIdLoader(DataLoader[int, in
 
 class WarehouseByIdLoader(DataLoader):
     context_key = "warehouse_by_id"
+    use_reference_data_cache = True
 
     def batch_load(self, keys: Iterable[UUID]) -> list[Warehouse | None]:
         warehouses = (
@@ -684,6 +685,7 @@ class StocksByWarehouseIdLoader(DataLoader):
 
 class WarehousesByChannelIdLoader(DataLoader):
     context_key = "warehouse_by_channel"
+    use_reference_data_cache = True
 
     def batch_load(self, keys):
         warehouse_and_channel_in_pairs = (
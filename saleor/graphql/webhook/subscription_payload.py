@@ -1,5 +1,6 @@
 import datetime
 from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any
 
 from celery.utils.log import get_task_logger
@@ -7,7 +8,7 @@ from django.conf import settings
 from django.db import models
 from django.utils import timezone
 from django.utils.functional import SimpleLazyObject
-from graphql import get_default_backend, parse
+from graphql import GraphQLDocument
 from graphql.error import GraphQLError
 from promise import Promise
 
@@ -23,6 +24,19 @@ from ..utils import format_error
 logger = get_task_logger(__name__)
 
 
+@lru_cache(maxsize=1000)
+def compile_subscription_query(subscription_query: str) -> GraphQLDocument:
+    """Parse and validate the subscription query once.
+
+    The same subscription queries of apps' webhooks are executed for every event,
+    so the document is cached by the query and executed without validating it
+    again. A change of the webhook's query results in a new document.
+    """
+    from ..api import SaleorGraphQLBackend, schema
+
+    return SaleorGraphQLBackend().document_from_string(schema, subscription_query)
+
+
 def initialize_request(
     requestor=None,
     sync_event=False,
@@ -102,15 +116,9 @@ def generate_payload_promise_from_subscription(
     generate a payload
     """
 
-    from ..api import schema
     from ..context import get_context_value
 
-    graphql_backend = get_default_backend()
-    ast = parse(subscription_query)
-    document = graphql_backend.document_from_string(
-        schema,
-        ast,
-    )
+    document = compile_subscription_query(subscription_query)
     app_id = app.pk if app else None
     request.app = app
     results_promise = document.execute(
@@ -185,15 +193,9 @@ def generate_payload_from_subscription(
     return: A payload ready to send via webhook. None if the function was not able to
     generate a payload
     """
-    from ..api import schema
     from ..context import get_context_value
 
-    graphql_backend = get_default_backend()
-    ast = parse(subscription_query)
-    document = graphql_backend.document_from_string(
-        schema,
-        ast,
-    )
+    document = compile_subscription_query(subscription_query)
     app_id = app.pk if app else None
     request.app = app
     results = document.execute(
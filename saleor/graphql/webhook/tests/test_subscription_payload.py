@@ -1,10 +1,14 @@
+from unittest import mock
+
 import graphene
 from django.test import override_settings
 from django.utils import timezone
+from graphql import validate
 
 from ....webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ....webhook.models import Webhook
 from ..subscription_payload import (
+    compile_subscription_query,
     generate_payload_from_subscription,
     generate_payload_promise_from_subscription,
     generate_pre_save_payloads,
@@ -444,3 +448,44 @@ def test_generate_payload_promise_from_subscription_unable_to_build_payload(
     # then
     payload = payload.get()
     assert payload is None
+
+
+@mock.patch("saleor.graphql.api.validate", wraps=validate)
+def test_subscription_query_is_validated_once(mocked_validate, variant):
+    # given
+    compile_subscription_query.cache_clear()
+    request = initialize_request()
+    event_type = WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED
+
+    # when
+    payloads = [
+        generate_payload_from_subscription(
+            event_type=event_type,
+            subscribable_object=variant,
+            subscription_query=SUBSCRIPTION_QUERY,
+            request=request,
+        )
+        for _ in range(2)
+    ]
+
+    # then
+    mocked_validate.assert_called_once()
+    assert payloads[0] == payloads[1]
+    assert payloads[0]["productVariant"]["name"] == variant.name
+
+
+def test_generate_payload_promise_from_invalid_subscription_query(variant):
+    # given
+    query = "subscription { event { ... on ProductVariantUpdated { notExisting } } }"
+    request = initialize_request()
+
+    # when
+    payload = generate_payload_promise_from_subscription(
+        event_type=WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED,
+        subscribable_object=variant,
+        subscription_query=query,
+        request=request,
+    ).get()
+
+    # then
+    assert payload is None
@@ -234,6 +234,41 @@ def call_order_events(
         call_event_including_protected_events(event_func, order, webhooks=webhooks)
 
 
+def call_orders_updated_event(
+    manager: "PluginsManager",
+    orders: list["Order"],
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+    webhook_event_map: dict[str, set["Webhook"]] | None = None,
+):
+    """Trigger the `ORDER_UPDATED` event for multiple orders at once.
+
+    Sync webhooks are still triggered separately for each editable order, when
+    required, but the async webhooks are generated and delivered in bulk.
+    """
+    event_name = WebhookEventAsyncType.ORDER_UPDATED
+    if webhook_event_map is None:
+        webhook_event_map = get_webhooks_for_multiple_events(
+            [event_name, *WebhookEventSyncType.ORDER_EVENTS]
+        )
+
+    if webhook_async_event_requires_sync_webhooks_to_trigger(
+        event_name, webhook_event_map, WebhookEventSyncType.ORDER_EVENTS
+    ):
+        for order in orders:
+            if order.status in ORDER_EDITABLE_STATUS:
+                _trigger_order_sync_webhooks(
+                    manager,
+                    order,
+                    database_connection_name=database_connection_name,
+                    webhook_event_map=webhook_event_map,
+                )
+
+    webhooks = webhook_event_map.get(event_name, set())
+    call_event_including_protected_events(
+        manager.orders_updated, orders, webhooks=webhooks
+    )
+
+
 def call_order_event(
     manager: "PluginsManager",
     event_name: str,
@@ -286,6 +321,7 @@ def order_created(
     from_draft: bool = False,
     site_settings: Optional["SiteSettings"] = None,
     automatic: bool = False,
+    create_order_event: bool = True,
 ):
     order = order_info.order
 
@@ -297,9 +333,10 @@ def order_created(
             extra={"tax_error": order.tax_error, "order_id": order_id},
         )
 
-    events.order_created_event(
-        order=order, user=user, app=app, from_draft=from_draft, automatic=automatic
-    )
+    if create_order_event:
+        events.order_created_event(
+            order=order, user=user, app=app, from_draft=from_draft, automatic=automatic
+        )
 
     webhook_event_map = get_webhooks_for_multiple_events(
         WEBHOOK_EVENTS_FOR_ORDER_CREATED
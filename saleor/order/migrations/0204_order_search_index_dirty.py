@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-10-19 10:30
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("order", "0203_merge_20250527_1210"),
+    ]
+
+    atomic = False
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="search_index_dirty",
+            field=models.BooleanField(default=False),
+        ),
+        AddIndexConcurrently(
+            model_name="order",
+            index=models.Index(
+                condition=models.Q(("search_index_dirty", True)),
+                fields=["search_index_dirty"],
+                name="order_search_index_dirty_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-19 18:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("order", "0204_order_search_index_dirty"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="post_create_actions_pending",
+            field=models.BooleanField(default=False),
+        ),
+    ]
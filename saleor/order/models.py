@@ -353,6 +353,9 @@ class Order(ModelWithMetadata, ModelWithExternalReference):
     redirect_url = models.URLField(blank=True, null=True)
     search_document = models.TextField(blank=True, default="")
     search_vector = SearchVectorField(blank=True, null=True)
+    search_index_dirty = models.BooleanField(default=False)
+    # set when the post-create actions of the order are deferred to a worker
+    post_create_actions_pending = models.BooleanField(default=False)
     # this field is used only for draft/unconfirmed orders
     should_refresh_prices = models.BooleanField(default=True)
     tax_exemption = models.BooleanField(default=False)
@@ -393,6 +396,11 @@ class Order(ModelWithMetadata, ModelWithExternalReference):
                 name="order_user_email_user_id_idx",
             ),
             BTreeIndex(fields=["checkout_token"], name="checkout_token_btree_idx"),
+            models.Index(
+                fields=["search_index_dirty"],
+                name="order_search_index_dirty_idx",
+                condition=models.Q(search_index_dirty=True),
+            ),
         ]
 
     def is_fully_paid(self):
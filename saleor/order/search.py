@@ -14,28 +14,53 @@ if TYPE_CHECKING:
     from .models import Order
 
 
+ORDER_FIELDS_TO_PREFETCH = [
+    "user",
+    "billing_address",
+    "shipping_address",
+    "payments",
+    "discounts",
+    "lines",
+    "payment_transactions__events",
+]
+
+ORDERS_BATCH_SIZE = 500
+
+
 def update_order_search_vector(order: "Order", *, save: bool = True):
     order.search_vector = FlatConcatSearchVector(
         *prepare_order_search_vector_value(order)
     )
+    order.search_index_dirty = False
     if save:
-        order.save(update_fields=["search_vector", "updated_at"])
+        order.save(update_fields=["search_vector", "search_index_dirty", "updated_at"])
+
+
+def set_orders_search_vector(orders: list["Order"]):
+    """Set `search_vector` for given orders without saving them.
+
+    Related objects are fetched for all orders at once.
+    """
+    prefetch_related_objects(orders, *ORDER_FIELDS_TO_PREFETCH)
+    for order in orders:
+        order.search_vector = FlatConcatSearchVector(
+            *prepare_order_search_vector_value(order, already_prefetched=True)
+        )
+        order.search_index_dirty = False
+
+
+def update_orders_search_vector(orders: list["Order"]):
+    from .models import Order
+
+    set_orders_search_vector(orders)
+    Order.objects.bulk_update(orders, ["search_vector", "search_index_dirty"])
 
 
 def prepare_order_search_vector_value(
     order: "Order", *, already_prefetched=False
 ) -> list[NoValidationSearchVector]:
     if not already_prefetched:
-        prefetch_related_objects(
-            [order],
-            "user",
-            "billing_address",
-            "shipping_address",
-            "payments",
-            "discounts",
-            "lines",
-            "payment_transactions__events",
-        )
+        prefetch_related_objects([order], *ORDER_FIELDS_TO_PREFETCH)
     search_vectors = [
         NoValidationSearchVector(Value(str(order.number)), config="simple", weight="A")
     ]
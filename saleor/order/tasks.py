@@ -2,10 +2,13 @@ import datetime
 import logging
 
 from django.conf import settings
+from django.contrib.sites.models import Site
 from django.db.models import Exists, F, Func, OuterRef, Subquery, Value
 from django.db.models.functions import Greatest
 from django.utils import timezone
 
+from ..account.models import User
+from ..app.models import App
 from ..celeryconf import app
 from ..channel.models import Channel
 from ..core.db.connection import allow_writer
@@ -16,16 +19,21 @@ from ..plugins.manager import get_plugins_manager
 from ..warehouse.management import deallocate_stock_for_orders
 from ..webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ..webhook.utils import get_webhooks_for_multiple_events
-from . import OrderEvents, OrderStatus
-from .actions import call_order_event, call_order_events
+from . import ORDER_EDITABLE_STATUS, OrderEvents, OrderStatus, events
+from .actions import call_order_events, call_orders_updated_event, order_created
+from .fetch import fetch_order_info
 from .models import Order, OrderEvent
-from .utils import invalidate_order_prices
+from .notifications import send_order_confirmation
+from .search import ORDERS_BATCH_SIZE, update_orders_search_vector
 
 logger = logging.getLogger(__name__)
 
 # Batch size of 100 is about ~1MB of memory usage in task
 EXPIRE_ORDER_BATCH_SIZE = 100
 
+# Number of orders for which the `ORDER_UPDATED` event is processed in bulk
+ORDER_UPDATED_BATCH_SIZE = 500
+
 # Batch size of 5000 is about ~5MB of memory usage in task
 # It takes +/- 8 secs to delete 5000 orders
 DELETE_EXPIRED_ORDER_BATCH_SIZE = 5000
@@ -34,12 +42,11 @@ DELETE_EXPIRED_ORDER_BATCH_SIZE = 5000
 @app.task
 @allow_writer()
 def recalculate_orders_task(order_ids: list[int]):
-    orders = Order.objects.filter(id__in=order_ids)
-
-    for order in orders:
-        invalidate_order_prices(order)
-
-    Order.objects.bulk_update(orders, ["should_refresh_prices"])
+    # Only editable orders can be marked for the prices recalculation,
+    # the same as in `invalidate_order_prices`.
+    Order.objects.filter(id__in=order_ids, status__in=ORDER_EDITABLE_STATUS).update(
+        should_refresh_prices=True
+    )
 
 
 @app.task
@@ -52,15 +59,108 @@ def send_order_updated(order_ids):
             *WebhookEventSyncType.ORDER_EVENTS,
         ]
     )
-    for order in Order.objects.filter(id__in=order_ids):
-        call_order_event(
+    for batch_start in range(0, len(order_ids), ORDER_UPDATED_BATCH_SIZE):
+        batch_ids = order_ids[batch_start : batch_start + ORDER_UPDATED_BATCH_SIZE]
+        orders = list(
+            Order.objects.filter(id__in=batch_ids).select_related(
+                "channel", "user", "billing_address", "shipping_address"
+            )
+        )
+        if not orders:
+            continue
+        call_orders_updated_event(
             manager,
-            WebhookEventAsyncType.ORDER_UPDATED,
-            order,
+            orders,
             webhook_event_map=webhook_event_map,
         )
 
 
+@app.task(
+    queue=settings.ORDER_CREATED_ACTIONS_QUEUE_NAME,
+    autoretry_for=(Exception,),
+    retry_backoff=10,
+    retry_kwargs={"max_retries": 5},
+)
+@allow_writer()
+def order_created_actions_task(order_id, user_id=None, app_id=None, automatic=False):
+    """Process the actions deferred from the checkout completion.
+
+    Create the order and customer events, send the order confirmation and trigger
+    the `ORDER_CREATED` webhooks. The order search vector is updated by
+    `update_orders_search_vector_task`.
+
+    The order placed event is created once, under the order lock. The remaining
+    actions are processed until they succeed: the order's
+    `post_create_actions_pending` flag is cleared only after they return, so a
+    failed or interrupted run is repeated by the retry. The lock is released
+    before calling the plugins, so sync webhooks are not sent while holding it.
+    """
+    user = User.objects.filter(pk=user_id).first() if user_id else None
+    app = App.objects.filter(pk=app_id).first() if app_id else None
+
+    with traced_atomic_transaction():
+        order = (
+            Order.objects.select_for_update()
+            .select_related("channel")
+            .filter(pk=order_id, post_create_actions_pending=True)
+            .first()
+        )
+        if not order:
+            return
+
+        placed_events = [
+            OrderEvents.PLACED,
+            OrderEvents.PLACED_AUTOMATICALLY_FROM_PAID_CHECKOUT,
+        ]
+        if not OrderEvent.objects.filter(order=order, type__in=placed_events).exists():
+            events.order_created_event(
+                order=order, user=user, app=app, automatic=automatic
+            )
+
+    manager = get_plugins_manager(allow_replica=False)
+    site_settings = Site.objects.get_current().settings
+    order_info = fetch_order_info(order)
+    order_created(
+        order_info=order_info,
+        user=user,
+        app=app,
+        manager=manager,
+        site_settings=site_settings,
+        automatic=automatic,
+        create_order_event=False,
+    )
+    send_order_confirmation(order_info, order.redirect_url, manager)
+    Order.objects.filter(pk=order.pk).update(post_create_actions_pending=False)
+
+
+@app.task(
+    queue=settings.UPDATE_SEARCH_VECTOR_INDEX_QUEUE_NAME,
+    expires=settings.BEAT_UPDATE_SEARCH_EXPIRE_AFTER_SEC,
+)
+def update_orders_search_vector_task():
+    order_ids = list(
+        Order.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(search_index_dirty=True)
+        .order_by("updated_at")
+        .values_list("pk", flat=True)[:ORDERS_BATCH_SIZE]
+    )
+    if not order_ids:
+        return
+    with allow_writer():
+        with traced_atomic_transaction():
+            # Re-read the orders on the writer under a lock, so the dirty flag set by
+            # a concurrent change is not cleared with a search vector built from
+            # stale data. Orders locked by other transactions are left for the next
+            # run.
+            orders = list(
+                Order.objects.select_for_update(of=("self",), skip_locked=True)
+                .filter(pk__in=order_ids, search_index_dirty=True)
+                .order_by("pk")
+            )
+            if orders:
+                update_orders_search_vector(orders)
+
+
 def _bulk_release_voucher_usage(order_ids):
     voucher_orders = Order.objects.filter(
         voucher_code=OuterRef("code"),
@@ -3,22 +3,28 @@ from unittest import mock
 from unittest.mock import ANY, call, patch
 
 import pytest
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from freezegun import freeze_time
 
 from ...core.models import EventDelivery
 from ...discount.models import VoucherCustomer
+from ...plugins.tests.sample_plugins import PluginSample
 from ...warehouse.models import Allocation
 from ...webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from .. import OrderEvents, OrderStatus
-from ..actions import call_order_event, call_order_events
+from ..actions import call_order_events, call_orders_updated_event
 from ..models import Order, OrderEvent, get_order_number
 from ..tasks import (
     _bulk_release_voucher_usage,
     delete_expired_orders_task,
     expire_orders_task,
+    order_created_actions_task,
+    recalculate_orders_task,
     send_order_updated,
+    update_orders_search_vector_task,
 )
 
 
@@ -771,8 +777,8 @@ def test_bulk_release_voucher_usage_voucher_usage_mismatch(
 
 
 @patch(
-    "saleor.order.tasks.call_order_event",
-    wraps=call_order_event,
+    "saleor.order.tasks.call_orders_updated_event",
+    wraps=call_orders_updated_event,
 )
 @patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
 @patch(
@@ -782,7 +788,7 @@ def test_bulk_release_voucher_usage_voucher_usage_mismatch(
 def test_send_order_updated(
     mocked_send_webhook_request_async,
     mocked_send_webhook_request_sync,
-    wrapped_call_order_event,
+    wrapped_call_orders_updated_event,
     setup_order_webhooks,
     order_with_lines,
     settings,
@@ -851,4 +857,199 @@ def test_send_order_updated(
         == WebhookEventSyncType.ORDER_FILTER_SHIPPING_METHODS
     )
 
-    assert wrapped_call_order_event.called
+    assert wrapped_call_orders_updated_event.called
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.apply_async"
+)
+@override_settings(PLUGINS=["saleor.plugins.webhook.plugin.WebhookPlugin"])
+def test_send_order_updated_multiple_orders(
+    mocked_send_webhook_request_async,
+    order_list,
+    subscription_order_updated_webhook,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    order_ids = [order.pk for order in order_list]
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        send_order_updated(order_ids)
+
+    # then
+    deliveries = EventDelivery.objects.filter(
+        webhook_id=subscription_order_updated_webhook.id,
+        event_type=WebhookEventAsyncType.ORDER_UPDATED,
+    )
+    assert deliveries.count() == len(order_list)
+    assert mocked_send_webhook_request_async.call_count == len(order_list)
+
+
+def _count_send_order_updated_queries(order_ids):
+    with CaptureQueriesContext(connection) as queries:
+        send_order_updated(order_ids)
+    return len(queries)
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.apply_async"
+)
+@override_settings(PLUGINS=["saleor.plugins.webhook.plugin.WebhookPlugin"])
+def test_send_order_updated_number_of_queries_doesnt_depend_on_orders_count(
+    mocked_send_webhook_request_async,
+    order_list,
+    subscription_order_updated_webhook,
+    settings,
+):
+    # given
+    settings.WEBHOOK_BATCHED_PAYLOAD_GENERATION_ENABLED = True
+    order_ids = [order.pk for order in order_list]
+    # warm up the caches shared between the runs
+    send_order_updated(order_ids[:1])
+
+    # when
+    single_order_queries = _count_send_order_updated_queries(order_ids[:1])
+    multiple_orders_queries = _count_send_order_updated_queries(order_ids)
+
+    # then
+    assert multiple_orders_queries == single_order_queries
+
+
+@patch.object(PluginSample, "order_updated", create=True)
+@override_settings(PLUGINS=["saleor.plugins.tests.sample_plugins.PluginSample"])
+def test_send_order_updated_calls_order_updated_for_plugins_without_bulk_hook(
+    mocked_order_updated, order_list
+):
+    # given
+    order_ids = [order.pk for order in order_list]
+
+    # when
+    send_order_updated(order_ids)
+
+    # then
+    assert mocked_order_updated.call_count == len(order_list)
+    assert {
+        order_call.args[0].pk for order_call in mocked_order_updated.call_args_list
+    } == set(order_ids)
+
+
+def test_recalculate_orders_task(order_list):
+    # given
+    order_1, order_2, order_3 = order_list
+    order_1.status = OrderStatus.UNCONFIRMED
+    order_2.status = OrderStatus.DRAFT
+    order_3.status = OrderStatus.UNFULFILLED
+    for order in order_list:
+        order.should_refresh_prices = False
+    Order.objects.bulk_update(order_list, ["status", "should_refresh_prices"])
+
+    # when
+    recalculate_orders_task([order.pk for order in order_list])
+
+    # then
+    for order in order_list:
+        order.refresh_from_db()
+    assert order_1.should_refresh_prices is True
+    assert order_2.should_refresh_prices is True
+    assert order_3.should_refresh_prices is False
+
+
+@patch("saleor.order.tasks.send_order_confirmation")
+@patch("saleor.plugins.manager.PluginsManager.order_created")
+def test_order_created_actions_task(
+    mocked_order_created,
+    mocked_send_order_confirmation,
+    order_with_lines,
+    customer_user,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    order = order_with_lines
+    order.post_create_actions_pending = True
+    order.save(update_fields=["post_create_actions_pending"])
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        order_created_actions_task(order_id=order.pk, user_id=customer_user.pk)
+
+    # then
+    assert OrderEvent.objects.filter(
+        order=order, type=OrderEvents.PLACED, user=customer_user
+    ).exists()
+    mocked_order_created.assert_called_once()
+    mocked_send_order_confirmation.assert_called_once()
+    order.refresh_from_db()
+    assert order.post_create_actions_pending is False
+
+
+@patch("saleor.order.tasks.send_order_confirmation")
+@patch("saleor.plugins.manager.PluginsManager.order_created")
+def test_order_created_actions_task_already_processed(
+    mocked_order_created,
+    mocked_send_order_confirmation,
+    order_with_lines,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    order = order_with_lines
+    OrderEvent.objects.create(order=order, type=OrderEvents.PLACED)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        order_created_actions_task(order_id=order.pk)
+
+    # then
+    assert OrderEvent.objects.filter(order=order, type=OrderEvents.PLACED).count() == 1
+    mocked_order_created.assert_not_called()
+    mocked_send_order_confirmation.assert_not_called()
+
+
+@patch("saleor.order.tasks.send_order_confirmation")
+@patch("saleor.plugins.manager.PluginsManager.order_created")
+def test_order_created_actions_task_repeats_actions_after_failure(
+    mocked_order_created,
+    mocked_send_order_confirmation,
+    order_with_lines,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    order = order_with_lines
+    order.post_create_actions_pending = True
+    order.save(update_fields=["post_create_actions_pending"])
+    mocked_send_order_confirmation.side_effect = [Exception("SMTP error"), None]
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        with pytest.raises(Exception, match="SMTP error"):
+            order_created_actions_task.run(order_id=order.pk)
+        order_created_actions_task.run(order_id=order.pk)
+
+    # then
+    assert OrderEvent.objects.filter(order=order, type=OrderEvents.PLACED).count() == 1
+    assert mocked_order_created.call_count == 2
+    assert mocked_send_order_confirmation.call_count == 2
+    order.refresh_from_db()
+    assert order.post_create_actions_pending is False
+
+
+def test_update_orders_search_vector_task(order_list):
+    # given
+    order_1, order_2, order_3 = order_list
+    for order in order_list:
+        order.search_vector = None
+    order_1.search_index_dirty = True
+    order_2.search_index_dirty = True
+    Order.objects.bulk_update(order_list, ["search_vector", "search_index_dirty"])
+
+    # when
+    update_orders_search_vector_task()
+
+    # then
+    for order in order_list:
+        order.refresh_from_db()
+    assert order_1.search_vector
+    assert order_1.search_index_dirty is False
+    assert order_2.search_vector
+    assert order_2.search_index_dirty is False
+    assert not order_3.search_vector
@@ -0,0 +1,83 @@
+# Generated by Django 5.2 on 2026-10-19 12:00
+
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("payment", "0061_merge_20250527_1210"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TransactionAmountSnapshot",
+            fields=[
+                (
+                    "transaction",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="amount_snapshot",
+                        serialize=False,
+                        to="payment.transactionitem",
+                    ),
+                ),
+                ("version", models.PositiveIntegerField(default=0)),
+                ("event_count", models.PositiveIntegerField(default=0)),
+                ("last_event_id", models.IntegerField(blank=True, null=True)),
+                ("last_event_created_at", models.DateTimeField(blank=True, null=True)),
+                ("has_authorization_adjustment", models.BooleanField(default=False)),
+                (
+                    "authorized_value",
+                    models.DecimalField(
+                        decimal_places=3, default=Decimal("0"), max_digits=20
+                    ),
+                ),
+                (
+                    "charged_value",
+                    models.DecimalField(
+                        decimal_places=3, default=Decimal("0"), max_digits=20
+                    ),
+                ),
+                (
+                    "refunded_value",
+                    models.DecimalField(
+                        decimal_places=3, default=Decimal("0"), max_digits=20
+                    ),
+                ),
+                (
+                    "canceled_value",
+                    models.DecimalField(
+                        decimal_places=3, default=Decimal("0"), max_digits=20
+                    ),
+                ),
+                (
+                    "authorize_pending_value",
+                    models.DecimalField(
+                        decimal_places=3, default=Decimal("0"), max_digits=20
+                    ),
+                ),
+                (
+                    "charge_pending_value",
+                    models.DecimalField(
+                        decimal_places=3, default=Decimal("0"), max_digits=20
+                    ),
+                ),
+                (
+                    "refund_pending_value",
+                    models.DecimalField(
+                        decimal_places=3, default=Decimal("0"), max_digits=20
+                    ),
+                ),
+                (
+                    "cancel_pending_value",
+                    models.DecimalField(
+                        decimal_places=3, default=Decimal("0"), max_digits=20
+                    ),
+                ),
+            ],
+        ),
+    ]
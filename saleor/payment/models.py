@@ -222,6 +222,68 @@ class TransactionEvent(models.Model):
         ]
 
 
+class TransactionAmountSnapshot(models.Model):
+    """Amounts of a transaction calculated from the events applied so far.
+
+    Amounts are stored before clamping negative values, so new events can be
+    applied to them as deltas.
+    """
+
+    transaction = models.OneToOneField(
+        TransactionItem,
+        primary_key=True,
+        related_name="amount_snapshot",
+        on_delete=models.CASCADE,
+    )
+    # Incremented on every change, to detect concurrent updates.
+    version = models.PositiveIntegerField(default=0)
+    event_count = models.PositiveIntegerField(default=0)
+    last_event_id = models.IntegerField(null=True, blank=True)
+    last_event_created_at = models.DateTimeField(null=True, blank=True)
+    has_authorization_adjustment = models.BooleanField(default=False)
+
+    authorized_value = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=Decimal("0"),
+    )
+    charged_value = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=Decimal("0"),
+    )
+    refunded_value = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=Decimal("0"),
+    )
+    canceled_value = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=Decimal("0"),
+    )
+    authorize_pending_value = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=Decimal("0"),
+    )
+    charge_pending_value = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=Decimal("0"),
+    )
+    refund_pending_value = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=Decimal("0"),
+    )
+    cancel_pending_value = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=Decimal("0"),
+    )
+
+
 class Payment(ModelWithMetadata):
     """A model that represents a single payment.
 
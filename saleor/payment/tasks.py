@@ -1,14 +1,15 @@
 import datetime
 import logging
 import uuid
+from typing import TYPE_CHECKING
 
 import graphene
 from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
-from django.db.models import Exists, OuterRef, Q
+from django.db.models import Count, Exists, OuterRef, Q
 
 from ..celeryconf import app
-from ..channel.models import Channel
 from ..checkout import CheckoutAuthorizeStatus
 from ..checkout.models import Checkout
 from ..core.db.connection import allow_writer
@@ -17,10 +18,20 @@ from ..plugins.manager import get_plugins_manager
 from . import PaymentError, TransactionAction, TransactionEventType
 from .gateway import request_cancelation_action, request_refund_action
 
+if TYPE_CHECKING:
+    from ..plugins.manager import PluginsManager
+
 logger = logging.getLogger(__name__)
 
+RELEASE_FUNDS_SLOT_KEY_PREFIX = "release_funds_slot:"
+# Longer than a task sending requests for a batch of transactions is expected
+# to take.
+RELEASE_FUNDS_SLOT_TIMEOUT = 60 * 60
+
 
-def transactions_to_release_funds():
+def transactions_to_release_funds(
+    using: str = settings.DATABASE_CONNECTION_REPLICA_NAME,
+):
     """Fetch transactions for checkouts eligible for automatic refunds.
 
     The function retrieves checkouts that are automatically refundable and have exceeded the
@@ -32,9 +43,7 @@ def transactions_to_release_funds():
         - settings.CHECKOUT_TTL_BEFORE_RELEASING_FUNDS
     )
 
-    checkouts = Checkout.objects.using(
-        settings.DATABASE_CONNECTION_REPLICA_NAME
-    ).filter(
+    checkouts = Checkout.objects.using(using).filter(
         automatically_refundable=True,
         last_change__lt=expired_checkouts_time,
         last_transaction_modified_at__lt=expired_checkouts_time,
@@ -46,7 +55,7 @@ def transactions_to_release_funds():
 
     # Fetch transactions for checkouts that are ready to release funds.
     transactions = (
-        TransactionItem.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME).filter(
+        TransactionItem.objects.using(using).filter(
             Q(
                 Exists(checkouts.filter(pk=OuterRef("checkout_id"))),
                 order_id=None,
@@ -58,136 +67,202 @@ def transactions_to_release_funds():
     return transactions
 
 
-@app.task
-@allow_writer()
-def transaction_release_funds_for_checkout_task():
-    TRANSACTION_BATCH_SIZE = int(settings.TRANSACTION_BATCH_FOR_RELEASING_FUNDS)
+def _get_release_funds_slot_key(app_id, app_identifier, slot: int) -> str:
+    return f"{RELEASE_FUNDS_SLOT_KEY_PREFIX}{app_id}-{app_identifier}-{slot}"
 
-    # Fetch transactions that are ready to release funds
-    transactions = transactions_to_release_funds().order_by("modified_at")
-    transactions_data = list(
-        transactions.values_list("pk", "checkout_id")[:TRANSACTION_BATCH_SIZE]
-    )
-    transaction_pks = [pk for pk, _checkout_id in transactions_data]
-    checkout_ids = [checkout_id for _, checkout_id in transactions_data]
 
-    checkouts_data = Checkout.objects.filter(pk__in=checkout_ids).values_list(
-        "pk", "channel_id"
-    )
-    checkout_channel_ids = {channel_id for _, channel_id in checkouts_data}
-    channels_in_bulk = (
-        Channel.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-        .filter(id__in=checkout_channel_ids)
-        .in_bulk()
-    )
-    checkout_id_to_channel = {
-        checkout_id: channels_in_bulk[channel_id]
-        for checkout_id, channel_id in checkouts_data
-    }
-    if transaction_pks:
-        # Select_related app as, this will be used to trigger the proper webhook.
-        transactions = TransactionItem.objects.filter(
-            pk__in=transaction_pks,
-            order_id=None,  # type: ignore[misc]
-        ).select_related("app")
-        transactions_with_cancel_request_events = []
-        transactions_with_charge_request_events = []
-
-        for transaction_item in transactions:
-            # If transaction is authorized we need to trigger the cancel event
-            if transaction_item.authorized_value:
-                event = TransactionEvent(
+def _acquire_release_funds_slot(app_id, app_identifier, slot: int) -> str | None:
+    """Take one of the app's slots for sending requests to release funds.
+
+    Slots are kept in the cache, so the limit of tasks per app is shared by all
+    sweeps. A slot of a lost task is freed when it expires.
+    """
+    token = uuid.uuid4().hex
+    key = _get_release_funds_slot_key(app_id, app_identifier, slot)
+    if cache.add(key, token, timeout=RELEASE_FUNDS_SLOT_TIMEOUT):
+        return token
+    return None
+
+
+def _free_release_funds_slot(app_id, app_identifier, slot: int, token: str):
+    key = _get_release_funds_slot_key(app_id, app_identifier, slot)
+    # the slot could expire and be taken by another task in the meantime
+    if cache.get(key) == token:
+        cache.delete(key)
+
+
+def _claim_transaction_to_release_funds(
+    app_id, app_identifier
+) -> list[TransactionEvent]:
+    """Create cancel and refund request events for a transaction of the app.
+
+    The transaction is locked with `SKIP LOCKED`, so tasks running in parallel
+    claim different transactions. It's marked as not refundable in the same
+    database transaction, right before its requests are sent, so transactions
+    of tasks that were lost stay ready to release funds for the following sweeps.
+    """
+    with transaction.atomic():
+        transaction_item = (
+            transactions_to_release_funds(
+                using=settings.DATABASE_CONNECTION_DEFAULT_NAME
+            )
+            .filter(app_id=app_id, app_identifier=app_identifier)
+            .select_related("app", "checkout__channel")
+            .order_by("modified_at")
+            .select_for_update(skip_locked=True, of=("self",))
+            .first()
+        )
+        if not transaction_item:
+            return []
+
+        events = []
+        # If transaction is authorized we need to trigger the cancel event
+        if transaction_item.authorized_value:
+            events.append(
+                TransactionEvent(
                     amount_value=transaction_item.authorized_value,
                     currency=transaction_item.currency,
                     type=TransactionEventType.CANCEL_REQUEST,
-                    transaction_id=transaction_item.id,
+                    transaction=transaction_item,
                     idempotency_key=str(uuid.uuid4()),
                 )
-                transactions_with_cancel_request_events.append(
-                    (transaction_item, event)
-                )
+            )
 
-            # If transaction is charged we need to trigger the refund event
-            if transaction_item.charged_value:
-                event = TransactionEvent(
+        # If transaction is charged we need to trigger the refund event
+        if transaction_item.charged_value:
+            events.append(
+                TransactionEvent(
                     amount_value=transaction_item.charged_value,
                     currency=transaction_item.currency,
                     type=TransactionEventType.REFUND_REQUEST,
-                    transaction_id=transaction_item.id,
+                    transaction=transaction_item,
                     idempotency_key=str(uuid.uuid4()),
                 )
-                transactions_with_charge_request_events.append(
-                    (transaction_item, event)
-                )
+            )
+
+        TransactionEvent.objects.bulk_create(events)
+        # Mark transactions as not refundable to avoid multiple automatic
+        # refund requests
+        transaction_item.last_refund_success = False
+        transaction_item.save(update_fields=["last_refund_success"])
+    return events
 
-        if (
-            transactions_with_charge_request_events
-            or transactions_with_cancel_request_events
-        ):
-            with transaction.atomic():
-                TransactionEvent.objects.bulk_create(
-                    [event for _tr, event in transactions_with_cancel_request_events]
-                    + [event for _tr, event in transactions_with_charge_request_events]
+
+@app.task
+@allow_writer()
+def transaction_release_funds_for_checkout_task():
+    """Request releasing funds of transactions for abandoned checkouts.
+
+    Requests are sent by `transaction_release_funds_task`, in parallel for
+    different payment apps and by at most
+    `TRANSACTION_RELEASING_FUNDS_CONCURRENCY_PER_APP` tasks per app at a time.
+    Without `TRANSACTION_RELEASING_FUNDS_SLOTS_ENABLED`, the limit applies only
+    to the tasks queued by a single sweep.
+    """
+    concurrency_per_app = settings.TRANSACTION_RELEASING_FUNDS_CONCURRENCY_PER_APP
+
+    transactions_per_app = (
+        transactions_to_release_funds()
+        .order_by()
+        .values_list("app_id", "app_identifier")
+        .annotate(count=Count("pk"))
+    )
+    if not transactions_per_app:
+        logger.warning("No transactions to release funds.")
+        return
+
+    for app_id, app_identifier, count in transactions_per_app:
+        for slot in range(min(count, concurrency_per_app)):
+            if not settings.TRANSACTION_RELEASING_FUNDS_SLOTS_ENABLED:
+                transaction_release_funds_task.delay(app_id, app_identifier)
+                continue
+            token = _acquire_release_funds_slot(app_id, app_identifier, slot)
+            # the slot is taken by a task that is still sending requests
+            if not token:
+                continue
+            transaction_release_funds_task.delay(app_id, app_identifier, slot, token)
+
+
+@app.task
+@allow_writer()
+def transaction_release_funds_task(
+    app_id, app_identifier, slot: int | None = None, token: str | None = None
+):
+    """Send requests to release funds of the app's transactions.
+
+    The task claims up to `TRANSACTION_BATCH_FOR_RELEASING_FUNDS` transactions.
+    When it holds one of the app's slots, it frees the slot afterwards and
+    queues the sweep again if there may be more transactions. Otherwise, they
+    are left for the next scheduled sweep, so the number of running tasks
+    doesn't grow.
+    """
+    batch_size = int(settings.TRANSACTION_BATCH_FOR_RELEASING_FUNDS)
+    manager = get_plugins_manager(allow_replica=True)
+    try:
+        for _ in range(batch_size):
+            events = _claim_transaction_to_release_funds(app_id, app_identifier)
+            if not events:
+                return
+            _send_release_funds_requests(events, manager)
+    finally:
+        if slot is not None and token is not None:
+            _free_release_funds_slot(app_id, app_identifier, slot, token)
+    if token is not None:
+        transaction_release_funds_for_checkout_task.delay()
+
+
+def _send_release_funds_requests(
+    events: list[TransactionEvent], manager: "PluginsManager"
+):
+    for event in events:
+        transaction_item = event.transaction
+        # transactions ready to release funds always belong to a checkout
+        channel_slug = transaction_item.checkout.channel.slug  # type: ignore[union-attr]
+        transaction_id = graphene.Node.to_global_id(
+            "TransactionItem", transaction_item.pk
+        )
+        if event.type == TransactionEventType.CANCEL_REQUEST:
+            logger.info(
+                "Releasing funds for transaction %s - canceling",
+                transaction_item.token,
+                extra={"transactionId": transaction_id},
+            )
+            try:
+                request_cancelation_action(
+                    request_event=event,
+                    cancel_value=event.amount_value,
+                    action=TransactionAction.CANCEL,
+                    channel_slug=channel_slug,
+                    user=None,
+                    app=None,
+                    transaction=transaction_item,
+                    manager=manager,
                 )
-                # Mark transactions as not refundable to avoid multiple automatic
-                # refund requests
-                transactions.update(last_refund_success=False)
-
-            manager = get_plugins_manager(allow_replica=True)
-            for transaction_item, event in transactions_with_cancel_request_events:
-                channel = checkout_id_to_channel[transaction_item.checkout_id]
-                logger.info(
-                    "Releasing funds for transaction %s - canceling",
+            except PaymentError as e:
+                logger.warning(
+                    "Unable to cancel transaction %s. %s",
                     transaction_item.token,
-                    extra={
-                        "transactionId": graphene.Node.to_global_id(
-                            "TransactionItem", transaction_item.pk
-                        )
-                    },
+                    str(e),
                 )
-                try:
-                    request_cancelation_action(
-                        request_event=event,
-                        cancel_value=event.amount_value,
-                        action=TransactionAction.CANCEL,
-                        channel_slug=channel.slug,
-                        user=None,
-                        app=None,
-                        transaction=transaction_item,
-                        manager=manager,
-                    )
-                except PaymentError as e:
-                    logger.warning(
-                        "Unable to cancel transaction %s. %s",
-                        transaction_item.token,
-                        str(e),
-                    )
-            for transaction_item, event in transactions_with_charge_request_events:
-                channel = checkout_id_to_channel[transaction_item.checkout_id]
-                logger.info(
-                    "Releasing funds for transaction %s - refunding",
+        else:
+            logger.info(
+                "Releasing funds for transaction %s - refunding",
+                transaction_item.token,
+                extra={"transactionId": transaction_id},
+            )
+            try:
+                request_refund_action(
+                    request_event=event,
+                    refund_value=event.amount_value,
+                    channel_slug=channel_slug,
+                    user=None,
+                    app=None,
+                    transaction=transaction_item,
+                    manager=manager,
+                )
+            except PaymentError as e:
+                logger.warning(
+                    "Unable to refund transaction %s. %s",
                     transaction_item.token,
-                    extra={
-                        "transactionId": graphene.Node.to_global_id(
-                            "TransactionItem", transaction_item.pk
-                        )
-                    },
+                    str(e),
                 )
-                try:
-                    request_refund_action(
-                        request_event=event,
-                        refund_value=event.amount_value,
-                        channel_slug=channel.slug,
-                        user=None,
-                        app=None,
-                        transaction=transaction_item,
-                        manager=manager,
-                    )
-                except PaymentError as e:
-                    logger.warning(
-                        "Unable to refund transaction %s. %s",
-                        transaction_item.token,
-                        str(e),
-                    )
-        else:
-            logger.warning("No transactions to release funds.")
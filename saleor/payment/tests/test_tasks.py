@@ -2,12 +2,26 @@ import datetime
 from decimal import Decimal
 from unittest import mock
 
+import pytest
+from django.core.cache import cache
 from freezegun import freeze_time
 
 from ...checkout import CheckoutAuthorizeStatus, CheckoutChargeStatus
 from ...checkout.actions import transaction_amounts_for_checkout_updated
 from .. import TransactionAction, TransactionEventType
-from ..tasks import transaction_release_funds_for_checkout_task
+from ..tasks import (
+    _acquire_release_funds_slot,
+    transaction_release_funds_for_checkout_task,
+    transaction_release_funds_task,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_release_funds_slots(settings):
+    settings.TRANSACTION_RELEASING_FUNDS_SLOTS_ENABLED = True
+    cache.clear()
+    yield
+    cache.clear()
 
 
 @mock.patch("saleor.payment.tasks.request_cancelation_action")
@@ -447,3 +461,207 @@ def test_transaction_release_funds_for_checkout_task_transaction_with_charge(
     )
     transaction_item.refresh_from_db()
     assert transaction_item.last_refund_success is False
+
+
+def _create_transactions_to_release_funds(
+    checkout, settings, transaction_item_generator, plugins_manager, count
+):
+    ttl_time = (
+        datetime.datetime.now(tz=datetime.UTC)
+        - settings.CHECKOUT_TTL_BEFORE_RELEASING_FUNDS
+    )
+    time_after_ttl = ttl_time - datetime.timedelta(seconds=1)
+    with freeze_time(time_after_ttl):
+        transaction_items = [
+            transaction_item_generator(
+                checkout_id=checkout.pk,
+                authorized_value=Decimal(100),
+            )
+            for _ in range(count)
+        ]
+        transaction_amounts_for_checkout_updated(
+            transaction_items[-1], plugins_manager, user=None, app=None
+        )
+        checkout.automatically_refundable = True
+        checkout.save(update_fields=["automatically_refundable", "last_change"])
+    return transaction_items
+
+
+@mock.patch("saleor.payment.tasks.request_cancelation_action")
+@freeze_time("2021-03-18 12:00:00")
+def test_transaction_release_funds_for_checkout_task_requeued_for_full_batch(
+    mocked_cancel_action,
+    checkout,
+    settings,
+    transaction_item_generator,
+    plugins_manager,
+):
+    # given
+    settings.TRANSACTION_BATCH_FOR_RELEASING_FUNDS = 1
+    transaction_items = _create_transactions_to_release_funds(
+        checkout, settings, transaction_item_generator, plugins_manager, count=2
+    )
+
+    # when
+    transaction_release_funds_for_checkout_task()
+
+    # then
+    assert mocked_cancel_action.call_count == 2
+    for transaction_item in transaction_items:
+        transaction_item.refresh_from_db()
+        assert transaction_item.last_refund_success is False
+
+
+@mock.patch("saleor.payment.tasks.transaction_release_funds_task.delay")
+@freeze_time("2021-03-18 12:00:00")
+def test_transaction_release_funds_for_checkout_task_limits_concurrency_per_app(
+    mocked_release_funds_task,
+    checkout,
+    settings,
+    transaction_item_generator,
+    plugins_manager,
+):
+    # given
+    settings.TRANSACTION_RELEASING_FUNDS_CONCURRENCY_PER_APP = 2
+    _create_transactions_to_release_funds(
+        checkout, settings, transaction_item_generator, plugins_manager, count=3
+    )
+
+    # when
+    transaction_release_funds_for_checkout_task()
+    transaction_release_funds_for_checkout_task()
+
+    # then
+    # the second sweep doesn't exceed the limit of slots taken by the first one
+    assert mocked_release_funds_task.call_count == 2
+    slots = [call.args[2] for call in mocked_release_funds_task.call_args_list]
+    assert slots == [0, 1]
+
+
+@mock.patch("saleor.payment.tasks.transaction_release_funds_task.delay")
+@freeze_time("2021-03-18 12:00:00")
+def test_transaction_release_funds_for_checkout_task_slots_disabled(
+    mocked_release_funds_task,
+    checkout,
+    settings,
+    transaction_item_generator,
+    plugins_manager,
+):
+    # given
+    settings.TRANSACTION_RELEASING_FUNDS_SLOTS_ENABLED = False
+    settings.TRANSACTION_RELEASING_FUNDS_CONCURRENCY_PER_APP = 2
+    [transaction_item, *_] = _create_transactions_to_release_funds(
+        checkout, settings, transaction_item_generator, plugins_manager, count=3
+    )
+    app_key = (transaction_item.app_id, transaction_item.app_identifier)
+
+    # when
+    transaction_release_funds_for_checkout_task()
+
+    # then
+    # the limit is applied to the sweep, without taking slots in the cache
+    assert mocked_release_funds_task.call_args_list == [
+        mock.call(*app_key),
+        mock.call(*app_key),
+    ]
+    assert _acquire_release_funds_slot(*app_key, slot=0)
+
+
+@mock.patch("saleor.payment.tasks.transaction_release_funds_for_checkout_task.delay")
+@mock.patch("saleor.payment.tasks.request_cancelation_action")
+@freeze_time("2021-03-18 12:00:00")
+def test_transaction_release_funds_task_without_slot_doesnt_requeue_sweep(
+    mocked_cancel_action,
+    mocked_sweep,
+    checkout,
+    settings,
+    transaction_item_generator,
+    plugins_manager,
+):
+    # given
+    settings.TRANSACTION_BATCH_FOR_RELEASING_FUNDS = 1
+    [transaction_item, _] = _create_transactions_to_release_funds(
+        checkout, settings, transaction_item_generator, plugins_manager, count=2
+    )
+
+    # when
+    transaction_release_funds_task(
+        transaction_item.app_id, transaction_item.app_identifier
+    )
+
+    # then
+    mocked_cancel_action.assert_called_once()
+    mocked_sweep.assert_not_called()
+
+
+@mock.patch("saleor.payment.tasks.transaction_release_funds_task.delay")
+@freeze_time("2021-03-18 12:00:00")
+def test_transaction_release_funds_for_checkout_task_lost_task_doesnt_claim(
+    mocked_release_funds_task,
+    checkout,
+    settings,
+    transaction_item_generator,
+    plugins_manager,
+):
+    # given
+    [transaction_item] = _create_transactions_to_release_funds(
+        checkout, settings, transaction_item_generator, plugins_manager, count=1
+    )
+
+    # when
+    transaction_release_funds_for_checkout_task()
+
+    # then
+    mocked_release_funds_task.assert_called_once()
+    transaction_item.refresh_from_db()
+    assert transaction_item.last_refund_success is True
+    assert not transaction_item.events.filter(
+        type=TransactionEventType.CANCEL_REQUEST
+    ).exists()
+
+
+@mock.patch("saleor.payment.tasks.request_cancelation_action")
+@freeze_time("2021-03-18 12:00:00")
+def test_transaction_release_funds_task_frees_slot(
+    mocked_cancel_action,
+    checkout,
+    settings,
+    transaction_item_generator,
+    plugins_manager,
+):
+    # given
+    [transaction_item] = _create_transactions_to_release_funds(
+        checkout, settings, transaction_item_generator, plugins_manager, count=1
+    )
+    app_key = (transaction_item.app_id, transaction_item.app_identifier)
+    token = _acquire_release_funds_slot(*app_key, slot=0)
+
+    # when
+    transaction_release_funds_task(*app_key, 0, token)
+
+    # then
+    mocked_cancel_action.assert_called_once()
+    assert _acquire_release_funds_slot(*app_key, slot=0)
+
+
+@mock.patch("saleor.payment.tasks.request_cancelation_action")
+def test_transaction_release_funds_task_skips_completed_checkout(
+    mocked_cancel_action, checkout, order, transaction_item_generator
+):
+    # given
+    transaction_item = transaction_item_generator(
+        checkout_id=checkout.pk,
+        authorized_value=Decimal(100),
+        order_id=order.pk,
+    )
+    app_key = (transaction_item.app_id, transaction_item.app_identifier)
+    token = _acquire_release_funds_slot(*app_key, slot=0)
+
+    # when
+    transaction_release_funds_task(*app_key, 0, token)
+
+    # then
+    assert not mocked_cancel_action.called
+    assert not transaction_item.events.filter(
+        type=TransactionEventType.CANCEL_REQUEST
+    ).exists()
@@ -5,8 +5,11 @@ from django.utils import timezone
 from freezegun import freeze_time
 
 from .. import TransactionEventType
-from ..models import TransactionItem
-from ..transaction_item_calculations import recalculate_transaction_amounts
+from ..models import TransactionAmountSnapshot, TransactionEvent, TransactionItem
+from ..transaction_item_calculations import (
+    recalculate_transaction_amounts,
+    recalculate_transactions_amounts,
+)
 
 
 def _assert_amounts(
@@ -1664,3 +1667,163 @@ def test_recalculate_transaction_amounts_updates_transaction_modified_at(
     # then
     transaction.refresh_from_db()
     assert transaction.modified_at == calculation_time
+
+
+def _create_event(transaction, event_type, amount, psp_reference, created_at):
+    return TransactionEvent.objects.create(
+        transaction=transaction,
+        type=event_type,
+        amount_value=amount,
+        psp_reference=psp_reference,
+        include_in_calculations=True,
+        currency=transaction.currency,
+        created_at=created_at,
+    )
+
+
+def test_recalculate_transaction_amounts_applies_new_events_to_snapshot(
+    transaction_item_generator, settings
+):
+    # given
+    settings.TRANSACTION_AMOUNT_SNAPSHOTS_ENABLED = True
+    transaction = transaction_item_generator()
+    created_at = timezone.now()
+    _create_event(
+        transaction,
+        TransactionEventType.AUTHORIZATION_SUCCESS,
+        Decimal("100.00"),
+        "auth",
+        created_at,
+    )
+    recalculate_transaction_amounts(transaction)
+    events = [
+        (TransactionEventType.CHARGE_REQUEST, Decimal("30.00"), "charge-1"),
+        (TransactionEventType.CHARGE_SUCCESS, Decimal("30.00"), "charge-1"),
+        (TransactionEventType.CHARGE_SUCCESS, Decimal("20.00"), "charge-2"),
+        (TransactionEventType.REFUND_REQUEST, Decimal("10.00"), "refund-1"),
+        (TransactionEventType.REFUND_FAILURE, Decimal("10.00"), "refund-1"),
+        (TransactionEventType.CHARGE_SUCCESS, Decimal("5.00"), None),
+    ]
+
+    # when
+    for i, (event_type, amount, psp_reference) in enumerate(events, start=1):
+        _create_event(
+            transaction,
+            event_type,
+            amount,
+            psp_reference,
+            created_at + datetime.timedelta(seconds=i),
+        )
+        recalculate_transaction_amounts(transaction)
+
+    # then
+    snapshot = TransactionAmountSnapshot.objects.get(transaction=transaction)
+    assert snapshot.version == len(events)
+    assert snapshot.event_count == len(events) + 1
+    transaction.refresh_from_db()
+    _assert_amounts(
+        transaction,
+        authorized_value=Decimal("50.00"),
+        charged_value=Decimal("55.00"),
+    )
+
+
+def test_recalculate_transaction_amounts_replays_events_reported_out_of_order(
+    transaction_item_generator, settings
+):
+    # given
+    settings.TRANSACTION_AMOUNT_SNAPSHOTS_ENABLED = True
+    transaction = transaction_item_generator()
+    created_at = timezone.now()
+    _create_event(
+        transaction,
+        TransactionEventType.CHARGE_SUCCESS,
+        Decimal("30.00"),
+        "charge-1",
+        created_at,
+    )
+    recalculate_transaction_amounts(transaction)
+
+    # when
+    _create_event(
+        transaction,
+        TransactionEventType.CHARGE_FAILURE,
+        Decimal("30.00"),
+        "charge-1",
+        created_at - datetime.timedelta(seconds=1),
+    )
+    recalculate_transaction_amounts(transaction)
+
+    # then
+    transaction.refresh_from_db()
+    _assert_amounts(transaction, charged_value=Decimal("30.00"))
+    snapshot = TransactionAmountSnapshot.objects.get(transaction=transaction)
+    assert snapshot.event_count == 2
+    assert snapshot.last_event_created_at == created_at
+
+
+def test_recalculate_transaction_amounts_replays_events_after_event_update(
+    transaction_item_generator, settings
+):
+    # given
+    settings.TRANSACTION_AMOUNT_SNAPSHOTS_ENABLED = True
+    transaction = transaction_item_generator()
+    created_at = timezone.now()
+    request_event = _create_event(
+        transaction,
+        TransactionEventType.CHARGE_REQUEST,
+        Decimal("30.00"),
+        None,
+        created_at,
+    )
+    recalculate_transaction_amounts(transaction)
+    _create_event(
+        transaction,
+        TransactionEventType.CHARGE_SUCCESS,
+        Decimal("30.00"),
+        "charge-1",
+        created_at + datetime.timedelta(seconds=1),
+    )
+
+    # when
+    request_event.psp_reference = "charge-1"
+    request_event.save(update_fields=["psp_reference"])
+    recalculate_transaction_amounts(transaction)
+
+    # then
+    transaction.refresh_from_db()
+    _assert_amounts(transaction, charged_value=Decimal("30.00"))
+
+
+def test_recalculate_transactions_amounts(
+    transaction_item_generator, transaction_events_generator, settings
+):
+    # given
+    settings.TRANSACTION_AMOUNT_SNAPSHOTS_ENABLED = True
+    first_transaction = transaction_item_generator()
+    second_transaction = transaction_item_generator()
+    transaction_events_generator(
+        transaction=first_transaction,
+        psp_references=["1"],
+        types=[TransactionEventType.AUTHORIZATION_SUCCESS],
+        amounts=[Decimal("11.00")],
+    )
+    transaction_events_generator(
+        transaction=second_transaction,
+        psp_references=["2"],
+        types=[TransactionEventType.CHARGE_SUCCESS],
+        amounts=[Decimal("12.00")],
+    )
+
+    # when
+    recalculate_transactions_amounts([first_transaction, second_transaction])
+
+    # then
+    first_transaction.refresh_from_db()
+    _assert_amounts(first_transaction, authorized_value=Decimal("11.00"))
+    second_transaction.refresh_from_db()
+    _assert_amounts(second_transaction, charged_value=Decimal("12.00"))
+    snapshots = TransactionAmountSnapshot.objects.filter(
+        transaction__in=[first_transaction, second_transaction]
+    )
+    assert snapshots.count() == 2
@@ -4,8 +4,14 @@ from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import cast
 
+from django.conf import settings
+from django.db.models import F
+from django.db.models.signals import post_save
+from django.utils import timezone
+
+from ..core.tracing import traced_atomic_transaction
 from . import TransactionEventType
-from .models import TransactionEvent, TransactionItem
+from .models import TransactionAmountSnapshot, TransactionEvent, TransactionItem
 
 
 @dataclass
@@ -43,6 +49,37 @@ AUTHORIZATION_EVENTS = [
     TransactionEventType.AUTHORIZATION_REQUEST,
 ]
 
+CHARGE_EVENTS = [
+    TransactionEventType.CHARGE_SUCCESS,
+    TransactionEventType.CHARGE_FAILURE,
+    TransactionEventType.CHARGE_BACK,
+    TransactionEventType.CHARGE_REQUEST,
+]
+
+REFUND_EVENTS = [
+    TransactionEventType.REFUND_SUCCESS,
+    TransactionEventType.REFUND_FAILURE,
+    TransactionEventType.REFUND_REVERSE,
+    TransactionEventType.REFUND_REQUEST,
+]
+
+CANCEL_EVENTS = [
+    TransactionEventType.CANCEL_SUCCESS,
+    TransactionEventType.CANCEL_FAILURE,
+    TransactionEventType.CANCEL_REQUEST,
+]
+
+AMOUNT_FIELDS = [
+    "authorized_value",
+    "charged_value",
+    "refunded_value",
+    "canceled_value",
+    "authorize_pending_value",
+    "charge_pending_value",
+    "refund_pending_value",
+    "cancel_pending_value",
+]
+
 
 @dataclass
 class ActionEventMap:
@@ -326,11 +363,7 @@ def _set_transaction_amounts_to_zero(transaction: TransactionItem):
     transaction.cancel_pending_value = Decimal("0")
 
 
-def calculate_transaction_amount_based_on_events(transaction: TransactionItem):
-    events: Iterable[TransactionEvent] = transaction.events.order_by(
-        "created_at"
-    ).exclude(include_in_calculations=False)
-
+def _calculate_amounts(transaction: TransactionItem, events: list[TransactionEvent]):
     action_map = _initilize_action_map(events)
     _set_transaction_amounts_to_zero(transaction)
 
@@ -349,6 +382,197 @@ def calculate_transaction_amount_based_on_events(transaction: TransactionItem):
         _recalculate_cancel_amounts(transaction, cancel_events)
 
 
+def _get_events_for_calculations(transaction: TransactionItem):
+    return transaction.events.order_by("created_at").exclude(
+        include_in_calculations=False
+    )
+
+
+def calculate_transaction_amount_based_on_events(transaction: TransactionItem):
+    events = list(_get_events_for_calculations(transaction))
+    _calculate_amounts(transaction, events)
+
+
+def _get_amounts(events: list[TransactionEvent]) -> dict[str, Decimal]:
+    amounts = TransactionItem()
+    _calculate_amounts(amounts, events)
+    return {
+        amount_field: getattr(amounts, amount_field) for amount_field in AMOUNT_FIELDS
+    }
+
+
+def _get_action_event_types(event_type: str) -> list[str] | None:
+    for event_types in [
+        AUTHORIZATION_EVENTS,
+        CHARGE_EVENTS,
+        REFUND_EVENTS,
+        CANCEL_EVENTS,
+    ]:
+        if event_type in event_types:
+            return event_types
+    return None
+
+
+def _get_amounts_delta(
+    transaction: TransactionItem, event: TransactionEvent
+) -> dict[str, Decimal]:
+    """Return the change of the transaction amounts caused by the newest event.
+
+    Events with a psp reference are grouped with the events of the same action and
+    psp reference, so the delta is the difference between the amounts of the group
+    with and without the new event.
+    """
+    if not event.psp_reference:
+        return _get_amounts([event])
+    event_types = _get_action_event_types(event.type)
+    if event_types is None:
+        return {}
+    previous_events = list(
+        transaction.events.filter(
+            include_in_calculations=True,
+            psp_reference=event.psp_reference,
+            type__in=event_types,
+            created_at__lt=event.created_at,
+        ).order_by("created_at")
+    )
+    amounts_before = _get_amounts(previous_events)
+    amounts_after = _get_amounts(previous_events + [event])
+    return {
+        amount_field: amounts_after[amount_field] - amounts_before[amount_field]
+        for amount_field in AMOUNT_FIELDS
+    }
+
+
+def _apply_new_events(
+    transaction: TransactionItem, snapshot: TransactionAmountSnapshot
+) -> bool:
+    """Apply events created after the snapshot was saved as deltas to its amounts.
+
+    Return False if the snapshot can't be updated incrementally and the amounts have
+    to be calculated from all events, e.g. when a new event is older than the
+    applied ones, an older event was included in calculations or the authorization
+    amount was overwritten by an adjustment.
+    """
+    events = transaction.events.filter(include_in_calculations=True)
+    new_events = list(
+        events.filter(pk__gt=snapshot.last_event_id or 0).order_by("created_at", "pk")
+    )
+    if events.count() != snapshot.event_count + len(new_events):
+        return False
+    if not new_events:
+        return True
+
+    last_event_created_at = snapshot.last_event_created_at
+    for event in new_events:
+        if last_event_created_at and event.created_at <= last_event_created_at:
+            return False
+        if event.type == TransactionEventType.AUTHORIZATION_ADJUSTMENT or (
+            snapshot.has_authorization_adjustment and event.type in AUTHORIZATION_EVENTS
+        ):
+            return False
+        for amount_field, delta in _get_amounts_delta(transaction, event).items():
+            setattr(snapshot, amount_field, getattr(snapshot, amount_field) + delta)
+        last_event_created_at = event.created_at
+
+    snapshot.event_count += len(new_events)
+    snapshot.last_event_id = max(event.pk for event in new_events)
+    snapshot.last_event_created_at = last_event_created_at
+    updated = TransactionAmountSnapshot.objects.filter(
+        pk=snapshot.pk, version=snapshot.version
+    ).update(
+        version=F("version") + 1,
+        event_count=snapshot.event_count,
+        last_event_id=snapshot.last_event_id,
+        last_event_created_at=snapshot.last_event_created_at,
+        **{
+            amount_field: getattr(snapshot, amount_field)
+            for amount_field in AMOUNT_FIELDS
+        },
+    )
+    # the snapshot was changed by a concurrent recalculation
+    return bool(updated)
+
+
+def _create_snapshot(
+    transaction: TransactionItem, events: list[TransactionEvent]
+) -> TransactionAmountSnapshot:
+    last_event = max(events, key=lambda event: event.pk, default=None)
+    return TransactionAmountSnapshot(
+        transaction_id=transaction.pk,
+        event_count=len(events),
+        last_event_id=last_event.pk if last_event else None,
+        last_event_created_at=max((event.created_at for event in events), default=None),
+        has_authorization_adjustment=any(
+            event.type == TransactionEventType.AUTHORIZATION_ADJUSTMENT
+            for event in events
+        ),
+        **{
+            amount_field: getattr(transaction, amount_field)
+            for amount_field in AMOUNT_FIELDS
+        },
+    )
+
+
+def _save_snapshots(snapshots: list[TransactionAmountSnapshot]):
+    with traced_atomic_transaction():
+        # locking existing snapshots makes concurrent incremental updates wait
+        # and fail on the changed version
+        versions = dict(
+            TransactionAmountSnapshot.objects.select_for_update()
+            .filter(pk__in=[snapshot.pk for snapshot in snapshots])
+            .values_list("pk", "version")
+        )
+        for snapshot in snapshots:
+            snapshot.version = versions.get(snapshot.pk, -1) + 1
+        TransactionAmountSnapshot.objects.bulk_create(
+            snapshots,
+            update_conflicts=True,
+            unique_fields=["transaction"],
+            update_fields=[
+                "version",
+                "event_count",
+                "last_event_id",
+                "last_event_created_at",
+                "has_authorization_adjustment",
+                *AMOUNT_FIELDS,
+            ],
+        )
+
+
+def calculate_transaction_amount_based_on_snapshot(transaction: TransactionItem):
+    """Calculate the transaction amounts by applying new events to the snapshot.
+
+    The snapshot is rebuilt from all events when it's missing or the new events
+    can't be applied incrementally.
+    """
+    snapshot = TransactionAmountSnapshot.objects.filter(
+        transaction_id=transaction.pk
+    ).first()
+    if snapshot and _apply_new_events(transaction, snapshot):
+        for amount_field in AMOUNT_FIELDS:
+            setattr(transaction, amount_field, getattr(snapshot, amount_field))
+        return
+
+    events = list(_get_events_for_calculations(transaction))
+    _calculate_amounts(transaction, events)
+    _save_snapshots([_create_snapshot(transaction, events)])
+
+
+def calculate_transaction_amounts(transaction: TransactionItem):
+    """Set the transaction amounts calculated from events, without saving them."""
+    if settings.TRANSACTION_AMOUNT_SNAPSHOTS_ENABLED:
+        calculate_transaction_amount_based_on_snapshot(transaction)
+    else:
+        calculate_transaction_amount_based_on_events(transaction)
+
+
+def _clamp_amounts(transaction: TransactionItem):
+    transaction.authorized_value = max(transaction.authorized_value, Decimal("0"))
+    transaction.authorize_pending_value = max(
+        transaction.authorize_pending_value, Decimal("0")
+    )
+
+
 def recalculate_transaction_amounts(transaction: TransactionItem, save: bool = True):
     """Recalculate transaction amounts.
 
@@ -375,25 +599,62 @@ def recalculate_transaction_amounts(transaction: TransactionItem, save: bool = T
     There is a possibility of having events that don't have psp reference (for
     example the events created by Saleor to keep correct amounts). In that case
     the event amounts will be included in the transaction amounts.
-    """
-    calculate_transaction_amount_based_on_events(transaction)
 
-    transaction.authorized_value = max(transaction.authorized_value, Decimal("0"))
-    transaction.authorize_pending_value = max(
-        transaction.authorize_pending_value, Decimal("0")
-    )
+    With `TRANSACTION_AMOUNT_SNAPSHOTS_ENABLED`, events created since the last
+    calculation are applied as deltas to the amounts stored in the transaction's
+    snapshot, and all events are replayed only when the new events can't be
+    applied in order.
+    """
+    calculate_transaction_amounts(transaction)
+    _clamp_amounts(transaction)
 
     if save:
-        transaction.save(
-            update_fields=[
-                "authorized_value",
-                "charged_value",
-                "refunded_value",
-                "canceled_value",
-                "authorize_pending_value",
-                "charge_pending_value",
-                "refund_pending_value",
-                "cancel_pending_value",
-                "modified_at",
-            ]
-        )
+        transaction.save(update_fields=[*AMOUNT_FIELDS, "modified_at"])
+
+
+def recalculate_transactions_amounts(transactions: list[TransactionItem]):
+    """Recalculate amounts of multiple transactions from all their events.
+
+    Meant for reprocessing many transactions at once, e.g. after events delayed by
+    a payment provider outage were reported. Events of all transactions are fetched
+    with a single query and the transactions are saved in bulk.
+    """
+    events_per_transaction: dict[int, list[TransactionEvent]] = defaultdict(list)
+    events = TransactionEvent.objects.filter(
+        transaction_id__in=[transaction.pk for transaction in transactions],
+        include_in_calculations=True,
+    ).order_by("created_at")
+    for event in events:
+        events_per_transaction[event.transaction_id].append(event)
+
+    snapshots = []
+    now = timezone.now()
+    for transaction in transactions:
+        transaction_events = events_per_transaction[transaction.pk]
+        _calculate_amounts(transaction, transaction_events)
+        snapshots.append(_create_snapshot(transaction, transaction_events))
+        _clamp_amounts(transaction)
+        transaction.modified_at = now
+
+    TransactionItem.objects.bulk_update(transactions, [*AMOUNT_FIELDS, "modified_at"])
+    if settings.TRANSACTION_AMOUNT_SNAPSHOTS_ENABLED:
+        _save_snapshots(snapshots)
+
+
+def invalidate_transaction_amount_snapshot(
+    instance: TransactionEvent, created: bool, **_kwargs
+):
+    # a change of an applied event, e.g. a psp reference assigned to a request event,
+    # requires calculating the amounts from all events
+    if not created:
+        TransactionAmountSnapshot.objects.filter(
+            transaction_id=instance.transaction_id
+        ).delete()
+
+
+def connect_transaction_amount_snapshot_signals():
+    post_save.connect(
+        invalidate_transaction_amount_snapshot,
+        sender=TransactionEvent,
+        dispatch_uid="invalidate_transaction_amount_snapshot",
+    )
@@ -601,6 +601,15 @@ class BasePlugin:
     # Webhook-related functionality will be moved from the plugin to core modules.
     customer_created: Callable[["User", Any], Any]
 
+    # Trigger when multiple users are created at once, e.g. by a bulk mutation.
+    #
+    # Overwrite this method if you need to trigger specific logic for a batch of
+    # created users.
+    #
+    # Note: This method is deprecated and will be removed in a future release.
+    # Webhook-related functionality will be moved from the plugin to core modules.
+    customers_created: Callable[[list["User"], Any, None], Any]
+
     # Trigger when user is deleted.
     #
     # Overwrite this method if you need to trigger specific logic after a user is
@@ -619,6 +628,15 @@ class BasePlugin:
     # Webhook-related functionality will be moved from the plugin to core modules.
     customer_updated: Callable[["User", Any, None], Any]
 
+    # Trigger when multiple users are updated at once, e.g. by a bulk mutation.
+    #
+    # Overwrite this method if you need to trigger specific logic for a batch of
+    # updated users.
+    #
+    # Note: This method is deprecated and will be removed in a future release.
+    # Webhook-related functionality will be moved from the plugin to core modules.
+    customers_updated: Callable[[list["User"], Any, None], Any]
+
     # Trigger when user metadata is updated.
     #
     # Overwrite this method if you need to trigger specific logic after a user
@@ -773,6 +791,15 @@ class BasePlugin:
     # Webhook-related functionality will be moved from the plugin to core modules.
     gift_card_created: Callable[["GiftCard", None, None], None]
 
+    # Trigger when multiple gift cards are created at once, e.g. by a bulk mutation.
+    #
+    # Overwrite this method if you need to trigger specific logic for a batch of
+    # created gift cards.
+    #
+    # Note: This method is deprecated and will be removed in a future release.
+    # Webhook-related functionality will be moved from the plugin to core modules.
+    gift_cards_created: Callable[[list["GiftCard"], None, None], None]
+
     # Trigger when gift card is deleted.
     #
     # Overwrite this method if you need to trigger specific logic after a gift card is
@@ -1066,6 +1093,15 @@ class BasePlugin:
     # Webhook-related functionality will be moved from the plugin to core modules.
     order_updated: Callable[["Order", Any, None], Any]
 
+    # Trigger when multiple orders are updated at once, e.g. by a background job.
+    #
+    # Overwrite this method if you need to trigger specific logic for a batch of
+    # changed orders.
+    #
+    # Note: This method is deprecated and will be removed in a future release.
+    # Webhook-related functionality will be moved from the plugin to core modules.
+    orders_updated: Callable[[list["Order"], Any, None], Any]
+
     # Trigger when order metadata is updated.
     #
     # Overwrite this method if you need to trigger specific logic when an order
@@ -231,6 +231,40 @@ class PluginsManager(PaymentInterface):
             )
         return value
 
+    def __run_method_on_plugins_without_bulk_method(
+        self,
+        bulk_method_name: str,
+        method_name: str,
+        instances: Iterable[Any],
+        get_channel_slug: Callable[[Any], str | None] | None = None,
+        **kwargs,
+    ):
+        """Run method_name per instance on plugins not implementing bulk_method_name.
+
+        Bulk events are dispatched only to plugins that implement the bulk method,
+        so plugins implementing just the single-instance hook are called for each
+        instance separately to not miss the event.
+        """
+        plugin_ids = []
+        for plugin_path in self.plugins:
+            PluginClass = import_string(plugin_path)
+            if (
+                getattr(PluginClass, bulk_method_name, NotImplemented) == NotImplemented
+                and getattr(PluginClass, method_name, NotImplemented) != NotImplemented
+            ):
+                plugin_ids.append(PluginClass.PLUGIN_ID)
+        if not plugin_ids:
+            return
+        for instance in instances:
+            self.__run_method_on_plugins(
+                method_name,
+                None,
+                instance,
+                channel_slug=get_channel_slug(instance) if get_channel_slug else None,
+                plugin_ids=plugin_ids,
+                **kwargs,
+            )
+
     def __run_method_on_single_plugin(
         self,
         plugin: Optional["BasePlugin"],
@@ -707,6 +741,21 @@ class PluginsManager(PaymentInterface):
             "customer_created", default_value, customer, channel_slug=None
         )
 
+    # Note: this method is deprecated and will be removed in a future release.
+    # Webhook-related functionality will be moved from plugin to core modules.
+    def customers_created(self, customers: list["User"], webhooks=None):
+        default_value = None
+        self.__run_method_on_plugins_without_bulk_method(
+            "customers_created", "customer_created", customers
+        )
+        return self.__run_method_on_plugins(
+            "customers_created",
+            default_value,
+            customers,
+            webhooks=webhooks,
+            channel_slug=None,
+        )
+
     # Note: this method is deprecated and will be removed in a future release.
     # Webhook-related functionality will be moved from plugin to core modules.
     def customer_deleted(self, customer: "User", webhooks=None):
@@ -731,6 +780,21 @@ class PluginsManager(PaymentInterface):
             channel_slug=None,
         )
 
+    # Note: this method is deprecated and will be removed in a future release.
+    # Webhook-related functionality will be moved from plugin to core modules.
+    def customers_updated(self, customers: list["User"], webhooks=None):
+        default_value = None
+        self.__run_method_on_plugins_without_bulk_method(
+            "customers_updated", "customer_updated", customers, webhooks=webhooks
+        )
+        return self.__run_method_on_plugins(
+            "customers_updated",
+            default_value,
+            customers,
+            webhooks=webhooks,
+            channel_slug=None,
+        )
+
     # Note: this method is deprecated and will be removed in a future release.
     # Webhook-related functionality will be moved from plugin to core modules.
     def customer_metadata_updated(self, customer: "User", webhooks=None):
@@ -1225,6 +1289,25 @@ class PluginsManager(PaymentInterface):
             webhooks=webhooks,
         )
 
+    # Note: this method is deprecated and will be removed in a future release.
+    # Webhook-related functionality will be moved from plugin to core modules.
+    def orders_updated(self, orders: list["Order"], webhooks=None):
+        default_value = None
+        self.__run_method_on_plugins_without_bulk_method(
+            "orders_updated",
+            "order_updated",
+            orders,
+            get_channel_slug=lambda order: order.channel.slug,
+            webhooks=webhooks,
+        )
+        return self.__run_method_on_plugins(
+            "orders_updated",
+            default_value,
+            orders,
+            channel_slug=None,
+            webhooks=webhooks,
+        )
+
     # Note: this method is deprecated and will be removed in a future release.
     # Webhook-related functionality will be moved from plugin to core modules.
     def order_cancelled(self, order: "Order", webhooks=None):
@@ -1875,6 +1958,24 @@ class PluginsManager(PaymentInterface):
             channel_slug=None,
         )
 
+    # Note: this method is deprecated and will be removed in a future release.
+    # Webhook-related functionality will be moved from plugin to core modules.
+    def gift_cards_created(self, gift_cards: list["GiftCard"], webhooks=None):
+        default_value = None
+        self.__run_method_on_plugins_without_bulk_method(
+            "gift_cards_created",
+            "gift_card_created",
+            gift_cards,
+            webhooks=webhooks,
+        )
+        return self.__run_method_on_plugins(
+            "gift_cards_created",
+            default_value,
+            gift_cards,
+            webhooks=webhooks,
+            channel_slug=None,
+        )
+
     # Note: this method is deprecated and will be removed in a future release.
     # Webhook-related functionality will be moved from plugin to core modules.
     def gift_card_updated(self, gift_card: "GiftCard"):
@@ -1717,3 +1717,100 @@ def test_excluded_shipping_methods_for_order_dont_run_webhook_on_missing_shippin
     # then webhook should not be emitted
 
     mock__run_method_on_plugins.assert_not_called()
+
+
+@patch.object(PluginSample, "order_updated", create=True)
+def test_manager_orders_updated_falls_back_to_order_updated(
+    mocked_order_updated, order_list
+):
+    # given
+    plugins = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    manager = PluginsManager(plugins=plugins)
+
+    # when
+    manager.orders_updated(order_list)
+
+    # then
+    assert mocked_order_updated.call_count == len(order_list)
+    mocked_order_updated.assert_has_calls(
+        [mock.call(order, previous_value=None, webhooks=None) for order in order_list]
+    )
+
+
+@patch.object(PluginSample, "orders_updated", create=True)
+@patch.object(PluginSample, "order_updated", create=True)
+def test_manager_orders_updated_no_fallback_when_bulk_method_implemented(
+    mocked_order_updated, mocked_orders_updated, order_list
+):
+    # given
+    plugins = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    manager = PluginsManager(plugins=plugins)
+
+    # when
+    manager.orders_updated(order_list)
+
+    # then
+    mocked_orders_updated.assert_called_once_with(
+        order_list, previous_value=None, webhooks=None
+    )
+    mocked_order_updated.assert_not_called()
+
+
+@patch.object(PluginSample, "gift_card_created", create=True)
+def test_manager_gift_cards_created_falls_back_to_gift_card_created(
+    mocked_gift_card_created, gift_card_list
+):
+    # given
+    plugins = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    manager = PluginsManager(plugins=plugins)
+
+    # when
+    manager.gift_cards_created(gift_card_list)
+
+    # then
+    assert mocked_gift_card_created.call_count == len(gift_card_list)
+    mocked_gift_card_created.assert_has_calls(
+        [
+            mock.call(gift_card, previous_value=None, webhooks=None)
+            for gift_card in gift_card_list
+        ]
+    )
+
+
+@patch.object(PluginSample, "customer_created", create=True)
+def test_manager_customers_created_falls_back_to_customer_created(
+    mocked_customer_created, customer_users
+):
+    # given
+    plugins = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    manager = PluginsManager(plugins=plugins)
+
+    # when
+    manager.customers_created(customer_users)
+
+    # then
+    assert mocked_customer_created.call_count == len(customer_users)
+    mocked_customer_created.assert_has_calls(
+        [mock.call(customer, previous_value=None) for customer in customer_users]
+    )
+
+
+@patch.object(PluginSample, "customer_updated", create=True)
+def test_manager_customers_updated_falls_back_to_customer_updated(
+    mocked_customer_updated, customer_users
+):
+    # given
+    plugins = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    manager = PluginsManager(plugins=plugins)
+
+    # when
+    manager.customers_updated(customer_users)
+
+    # then
+    assert mocked_customer_updated.call_count == len(customer_users)
+    mocked_customer_updated.assert_has_calls(
+        [
+            mock.call(customer, previous_value=None, webhooks=None)
+            for customer in customer_users
+        ]
+    )
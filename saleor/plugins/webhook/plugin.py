@@ -650,17 +650,20 @@ class WebhookPlugin(BasePlugin):
         )
         return previous_value
 
+    def _generate_gift_card_payload(self, gift_card: "GiftCard") -> str:
+        return self._serialize_payload(
+            {
+                "id": graphene.Node.to_global_id("GiftCard", gift_card.id),
+                "is_active": gift_card.is_active,
+                "meta": self._generate_meta(),
+            }
+        )
+
     def _trigger_gift_card_event(
         self, event_type, gift_card: "GiftCard", webhooks=None
     ):
         if webhooks := self._get_webhooks_for_event(event_type, webhooks):
-            payload = self._serialize_payload(
-                {
-                    "id": graphene.Node.to_global_id("GiftCard", gift_card.id),
-                    "is_active": gift_card.is_active,
-                    "meta": self._generate_meta(),
-                }
-            )
+            payload = self._generate_gift_card_payload(gift_card)
             self.trigger_webhooks_async(
                 payload,
                 event_type,
@@ -679,6 +682,30 @@ class WebhookPlugin(BasePlugin):
         )
         return previous_value
 
+    def gift_cards_created(
+        self, gift_cards: list["GiftCard"], previous_value: None, webhooks=None
+    ) -> None:
+        if not self.active:
+            return previous_value
+        event_type = WebhookEventAsyncType.GIFT_CARD_CREATED
+        if webhooks := self._get_webhooks_for_event(event_type, webhooks):
+            trigger_webhooks_async_for_multiple_objects(
+                event_type,
+                webhooks,
+                webhook_payloads_data=[
+                    WebhookPayloadData(
+                        subscribable_object=gift_card,
+                        legacy_data_generator=partial(
+                            self._generate_gift_card_payload, gift_card
+                        ),
+                    )
+                    for gift_card in gift_cards
+                ],
+                requestor=self.requestor,
+                allow_replica=self.allow_replica,
+            )
+        return previous_value
+
     def gift_card_updated(self, gift_card: "GiftCard", previous_value: None) -> None:
         if not self.active:
             return previous_value
@@ -1044,6 +1071,44 @@ class WebhookPlugin(BasePlugin):
             )
         return previous_value
 
+    def orders_updated(
+        self, orders: list["Order"], previous_value: None, webhooks=None
+    ) -> None:
+        if not self.active:
+            return previous_value
+        event_type = WebhookEventAsyncType.ORDER_UPDATED
+        if webhooks is None:
+            webhooks = get_webhooks_for_event(event_type)
+        if not webhooks:
+            return previous_value
+
+        orders_per_channel: dict[str, list[Order]] = defaultdict(list)
+        for order in orders:
+            orders_per_channel[order.channel.slug].append(order)
+
+        for channel_slug, channel_orders in orders_per_channel.items():
+            channel_webhooks = self._get_webhooks_for_channel_events(
+                event_type, channel_slug, webhooks
+            )
+            if not channel_webhooks:
+                continue
+            trigger_webhooks_async_for_multiple_objects(
+                event_type,
+                channel_webhooks,
+                webhook_payloads_data=[
+                    WebhookPayloadData(
+                        subscribable_object=order,
+                        legacy_data_generator=partial(
+                            generate_order_payload, order, self.requestor
+                        ),
+                    )
+                    for order in channel_orders
+                ],
+                requestor=self.requestor,
+                queue=settings.ORDER_WEBHOOK_EVENTS_CELERY_QUEUE_NAME,
+            )
+        return previous_value
+
     def order_expired(
         self, order: "Order", previous_value: None, webhooks=None
     ) -> None:
@@ -1665,6 +1730,36 @@ class WebhookPlugin(BasePlugin):
             )
         return previous_value
 
+    def _trigger_customers_event(
+        self, event_type, customers: list["User"], webhooks=None
+    ):
+        if webhooks := self._get_webhooks_for_event(event_type, webhooks):
+            trigger_webhooks_async_for_multiple_objects(
+                event_type,
+                webhooks,
+                webhook_payloads_data=[
+                    WebhookPayloadData(
+                        subscribable_object=customer,
+                        legacy_data_generator=partial(
+                            generate_customer_payload, customer, self.requestor
+                        ),
+                    )
+                    for customer in customers
+                ],
+                requestor=self.requestor,
+                allow_replica=self.allow_replica,
+            )
+
+    def customers_created(
+        self, customers: list["User"], previous_value: None, webhooks=None
+    ) -> None:
+        if not self.active:
+            return previous_value
+        self._trigger_customers_event(
+            WebhookEventAsyncType.CUSTOMER_CREATED, customers, webhooks
+        )
+        return previous_value
+
     def customer_updated(
         self, customer: "User", previous_value: None, webhooks=None
     ) -> None:
@@ -1685,6 +1780,16 @@ class WebhookPlugin(BasePlugin):
             )
         return previous_value
 
+    def customers_updated(
+        self, customers: list["User"], previous_value: None, webhooks=None
+    ) -> None:
+        if not self.active:
+            return previous_value
+        self._trigger_customers_event(
+            WebhookEventAsyncType.CUSTOMER_UPDATED, customers, webhooks
+        )
+        return previous_value
+
     def customer_deleted(
         self, customer: "User", previous_value: None, webhooks=None
     ) -> None:
@@ -676,11 +676,21 @@ CELERY_BEAT_SCHEDULE = {
         "schedule": datetime.timedelta(seconds=BEAT_UPDATE_SEARCH_SEC),
         "options": {"expires": BEAT_UPDATE_SEARCH_EXPIRE_AFTER_SEC},
     },
+    "update-orders-search-vectors": {
+        "task": "saleor.order.tasks.update_orders_search_vector_task",
+        "schedule": datetime.timedelta(seconds=BEAT_UPDATE_SEARCH_SEC),
+        "options": {"expires": BEAT_UPDATE_SEARCH_EXPIRE_AFTER_SEC},
+    },
     "update-gift-cards-search-vectors": {
         "task": "saleor.giftcard.tasks.update_gift_cards_search_vector_task",
         "schedule": datetime.timedelta(seconds=BEAT_UPDATE_SEARCH_SEC),
         "options": {"expires": BEAT_UPDATE_SEARCH_EXPIRE_AFTER_SEC},
     },
+    "update-users-search-documents": {
+        "task": "saleor.account.tasks.update_users_search_document_task",
+        "schedule": datetime.timedelta(seconds=BEAT_UPDATE_SEARCH_SEC),
+        "options": {"expires": BEAT_UPDATE_SEARCH_EXPIRE_AFTER_SEC},
+    },
     "expire-orders": {
         "task": "saleor.order.tasks.expire_orders_task",
         "schedule": BEAT_EXPIRE_ORDERS_AFTER_TIMEDELTA,
@@ -708,6 +718,33 @@ CELERY_BEAT_SCHEDULE = {
     },
 }
 
+# When enabled, async subscription webhooks for objects stored in the database are not
+# generated in the request. Instead, compact outbox records are written in the same
+# transaction as the change that caused the event, and a relay task generates payloads
+# and deliveries in bulk. Payloads for deleted and non-model objects are still
+# generated in the request.
+WEBHOOK_EVENT_OUTBOX_ENABLED = get_bool_from_env("WEBHOOK_EVENT_OUTBOX_ENABLED", False)
+# The maximum number of outbox records processed by a single relay task execution
+WEBHOOK_EVENT_OUTBOX_BATCH_SIZE = int(
+    os.environ.get("WEBHOOK_EVENT_OUTBOX_BATCH_SIZE", 500)
+)
+# The number of failed attempts after which the relay stops processing an outbox
+# record; such records are logged and kept in the table for inspection
+WEBHOOK_EVENT_OUTBOX_MAX_ATTEMPTS = int(
+    os.environ.get("WEBHOOK_EVENT_OUTBOX_MAX_ATTEMPTS", 5)
+)
+BEAT_WEBHOOK_EVENT_OUTBOX_RELAY_SEC = parse(
+    os.environ.get("BEAT_WEBHOOK_EVENT_OUTBOX_RELAY_FREQUENCY", "30 seconds")
+)
+if WEBHOOK_EVENT_OUTBOX_ENABLED:
+    # The relay task is also triggered after each commit that writes outbox records;
+    # the beat entry picks up records left over by failed or lost tasks.
+    CELERY_BEAT_SCHEDULE["relay-webhook-event-outbox"] = {
+        "task": "saleor.webhook.transport.asynchronous.transport.relay_event_outbox_task",
+        "schedule": datetime.timedelta(seconds=BEAT_WEBHOOK_EVENT_OUTBOX_RELAY_SEC),
+        "options": {"expires": BEAT_WEBHOOK_EVENT_OUTBOX_RELAY_SEC},
+    }
+
 # The maximum wait time between each is_due() call on schedulers
 # It needs to be higher than the frequency of the schedulers to avoid unnecessary
 # is_due() calls
@@ -719,6 +756,20 @@ EVENT_PAYLOAD_DELETE_PERIOD = datetime.timedelta(
 EVENT_PAYLOAD_DELETE_TASK_TIME_LIMIT = datetime.timedelta(
     seconds=parse(os.environ.get("EVENT_PAYLOAD_DELETE_TASK_TIME_LIMIT", "1 hour"))
 )
+# When enabled, webhook payloads of events with many objects are generated for all
+# objects at once, sharing dataloaders between the objects.
+WEBHOOK_BATCHED_PAYLOAD_GENERATION_ENABLED = get_bool_from_env(
+    "WEBHOOK_BATCHED_PAYLOAD_GENERATION_ENABLED", False
+)
+
+# When enabled, payloads created in one batch are compressed and written together
+# to segment files of at most the given size, instead of one file per payload.
+EVENT_PAYLOAD_SEGMENTS_ENABLED = get_bool_from_env(
+    "EVENT_PAYLOAD_SEGMENTS_ENABLED", False
+)
+EVENT_PAYLOAD_SEGMENT_MAX_SIZE = int(
+    os.environ.get("EVENT_PAYLOAD_SEGMENT_MAX_SIZE", 8 * 1024 * 1024)
+)
 EVENT_DELIVERY_ATTEMPT_RESPONSE_SIZE_LIMIT = int(
     os.environ.get("EVENT_DELIVERY_ATTEMPT_RESPONSE_SIZE_LIMIT", 1024)
 )
@@ -822,6 +873,69 @@ def SENTRY_INIT(dsn: str, sentry_opts: dict):
 GRAPHQL_PAGINATION_LIMIT = 100
 GRAPHQL_MIDDLEWARE: list[str] = []
 
+# Per-field profiling of GraphQL operations. When enabled, requestors with the
+# MANAGE_OBSERVABILITY permission can send the `X-Saleor-Profile` header to get
+# the profile of the operation in response `extensions`. Additionally, the given
+# fraction of all operations is profiled to export per-field metrics.
+GRAPHQL_PROFILING_ENABLED = get_bool_from_env("GRAPHQL_PROFILING_ENABLED", False)
+GRAPHQL_PROFILING_SAMPLE_RATE = float(
+    os.environ.get("GRAPHQL_PROFILING_SAMPLE_RATE", 0.0)
+)
+# Number of executions of the same SQL query by one field path reported as N+1
+GRAPHQL_PROFILING_N_PLUS_ONE_THRESHOLD = int(
+    os.environ.get("GRAPHQL_PROFILING_N_PLUS_ONE_THRESHOLD", 5)
+)
+if GRAPHQL_PROFILING_ENABLED:
+    GRAPHQL_MIDDLEWARE.append("saleor.graphql.core.profiling.ProfilingMiddleware")
+
+# When enabled, dataloaders of nested fields selected on connection nodes are
+# loaded as soon as the page of nodes is fetched, instead of level by level.
+GRAPHQL_QUERY_PLANNER_ENABLED = get_bool_from_env(
+    "GRAPHQL_QUERY_PLANNER_ENABLED", False
+)
+
+# When enabled, connections and the major dataloaders don't load heavy columns,
+# like descriptions, metadata and search documents, that are not needed by the
+# selected GraphQL fields.
+GRAPHQL_QUERYSET_PROJECTION_ENABLED = get_bool_from_env(
+    "GRAPHQL_QUERYSET_PROJECTION_ENABLED", False
+)
+
+# When enabled, operations sent in one batch request share the context, so the
+# requestor, the plugins manager and values loaded by dataloaders are reused.
+GRAPHQL_BATCH_SHARED_CONTEXT_ENABLED = get_bool_from_env(
+    "GRAPHQL_BATCH_SHARED_CONTEXT_ENABLED", False
+)
+
+# When enabled, ASGI workers build the GraphQL schema, load the plugins and parse
+# webhook subscription queries before serving the first request.
+WARMUP_ENABLED = get_bool_from_env("WARMUP_ENABLED", False)
+
+# Path to a JSON file with a list of GraphQL documents of frequently executed
+# operations, that are parsed and validated during the warm-up.
+GRAPHQL_WARMUP_OPERATIONS_MANIFEST = os.environ.get(
+    "GRAPHQL_WARMUP_OPERATIONS_MANIFEST"
+)
+
+# When enabled, the GraphQL endpoint is served by an asynchronous view that executes
+# operations in a dedicated thread pool. Under ASGI, Django runs synchronous views
+# one at a time in a single thread per worker, so a request waiting on the database
+# or a synchronous webhook blocks all other requests handled by that worker.
+# Each thread of the pool keeps its own database connections, so the pool size
+# should not exceed the available connections per worker.
+GRAPHQL_ASYNC_EXECUTION_ENABLED = get_bool_from_env(
+    "GRAPHQL_ASYNC_EXECUTION_ENABLED", False
+)
+GRAPHQL_ASYNC_EXECUTION_MAX_WORKERS = int(
+    os.environ.get("GRAPHQL_ASYNC_EXECUTION_MAX_WORKERS", 8)
+)
+
+# Serialize GraphQL responses and webhook payloads with `orjson`. The package is not
+# installed by default and has to be added to the environment. Its output is compact
+# and doesn't escape non-ASCII characters, so payload bytes differ from the standard
+# library encoder used when disabled.
+FAST_JSON_SERIALIZER_ENABLED = get_bool_from_env("FAST_JSON_SERIALIZER_ENABLED", False)
+
 # Set GRAPHQL_QUERY_MAX_COMPLEXITY=0 in env to disable (not recommended)
 GRAPHQL_QUERY_MAX_COMPLEXITY = int(
     os.environ.get("GRAPHQL_QUERY_MAX_COMPLEXITY", 50000)
@@ -918,7 +1032,68 @@ CHECKOUT_BATCH_FOR_RELEASING_FUNDS = os.environ.get(
 TRANSACTION_BATCH_FOR_RELEASING_FUNDS = os.environ.get(
     "TRANSACTION_BATCH_FOR_RELEASING_FUNDS", 60
 )
+# The maximum number of tasks sending requests to release funds to a single payment
+# app at the same time.
+TRANSACTION_RELEASING_FUNDS_CONCURRENCY_PER_APP = int(
+    os.environ.get("TRANSACTION_RELEASING_FUNDS_CONCURRENCY_PER_APP", 4)
+)
+# When enabled, tasks releasing funds take per-app slots kept in the Redis cache, so
+# the concurrency limit above is shared by all sweeps. Otherwise, it's applied to
+# each sweep separately.
+TRANSACTION_RELEASING_FUNDS_SLOTS_ENABLED = get_bool_from_env(
+    "TRANSACTION_RELEASING_FUNDS_SLOTS_ENABLED", False
+)
+if TRANSACTION_RELEASING_FUNDS_SLOTS_ENABLED and (
+    CACHE_URL is None or not CACHE_URL.startswith("redis")
+):
+    raise ImproperlyConfigured(
+        "Releasing funds slots cannot be used when Redis cache is not configured."
+    )
+
+# When enabled, checkout completion commits only the order, its lines, discounts,
+# allocations and payments, and the remaining non-critical actions (order search
+# vector, order and customer events, notifications and `ORDER_CREATED` webhooks) are
+# processed afterwards by a Celery worker.
+CHECKOUT_COMPLETE_DEFER_ORDER_ACTIONS = get_bool_from_env(
+    "CHECKOUT_COMPLETE_DEFER_ORDER_ACTIONS", False
+)
+
+# When enabled, orders created by the checkout completion and `orderBulkCreate` are
+# only marked as requiring indexing, and their `search_vector` is set in batches by
+# the 'update-orders-search-vectors' Celery beat entry.
+ORDER_SEARCH_INDEX_DEFERRED = get_bool_from_env("ORDER_SEARCH_INDEX_DEFERRED", False)
+
+# When enabled, dataloaders of reference data (channels, tax configuration,
+# warehouses, shipping zones, attributes, sites and menus) keep loaded instances in
+# a process-local cache shared between requests. Entries are invalidated when any of
+# the reference models is changed, and expire after the given timeout.
+DATALOADER_REFERENCE_CACHE_ENABLED = get_bool_from_env(
+    "DATALOADER_REFERENCE_CACHE_ENABLED", False
+)
+DATALOADER_REFERENCE_CACHE_TIMEOUT = parse(
+    os.environ.get("DATALOADER_REFERENCE_CACHE_TIMEOUT", "5 minutes")
+)
+DATALOADER_REFERENCE_CACHE_MAX_SIZE = int(
+    os.environ.get("DATALOADER_REFERENCE_CACHE_MAX_SIZE", 10000)
+)
 
+# When enabled, app tokens that passed the password hash check are remembered by
+# their keyed HMAC, so following requests of the app skip the slow hasher. Tokens
+# are still matched against the database on every request.
+APP_TOKEN_CACHE_ENABLED = get_bool_from_env("APP_TOKEN_CACHE_ENABLED", True)
+APP_TOKEN_CACHE_TIMEOUT = parse(os.environ.get("APP_TOKEN_CACHE_TIMEOUT", "5 minutes"))
+
+# When enabled, verified JWT claims and the authenticated users with their
+# permissions are kept in a process-local cache between requests. Cached users are
+# invalidated when the user, their groups or permission groups change; changes
+# made without model signals are picked up after the given timeout.
+AUTH_CACHE_ENABLED = get_bool_from_env("AUTH_CACHE_ENABLED", False)
+AUTH_CACHE_TIMEOUT = parse(os.environ.get("AUTH_CACHE_TIMEOUT", "1 minute"))
+# Versions invalidating the cached users are kept in the cache shared by processes.
+if AUTH_CACHE_ENABLED and (CACHE_URL is None or not CACHE_URL.startswith("redis")):
+    raise ImproperlyConfigured(
+        "Auth cache cannot be used when Redis cache is not configured."
+    )
 
 # The maximum SearchVector expression count allowed per index SQL statement
 # If the count is exceeded, the expression list will be truncated
@@ -977,6 +1152,12 @@ AUTOMATIC_CHECKOUT_COMPLETION_QUEUE_NAME = os.environ.get(
     "AUTOMATIC_CHECKOUT_COMPLETION_QUEUE_NAME", None
 )
 
+# Queue name for execution of order post-create actions deferred by the checkout
+# completion (see `CHECKOUT_COMPLETE_DEFER_ORDER_ACTIONS`)
+ORDER_CREATED_ACTIONS_QUEUE_NAME = os.environ.get(
+    "ORDER_CREATED_ACTIONS_QUEUE_NAME", None
+)
+
 # Lock time for request password reset mutation per user (seconds)
 RESET_PASSWORD_LOCK_TIME = parse(
     os.environ.get("RESET_PASSWORD_LOCK_TIME", "15 minutes")
@@ -1015,6 +1196,12 @@ WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT = 18
 WEBHOOK_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT)
 WEBHOOK_SYNC_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT)
 
+# The max number of orders that can be imported with a single `orderBulkCreate` call.
+# All orders of the call are saved in a single transaction with multi-row inserts.
+ORDER_BULK_CREATE_MAX_ORDERS = int(
+    os.environ.get("ORDER_BULK_CREATE_MAX_ORDERS", 1000)
+)
+
 # The max number of rules with order_predicate defined
 ORDER_RULES_LIMIT = os.environ.get("ORDER_RULES_LIMIT", 100)
 
@@ -1034,6 +1221,13 @@ ENABLE_LIMITING_WEBHOOKS_FOR_IDENTICAL_PAYLOADS = get_bool_from_env(
 # That setting limits the allowed number of transaction items for single entity.
 TRANSACTION_ITEMS_LIMIT = 100
 
+# Keep amounts of each transaction in a snapshot and apply new transaction events
+# to it as deltas, instead of replaying all events of the transaction whenever a new
+# event is reported.
+TRANSACTION_AMOUNT_SNAPSHOTS_ENABLED = get_bool_from_env(
+    "TRANSACTION_AMOUNT_SNAPSHOTS_ENABLED", False
+)
+
 
 TOKEN_GENERATOR_CLASS = "django.contrib.auth.tokens.PasswordResetTokenGenerator"
 
@@ -1061,6 +1255,59 @@ BREAKER_BOARD_DRY_RUN_SYNC_EVENTS = get_list(
     os.environ.get("BREAKER_BOARD_DRY_RUN_SYNC_EVENTS", "")
 )
 
+# When enabled, async webhook deliveries wait in per-app queues and a scheduler
+# dispatches them in turns between apps. Each app has a limit of deliveries sent at
+# the same time, which grows while the app responds within the latency threshold and
+# shrinks on failed or slow responses.
+WEBHOOK_SCHEDULER_ENABLED = get_bool_from_env("WEBHOOK_SCHEDULER_ENABLED", False)
+if WEBHOOK_SCHEDULER_ENABLED and (
+    CACHE_URL is None or not CACHE_URL.startswith("redis")
+):
+    raise ImproperlyConfigured(
+        "Webhook scheduler cannot be used when Redis cache is not configured."
+    )
+WEBHOOK_SCHEDULER_MIN_CONCURRENCY = int(
+    os.environ.get("WEBHOOK_SCHEDULER_MIN_CONCURRENCY", 1)
+)
+WEBHOOK_SCHEDULER_MAX_CONCURRENCY = int(
+    os.environ.get("WEBHOOK_SCHEDULER_MAX_CONCURRENCY", 50)
+)
+WEBHOOK_SCHEDULER_INITIAL_CONCURRENCY = int(
+    os.environ.get("WEBHOOK_SCHEDULER_INITIAL_CONCURRENCY", 10)
+)
+WEBHOOK_SCHEDULER_LATENCY_THRESHOLD = parse(
+    os.environ.get("WEBHOOK_SCHEDULER_LATENCY_THRESHOLD", "2 seconds")
+)
+# Time after which a dispatched delivery that didn't finish, e.g. because its task
+# was lost, no longer counts against the app's limit.
+WEBHOOK_SCHEDULER_LEASE_TIMEOUT = parse(
+    os.environ.get("WEBHOOK_SCHEDULER_LEASE_TIMEOUT", "5 minutes")
+)
+# The maximum number of deliveries dispatched by a single scheduler pass
+WEBHOOK_SCHEDULER_DISPATCH_BATCH_SIZE = int(
+    os.environ.get("WEBHOOK_SCHEDULER_DISPATCH_BATCH_SIZE", 500)
+)
+# Number of deliveries an app gets per turn, as "app_id:weight" pairs, for ex:
+# "12:3, 15:2". Other apps get one delivery per turn.
+WEBHOOK_SCHEDULER_APP_WEIGHTS = {
+    int(app_id): int(weight)
+    for app_id, weight in (
+        item.split(":")
+        for item in get_list(os.environ.get("WEBHOOK_SCHEDULER_APP_WEIGHTS", ""))
+    )
+}
+BEAT_WEBHOOK_SCHEDULER_DISPATCH_SEC = parse(
+    os.environ.get("BEAT_WEBHOOK_SCHEDULER_DISPATCH_FREQUENCY", "30 seconds")
+)
+if WEBHOOK_SCHEDULER_ENABLED:
+    # Passes are triggered when deliveries are queued or finished; the beat entry
+    # dispatches deliveries left over by failed or lost tasks.
+    CELERY_BEAT_SCHEDULE["dispatch-webhook-deliveries"] = {
+        "task": "saleor.webhook.transport.asynchronous.transport.dispatch_webhook_deliveries_task",
+        "schedule": datetime.timedelta(seconds=BEAT_WEBHOOK_SCHEDULER_DISPATCH_SEC),
+        "options": {"expires": BEAT_WEBHOOK_SCHEDULER_DISPATCH_SEC},
+    }
+
 TELEMETRY_TRACER_CLASS = "saleor.core.telemetry.trace.Tracer"
 TELEMETRY_METER_CLASS = "saleor.core.telemetry.metric.Meter"
 # Whether to raise or log exceptions for telemetry unit conversion errors
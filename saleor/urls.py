@@ -6,7 +6,7 @@ from django.views.decorators.csrf import csrf_exempt
 
 from .core.views import jwks
 from .graphql.api import backend, schema
-from .graphql.views import GraphQLView
+from .graphql.views import AsyncGraphQLView, GraphQLView
 from .plugins.views import (
     handle_global_plugin_webhook,
     handle_plugin_per_channel_webhook,
@@ -19,10 +19,14 @@ from .thumbnail.views import handle_thumbnail
 from graphene_file_upload.django import FileUploadGraphQLView
 
 
+graphql_view_class = (
+    AsyncGraphQLView if settings.GRAPHQL_ASYNC_EXECUTION_ENABLED else GraphQLView
+)
+
 urlpatterns = [
     re_path(
         r"^graphql/$",
-        csrf_exempt(GraphQLView.as_view(schema=schema, backend=backend)),
+        csrf_exempt(graphql_view_class.as_view(schema=schema, backend=backend)),
         name="api",
     ),
     re_path(
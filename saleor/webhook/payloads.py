@@ -25,7 +25,7 @@ from ..core.utils.anonymization import (
     anonymize_order,
     generate_fake_user,
 )
-from ..core.utils.json_serializer import CustomJsonEncoder
+from ..core.utils.json_serializer import json_dumps
 from ..discount.utils.shared import is_order_level_discount
 from ..discount.utils.voucher import is_order_level_voucher
 from ..order import FulfillmentStatus, OrderStatus
@@ -1082,7 +1082,7 @@ def generate_payment_payload(
     if payment_app_data := from_payment_app_id(data["gateway"]):
         data["payment_method"] = payment_app_data.name
         data["meta"] = generate_meta(requestor_data=generate_requestor(requestor))
-    return json.dumps(data, cls=CustomJsonEncoder)
+    return json_dumps(data)
 
 
 @allow_writer()
@@ -1264,7 +1264,7 @@ def generate_excluded_shipping_methods_for_order_payload(
             for shipping_method in available_shipping_methods
         ],
     }
-    return json.dumps(payload, cls=CustomJsonEncoder)
+    return json_dumps(payload)
 
 
 @allow_writer()
@@ -1281,7 +1281,7 @@ def generate_excluded_shipping_methods_for_checkout_payload(
             for shipping_method in available_shipping_methods
         ],
     }
-    return json.dumps(payload, cls=CustomJsonEncoder)
+    return json_dumps(payload)
 
 
 @allow_writer()
@@ -1528,7 +1528,7 @@ def generate_transaction_action_request_payload(
         },
         "meta": generate_meta(requestor_data=generate_requestor(requestor)),
     }
-    return json.dumps(payload, cls=CustomJsonEncoder)
+    return json_dumps(payload)
 
 
 @allow_writer()
@@ -1552,7 +1552,7 @@ def generate_transaction_session_payload(
             "TransactionItem", transaction.token
         ),
     }
-    return json.dumps(payload, cls=CustomJsonEncoder)
+    return json_dumps(payload)
 
 
 @allow_writer()
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class AdaptiveConcurrencyLimit:
+    """Limit of deliveries of an app that are sent at the same time.
+
+    The limit follows the additive-increase/multiplicative-decrease rule: it grows by
+    one after about `limit` fast successful deliveries and is cut by `backoff_ratio`
+    on every failed delivery or a delivery slower than `latency_threshold`.
+    """
+
+    min_limit: int
+    max_limit: int
+    initial_limit: int
+    latency_threshold: float
+    backoff_ratio: float = 0.9
+
+    def update(self, limit: float, latency: float, failed: bool) -> float:
+        if failed or latency > self.latency_threshold:
+            return max(float(self.min_limit), limit * self.backoff_ratio)
+        return min(float(self.max_limit), limit + 1 / limit)
+
+    def is_saturated(self, limit: float) -> bool:
+        return limit <= self.min_limit
@@ -0,0 +1,190 @@
+"""Fair scheduling of async webhook deliveries between apps.
+
+Deliveries wait in per-app queues and are dispatched to Celery in passes. A pass
+takes deliveries from apps in turns, each app up to its weight per turn, so a
+single app with many deliveries can't take over all workers. Each app has its own
+adaptive limit of deliveries in progress; the limit of a slow or failing app shrinks,
+and its deliveries wait in its queue instead of occupying workers. Results of an app
+whose limit dropped to the minimum are registered in the breaker board, which stops
+dispatching the app's deliveries while its circuit breaker is open.
+"""
+
+import random
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+
+from ...app.models import App
+from ...core.telemetry import MetricType, Scope, Unit, meter
+from ...graphql.app.enums import CircuitBreakerState
+from ..circuit_breaker.breaker_board import BreakerBoard, initialize_breaker_board
+from .limiter import AdaptiveConcurrencyLimit
+from .storage import RedisSchedulerStorage
+
+if TYPE_CHECKING:
+    from ...core.models import EventDelivery
+
+METRIC_QUEUE_DEPTH = meter.create_metric(
+    "saleor.webhooks.async.scheduler.queue_depth",
+    scope=Scope.CORE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.REQUEST,
+    description="Number of async webhook deliveries of an app waiting for dispatch.",
+)
+
+METRIC_QUEUE_AGE = meter.create_metric(
+    "saleor.webhooks.async.scheduler.queue_age",
+    scope=Scope.CORE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.SECOND,
+    description="Age of the oldest async webhook delivery of an app waiting for dispatch.",
+)
+
+# (delivery ID, Celery queue name)
+QueuedDelivery = tuple[int, str]
+
+
+class DeliveryScheduler:
+    def __init__(
+        self,
+        storage: RedisSchedulerStorage,
+        limit: AdaptiveConcurrencyLimit,
+        lease_seconds: float,
+        batch_size: int,
+        app_weights: dict[int, int] | None = None,
+        breaker_board: BreakerBoard | None = None,
+    ):
+        self.storage = storage
+        self.limit = limit
+        self.lease_seconds = lease_seconds
+        self.batch_size = batch_size
+        self.app_weights = app_weights or {}
+        self.breaker_board = breaker_board
+
+    def enqueue(
+        self, deliveries: Iterable[tuple["EventDelivery", str]]
+    ) -> list["EventDelivery"]:
+        """Queue deliveries with names of their Celery queues.
+
+        Return deliveries that could not be queued and have to be sent without
+        the scheduler.
+        """
+        deliveries_per_app: defaultdict[int, list[EventDelivery]] = defaultdict(list)
+        queues: dict[int, str] = {}
+        for delivery, queue in deliveries:
+            deliveries_per_app[delivery.webhook.app_id].append(delivery)
+            queues[delivery.pk] = queue
+        now = time.time()
+        not_queued = []
+        for app_id, app_deliveries in deliveries_per_app.items():
+            queued = self.storage.enqueue(
+                app_id,
+                [(delivery.pk, queues[delivery.pk]) for delivery in app_deliveries],
+                now,
+            )
+            if not queued:
+                not_queued.extend(app_deliveries)
+        return not_queued
+
+    def has_queued_deliveries(self) -> bool:
+        return bool(self.storage.get_queued_app_ids())
+
+    def dispatch(self) -> list[QueuedDelivery]:
+        """Take deliveries to send from app queues, in turns, within apps' limits."""
+        now = time.time()
+        app_ids = self.storage.get_queued_app_ids()
+        # the order of apps in turns changes between passes
+        random.shuffle(app_ids)
+        apps = App.objects.in_bulk(app_ids)
+
+        limits: dict[int, float] = {}
+        for app_id in app_ids:
+            app = apps.get(app_id)
+            depth, age = self.storage.get_queue_stats(app_id, now)
+            attributes = {"app.name": app.name if app else str(app_id)}
+            meter.record(
+                METRIC_QUEUE_DEPTH, depth, unit=Unit.REQUEST, attributes=attributes
+            )
+            meter.record(METRIC_QUEUE_AGE, age, unit=Unit.SECOND, attributes=attributes)
+            if app and self._is_breaker_open(app):
+                continue
+            limits[app_id] = self.get_limit(app_id)
+
+        dispatched: list[QueuedDelivery] = []
+        budget = self.batch_size
+        active = [app_id for app_id in app_ids if app_id in limits]
+        while budget and active:
+            for app_id in list(active):
+                count = min(self.app_weights.get(app_id, 1), budget)
+                deliveries = self.storage.start(
+                    app_id, count, limits[app_id], now, now + self.lease_seconds
+                )
+                dispatched.extend(deliveries)
+                budget -= len(deliveries)
+                # the app's queue is empty or the app reached its limit
+                if len(deliveries) < count:
+                    active.remove(app_id)
+                if not budget:
+                    break
+        return dispatched
+
+    def complete(self, app: App, delivery_id: int, latency: float, failed: bool):
+        """Release the delivery's place within the app's limit and adjust the limit."""
+        if not self.storage.finish(app.id, delivery_id):
+            return
+        self._update_limit(app, latency, failed)
+
+    def retry(self, app: App, delivery_id: int, latency: float, retry_at: float):
+        """Keep the place of a failed delivery within the app's limit until its retry.
+
+        The limit is adjusted as for any failed delivery, and the lease is extended to
+        expire only after the retry is expected to finish.
+        """
+        if not self.storage.extend(app.id, delivery_id, retry_at + self.lease_seconds):
+            return
+        self._update_limit(app, latency, failed=True)
+
+    def _update_limit(self, app: App, latency: float, failed: bool):
+        limit = self.limit.update(self.get_limit(app.id), latency, failed)
+        self.storage.set_limit(app.id, limit)
+        if self.breaker_board and self.limit.is_saturated(limit):
+            if failed:
+                self.breaker_board.register_error(app.id)
+            else:
+                self.breaker_board.register_success(app.id)
+
+    def release(self, delivery_id: int) -> bool:
+        """Release the place of a delivery that won't be sent, keeping the limit."""
+        return self.storage.release(delivery_id)
+
+    def get_limit(self, app_id: int) -> float:
+        limit = self.storage.get_limit(app_id)
+        return limit if limit is not None else float(self.limit.initial_limit)
+
+    def _is_breaker_open(self, app: App) -> bool:
+        if not self.breaker_board:
+            return False
+        state = self.breaker_board.update_breaker_state(app)
+        return state == CircuitBreakerState.OPEN
+
+
+def initialize_delivery_scheduler() -> DeliveryScheduler | None:
+    if not settings.WEBHOOK_SCHEDULER_ENABLED:
+        return None
+
+    return DeliveryScheduler(
+        storage=RedisSchedulerStorage(),
+        limit=AdaptiveConcurrencyLimit(
+            min_limit=settings.WEBHOOK_SCHEDULER_MIN_CONCURRENCY,
+            max_limit=settings.WEBHOOK_SCHEDULER_MAX_CONCURRENCY,
+            initial_limit=settings.WEBHOOK_SCHEDULER_INITIAL_CONCURRENCY,
+            latency_threshold=settings.WEBHOOK_SCHEDULER_LATENCY_THRESHOLD,
+        ),
+        lease_seconds=settings.WEBHOOK_SCHEDULER_LEASE_TIMEOUT,
+        batch_size=settings.WEBHOOK_SCHEDULER_DISPATCH_BATCH_SIZE,
+        app_weights=settings.WEBHOOK_SCHEDULER_APP_WEIGHTS,
+        breaker_board=initialize_breaker_board(),
+    )
@@ -0,0 +1,203 @@
+import logging
+
+from django.core.cache import cache
+from redis import RedisError
+
+logger = logging.getLogger(__name__)
+
+# Checking the capacity, popping deliveries from the queue and leasing them happens
+# in a single script, so concurrent dispatch passes can't exceed the app's limit.
+# KEYS: queue, in progress, leases, apps
+# ARGV: app ID, count, limit, now, lease deadline
+START_SCRIPT = """
+local expired = redis.call("ZRANGEBYSCORE", KEYS[2], "-inf", ARGV[4])
+for _, delivery_id in ipairs(expired) do
+    local lease = redis.call("HGET", KEYS[3], delivery_id)
+    redis.call("ZREM", KEYS[2], delivery_id)
+    redis.call("HDEL", KEYS[3], delivery_id)
+    if lease then
+        local queue = string.sub(lease, string.find(lease, "|", 1, true) + 1)
+        redis.call("ZADD", KEYS[1], "NX", ARGV[4], delivery_id .. "|" .. queue)
+    end
+end
+
+local capacity = math.floor(tonumber(ARGV[3])) - redis.call("ZCARD", KEYS[2])
+local count = math.min(tonumber(ARGV[2]), capacity)
+local started = {}
+if count > 0 then
+    local members = redis.call("ZPOPMIN", KEYS[1], count)
+    for i = 1, #members, 2 do
+        local member = members[i]
+        local separator = string.find(member, "|", 1, true)
+        local delivery_id = string.sub(member, 1, separator - 1)
+        local queue = string.sub(member, separator + 1)
+        redis.call("ZADD", KEYS[2], ARGV[5], delivery_id)
+        redis.call("HSET", KEYS[3], delivery_id, ARGV[1] .. "|" .. queue)
+        table.insert(started, member)
+    end
+end
+
+if redis.call("ZCARD", KEYS[1]) == 0 then
+    redis.call("SREM", KEYS[4], ARGV[1])
+else
+    redis.call("SADD", KEYS[4], ARGV[1])
+end
+return started
+"""
+
+
+class RedisSchedulerStorage:
+    """Per-app queues of deliveries waiting for dispatch and deliveries in progress.
+
+    Queued deliveries are kept with the name of their Celery queue and scored by the
+    time they were queued. Deliveries in progress are scored by the time after which
+    their lease expires and they are queued again, in case their task was lost; their
+    apps and Celery queues are kept in a hash of leases shared by all apps.
+    """
+
+    WARNING_MESSAGE = "An error occurred when interacting with Redis"
+    KEY_PREFIX = "wds"  # as in "webhook delivery scheduler"
+    APPS_KEY = "apps"
+    LEASES_KEY = "leases"
+
+    def __init__(self, client=None):
+        if client:
+            self._client = client
+        else:
+            self._client = cache._cache.get_client()  # type: ignore[attr-defined]
+        self._start_script = self._client.register_script(START_SCRIPT)
+
+    def _get_key(self, *parts) -> str:
+        return "-".join([self.KEY_PREFIX, *map(str, parts)])
+
+    def enqueue(
+        self, app_id: int, deliveries: list[tuple[int, str]], now: float
+    ) -> bool:
+        try:
+            p = self._client.pipeline()
+            p.zadd(
+                self._get_key(app_id, "queue"),
+                {f"{delivery_id}|{queue}": now for delivery_id, queue in deliveries},
+                nx=True,
+            )
+            p.sadd(self._get_key(self.APPS_KEY), app_id)
+            p.execute()
+        except RedisError:
+            logger.warning(self.WARNING_MESSAGE, exc_info=True)
+            return False
+        return True
+
+    def get_queued_app_ids(self) -> list[int]:
+        try:
+            app_ids = self._client.smembers(self._get_key(self.APPS_KEY))
+        except RedisError:
+            logger.warning(self.WARNING_MESSAGE, exc_info=True)
+            return []
+        return [int(app_id) for app_id in app_ids]
+
+    def get_queue_stats(self, app_id: int, now: float) -> tuple[int, float]:
+        """Return the number of queued deliveries and the age of the oldest one."""
+        key = self._get_key(app_id, "queue")
+        try:
+            p = self._client.pipeline()
+            p.zcard(key)
+            p.zrange(key, 0, 0, withscores=True)
+            depth, oldest = p.execute()
+        except RedisError:
+            logger.warning(self.WARNING_MESSAGE, exc_info=True)
+            return 0, 0.0
+        age = now - oldest[0][1] if oldest else 0.0
+        return depth, age
+
+    def start(
+        self,
+        app_id: int,
+        count: int,
+        limit: float,
+        now: float,
+        lease_deadline: float,
+    ) -> list[tuple[int, str]]:
+        """Move up to `count` oldest deliveries of the app to deliveries in progress.
+
+        Deliveries whose lease expired go back to the queue first, and no more
+        deliveries are started than the app's limit allows.
+        """
+        try:
+            members = self._start_script(
+                keys=[
+                    self._get_key(app_id, "queue"),
+                    self._get_key(app_id, "in_progress"),
+                    self._get_key(self.LEASES_KEY),
+                    self._get_key(self.APPS_KEY),
+                ],
+                args=[app_id, count, limit, now, lease_deadline],
+            )
+        except RedisError:
+            logger.warning(self.WARNING_MESSAGE, exc_info=True)
+            return []
+        deliveries = []
+        for member in members:
+            delivery_id, queue = str(member, "utf-8").split("|", 1)
+            deliveries.append((int(delivery_id), queue))
+        return deliveries
+
+    def finish(self, app_id: int, delivery_id: int) -> bool:
+        """Remove the delivery from deliveries in progress.
+
+        Return `False` if the delivery was not dispatched by the scheduler.
+        """
+        try:
+            p = self._client.pipeline()
+            p.zrem(self._get_key(app_id, "in_progress"), delivery_id)
+            p.hdel(self._get_key(self.LEASES_KEY), delivery_id)
+            removed, _ = p.execute()
+        except RedisError:
+            logger.warning(self.WARNING_MESSAGE, exc_info=True)
+            return False
+        return bool(removed)
+
+    def extend(self, app_id: int, delivery_id: int, lease_deadline: float) -> bool:
+        """Move the lease deadline of the delivery in progress.
+
+        Return `False` if the delivery was not dispatched by the scheduler.
+        """
+        try:
+            changed = self._client.zadd(
+                self._get_key(app_id, "in_progress"),
+                {delivery_id: lease_deadline},
+                xx=True,
+                ch=True,
+            )
+        except RedisError:
+            logger.warning(self.WARNING_MESSAGE, exc_info=True)
+            return False
+        return bool(changed)
+
+    def release(self, delivery_id: int) -> bool:
+        """Remove the delivery from deliveries in progress of its app.
+
+        Return `False` if the delivery was not dispatched by the scheduler.
+        """
+        try:
+            lease = self._client.hget(self._get_key(self.LEASES_KEY), delivery_id)
+        except RedisError:
+            logger.warning(self.WARNING_MESSAGE, exc_info=True)
+            return False
+        if lease is None:
+            return False
+        app_id, _ = str(lease, "utf-8").split("|", 1)
+        return self.finish(int(app_id), delivery_id)
+
+    def get_limit(self, app_id: int) -> float | None:
+        try:
+            limit = self._client.get(self._get_key(app_id, "limit"))
+        except RedisError:
+            logger.warning(self.WARNING_MESSAGE, exc_info=True)
+            return None
+        return float(limit) if limit is not None else None
+
+    def set_limit(self, app_id: int, limit: float):
+        try:
+            self._client.set(self._get_key(app_id, "limit"), limit)
+        except RedisError:
+            logger.warning(self.WARNING_MESSAGE, exc_info=True)
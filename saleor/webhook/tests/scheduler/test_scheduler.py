@@ -0,0 +1,284 @@
+import time
+from unittest.mock import MagicMock
+
+import fakeredis
+import pytest
+
+from ....app.models import App
+from ....core.models import EventDelivery
+from ....graphql.app.enums import CircuitBreakerState
+from ....webhook.models import Webhook
+from ...scheduler.limiter import AdaptiveConcurrencyLimit
+from ...scheduler.scheduler import DeliveryScheduler
+from ...scheduler.storage import RedisSchedulerStorage
+
+QUEUE = "webhooks"
+
+
+@pytest.fixture
+def scheduler_storage():
+    # deliveries are started by a Lua script, which fakeredis runs with lupa
+    pytest.importorskip("lupa")
+    server = fakeredis.FakeServer()
+    server.connected = True
+    return RedisSchedulerStorage(client=fakeredis.FakeRedis(server=server))
+
+
+def create_scheduler(storage, initial_limit=2, **kwargs):
+    limit = AdaptiveConcurrencyLimit(
+        min_limit=1,
+        max_limit=10,
+        initial_limit=initial_limit,
+        latency_threshold=1,
+    )
+    return DeliveryScheduler(
+        storage=storage, limit=limit, lease_seconds=60, batch_size=100, **kwargs
+    )
+
+
+def create_deliveries(identifier, count):
+    app = App.objects.create(name=identifier, identifier=identifier, is_active=True)
+    webhook = Webhook.objects.create(
+        name=identifier, app=app, target_url="https://example.com/"
+    )
+    deliveries = EventDelivery.objects.bulk_create(
+        [
+            EventDelivery(event_type="order_created", webhook=webhook)
+            for _ in range(count)
+        ]
+    )
+    return app, deliveries
+
+
+def test_adaptive_limit_grows_on_fast_responses_and_shrinks_on_failures():
+    # given
+    limit = AdaptiveConcurrencyLimit(
+        min_limit=1, max_limit=4, initial_limit=2, latency_threshold=1
+    )
+
+    # when
+    grown = limit.update(2.0, latency=0.1, failed=False)
+    shrunk_on_failure = limit.update(2.0, latency=0.1, failed=True)
+    shrunk_on_latency = limit.update(2.0, latency=5, failed=False)
+
+    # then
+    assert grown == 2.5
+    assert shrunk_on_failure == shrunk_on_latency == pytest.approx(1.8)
+    assert limit.update(4.0, latency=0.1, failed=False) == 4
+    assert limit.update(1.0, latency=0.1, failed=True) == 1
+
+
+def test_dispatch_respects_app_limit(scheduler_storage, db):
+    # given
+    scheduler = create_scheduler(scheduler_storage, initial_limit=2)
+    _, deliveries = create_deliveries("app", 5)
+    scheduler.enqueue((delivery, QUEUE) for delivery in deliveries)
+
+    # when
+    dispatched = scheduler.dispatch()
+    dispatched_again = scheduler.dispatch()
+
+    # then
+    assert dispatched == [(deliveries[0].pk, QUEUE), (deliveries[1].pk, QUEUE)]
+    assert dispatched_again == []
+    assert scheduler.has_queued_deliveries()
+
+
+def test_dispatch_shares_turns_between_apps(scheduler_storage, db):
+    # given
+    scheduler = create_scheduler(scheduler_storage, initial_limit=10)
+    scheduler.batch_size = 4
+    _, busy_app_deliveries = create_deliveries("busy", 10)
+    _, other_app_deliveries = create_deliveries("other", 2)
+    scheduler.enqueue((delivery, QUEUE) for delivery in busy_app_deliveries)
+    scheduler.enqueue((delivery, QUEUE) for delivery in other_app_deliveries)
+
+    # when
+    dispatched_ids = {delivery_id for delivery_id, _ in scheduler.dispatch()}
+
+    # then
+    assert {delivery.pk for delivery in other_app_deliveries} <= dispatched_ids
+    assert len(dispatched_ids) == 4
+
+
+def test_dispatch_uses_app_weights(scheduler_storage, db):
+    # given
+    scheduler = create_scheduler(scheduler_storage, initial_limit=10)
+    scheduler.batch_size = 4
+    heavy_app, heavy_app_deliveries = create_deliveries("heavy", 10)
+    _, light_app_deliveries = create_deliveries("light", 10)
+    scheduler.app_weights = {heavy_app.pk: 3}
+    scheduler.enqueue((delivery, QUEUE) for delivery in heavy_app_deliveries)
+    scheduler.enqueue((delivery, QUEUE) for delivery in light_app_deliveries)
+
+    # when
+    dispatched_ids = {delivery_id for delivery_id, _ in scheduler.dispatch()}
+
+    # then
+    heavy_app_ids = {delivery.pk for delivery in heavy_app_deliveries}
+    assert len(dispatched_ids & heavy_app_ids) == 3
+
+
+def test_complete_releases_place_and_adjusts_limit(scheduler_storage, db):
+    # given
+    scheduler = create_scheduler(scheduler_storage, initial_limit=1)
+    app, deliveries = create_deliveries("app", 2)
+    scheduler.enqueue((delivery, QUEUE) for delivery in deliveries)
+    [(delivery_id, _)] = scheduler.dispatch()
+
+    # when
+    scheduler.complete(app, delivery_id, latency=0.1, failed=False)
+
+    # then
+    assert scheduler.get_limit(app.pk) == 2
+    assert scheduler.dispatch() == [(deliveries[1].pk, QUEUE)]
+
+
+def test_dispatch_limit_is_shared_between_schedulers(scheduler_storage, db):
+    # given
+    scheduler = create_scheduler(scheduler_storage, initial_limit=2)
+    other_scheduler = create_scheduler(scheduler_storage, initial_limit=2)
+    _, deliveries = create_deliveries("app", 5)
+    scheduler.enqueue((delivery, QUEUE) for delivery in deliveries)
+
+    # when
+    dispatched = scheduler.dispatch() + other_scheduler.dispatch()
+
+    # then
+    assert dispatched == [(deliveries[0].pk, QUEUE), (deliveries[1].pk, QUEUE)]
+
+
+def test_start_queues_deliveries_with_expired_lease_again(scheduler_storage, db):
+    # given
+    app, deliveries = create_deliveries("app", 2)
+    scheduler_storage.enqueue(
+        app.pk, [(delivery.pk, QUEUE) for delivery in deliveries], now=1
+    )
+    [(lost_delivery_id, _)] = scheduler_storage.start(
+        app.pk, 1, limit=1, now=1, lease_deadline=10
+    )
+
+    # when
+    started_before_expiry = scheduler_storage.start(
+        app.pk, 2, limit=1, now=5, lease_deadline=15
+    )
+    started_after_expiry = scheduler_storage.start(
+        app.pk, 2, limit=2, now=11, lease_deadline=20
+    )
+
+    # then
+    assert started_before_expiry == []
+    assert started_after_expiry == [
+        (deliveries[1].pk, QUEUE),
+        (lost_delivery_id, QUEUE),
+    ]
+    assert scheduler_storage.get_queued_app_ids() == []
+
+
+def test_retry_keeps_place_within_app_limit(scheduler_storage, db):
+    # given
+    scheduler = create_scheduler(scheduler_storage, initial_limit=1)
+    app, deliveries = create_deliveries("app", 2)
+    scheduler.enqueue((delivery, QUEUE) for delivery in deliveries)
+    [(delivery_id, _)] = scheduler.dispatch()
+
+    # when
+    scheduler.retry(app, delivery_id, latency=0.1, retry_at=time.time() + 100)
+
+    # then
+    # the failing app's retry still takes its only place
+    assert scheduler.dispatch() == []
+    assert scheduler.get_limit(app.pk) == 1
+
+    # the place is released once the retried delivery completes
+    scheduler.complete(app, delivery_id, latency=0.1, failed=False)
+    assert scheduler.dispatch() == [(deliveries[1].pk, QUEUE)]
+
+
+def test_extended_lease_is_not_queued_again_before_deadline(scheduler_storage, db):
+    # given
+    app, [delivery] = create_deliveries("app", 1)
+    scheduler_storage.enqueue(app.pk, [(delivery.pk, QUEUE)], now=1)
+    scheduler_storage.start(app.pk, 1, limit=1, now=1, lease_deadline=10)
+
+    # when
+    extended = scheduler_storage.extend(app.pk, delivery.pk, lease_deadline=50)
+
+    # then
+    assert extended is True
+    assert scheduler_storage.start(app.pk, 1, limit=2, now=20, lease_deadline=30) == []
+    assert scheduler_storage.get_queued_app_ids() == []
+
+
+def test_retry_ignores_deliveries_not_dispatched_by_scheduler(scheduler_storage, db):
+    # given
+    scheduler = create_scheduler(scheduler_storage, initial_limit=2)
+    app, [delivery] = create_deliveries("app", 1)
+
+    # when
+    scheduler.retry(app, delivery.pk, latency=10, retry_at=time.time())
+
+    # then
+    assert scheduler_storage.get_limit(app.pk) is None
+
+
+def test_release_frees_place_without_adjusting_limit(scheduler_storage, db):
+    # given
+    scheduler = create_scheduler(scheduler_storage, initial_limit=1)
+    app, deliveries = create_deliveries("app", 2)
+    scheduler.enqueue((delivery, QUEUE) for delivery in deliveries)
+    [(delivery_id, _)] = scheduler.dispatch()
+
+    # when
+    released = scheduler.release(delivery_id)
+
+    # then
+    assert released is True
+    assert scheduler.release(delivery_id) is False
+    assert scheduler_storage.get_limit(app.pk) is None
+    assert scheduler.dispatch() == [(deliveries[1].pk, QUEUE)]
+
+
+def test_complete_ignores_deliveries_not_dispatched_by_scheduler(scheduler_storage, db):
+    # given
+    scheduler = create_scheduler(scheduler_storage, initial_limit=2)
+    app, [delivery] = create_deliveries("app", 1)
+
+    # when
+    scheduler.complete(app, delivery.pk, latency=10, failed=True)
+
+    # then
+    assert scheduler_storage.get_limit(app.pk) is None
+
+
+def test_saturated_app_failures_are_registered_in_breaker_board(scheduler_storage, db):
+    # given
+    breaker_board = MagicMock()
+    scheduler = create_scheduler(
+        scheduler_storage, initial_limit=1, breaker_board=breaker_board
+    )
+    app, deliveries = create_deliveries("app", 1)
+    scheduler.enqueue((delivery, QUEUE) for delivery in deliveries)
+    [(delivery_id, _)] = scheduler.dispatch()
+
+    # when
+    scheduler.complete(app, delivery_id, latency=10, failed=True)
+
+    # then
+    breaker_board.register_error.assert_called_once_with(app.pk)
+
+
+def test_dispatch_skips_app_with_open_breaker(scheduler_storage, db):
+    # given
+    breaker_board = MagicMock()
+    breaker_board.update_breaker_state.return_value = CircuitBreakerState.OPEN
+    scheduler = create_scheduler(scheduler_storage, breaker_board=breaker_board)
+    _, deliveries = create_deliveries("app", 1)
+    scheduler.enqueue((delivery, QUEUE) for delivery in deliveries)
+
+    # when
+    dispatched = scheduler.dispatch()
+
+    # then
+    assert dispatched == []
+    assert scheduler.has_queued_deliveries()
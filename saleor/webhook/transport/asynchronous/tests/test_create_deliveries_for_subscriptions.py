@@ -2,7 +2,9 @@ import json
 from unittest import mock
 
 import graphene
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from .....graphql.webhook.subscription_payload import generate_payload_from_subscription
 from .....webhook.event_types import WebhookEventAsyncType
@@ -210,3 +212,55 @@ def test_create_deliveries_for_multiple_subscription_objects_when_more_objs_than
                 "id": graphene.Node.to_global_id("Product", product_list[index].pk)
             }
         }
+
+
+PRODUCT_UPDATED_WITH_PRODUCT_TYPE_QUERY = """
+    subscription {
+        event {
+            ... on ProductUpdated {
+                product {
+                    id
+                    productType {
+                        name
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def _count_queries_of_multiple_objects_deliveries(webhook, product_list):
+    with CaptureQueriesContext(connection) as queries:
+        deliveries = create_deliveries_for_multiple_subscription_objects(
+            WebhookEventAsyncType.PRODUCT_UPDATED, product_list, [webhook]
+        )
+    return deliveries, len(queries)
+
+
+def test_create_deliveries_for_multiple_subscription_objects_batched(
+    webhook_app, product_list, settings
+):
+    # given
+    webhook = Webhook.objects.create(
+        name="Webhook",
+        app=webhook_app,
+        subscription_query=PRODUCT_UPDATED_WITH_PRODUCT_TYPE_QUERY,
+    )
+    webhook.events.create(event_type=WebhookEventAsyncType.PRODUCT_UPDATED)
+    settings.WEBHOOK_BATCHED_PAYLOAD_GENERATION_ENABLED = False
+    per_object_deliveries, per_object_queries = (
+        _count_queries_of_multiple_objects_deliveries(webhook, product_list)
+    )
+
+    # when
+    settings.WEBHOOK_BATCHED_PAYLOAD_GENERATION_ENABLED = True
+    deliveries, queries = _count_queries_of_multiple_objects_deliveries(
+        webhook, product_list
+    )
+
+    # then
+    assert [delivery.payload.get_payload() for delivery in deliveries] == [
+        delivery.payload.get_payload() for delivery in per_object_deliveries
+    ]
+    assert queries < per_object_queries
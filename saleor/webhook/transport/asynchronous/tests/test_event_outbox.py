@@ -0,0 +1,221 @@
+import json
+from unittest import mock
+
+from django.test import override_settings
+
+from .....core.models import EventDelivery, EventOutbox
+from ....event_types import WebhookEventAsyncType
+from ..transport import relay_event_outbox_task, trigger_webhooks_async
+
+
+@override_settings(WEBHOOK_EVENT_OUTBOX_ENABLED=True)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.relay_event_outbox_task.delay"
+)
+def test_trigger_webhooks_async_creates_outbox_record(
+    mocked_relay_event_outbox_task,
+    product,
+    subscription_product_updated_webhook,
+    staff_user,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    webhook = subscription_product_updated_webhook
+    event_type = WebhookEventAsyncType.PRODUCT_UPDATED
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        trigger_webhooks_async(
+            None,
+            event_type,
+            [webhook],
+            subscribable_object=product,
+            requestor=staff_user,
+        )
+
+    # then
+    record = EventOutbox.objects.get()
+    assert record.event_type == event_type
+    assert record.model_name == "product.product"
+    assert record.object_id == str(product.pk)
+    assert record.requestor_model_name == "account.user"
+    assert record.requestor_object_id == str(staff_user.pk)
+    assert record.webhook_ids == [webhook.pk]
+    assert not EventDelivery.objects.exists()
+    mocked_relay_event_outbox_task.assert_called_once_with()
+
+
+@override_settings(WEBHOOK_EVENT_OUTBOX_ENABLED=True)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.apply_async"
+)
+def test_trigger_webhooks_async_deleted_object_skips_outbox(
+    mocked_send_webhook_request_async,
+    product,
+    subscription_product_deleted_webhook,
+):
+    # given
+    webhook = subscription_product_deleted_webhook
+    event_type = WebhookEventAsyncType.PRODUCT_DELETED
+    product_id = product.pk
+    product.delete()
+    product.pk = product_id
+
+    # when
+    trigger_webhooks_async(
+        None,
+        event_type,
+        [webhook],
+        subscribable_object=product,
+    )
+
+    # then
+    assert not EventOutbox.objects.exists()
+    delivery = EventDelivery.objects.get(webhook=webhook)
+    assert json.loads(delivery.payload.get_payload())["product"]
+    mocked_send_webhook_request_async.assert_called_once()
+
+
+@override_settings(WEBHOOK_EVENT_OUTBOX_ENABLED=True)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.apply_async"
+)
+def test_trigger_webhooks_async_non_model_object_skips_outbox(
+    mocked_send_webhook_request_async,
+    customer_user,
+    channel_USD,
+    subscription_account_delete_requested_webhook,
+):
+    # given
+    webhook = subscription_account_delete_requested_webhook
+    event_type = WebhookEventAsyncType.ACCOUNT_DELETE_REQUESTED
+    data = {
+        "user": customer_user,
+        "channel_slug": channel_USD.slug,
+        "token": "token",
+        "redirect_url": "http://www.example.com/",
+    }
+
+    # when
+    trigger_webhooks_async(
+        None,
+        event_type,
+        [webhook],
+        subscribable_object=data,
+    )
+
+    # then
+    assert not EventOutbox.objects.exists()
+    assert EventDelivery.objects.filter(webhook=webhook).exists()
+    mocked_send_webhook_request_async.assert_called_once()
+
+
+@override_settings(WEBHOOK_EVENT_OUTBOX_ENABLED=True)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.apply_async"
+)
+def test_relay_event_outbox_task(
+    mocked_send_webhook_request_async,
+    product_list,
+    subscription_product_updated_webhook,
+):
+    # given
+    webhook = subscription_product_updated_webhook
+    event_type = WebhookEventAsyncType.PRODUCT_UPDATED
+    EventOutbox.objects.bulk_create(
+        [
+            EventOutbox(
+                event_type=event_type,
+                model_name="product.product",
+                object_id=str(product.pk),
+                webhook_ids=[webhook.pk],
+            )
+            for product in product_list
+        ]
+    )
+
+    # when
+    relay_event_outbox_task()
+
+    # then
+    assert not EventOutbox.objects.exists()
+    deliveries = EventDelivery.objects.filter(webhook=webhook)
+    assert deliveries.count() == len(product_list)
+    payload = json.loads(deliveries.first().payload.get_payload())
+    assert payload["product"]
+    assert mocked_send_webhook_request_async.call_count == len(product_list)
+
+
+@override_settings(WEBHOOK_EVENT_OUTBOX_ENABLED=True)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.apply_async"
+)
+def test_relay_event_outbox_task_inactive_webhook(
+    mocked_send_webhook_request_async,
+    product,
+    subscription_product_updated_webhook,
+):
+    # given
+    webhook = subscription_product_updated_webhook
+    webhook.is_active = False
+    webhook.save(update_fields=["is_active"])
+    EventOutbox.objects.create(
+        event_type=WebhookEventAsyncType.PRODUCT_UPDATED,
+        model_name="product.product",
+        object_id=str(product.pk),
+        webhook_ids=[webhook.pk],
+    )
+
+    # when
+    relay_event_outbox_task()
+
+    # then
+    assert not EventOutbox.objects.exists()
+    assert not EventDelivery.objects.exists()
+    mocked_send_webhook_request_async.assert_not_called()
+
+
+@override_settings(
+    WEBHOOK_EVENT_OUTBOX_ENABLED=True, WEBHOOK_EVENT_OUTBOX_MAX_ATTEMPTS=2
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.apply_async"
+)
+def test_relay_event_outbox_task_failing_group_doesnt_block_others(
+    mocked_send_webhook_request_async,
+    product,
+    subscription_product_updated_webhook,
+):
+    # given
+    webhook = subscription_product_updated_webhook
+    event_type = WebhookEventAsyncType.PRODUCT_UPDATED
+    failing_record = EventOutbox.objects.create(
+        event_type=event_type,
+        model_name="product.unknownmodel",
+        object_id=str(product.pk),
+        webhook_ids=[webhook.pk],
+    )
+    EventOutbox.objects.create(
+        event_type=event_type,
+        model_name="product.product",
+        object_id=str(product.pk),
+        webhook_ids=[webhook.pk],
+    )
+
+    # when
+    relay_event_outbox_task()
+
+    # then
+    assert list(EventOutbox.objects.all()) == [failing_record]
+    failing_record.refresh_from_db()
+    assert failing_record.attempts == 1
+    assert EventDelivery.objects.filter(webhook=webhook).count() == 1
+    mocked_send_webhook_request_async.assert_called_once()
+
+    # when
+    relay_event_outbox_task()
+    relay_event_outbox_task()
+
+    # then
+    failing_record.refresh_from_db()
+    assert failing_record.attempts == 2
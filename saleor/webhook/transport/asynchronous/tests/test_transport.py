@@ -1,7 +1,8 @@
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import pytest
 from celery.exceptions import Retry as CeleryTaskRetryError
+from django.core.cache import cache
 from opentelemetry.trace import StatusCode
 
 from .....tests.utils import get_metric_data_point, get_span_by_name
@@ -10,7 +11,11 @@ from ...metrics import (
     METRIC_EXTERNAL_REQUEST_COUNT,
     METRIC_EXTERNAL_REQUEST_DURATION,
 )
-from ..transport import send_webhook_request_async
+from ..transport import (
+    WEBHOOK_DELIVERIES_DISPATCH_PENDING_KEY,
+    schedule_webhook_deliveries_dispatch,
+    send_webhook_request_async,
+)
 
 
 @patch(
@@ -178,3 +183,77 @@ def test_send_webhook_request_async_record_external_request_with_unknown_webhook
     assert external_request_content_length.attributes == attributes
     assert external_request_content_length.count == 1
     assert external_request_content_length.sum == payload_size
+
+
+@patch("saleor.webhook.transport.asynchronous.transport.delivery_scheduler")
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhook_request_async_keeps_scheduled_delivery_place_on_retry(
+    mock_send_webhook_using_scheme_method,
+    mocked_delivery_scheduler,
+    event_delivery,
+    webhook_response_failed,
+):
+    # given
+    mock_send_webhook_using_scheme_method.return_value = webhook_response_failed
+
+    # when
+    with pytest.raises(CeleryTaskRetryError):
+        send_webhook_request_async(
+            event_delivery_id=event_delivery.id, telemetry_context={}
+        )
+
+    # then
+    mocked_delivery_scheduler.retry.assert_called_once_with(
+        event_delivery.webhook.app,
+        event_delivery.pk,
+        latency=webhook_response_failed.duration,
+        retry_at=ANY,
+    )
+    mocked_delivery_scheduler.complete.assert_not_called()
+
+
+@patch("saleor.webhook.transport.asynchronous.transport.delivery_scheduler")
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhook_request_async_completes_scheduled_delivery_on_success(
+    mock_send_webhook_using_scheme_method,
+    mocked_delivery_scheduler,
+    event_delivery,
+    webhook_response,
+):
+    # given
+    mock_send_webhook_using_scheme_method.return_value = webhook_response
+    mocked_delivery_scheduler.has_queued_deliveries.return_value = False
+
+    # when
+    send_webhook_request_async(
+        event_delivery_id=event_delivery.id, telemetry_context={}
+    )
+
+    # then
+    mocked_delivery_scheduler.complete.assert_called_once_with(
+        event_delivery.webhook.app,
+        event_delivery.pk,
+        latency=webhook_response.duration,
+        failed=False,
+    )
+    mocked_delivery_scheduler.retry.assert_not_called()
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.dispatch_webhook_deliveries_task.delay"
+)
+def test_schedule_webhook_deliveries_dispatch_is_debounced(mocked_delay):
+    # given
+    cache.delete(WEBHOOK_DELIVERIES_DISPATCH_PENDING_KEY)
+
+    # when
+    schedule_webhook_deliveries_dispatch()
+    schedule_webhook_deliveries_dispatch()
+
+    # then
+    mocked_delay.assert_called_once_with()
+    cache.delete(WEBHOOK_DELIVERIES_DISPATCH_PENDING_KEY)
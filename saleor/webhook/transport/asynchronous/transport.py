@@ -1,23 +1,27 @@
 import datetime
-import json
 import logging
+import time
 from collections import defaultdict
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterator, Sequence
 from dataclasses import asdict, dataclass
-from typing import TYPE_CHECKING, Any
+from typing import Any
 from urllib.parse import urlparse
 
 from celery import group
+from celery.exceptions import Retry
 from celery.utils.log import get_task_logger
 from django.apps import apps
 from django.conf import settings
-from django.db import transaction
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import F
 from opentelemetry.trace import StatusCode
+from promise import Promise
 
 from ....celeryconf import app
 from ....core import EventDeliveryStatus
 from ....core.db.connection import allow_writer
-from ....core.models import EventDelivery, EventPayload
+from ....core.models import EventDelivery, EventOutbox, EventPayload
 from ....core.telemetry import (
     TelemetryTaskContext,
     get_task_context,
@@ -25,7 +29,9 @@ from ....core.telemetry import (
 )
 from ....core.tracing import webhooks_otel_trace
 from ....core.utils import get_domain
+from ....core.utils.json_serializer import json_dumps
 from ....core.utils.url import sanitize_url_for_logging
+from ....graphql.core import SaleorContext
 from ....graphql.core.dataloaders import DataLoader
 from ....graphql.webhook.subscription_payload import (
     generate_payload_from_subscription,
@@ -40,7 +46,9 @@ from ...metrics import (
     record_async_webhooks_count,
     record_first_delivery_attempt_delay,
 )
+from ...models import Webhook
 from ...observability import WebhookData
+from ...scheduler.scheduler import DeliveryScheduler, initialize_delivery_scheduler
 from ..metrics import (
     record_external_request,
 )
@@ -64,17 +72,21 @@ from ..utils import (
     send_webhook_using_scheme_method,
 )
 
-if TYPE_CHECKING:
-    from ....webhook.models import Webhook
-
-
 logger = logging.getLogger(__name__)
 task_logger = get_task_logger(f"{__name__}.celery")
 
+delivery_scheduler = initialize_delivery_scheduler()
+
 OBSERVABILITY_QUEUE_NAME = "observability"
 MAX_WEBHOOK_EVENTS_IN_DB_BULK = 100
 
 MAX_WEBHOOK_RETRIES = 5
+
+# Set while a dispatch pass of the delivery scheduler waits to start, so deliveries
+# queued or finished at the same time schedule a single pass. The timeout only
+# matters when the task is lost; the beat dispatches the deliveries then.
+WEBHOOK_DELIVERIES_DISPATCH_PENDING_KEY = "webhook_deliveries_dispatch_pending"
+WEBHOOK_DELIVERIES_DISPATCH_PENDING_TIMEOUT = 30
 WEBHOOK_ASYNC_BATCH_SIZE = 100
 
 
@@ -85,6 +97,67 @@ class WebhookPayloadData:
     data: str | None = None  # deprecated, legacy_data_generator should be used instead
 
 
+def _generate_payloads_per_object(
+    event_type: str,
+    subscribable_objects,
+    webhooks,
+    get_request: Callable[[dict[str, type[DataLoader]]], SaleorContext],
+) -> Iterator[tuple[Webhook, Any, dict[str, Any] | None]]:
+    for subscribable_object in subscribable_objects:
+        # Dataloaders are shared between calls to generate_payload_from_subscription to
+        # reuse their cache. This avoids unnecessary DB queries when different webhooks
+        # need to resolve the same data.
+        request = get_request({})
+        for webhook in webhooks:
+            data = generate_payload_from_subscription(
+                event_type=event_type,
+                subscribable_object=subscribable_object,
+                subscription_query=webhook.subscription_query,
+                request=request,
+                app=webhook.app,
+            )
+            yield webhook, subscribable_object, data
+
+
+def _generate_payloads_for_all_objects(
+    event_type: str,
+    subscribable_objects,
+    webhooks,
+    request: SaleorContext,
+) -> Iterator[tuple[Webhook, Any, dict[str, Any] | None]]:
+    """Generate payloads of all objects at once, webhook by webhook.
+
+    All objects share the request and its dataloaders, and payloads of all objects
+    are resolved together, so each dataloader receives keys of all objects in one
+    batch. The request is bound to the webhook's app while its payloads are
+    resolved, so permissions are checked against the right app.
+    """
+    subscribable_objects = list(subscribable_objects)
+    for webhook in webhooks:
+
+        def generate_payloads(_, webhook=webhook):
+            return Promise.all(
+                [
+                    generate_payload_promise_from_subscription(
+                        event_type=event_type,
+                        subscribable_object=subscribable_object,
+                        subscription_query=webhook.subscription_query,
+                        request=request,
+                        app=webhook.app,
+                    )
+                    for subscribable_object in subscribable_objects
+                ]
+            )
+
+        # Executing the queries inside a promise callback defers dataloaders'
+        # batches until all objects requested their keys.
+        payloads = Promise.resolve(None).then(generate_payloads).get()
+        for subscribable_object, data in zip(
+            subscribable_objects, payloads, strict=True
+        ):
+            yield webhook, subscribable_object, data
+
+
 def create_deliveries_for_multiple_subscription_objects(
     event_type,
     subscribable_objects,
@@ -120,13 +193,8 @@ def create_deliveries_for_multiple_subscription_objects(
     event_deliveries = []
     event_deliveries_for_bulk_update = []
 
-    for subscribable_object in subscribable_objects:
-        # Dataloaders are shared between calls to generate_payload_from_subscription to
-        # reuse their cache. This avoids unnecessary DB queries when different webhooks
-        # need to resolve the same data.
-        dataloaders: dict[str, type[DataLoader]] = {}
-
-        request = initialize_request(
+    def get_request(dataloaders: dict[str, type[DataLoader]]) -> SaleorContext:
+        return initialize_request(
             requestor,
             event_type in WebhookEventSyncType.ALL,
             event_type=event_type,
@@ -135,64 +203,65 @@ def create_deliveries_for_multiple_subscription_objects(
             dataloaders=dataloaders,
         )
 
-        for webhook in webhooks:
-            data = generate_payload_from_subscription(
-                event_type=event_type,
-                subscribable_object=subscribable_object,
-                subscription_query=webhook.subscription_query,
-                request=request,
-                app=webhook.app,
+    if settings.WEBHOOK_BATCHED_PAYLOAD_GENERATION_ENABLED:
+        payloads = _generate_payloads_for_all_objects(
+            event_type, subscribable_objects, webhooks, get_request({})
+        )
+    else:
+        payloads = _generate_payloads_per_object(
+            event_type, subscribable_objects, webhooks, get_request
+        )
+
+    for webhook, subscribable_object, data in payloads:
+        if not data:
+            logger.info(
+                "No payload was generated with subscription for event: %s",
+                event_type,
             )
+            continue
 
-            if not data:
+        if (
+            settings.ENABLE_LIMITING_WEBHOOKS_FOR_IDENTICAL_PAYLOADS
+            and pre_save_payloads
+        ):
+            key = get_pre_save_payload_key(webhook, subscribable_object)
+            pre_save_payload = pre_save_payloads.get(key)
+            if pre_save_payload and pre_save_payload == data:
                 logger.info(
-                    "No payload was generated with subscription for event: %s",
+                    "[Webhook ID:%r] No data changes for event %r, skip delivery to %r",
+                    webhook.id,
                     event_type,
+                    sanitize_url_for_logging(webhook.target_url),
                 )
                 continue
 
-            if (
-                settings.ENABLE_LIMITING_WEBHOOKS_FOR_IDENTICAL_PAYLOADS
-                and pre_save_payloads
-            ):
-                key = get_pre_save_payload_key(webhook, subscribable_object)
-                pre_save_payload = pre_save_payloads.get(key)
-                if pre_save_payload and pre_save_payload == data:
-                    logger.info(
-                        "[Webhook ID:%r] No data changes for event %r, skip delivery to %r",
-                        webhook.id,
-                        event_type,
-                        sanitize_url_for_logging(webhook.target_url),
-                    )
-                    continue
+        payload_data = json_dumps({**data})
+        event_payloads_data.append(payload_data)
+        event_payload = EventPayload()
+        event_payloads.append(event_payload)
+        event_delivery = EventDelivery(
+            status=EventDeliveryStatus.PENDING,
+            event_type=event_type,
+            payload=event_payload,
+            webhook=webhook,
+        )
+        event_deliveries_for_bulk_update.append(event_delivery)
 
-            payload_data = json.dumps({**data})
-            event_payloads_data.append(payload_data)
-            event_payload = EventPayload()
-            event_payloads.append(event_payload)
-            event_delivery = EventDelivery(
-                status=EventDeliveryStatus.PENDING,
-                event_type=event_type,
-                payload=event_payload,
-                webhook=webhook,
-            )
-            event_deliveries_for_bulk_update.append(event_delivery)
-
-            if len(event_deliveries_for_bulk_update) > MAX_WEBHOOK_EVENTS_IN_DB_BULK:
-                with allow_writer():
-                    # Use transaction to ensure EventPayload and EventDelivery are created together, preventing inconsistent DB state.
-                    with transaction.atomic():
-                        EventPayload.objects.bulk_create_with_payload_files(
-                            event_payloads, event_payloads_data
-                        )
-                        event_deliveries.extend(
-                            EventDelivery.objects.bulk_create(
-                                event_deliveries_for_bulk_update
-                            )
+        if len(event_deliveries_for_bulk_update) > MAX_WEBHOOK_EVENTS_IN_DB_BULK:
+            with allow_writer():
+                # Use transaction to ensure EventPayload and EventDelivery are created together, preventing inconsistent DB state.
+                with transaction.atomic():
+                    EventPayload.objects.bulk_create_with_payload_files(
+                        event_payloads, event_payloads_data
+                    )
+                    event_deliveries.extend(
+                        EventDelivery.objects.bulk_create(
+                            event_deliveries_for_bulk_update
                         )
-                event_payloads = []
-                event_payloads_data = []
-                event_deliveries_for_bulk_update = []
+                    )
+            event_payloads = []
+            event_payloads_data = []
+            event_deliveries_for_bulk_update = []
 
     with allow_writer():
         # Use transaction to ensure EventPayload and EventDelivery are created together, preventing inconsistent DB state.
@@ -315,6 +384,106 @@ def get_queue_name_for_webhook(webhook, default_queue):
     )
 
 
+def get_outbox_subscribable_objects(subscribable_objects) -> list:
+    """Return the subscribable objects that can be relayed through the outbox.
+
+    The relay reloads the objects by their primary keys, so only model instances
+    stored in the database are returned. Payloads for other objects, e.g. deleted
+    instances or plain data objects, have to be generated in place.
+    """
+    pks_per_model: dict[type[models.Model], set] = defaultdict(set)
+    for subscribable_object in subscribable_objects:
+        if (
+            isinstance(subscribable_object, models.Model)
+            and subscribable_object.pk is not None
+        ):
+            pks_per_model[type(subscribable_object)].add(subscribable_object.pk)
+
+    persisted_pks: dict[type[models.Model], set] = {}
+    with allow_writer():
+        for model, pks in pks_per_model.items():
+            persisted_pks[model] = set(
+                model.objects.filter(pk__in=pks).values_list("pk", flat=True)
+            )
+    return [
+        subscribable_object
+        for subscribable_object in subscribable_objects
+        if isinstance(subscribable_object, models.Model)
+        and subscribable_object.pk in persisted_pks.get(type(subscribable_object), ())
+    ]
+
+
+def create_event_outbox_records(
+    event_type: str,
+    subscribable_objects,
+    webhooks: Sequence["Webhook"],
+    requestor=None,
+    request_time: datetime.datetime | None = None,
+    queue: str | None = None,
+) -> list[EventOutbox]:
+    """Store intents of triggering subscription webhooks for given objects.
+
+    Records are created in the current transaction and the relay task is scheduled
+    once the transaction is committed.
+    """
+    webhook_ids = [webhook.pk for webhook in webhooks]
+    records = []
+    for subscribable_object in subscribable_objects:
+        data = prepare_deferred_payload_data(
+            subscribable_object=subscribable_object,
+            requestor=requestor,
+            request_time=request_time,
+        )
+        records.append(
+            EventOutbox(
+                event_type=event_type,
+                model_name=data.model_name,
+                object_id=str(data.object_id),
+                requestor_model_name=data.requestor_model_name,
+                requestor_object_id=(
+                    str(data.requestor_object_id)
+                    if data.requestor_object_id is not None
+                    else None
+                ),
+                request_time=data.request_time,
+                webhook_ids=webhook_ids,
+                queue=queue,
+            )
+        )
+    with allow_writer():
+        records = EventOutbox.objects.bulk_create(records)
+    transaction.on_commit(relay_event_outbox_task.delay)
+    return records
+
+
+def send_webhook_requests_for_deliveries(
+    deliveries: Sequence[EventDelivery], queue: str | None = None
+):
+    if delivery_scheduler:
+        default_queue = queue or settings.WEBHOOK_CELERY_QUEUE_NAME
+        deliveries = delivery_scheduler.enqueue(
+            (delivery, get_queue_name_for_webhook(delivery.webhook, default_queue))
+            for delivery in deliveries
+        )
+        schedule_webhook_deliveries_dispatch()
+    for delivery in deliveries:
+        # TODO: switch to new `send_webhooks_async_for_app` task when we have
+        # deduplication mechanism in place.
+        send_webhook_request_async.apply_async(
+            kwargs={
+                "event_delivery_id": delivery.pk,
+                "telemetry_context": get_task_context().to_dict(),
+            },
+            queue=get_queue_name_for_webhook(
+                delivery.webhook,
+                default_queue=queue or settings.WEBHOOK_CELERY_QUEUE_NAME,
+            ),
+            bind=True,
+            retry_backoff=10,
+            retry_kwargs={"max_retries": 5},
+        )
+
+
 def trigger_webhooks_async_for_multiple_objects(
     event_type,
     webhooks,
@@ -335,7 +504,38 @@ def trigger_webhooks_async_for_multiple_objects(
     :param allow_replica: use a replica database.
     :param queue: defines the queue to which the event should be sent.
     """
-    if transaction.get_connection().in_atomic_block:
+    legacy_webhooks, subscription_webhooks = group_webhooks_by_subscription(webhooks)
+    subscribable_objects = [
+        webhook_payload_data.subscribable_object
+        for webhook_payload_data in webhook_payloads_data
+    ]
+
+    # Payloads of subscription webhooks for stored objects are generated by
+    # the outbox relay. Events that compare pre-save payloads need the state from
+    # the request, so they are still processed in place, like the objects that can't
+    # be reloaded by the relay.
+    use_outbox = settings.WEBHOOK_EVENT_OUTBOX_ENABLED and not pre_save_payloads
+    if use_outbox and subscription_webhooks:
+        outbox_objects = get_outbox_subscribable_objects(subscribable_objects)
+        if outbox_objects:
+            create_event_outbox_records(
+                event_type=event_type,
+                subscribable_objects=outbox_objects,
+                webhooks=subscription_webhooks,
+                requestor=requestor,
+                request_time=request_time,
+                queue=queue,
+            )
+            outbox_object_ids = {id(obj) for obj in outbox_objects}
+            subscribable_objects = [
+                obj for obj in subscribable_objects if id(obj) not in outbox_object_ids
+            ]
+        if not subscribable_objects:
+            subscription_webhooks = []
+
+    if (legacy_webhooks or subscription_webhooks) and (
+        transaction.get_connection().in_atomic_block
+    ):
         # Async webhooks should be delivered after the transaction is committed.
         # Otherwise the delivery task may not be able to fetch all the required data and
         # the delivery may fail.
@@ -343,8 +543,6 @@ def trigger_webhooks_async_for_multiple_objects(
             "Async webhook was triggered inside a transaction: %s", event_type
         )
 
-    legacy_webhooks, subscription_webhooks = group_webhooks_by_subscription(webhooks)
-
     is_deferred_payload = WebhookEventAsyncType.EVENT_MAP.get(event_type, {}).get(
         "is_deferred_payload", False
     )
@@ -382,10 +580,6 @@ def trigger_webhooks_async_for_multiple_objects(
                     )
 
     if subscription_webhooks:
-        subscribable_objects = [
-            webhook_payload_data.subscribable_object
-            for webhook_payload_data in webhook_payloads_data
-        ]
         if is_deferred_payload:
             deferred_deliveries_per_object = (
                 create_deliveries_for_deferred_payload_subscriptions(
@@ -432,22 +626,7 @@ def trigger_webhooks_async_for_multiple_objects(
             },
             bind=True,
         )
-    for delivery in deliveries:
-        # TODO: switch to new `send_webhooks_async_for_app` task when we have
-        # deduplication mechanism in place.
-        send_webhook_request_async.apply_async(
-            kwargs={
-                "event_delivery_id": delivery.pk,
-                "telemetry_context": get_task_context().to_dict(),
-            },
-            queue=get_queue_name_for_webhook(
-                delivery.webhook,
-                default_queue=queue or settings.WEBHOOK_CELERY_QUEUE_NAME,
-            ),
-            bind=True,
-            retry_backoff=10,
-            retry_kwargs={"max_retries": 5},
-        )
+    send_webhook_requests_for_deliveries(deliveries, queue)
 
 
 def trigger_webhooks_async(
@@ -493,6 +672,142 @@ def trigger_webhooks_async(
     )
 
 
+def _get_outbox_records_group_key(record: EventOutbox):
+    return (
+        record.event_type,
+        record.model_name,
+        record.requestor_model_name,
+        record.requestor_object_id,
+        record.request_time,
+        record.queue,
+        tuple(record.webhook_ids),
+    )
+
+
+def _get_outbox_requestor(requestor_model_name, requestor_object_id):
+    if requestor_object_id and requestor_model_name in (
+        RequestorModelName.APP,
+        RequestorModelName.USER,
+    ):
+        model = apps.get_model(requestor_model_name)
+        return model.objects.filter(pk=requestor_object_id).first()
+    return None
+
+
+@app.task
+@allow_writer()
+def relay_event_outbox_task():
+    """Generate payloads and deliveries for the stored outbox records.
+
+    Records are claimed with `SKIP LOCKED`, so multiple relay tasks can run in
+    parallel. Records sharing the event type, requestor and webhooks are processed
+    together: the subscribable objects are fetched with a single query and
+    the payloads are generated with shared dataloaders. Each group is processed in
+    its own savepoint, so a failing group doesn't block the others; its records
+    are kept with an increased number of attempts until they reach
+    `WEBHOOK_EVENT_OUTBOX_MAX_ATTEMPTS`.
+    """
+    batch_size = settings.WEBHOOK_EVENT_OUTBOX_BATCH_SIZE
+    deliveries_per_queue: dict[str | None, list[EventDelivery]] = defaultdict(list)
+    with transaction.atomic():
+        records = list(
+            EventOutbox.objects.select_for_update(skip_locked=True)
+            .filter(attempts__lt=settings.WEBHOOK_EVENT_OUTBOX_MAX_ATTEMPTS)
+            .order_by("pk")[:batch_size]
+        )
+        if not records:
+            return
+
+        webhook_ids = {pk for record in records for pk in record.webhook_ids}
+        webhooks = Webhook.objects.filter(
+            pk__in=webhook_ids, is_active=True, app__is_active=True
+        ).select_related("app")
+        webhooks_map = {webhook.pk: webhook for webhook in webhooks}
+
+        records_groups: dict[tuple, list[EventOutbox]] = defaultdict(list)
+        for record in records:
+            records_groups[_get_outbox_records_group_key(record)].append(record)
+
+        failed_record_ids: set[int] = set()
+        for group_key, group_records in records_groups.items():
+            try:
+                with transaction.atomic():
+                    deliveries = _relay_event_outbox_records_group(
+                        group_key, group_records, webhooks_map
+                    )
+            except Exception:
+                record_ids = [record.pk for record in group_records]
+                logger.exception(
+                    "Relaying event outbox records %s failed.",
+                    record_ids,
+                    extra={"event_type": group_key[0]},
+                )
+                failed_record_ids.update(record_ids)
+                continue
+            queue = group_key[5]
+            deliveries_per_queue[queue].extend(deliveries)
+
+        EventOutbox.objects.filter(
+            pk__in=[
+                record.pk for record in records if record.pk not in failed_record_ids
+            ]
+        ).delete()
+        EventOutbox.objects.filter(pk__in=failed_record_ids).update(
+            attempts=F("attempts") + 1
+        )
+
+    for queue, deliveries in deliveries_per_queue.items():
+        send_webhook_requests_for_deliveries(deliveries, queue)
+
+    if len(records) == batch_size:
+        relay_event_outbox_task.delay()
+
+
+def _relay_event_outbox_records_group(
+    group_key: tuple,
+    group_records: list[EventOutbox],
+    webhooks_map: dict[int, Webhook],
+) -> list[EventDelivery]:
+    (
+        event_type,
+        model_name,
+        requestor_model_name,
+        requestor_object_id,
+        request_time,
+        _queue,
+        group_webhook_ids,
+    ) = group_key
+    group_webhooks = [
+        webhooks_map[pk] for pk in group_webhook_ids if pk in webhooks_map
+    ]
+    if not group_webhooks:
+        return []
+
+    model = apps.get_model(model_name)
+    objects_map = {
+        str(obj.pk): obj
+        for obj in model.objects.filter(
+            pk__in=[record.object_id for record in group_records]
+        )
+    }
+    # Keep the order in which events were triggered.
+    subscribable_objects = [
+        objects_map[record.object_id]
+        for record in group_records
+        if record.object_id in objects_map
+    ]
+    if not subscribable_objects:
+        return []
+
+    return create_deliveries_for_multiple_subscription_objects(
+        event_type=event_type,
+        subscribable_objects=subscribable_objects,
+        webhooks=group_webhooks,
+        requestor=_get_outbox_requestor(requestor_model_name, requestor_object_id),
+        request_time=request_time,
+    )
+
+
 @app.task(bind=True)
 @allow_writer()
 @task_with_telemetry_context
@@ -530,6 +845,9 @@ def generate_deferred_payloads(
     event_payloads = []
     event_payloads_data = []
     event_deliveries_for_bulk_update = []
+    # Requests are shared between deliveries of the same event, so the webhooks
+    # reuse data loaded by dataloaders.
+    requests: dict[str, SaleorContext] = {}
 
     for delivery in deliveries:
         event_type = delivery.event_type
@@ -537,13 +855,15 @@ def generate_deferred_payloads(
         if not webhook.subscription_query:
             continue
 
-        request = initialize_request(
-            requestor,
-            event_type in WebhookEventSyncType.ALL,
-            event_type=event_type,
-            allow_replica=True,
-            request_time=args_obj.request_time,
-        )
+        if event_type not in requests:
+            requests[event_type] = initialize_request(
+                requestor,
+                event_type in WebhookEventSyncType.ALL,
+                event_type=event_type,
+                allow_replica=True,
+                request_time=args_obj.request_time,
+            )
+        request = requests[event_type]
         data_promise = generate_payload_promise_from_subscription(
             event_type=event_type,
             subscribable_object=subscribable_object,
@@ -555,7 +875,7 @@ def generate_deferred_payloads(
         if data_promise:
             data = data_promise.get()
             if data:
-                data_json = json.dumps({**data})
+                data_json = json_dumps({**data})
                 event_payloads_data.append(data_json)
                 event_payload = EventPayload()
                 event_payloads.append(event_payload)
@@ -571,6 +891,11 @@ def generate_deferred_payloads(
                 EventDelivery.objects.bulk_update(
                     event_deliveries_for_bulk_update, ["payload"]
                 )
+    if delivery_scheduler:
+        send_webhook_requests_for_deliveries(
+            event_deliveries_for_bulk_update, send_webhook_queue
+        )
+        return
     for delivery in event_deliveries_for_bulk_update:
         # Trigger webhook delivery task when the payload is ready.
         # TODO: switch to new `send_webhooks_async_for_app` task when we have
@@ -604,8 +929,12 @@ def send_webhook_request_async(
 ) -> None:
     delivery, not_found = get_delivery_for_webhook(event_delivery_id)
     if not delivery:
-        if not_found:
+        if not_found and self.request.retries < self.max_retries:
             raise self.retry(countdown=1)
+        if delivery_scheduler:
+            # the delivery won't be sent, so it must not take a place within the
+            # app's limit until its lease expires and it's queued again
+            release_scheduled_delivery(delivery_scheduler, event_delivery_id)
         return
 
     webhook = delivery.webhook
@@ -613,6 +942,7 @@ def send_webhook_request_async(
     attempt = create_attempt(delivery, self.request.id)
     response = WebhookResponse(content="", status=EventDeliveryStatus.FAILED)
     payload_size = 0
+    retry_error = None
 
     try:
         if not delivery.payload:
@@ -660,17 +990,96 @@ def send_webhook_request_async(
             delivery.status = EventDeliveryStatus.SUCCESS
             # update attempt without save to provide proper data in observability
             attempt_update(attempt, response, with_save=False)
+    except Retry as error:
+        retry_error = error
+        raise
     except ValueError as e:
         response.content = str(e)
         attempt_update(attempt, response)
         delivery_update(delivery=delivery, status=EventDeliveryStatus.FAILED)
     finally:
         record_external_request(webhook.target_url, response, payload_size)
+        if delivery_scheduler:
+            if retry_error:
+                retry_scheduled_delivery(
+                    delivery_scheduler, delivery, response, retry_error
+                )
+            else:
+                complete_scheduled_delivery(delivery_scheduler, delivery, response)
 
     observability.report_event_delivery_attempt(attempt)
     clear_successful_delivery(delivery)
 
 
+def complete_scheduled_delivery(
+    scheduler: DeliveryScheduler, delivery: EventDelivery, response: WebhookResponse
+):
+    scheduler.complete(
+        delivery.webhook.app,
+        delivery.pk,
+        latency=response.duration,
+        failed=response.status == EventDeliveryStatus.FAILED,
+    )
+    # the delivery released its place, so the next one can be dispatched
+    if scheduler.has_queued_deliveries():
+        schedule_webhook_deliveries_dispatch()
+
+
+def retry_scheduled_delivery(
+    scheduler: DeliveryScheduler,
+    delivery: EventDelivery,
+    response: WebhookResponse,
+    retry_error: Retry,
+):
+    # the delivery keeps its place within the app's limit until it's retried, so
+    # retries of a failing app don't run on top of the app's limit
+    next_retry = observability.task_next_retry_date(retry_error)
+    scheduler.retry(
+        delivery.webhook.app,
+        delivery.pk,
+        latency=response.duration,
+        retry_at=next_retry.timestamp() if next_retry else time.time(),
+    )
+
+
+def release_scheduled_delivery(scheduler: DeliveryScheduler, event_delivery_id: int):
+    if scheduler.release(event_delivery_id) and scheduler.has_queued_deliveries():
+        schedule_webhook_deliveries_dispatch()
+
+
+def schedule_webhook_deliveries_dispatch():
+    """Schedule a dispatch pass, unless one is already waiting to start."""
+    if cache.add(
+        WEBHOOK_DELIVERIES_DISPATCH_PENDING_KEY,
+        True,
+        timeout=WEBHOOK_DELIVERIES_DISPATCH_PENDING_TIMEOUT,
+    ):
+        dispatch_webhook_deliveries_task.delay()
+
+
+@app.task(queue=settings.WEBHOOK_CELERY_QUEUE_NAME)
+def dispatch_webhook_deliveries_task():
+    if not delivery_scheduler:
+        return
+
+    # deliveries queued or finished from now on need another pass
+    cache.delete(WEBHOOK_DELIVERIES_DISPATCH_PENDING_KEY)
+    deliveries = delivery_scheduler.dispatch()
+    for delivery_id, queue in deliveries:
+        send_webhook_request_async.apply_async(
+            kwargs={
+                "event_delivery_id": delivery_id,
+                "telemetry_context": get_task_context().to_dict(),
+            },
+            queue=queue,
+            bind=True,
+            retry_backoff=10,
+            retry_kwargs={"max_retries": 5},
+        )
+    if len(deliveries) == delivery_scheduler.batch_size:
+        dispatch_webhook_deliveries_task.delay()
+
+
 @app.task(
     queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
     bind=True,
@@ -1,5 +1,6 @@
 import json
 import logging
+import time
 from collections.abc import Callable
 from json import JSONDecodeError
 from typing import TYPE_CHECKING, Any, TypeVar
@@ -20,6 +21,7 @@ from ....core.tracing import webhooks_otel_trace
 from ....core.utils import get_domain
 from ....core.utils.events import call_event
 from ....core.utils.url import sanitize_url_for_logging
+from ....graphql.core.profiling import get_current_profile
 from ....graphql.webhook.subscription_payload import (
     generate_payload_from_subscription,
     initialize_request,
@@ -133,6 +135,7 @@ def _send_webhook_request_sync(
         delivery.event_type, payload_size, sync=True, app=webhook.app
     ) as span:
         try:
+            request_start = time.perf_counter()
             response = send_webhook_using_http(
                 webhook.target_url,
                 message,
@@ -142,6 +145,8 @@ def _send_webhook_request_sync(
                 timeout=timeout,
                 custom_headers=webhook.custom_headers,
             )
+            if profile := get_current_profile():
+                profile.record_webhook(time.perf_counter() - request_start)
             response_data = json.loads(response.content)
         except JSONDecodeError as e:
             logger.info(
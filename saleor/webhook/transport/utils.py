@@ -18,6 +18,7 @@ from celery import Task
 from celery.exceptions import MaxRetriesExceededError, Retry
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.db import transaction
 from django.db.models import Count
 from django.urls import reverse
 from google.cloud import pubsub_v1
@@ -558,15 +559,20 @@ def clear_successful_deliveries(deliveries: list["EventDelivery"]):
         payloads_to_delete = EventPayload.objects.filter(
             pk__in=payload_ids_to_delete, deliveries__isnull=True
         )
-        files_to_delete = [
+        files_to_delete = {
             event_payload.payload_file.name
             for event_payload in payloads_to_delete.using(
                 settings.DATABASE_CONNECTION_REPLICA_NAME
             )
             if event_payload.payload_file
-        ]
-        payloads_to_delete.delete()
-        delete_files_from_private_storage_task(files_to_delete)
+        }
+        with transaction.atomic():
+            EventPayload.objects.lock_files(files_to_delete)
+            payloads_to_delete.delete()
+            files_to_delete -= EventPayload.objects.get_referenced_files(
+                files_to_delete
+            )
+        delete_files_from_private_storage_task(list(files_to_delete))
 
 
 @allow_writer()